@@ -0,0 +1 @@
+"""Benchmarks package for llm_canvas performance measurements."""
@@ -0,0 +1,63 @@
+"""Node Store Memory Benchmark - Compares bytes per node across node stores.
+
+Builds the same conversation tree in a Canvas backed by a plain dict and by a
+CompactNodeStore, and reports the memory allocated per node with tracemalloc.
+
+Run with:
+    python -m benchmarks.node_store_memory --nodes 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from typing import Union
+
+from llm_canvas.canvas import Canvas
+from llm_canvas.node_store import CompactNodeStore, NodeStore
+
+ROLES = ("user", "assistant")
+
+
+def measure_bytes_per_node(node_store: Union[NodeStore, None], node_count: int, branch_every: int) -> float:
+    """Build a canvas with node_count messages and return the allocated bytes per node."""
+    # Message contents are created up front so both stores are charged for structure only
+    contents = [f"message {i}" for i in range(node_count)]
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    canvas = Canvas(title="benchmark", node_store=node_store)
+    branch = canvas.checkout(name="main")
+    for i, content in enumerate(contents):
+        if branch_every and i and i % branch_every == 0:
+            branch = branch.checkout(f"branch-{i}", create_if_not_exists=True)
+        branch.commit_message({"content": content, "role": ROLES[i % 2]})
+
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (after - before) / node_count
+
+
+def main() -> None:
+    """Main entry point for CLI."""
+    parser = argparse.ArgumentParser(description="Measure canvas memory use per node")
+    parser.add_argument("--nodes", type=int, default=50_000, help="Number of nodes to commit")
+    parser.add_argument("--branch-every", type=int, default=50, help="Start a new branch every N commits (0 to disable)")
+    args = parser.parse_args()
+
+    dict_bytes = measure_bytes_per_node(None, args.nodes, args.branch_every)
+    compact_bytes = measure_bytes_per_node(CompactNodeStore(), args.nodes, args.branch_every)
+
+    print(f"Nodes committed: {args.nodes}")
+    print(f"dict store:      {dict_bytes:8.1f} bytes/node")
+    print(f"compact store:   {compact_bytes:8.1f} bytes/node")
+    print(f"reduction:       {100 * (1 - compact_bytes / dict_bytes):8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
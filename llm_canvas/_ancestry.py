@@ -0,0 +1,198 @@
+"""Incrementally maintained ancestry index for canvas message nodes.
+
+Nodes are grouped into segments: append-only lists of node IDs that form a straight
+parent -> child chain. Committing to the tail of a chain appends to its segment in O(1).
+Branching from the middle of a segment starts a new segment that references the parent
+segment as a shared prefix, so sibling branches never copy each other's history.
+
+Each segment is owned by the index that created it, and only its owner appends to or
+trims it. Forking an index hands both copies a new owner token, so segments created
+before the fork are shared read-only and each fork continues in segments of its own.
+
+Segments also keep binary lifting tables over the segment tree, so the lowest common
+ancestor (merge base) of two nodes is found in O(log s) for s segments on their paths.
+"""
+
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from typing import Union
+
+from llm_canvas._layered import LayeredMapping
+
+
+class _Segment:
+    """A run of nodes where each node is the parent of the next one."""
+
+    __slots__ = ("base_depth", "jumps", "level", "node_ids", "owner", "parent", "parent_length")
+
+    def __init__(self, parent: Union[_Segment, None], parent_length: int, owner: object) -> None:
+        self.owner = owner
+        self.parent = parent
+        # Number of nodes of the parent segment that precede this segment
+        self.parent_length = parent_length
+        self.base_depth: int = parent.base_depth + parent_length if parent is not None else 0
+        self.node_ids: list[str] = []
+
+        # Number of ancestor segments, and jumps[k] is the ancestor segment 2**k levels up
+        self.level: int = parent.level + 1 if parent is not None else 0
+        self.jumps: list[_Segment] = []
+        ancestor = parent
+        while ancestor is not None:
+            self.jumps.append(ancestor)
+            k = len(self.jumps) - 1
+            ancestor = ancestor.jumps[k] if k < len(ancestor.jumps) else None
+
+    def ancestor_at_level(self, level: int) -> _Segment:
+        """Get the ancestor segment (or self) at the given level."""
+        segment = self
+        distance = self.level - level
+        k = 0
+        while distance:
+            if distance & 1:
+                segment = segment.jumps[k]
+            distance >>= 1
+            k += 1
+        return segment
+
+
+class AncestryIndex:
+    """Maps node IDs to their position in a forest of shared segments."""
+
+    def __init__(self) -> None:
+        self._locations: MutableMapping[str, tuple[_Segment, int]] = {}
+        self._owner = object()
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._locations
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def add(self, node_id: str, parent_id: Union[str, None]) -> None:
+        """
+        Record a new node below its parent.
+
+        A parent that is not indexed (or None) makes the node the root of a new tree.
+        Adding a node that is already indexed is a no-op.
+        """
+        if node_id in self._locations:
+            return
+
+        location = self._locations.get(parent_id) if parent_id is not None else None
+        if location is None:
+            segment = _Segment(None, 0, self._owner)
+        else:
+            parent_segment, index = location
+            # Extend an own segment when the parent is its tail, otherwise start a new one
+            if parent_segment.owner is self._owner and index == len(parent_segment.node_ids) - 1:
+                segment = parent_segment
+            else:
+                segment = _Segment(parent_segment, index + 1, self._owner)
+
+        segment.node_ids.append(node_id)
+        self._locations[node_id] = (segment, len(segment.node_ids) - 1)
+
+    def discard(self, node_id: str) -> None:
+        """
+        Remove a node that has no indexed descendants, e.g. one that was garbage collected.
+
+        Removing a node that is not indexed is a no-op.
+        """
+        location = self._locations.pop(node_id, None)
+        if location is None:
+            return
+
+        # Drop the removed nodes at the tail of the segment so commits can extend it again
+        segment = location[0]
+        while (
+            segment.owner is self._owner
+            and segment.node_ids
+            and self._locations.get(segment.node_ids[-1], (None,))[0] is not segment
+        ):
+            segment.node_ids.pop()
+
+    def fork(self) -> AncestryIndex:
+        """
+        Create a copy of this index in constant time.
+
+        Returns:
+            The new index, sharing the existing segments with this one
+        """
+        if not isinstance(self._locations, LayeredMapping):
+            self._locations = LayeredMapping(self._locations)
+        forked = AncestryIndex()
+        forked._locations = self._locations.fork()
+        # Neither index may extend or trim the segments they now share
+        self._owner = object()
+        return forked
+
+    def depth(self, node_id: str) -> int:
+        """Get the number of ancestors of a node (0 for roots)."""
+        segment, index = self._locations[node_id]
+        return segment.base_depth + index
+
+    def lowest_common_ancestor(self, node_id_a: str, node_id_b: str) -> Union[str, None]:
+        """
+        Get the deepest node that is an ancestor of (or equal to) both nodes.
+
+        Returns:
+            The ID of the common ancestor, or None if the nodes are in different trees
+        """
+        segment_a, index_a = self._locations[node_id_a]
+        segment_b, index_b = self._locations[node_id_b]
+
+        # Bring both positions to the same segment level
+        if segment_a.level > segment_b.level:
+            segment_a, index_a = self._lift(segment_a, segment_b.level)
+        elif segment_b.level > segment_a.level:
+            segment_b, index_b = self._lift(segment_b, segment_a.level)
+
+        if segment_a is not segment_b:
+            # Climb to the children of the lowest common segment
+            for k in range(len(segment_a.jumps) - 1, -1, -1):
+                if k < len(segment_a.jumps) and segment_a.jumps[k] is not segment_b.jumps[k]:
+                    segment_a = segment_a.jumps[k]
+                    segment_b = segment_b.jumps[k]
+            if segment_a.parent is None:
+                return None
+            index_a = segment_a.parent_length - 1
+            index_b = segment_b.parent_length - 1
+            segment_a = segment_a.parent
+
+        return segment_a.node_ids[min(index_a, index_b)]
+
+    def is_ancestor(self, ancestor_id: str, node_id: str) -> bool:
+        """Check whether a node is an ancestor of (or equal to) another node."""
+        return self.lowest_common_ancestor(ancestor_id, node_id) == ancestor_id
+
+    @staticmethod
+    def _lift(segment: _Segment, level: int) -> tuple[_Segment, int]:
+        """Get the segment and index of the deepest ancestor position at a lower segment level."""
+        below = segment.ancestor_at_level(level + 1)
+        assert below.parent is not None
+        return below.parent, below.parent_length - 1
+
+    def path(self, node_id: str, start_depth: int = 0) -> list[str]:
+        """
+        Get the IDs from the root down to (and including) the given node.
+
+        With start_depth, only the nodes at that depth or deeper are returned, and only the
+        segments covering them are visited, so the cost is proportional to the result.
+        """
+        segment, index = self._locations[node_id]
+        chunks = []
+        end = index + 1
+        while True:
+            start = max(start_depth - segment.base_depth, 0)
+            if start < end:
+                chunks.append(segment.node_ids[start:end])
+            if segment.parent is None or segment.base_depth <= start_depth:
+                break
+            end = segment.parent_length
+            segment = segment.parent
+
+        path: list[str] = []
+        for chunk in reversed(chunks):
+            path.extend(chunk)
+        return path
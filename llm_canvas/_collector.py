@@ -0,0 +1,100 @@
+"""Incremental mark-and-sweep garbage collector for canvas message nodes.
+
+A node is live when it can be reached from a root (a branch HEAD, a detached checkout or
+a pinned node) by following parent_id and merge_parent_ids links. A collection cycle marks
+the live nodes, then sweeps the node store for the rest. Both phases can be split into
+budgeted steps so a large canvas is collected a little at a time.
+
+Between steps the canvas keeps the cycle sound with two barriers: nodes created during a
+cycle are marked on creation, and existing nodes that become roots during a cycle are
+shaded (queued for marking). Nodes that lose their last root during a cycle survive until
+the next one.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Union
+
+from llm_canvas.node_store import NodeStore
+
+
+class GarbageCollector:
+    """State of the current collection cycle of one canvas."""
+
+    def __init__(self) -> None:
+        # None while no cycle is in progress
+        self._marked: Union[set[str], None] = None
+        self._gray: list[str] = []
+        # Node IDs left to sweep, None until the mark phase is done
+        self._sweep_ids: Union[list[str], None] = None
+
+    @property
+    def in_progress(self) -> bool:
+        """Whether a cycle has been started and not finished."""
+        return self._marked is not None
+
+    def start(self, root_ids: Iterable[str]) -> None:
+        """Start a cycle from the given roots."""
+        self._marked = set()
+        self._gray = list(root_ids)
+        self._sweep_ids = None
+
+    def shade(self, node_id: str) -> None:
+        """Keep an existing node alive in the current cycle (it became a root)."""
+        if self._marked is not None and node_id not in self._marked:
+            self._gray.append(node_id)
+
+    def allocate(self, node_id: str) -> None:
+        """Keep a node created during the current cycle alive."""
+        if self._marked is not None:
+            self._marked.add(node_id)
+
+    def step(self, nodes: NodeStore, budget: Union[int, None] = None) -> list[str]:
+        """
+        Advance the current cycle.
+
+        Each node marked or swept costs one unit of the budget. The cycle finishes once the
+        whole node store has been swept.
+
+        Args:
+            nodes: The node store being collected
+            budget: The maximum units of work to do (None to finish the cycle)
+
+        Returns:
+            The IDs of the unreachable nodes found in this step, descendants first
+        """
+        marked = self._marked
+        if marked is None:
+            return []
+        remaining = budget if budget is not None else -1
+
+        # Mark phase
+        while remaining and self._gray:
+            node_id = self._gray.pop()
+            if node_id in marked or node_id not in nodes:
+                continue
+            marked.add(node_id)
+            remaining -= 1
+            node = nodes[node_id]
+            if node["parent_id"] is not None:
+                self._gray.append(node["parent_id"])
+            self._gray.extend(node.get("merge_parent_ids", ()))
+
+        if self._gray:
+            return []
+
+        # Sweep phase, newest nodes first so descendants are found before their ancestors
+        if self._sweep_ids is None:
+            self._sweep_ids = list(nodes)
+        garbage: list[str] = []
+        while remaining and self._sweep_ids:
+            node_id = self._sweep_ids.pop()
+            remaining -= 1
+            if node_id not in marked and node_id in nodes:
+                garbage.append(node_id)
+
+        if not self._sweep_ids:
+            self._marked = None
+            self._sweep_ids = None
+        return garbage
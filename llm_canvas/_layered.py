@@ -0,0 +1,232 @@
+"""Copy-on-write mappings for forking canvases in constant time.
+
+A LayeredMapping reads through a stack of frozen layers and writes to its own top layer.
+Forking freezes the top layer and lets both mappings build on the shared layers, so
+neither copies the entries it already has. Deletions of entries that live in a frozen
+layer are recorded as tombstones in the top layer.
+
+Frozen layers are shared and must never be modified, values included: to change a mutable
+value (e.g. the child_ids list of a node), write back a changed copy. A snapshot freezes the
+top layer the same way and reads the frozen layers as they are.
+
+Each newly frozen layer is merged with the layers below it while it is at least as large
+as the next one, so layer sizes grow geometrically and an entry is copied O(log n) times
+over many forks and snapshots, while the oldest, largest layer is rarely rewritten.
+"""
+
+from __future__ import annotations
+
+from collections.abc import ItemsView, Iterator, Mapping, MutableMapping
+from typing import Callable, Generic, TypeVar, Union
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+# Number of frozen layers above which the newest layers are merged
+_MAX_LAYERS = 8
+
+
+class _Layer(Generic[K, V]):
+    """A frozen layer: entries written and keys deleted while it was the top layer."""
+
+    __slots__ = ("deleted", "values")
+
+    def __init__(self, values: Mapping[K, V], deleted: set[K]) -> None:
+        self.values = values
+        self.deleted = deleted
+
+
+def _layer_lookup(layers: tuple[_Layer[K, V], ...], key: object) -> Union[_Layer[K, V], None]:
+    """Find the frozen layer holding a key, newest first."""
+    for layer in layers:
+        if key in layer.values:
+            return layer
+        if key in layer.deleted:
+            break
+    return None
+
+
+def _iter_layers(layers: tuple[_Layer[K, V], ...], top: Mapping[K, V], mapping: Mapping[K, V]) -> Iterator[K]:
+    """Iterate over the keys of a mapping made of frozen layers and a top layer, oldest entries first."""
+    yielded: set[K] = set()
+    for values in (*(layer.values for layer in reversed(layers)), top):
+        for key in values:
+            if key not in yielded and key in mapping:
+                yielded.add(key)
+                yield key
+
+
+def _iter_layer_items(layers: tuple[_Layer[K, V], ...]) -> Iterator[tuple[K, V]]:
+    """Iterate over the entries of frozen layers in the order of _iter_layers, reading each layer once."""
+    if len(layers) == 1:
+        yield from layers[0].values.items()
+        return
+    # The newest value of every key that is not hidden by a newer tombstone
+    current: dict[K, V] = {}
+    hidden: set[K] = set()
+    for layer in layers:
+        for key, value in layer.values.items():
+            if key not in current and key not in hidden:
+                current[key] = value
+        hidden |= layer.deleted
+    for layer in reversed(layers):
+        for key in layer.values:
+            if key in current:
+                yield key, current.pop(key)
+
+
+class _FrozenItemsView(ItemsView[K, V]):
+    """The entries of a FrozenLayers, iterated without looking each key up in every layer."""
+
+    def __init__(self, mapping: Mapping[K, V], layers: tuple[_Layer[K, V], ...]) -> None:
+        super().__init__(mapping)
+        self._layers = layers
+
+    def __iter__(self) -> Iterator[tuple[K, V]]:
+        return _iter_layer_items(self._layers)
+
+
+class FrozenLayers(Mapping[K, V]):
+    """A read-only snapshot of a LayeredMapping, unaffected by later writes to it."""
+
+    def __init__(self, layers: tuple[_Layer[K, V], ...], length: int) -> None:
+        self._layers = layers
+        self._length = length
+
+    def __getitem__(self, key: K) -> V:
+        layer = _layer_lookup(self._layers, key)
+        if layer is None:
+            raise KeyError(key)
+        return layer.values[key]
+
+    def __contains__(self, key: object) -> bool:
+        return _layer_lookup(self._layers, key) is not None
+
+    def __iter__(self) -> Iterator[K]:
+        return _iter_layers(self._layers, {}, self)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def items(self) -> ItemsView[K, V]:
+        return _FrozenItemsView(self, self._layers)
+
+
+class LayeredMapping(MutableMapping[K, V]):
+    """A mutable mapping layered over frozen layers it may share with its forks."""
+
+    def __init__(
+        self,
+        base: Union[Mapping[K, V], None] = None,
+        top_factory: Callable[[], MutableMapping[K, V]] = dict,
+    ) -> None:
+        """
+        Create a layered mapping.
+
+        Args:
+            base: Optional mapping to use as the first frozen layer (it must not be modified afterwards)
+            top_factory: Creates the mapping used as a new top layer
+        """
+        self._top_factory = top_factory
+        self._top = top_factory()
+        self._deleted: set[K] = set()
+        self._layers: tuple[_Layer[K, V], ...] = (_Layer(base, set()),) if base else ()
+        self._length = len(base) if base else 0
+
+    @property
+    def depth(self) -> int:
+        """Get the number of frozen layers."""
+        return len(self._layers)
+
+    def local_mapping(self) -> Mapping[K, V]:
+        """Get the entries written since the last fork; it becomes a shared layer on the next fork."""
+        return self._top
+
+    def is_local(self, key: K) -> bool:
+        """Check whether a key was written since the last fork (i.e. it is not shared)."""
+        return key in self._top
+
+    def __getitem__(self, key: K) -> V:
+        if key in self._top:
+            return self._top[key]
+        if key not in self._deleted:
+            layer = _layer_lookup(self._layers, key)
+            if layer is not None:
+                return layer.values[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._top:
+            return True
+        if key in self._deleted:
+            return False
+        return _layer_lookup(self._layers, key) is not None
+
+    def __setitem__(self, key: K, value: V) -> None:
+        if key not in self:
+            self._length += 1
+        self._top[key] = value
+        self._deleted.discard(key)
+
+    def __delitem__(self, key: K) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._top.pop(key, None)
+        if _layer_lookup(self._layers, key) is not None:
+            self._deleted.add(key)
+        self._length -= 1
+
+    def __iter__(self) -> Iterator[K]:
+        # Oldest entries first, like a dict that received the same writes (except that a key
+        # deleted from a frozen layer and written again keeps its old position)
+        return _iter_layers(self._layers, self._top, self)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def fork(self) -> LayeredMapping[K, V]:
+        """
+        Create a copy of this mapping in constant time.
+
+        Both mappings share the current entries and write to separate top layers.
+
+        Returns:
+            The new mapping
+        """
+        self._freeze_top()
+        forked = LayeredMapping(top_factory=self._top_factory)
+        forked._layers = self._layers
+        forked._length = self._length
+        return forked
+
+    def snapshot(self) -> FrozenLayers[K, V]:
+        """
+        Get a read-only view of the current entries in constant time.
+
+        Values are shared with the mapping, so they must not be modified through the view.
+
+        Returns:
+            The view
+        """
+        self._freeze_top()
+        return FrozenLayers(self._layers, self._length)
+
+    def _freeze_top(self) -> None:
+        """Turn the top layer into a frozen layer, unless nothing was written since the last one."""
+        if not self._top and not self._deleted:
+            return
+        layers = [_Layer(self._top, self._deleted), *self._layers]
+        self._top = self._top_factory()
+        self._deleted = set()
+
+        while len(layers) > 1 and (len(layers) > _MAX_LAYERS or len(layers[0].values) >= len(layers[1].values)):
+            newer, older = layers[0], layers[1]
+            merged = self._top_factory()
+            merged.update(older.values)
+            for key in newer.deleted:
+                merged.pop(key, None)
+            merged.update(newer.values)
+            # Tombstones only matter while there are older layers to hide entries in
+            deleted = newer.deleted | older.deleted if layers[2:] else set()
+            layers[0:2] = [_Layer(merged, deleted)]
+        self._layers = tuple(layers)
@@ -0,0 +1,88 @@
+"""Secondary indexes over the meta of message nodes.
+
+A hash index maps each value of a meta key to the nodes having it, for equality queries
+(e.g. status == "error"). A sorted index keeps the nodes ordered by the numeric value of a
+meta key, for range queries (e.g. 1.0 <= latency <= 5.0). Canvases keep their indexes up to
+date as nodes are committed, updated and removed.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from collections.abc import Hashable
+from typing import Any, Union
+
+from llm_canvas.types import MetaIndexKind
+
+
+class HashIndex:
+    """Index from the values of a meta key to the nodes having them."""
+
+    def __init__(self) -> None:
+        self._node_ids: dict[Any, set[str]] = {}
+        self._values: dict[str, Any] = {}
+
+    def add(self, node_id: str, value: Any) -> None:
+        """Index the value of a node, replacing its previous one. Unhashable values are not indexed."""
+        self.remove(node_id)
+        if not isinstance(value, Hashable):
+            return
+        self._node_ids.setdefault(value, set()).add(node_id)
+        self._values[node_id] = value
+
+    def remove(self, node_id: str) -> None:
+        """Remove a node from the index."""
+        if node_id not in self._values:
+            return
+        value = self._values.pop(node_id)
+        node_ids = self._node_ids[value]
+        node_ids.discard(node_id)
+        if not node_ids:
+            del self._node_ids[value]
+
+    def equal(self, value: Any) -> set[str]:
+        """Get the IDs of the nodes whose value equals the given one."""
+        if not isinstance(value, Hashable):
+            return set()
+        return set(self._node_ids.get(value, ()))
+
+
+class SortedIndex:
+    """Index keeping nodes ordered by the numeric value of a meta key."""
+
+    def __init__(self) -> None:
+        self._entries: list[tuple[float, str]] = []
+        self._values: dict[str, float] = {}
+
+    def add(self, node_id: str, value: Any) -> None:
+        """Index the value of a node, replacing its previous one. Non-numeric values are not indexed."""
+        self.remove(node_id)
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or math.isnan(value):
+            return
+        bisect.insort(self._entries, (value, node_id))
+        self._values[node_id] = value
+
+    def remove(self, node_id: str) -> None:
+        """Remove a node from the index."""
+        if node_id not in self._values:
+            return
+        entry = (self._values.pop(node_id), node_id)
+        del self._entries[bisect.bisect_left(self._entries, entry)]
+
+    def range(self, low: Union[float, None], high: Union[float, None]) -> list[str]:
+        """Get the IDs of the nodes whose value is within the inclusive bounds, smallest value first."""
+        start = bisect.bisect_left(self._entries, (low,)) if low is not None else 0
+        end = len(self._entries)
+        if high is not None:
+            # Sorts after every entry with the high value itself
+            end = bisect.bisect_right(self._entries, (high, "\U0010ffff"))
+        return [node_id for _, node_id in self._entries[start:end]]
+
+
+MetaIndex = Union[HashIndex, SortedIndex]
+
+
+def create_meta_index(kind: MetaIndexKind) -> MetaIndex:
+    """Create an empty index of a kind."""
+    return HashIndex() if kind == "hash" else SortedIndex()
@@ -0,0 +1,323 @@
+"""Incrementally maintained full-text index over message content.
+
+The index maps each term to the messages containing it and how often, so a query only
+visits the postings of its own terms. Messages are added, replaced and removed as the
+canvas changes, and text streamed into a message is indexed by only tokenizing the new
+text (plus the word it may continue). Results are ranked with BM25.
+
+Each canvas has its own index (a shard). Shards can report to a SearchCorpus shared by a
+registry of canvases, which keeps the corpus-wide statistics BM25 needs and which shards
+contain each term, so a registry-wide query only visits the shards containing its terms
+and their scores can be merged as if they came from a single index.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+from collections import Counter
+from collections.abc import Iterable
+from typing import NamedTuple, Union
+
+from llm_canvas.types import Message, MessageNode, SearchFilters
+
+_TERM = re.compile(r"\w+")
+
+# BM25 parameters: term frequency saturation and document length normalization
+_K1 = 1.2
+_B = 0.75
+
+# Number of characters shown around the first match in a snippet
+_SNIPPET_BEFORE = 40
+_SNIPPET_AFTER = 80
+
+
+def message_text(message: Message) -> str:
+    """Get the searchable text of a message: its text blocks and tool results."""
+    content = message["content"]
+    if isinstance(content, str):
+        return content
+
+    texts: list[str] = []
+    for block in content:
+        if block["type"] == "text":
+            texts.append(block["text"])
+        elif block["type"] == "tool_result":
+            result = block.get("content")
+            if isinstance(result, str):
+                texts.append(result)
+            elif result is not None:
+                texts.extend(part["text"] for part in result if part["type"] == "text")  # type: ignore[index]
+    return "\n".join(texts)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase terms."""
+    return [term.lower() for term in _TERM.findall(text)]
+
+
+def snippet(text: str, terms: Iterable[str]) -> str:
+    """Get the part of a text around the first occurrence of one of the terms."""
+    pattern = "|".join(re.escape(term) for term in terms)
+    match = re.search(pattern, text, re.IGNORECASE) if pattern else None
+    if match is None:
+        return text[: _SNIPPET_BEFORE + _SNIPPET_AFTER].strip()
+    start = max(match.start() - _SNIPPET_BEFORE, 0)
+    end = match.end() + _SNIPPET_AFTER
+    return ("…" if start else "") + text[start:end].strip() + ("…" if end < len(text) else "")
+
+
+class _Attributes(NamedTuple):
+    """What search filters look at besides the text of a message."""
+
+    role: str
+    block_types: frozenset[str]
+    timestamp: Union[float, None]
+
+    @classmethod
+    def of(cls, node: MessageNode) -> _Attributes:
+        content = node["message"]["content"]
+        block_types = frozenset(("text",) if isinstance(content, str) else (block["type"] for block in content))
+        timestamp = (node["meta"] or {}).get("timestamp")
+        return cls(node["message"]["role"], block_types, timestamp)
+
+    def matches(self, filters: SearchFilters) -> bool:
+        if "roles" in filters and self.role not in filters["roles"]:
+            return False
+        if "block_types" in filters and self.block_types.isdisjoint(filters["block_types"]):
+            return False
+        if "since" in filters and (self.timestamp is None or self.timestamp < filters["since"]):
+            return False
+        return not ("until" in filters and (self.timestamp is None or self.timestamp > filters["until"]))
+
+
+class CorpusStatistics(NamedTuple):
+    """The statistics BM25 scores are computed with."""
+
+    node_count: int
+    total_length: int
+    document_frequencies: dict[str, int]
+
+
+class SearchCorpus:
+    """Statistics and a term directory shared by the search indexes (shards) of many canvases."""
+
+    def __init__(self) -> None:
+        # term -> shard key -> number of messages of the shard containing the term
+        self._shards: dict[str, dict[str, int]] = {}
+        self._node_count = 0
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, terms: Iterable[str]) -> tuple[set[str], CorpusStatistics]:
+        """
+        Get the shards containing any of the terms, and the statistics to score them with.
+
+        Returns:
+            The keys of the shards and the corpus-wide statistics
+        """
+        with self._lock:
+            shard_keys: set[str] = set()
+            frequencies: dict[str, int] = {}
+            for term in terms:
+                shards = self._shards.get(term, {})
+                shard_keys.update(shards)
+                frequencies[term] = sum(shards.values())
+            return shard_keys, CorpusStatistics(self._node_count, self._total_length, frequencies)
+
+    def update(self, shard_key: str, node_count: int, length: int, frequencies: dict[str, int]) -> None:
+        """Apply the changes of a shard: to its message count, term count and document frequencies."""
+        with self._lock:
+            self._node_count += node_count
+            self._total_length += length
+            for term, change in frequencies.items():
+                shards = self._shards.setdefault(term, {})
+                shards[shard_key] = shards.get(shard_key, 0) + change
+                if shards[shard_key] <= 0:
+                    del shards[shard_key]
+                    if not shards:
+                        del self._shards[term]
+
+
+class SearchIndex:
+    """Inverted index from terms to the messages containing them."""
+
+    def __init__(self, corpus: Union[SearchCorpus, None] = None, shard_key: str = "") -> None:
+        """
+        Create an empty index.
+
+        Args:
+            corpus: Optional corpus to report changes to (see SearchCorpus)
+            shard_key: The key of this index in the corpus, e.g. the canvas ID
+        """
+        self.corpus = corpus
+        self._shard_key = shard_key
+        # term -> node ID -> number of occurrences
+        self._postings: dict[str, dict[str, int]] = {}
+        self._node_terms: dict[str, Counter[str]] = {}
+        # Number of terms of each message
+        self._lengths: dict[str, int] = {}
+        self._attributes: dict[str, _Attributes] = {}
+        # Last term of each message when its text ends inside a word that a delta may continue
+        self._tails: dict[str, str] = {}
+        self._total_length = 0
+        # Changes not reported to the corpus yet
+        self._pending_nodes = 0
+        self._pending_length = 0
+        self._pending_frequencies: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._node_terms)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._node_terms
+
+    def add(self, node: MessageNode) -> None:
+        """Index the text of a message, replacing what was indexed for it before."""
+        node_id = node["id"]
+        self._remove(node_id)
+        self._node_terms[node_id] = Counter()
+        self._lengths[node_id] = 0
+        self._attributes[node_id] = _Attributes.of(node)
+        self._pending_nodes += 1
+        self._add_terms(node_id, message_text(node["message"]))
+        self._report()
+
+    def append(self, node_id: str, text: str) -> None:
+        """Index text appended to the end of an indexed message's text, e.g. a streamed delta."""
+        if not text:
+            return
+        tail = self._tails.pop(node_id, None)
+        if tail is not None and _TERM.match(text):
+            # The delta continues the last word, so it is indexed as one longer term
+            self._change(node_id, tail, -1)
+            text = tail + text
+        self._add_terms(node_id, text)
+        self._report()
+
+    def update_attributes(self, node: MessageNode) -> None:
+        """Refresh what the filters of an indexed message look at, e.g. after a delta changed its meta."""
+        if node["id"] in self._attributes:
+            self._attributes[node["id"]] = _Attributes.of(node)
+
+    def remove(self, node_id: str) -> None:
+        """Remove a message from the index."""
+        self._remove(node_id)
+        self._report()
+
+    def attach(self, corpus: Union[SearchCorpus, None], shard_key: str = "") -> None:
+        """
+        Report to another corpus (or stop reporting, with None).
+
+        The previous corpus forgets the messages of this index and the new one learns about
+        them from the aggregated statistics of the index, without tokenizing any text again.
+
+        Args:
+            corpus: The corpus to report changes to from now on
+            shard_key: The key of this index in the corpus, e.g. the canvas ID
+        """
+        if corpus is self.corpus and shard_key == self._shard_key:
+            return
+        frequencies = {term: len(postings) for term, postings in self._postings.items()}
+        if self.corpus is not None:
+            negated = {term: -count for term, count in frequencies.items()}
+            self.corpus.update(self._shard_key, -len(self._node_terms), -self._total_length, negated)
+        self.corpus = corpus
+        self._shard_key = shard_key
+        if corpus is not None:
+            corpus.update(shard_key, len(self._node_terms), self._total_length, frequencies)
+
+    def statistics(self, terms: Iterable[str]) -> CorpusStatistics:
+        """Get the statistics of this index alone."""
+        frequencies = {term: len(self._postings.get(term, ())) for term in terms}
+        return CorpusStatistics(len(self._node_terms), self._total_length, frequencies)
+
+    def search(
+        self,
+        terms: Iterable[str],
+        limit: Union[int, None] = None,
+        filters: Union[SearchFilters, None] = None,
+        statistics: Union[CorpusStatistics, None] = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Find the messages containing any of the terms, best matches first.
+
+        Args:
+            terms: The lowercase query terms (see tokenize)
+            limit: Optional maximum number of results
+            filters: Optional conditions the messages must meet
+            statistics: Statistics to score with, e.g. those of a whole corpus (defaults to this index's)
+
+        Returns:
+            Pairs of node ID and BM25 score
+        """
+        terms = set(terms)
+        if statistics is None:
+            statistics = self.statistics(terms)
+        if not statistics.node_count:
+            return []
+        average_length = statistics.total_length / statistics.node_count or 1.0
+
+        scores: dict[str, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            document_frequency = statistics.document_frequencies.get(term, len(postings))
+            idf = math.log(1 + (statistics.node_count - document_frequency + 0.5) / (document_frequency + 0.5))
+            for node_id, frequency in postings.items():
+                if filters and not self._attributes[node_id].matches(filters):
+                    continue
+                norm = frequency + _K1 * (1 - _B + _B * self._lengths[node_id] / average_length)
+                scores[node_id] = scores.get(node_id, 0.0) + idf * frequency * (_K1 + 1) / norm
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit] if limit is not None else ranked
+
+    def _remove(self, node_id: str) -> None:
+        terms = self._node_terms.get(node_id)
+        if terms is None:
+            return
+        for term, count in list(terms.items()):
+            self._change(node_id, term, -count)
+        del self._node_terms[node_id]
+        del self._lengths[node_id]
+        del self._attributes[node_id]
+        self._tails.pop(node_id, None)
+        self._pending_nodes -= 1
+
+    def _add_terms(self, node_id: str, text: str) -> None:
+        terms = tokenize(text)
+        for term in terms:
+            self._change(node_id, term, 1)
+        if terms and _TERM.fullmatch(text[-1]):
+            self._tails[node_id] = terms[-1]
+
+    def _change(self, node_id: str, term: str, count: int) -> None:
+        """Change the number of occurrences of a term in a message."""
+        node_terms = self._node_terms[node_id]
+        node_terms[term] += count
+        self._lengths[node_id] += count
+        self._total_length += count
+        self._pending_length += count
+        postings = self._postings.setdefault(term, {})
+        if node_terms[term] > 0:
+            if node_id not in postings:
+                self._pending_frequencies[term] = self._pending_frequencies.get(term, 0) + 1
+            postings[node_id] = node_terms[term]
+            return
+        del node_terms[term]
+        if postings.pop(node_id, None) is not None:
+            self._pending_frequencies[term] = self._pending_frequencies.get(term, 0) - 1
+        if not postings:
+            del self._postings[term]
+
+    def _report(self) -> None:
+        """Send the changes of the last operation to the corpus in one update."""
+        if self.corpus is not None and (self._pending_nodes or self._pending_length or self._pending_frequencies):
+            frequencies = {term: change for term, change in self._pending_frequencies.items() if change}
+            self.corpus.update(self._shard_key, self._pending_nodes, self._pending_length, frequencies)
+        self._pending_nodes = 0
+        self._pending_length = 0
+        self._pending_frequencies = {}
@@ -8,23 +8,34 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections.abc import AsyncGenerator
-from typing import Literal, Union
+from typing import Any, Literal, Union
 
-from fastapi import APIRouter, HTTPException, Path, Query
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
 
 from llm_canvas._server._types import SSEEvent
 from llm_canvas.canvas import Canvas
+from llm_canvas.node_store import CompactNodeStore
 from llm_canvas.types import (
+    BranchDiff,
+    CanvasChange,
     CanvasCommitMessageEvent,
+    CanvasCommitMessagesEvent,
     CanvasData,
+    CanvasMessageDeltaEvent,
     CanvasSummary,
     CanvasUpdateMessageEvent,
+    MessageDelta,
+    MessageNode,
+    MetaIndexKind,
+    RegistrySearchHit,
+    SearchFilters,
+    SearchHit,
 )
 
 from ._events import create_sse_stream, get_event_dispatcher
-from ._registry import get_local_registry
+from ._registry import get_local_blob_store, get_local_content_store, get_local_registry
 
 # ---- API Request BaseModel Definitions ----
 
@@ -43,14 +54,39 @@ class UpdateCanvasRequest(BaseModel):
     description: Union[str, None] = None
 
 
+class ForkCanvasRequest(BaseModel):
+    """Request type for POST /api/v1/canvas/{canvas_id}/fork"""
+
+    title: Union[str, None] = None
+    description: Union[str, None] = None
+
+
 class CommitMessageRequest(BaseModel):
     data: CanvasCommitMessageEvent
 
 
+class CommitMessagesRequest(BaseModel):
+    data: CanvasCommitMessagesEvent
+
+
 class UpdateMessageRequest(BaseModel):
     data: CanvasUpdateMessageEvent
 
 
+class MessageDeltaRequest(BaseModel):
+    """Request type for POST /api/v1/canvas/{canvas_id}/messages/{message_id}/delta"""
+
+    data: CanvasMessageDeltaEvent
+
+
+class QueryNodesRequest(BaseModel):
+    """Request type for POST /api/v1/canvas/{canvas_id}/nodes/query"""
+
+    equals: dict[str, Any] = {}
+    ranges: dict[str, tuple[Union[float, None], Union[float, None]]] = {}
+    limit: Union[int, None] = Field(None, ge=1)
+
+
 # ---- API Response BaseModel Definitions ----
 
 
@@ -66,6 +102,57 @@ class GetCanvasResponse(BaseModel):
     data: CanvasData
 
 
+class CanvasDiffResponse(BaseModel):
+    """Response type for GET /api/v1/canvas/{canvas_id}/diff"""
+
+    data: BranchDiff
+
+
+class MessageBranchesResponse(BaseModel):
+    """Response type for GET /api/v1/canvas/{canvas_id}/messages/{message_id}/branches"""
+
+    heads: list[str]
+
+
+class CanvasChangesResponse(BaseModel):
+    """Response type for GET /api/v1/canvas/{canvas_id}/changes"""
+
+    version: int
+    changes: Union[list[CanvasChange], None] = None
+    snapshot: Union[CanvasData, None] = None
+
+
+class CanvasSearchResponse(BaseModel):
+    """Response type for GET /api/v1/canvas/{canvas_id}/search"""
+
+    hits: list[SearchHit]
+
+
+class RegistrySearchResponse(BaseModel):
+    """Response type for GET /api/v1/search"""
+
+    hits: list[RegistrySearchHit]
+
+
+class QueryNodesResponse(BaseModel):
+    """Response type for POST /api/v1/canvas/{canvas_id}/nodes/query"""
+
+    nodes: list[MessageNode]
+
+
+class MetaIndexInfo(BaseModel):
+    """A meta key a canvas is indexed by, and the kind of the index"""
+
+    key: str
+    kind: MetaIndexKind
+
+
+class MetaIndexesResponse(BaseModel):
+    """Response type for PUT and DELETE /api/v1/canvas/{canvas_id}/meta_indexes/{key}"""
+
+    indexes: list[MetaIndexInfo]
+
+
 class ErrorResponse(BaseModel):
     """Standard error response format"""
 
@@ -108,6 +195,14 @@ class CreateMessageResponse(BaseModel):
     message: str
 
 
+class CreateMessagesResponse(BaseModel):
+    """Response type for POST /api/v1/canvas/{canvas_id}/messages/batch"""
+
+    message_ids: list[str]
+    canvas_id: str
+    message: str
+
+
 class DeleteMessageResponse(BaseModel):
     """Response type for DELETE /api/v1/canvas/{canvas_id}/messages/{message_id}"""
 
@@ -124,6 +219,8 @@ class SSEDocumentationResponse(BaseModel):
 
 logger = logging.getLogger(__name__)
 registry = get_local_registry()
+content_store = get_local_content_store()
+blob_store = get_local_blob_store()
 event_dispatcher = get_event_dispatcher()
 API_PREFIX = "/api/v1"
 
@@ -162,8 +259,8 @@ def list_canvases() -> CanvasListResponse:
     return CanvasListResponse(canvases=items)
 
 
-@v1_router.get("/canvas")
-def get_canvas(canvas_id: str = Query(..., description="Canvas UUID")) -> GetCanvasResponse:
+@v1_router.get("/canvas", response_model=GetCanvasResponse)
+def get_canvas(canvas_id: str = Query(..., description="Canvas UUID")) -> Response:
     """Get a full canvas by ID.
     Args:
         canvas_id: Canvas UUID to retrieve
@@ -178,10 +275,15 @@ def get_canvas(canvas_id: str = Query(..., description="Canvas UUID")) -> GetCan
         error_response = ErrorResponse(error="canvas_not_found", message="Canvas not found")
         raise HTTPException(
             status_code=404,
-            detail=error_response.dict(),
+            detail=error_response.model_dump(),
         )
 
-    return GetCanvasResponse(data=c.to_canvas_data())
+    # Serialized straight from a snapshot, so commits made meanwhile neither wait nor show up.
+    # Each stored node is built once and encoded without validating or copying the canvas again.
+    snapshot = c.snapshot()
+    data: CanvasData = {**snapshot.to_canvas_data(), "nodes": dict(snapshot.nodes.items())}
+    response = GetCanvasResponse.model_construct(data=data)
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @v1_router.post("/canvas")
@@ -193,7 +295,12 @@ async def create_canvas(request: CreateCanvasRequest) -> CreateCanvasResponse:
         CreateCanvasResponse with the canvas ID and success message
     """
 
-    canvas = Canvas(title=request.title, description=request.description)
+    canvas = Canvas(
+        title=request.title,
+        description=request.description,
+        node_store=CompactNodeStore(),
+        content_store=content_store,
+    )
     registry.add(canvas)
     logger.info(f"Created canvas {canvas.canvas_id}")
 
@@ -213,6 +320,7 @@ async def delete_canvas(canvas_id: str = Path(..., description="Canvas UUID to d
     Raises:
         HTTPException: 404 if canvas not found
     """
+    canvas = registry.get(canvas_id)
     removed = registry.remove(canvas_id)
     if not removed:
         error_response = ErrorResponse(error="canvas_not_found", message="Canvas not found")
@@ -220,6 +328,8 @@ async def delete_canvas(canvas_id: str = Path(..., description="Canvas UUID to d
             status_code=404,
             detail=error_response.dict(),
         )
+    if canvas:
+        canvas.release_content()
     logger.info(f"Deleted canvas {canvas_id}")
 
     # Trigger canvas deleted event
@@ -228,6 +338,37 @@ async def delete_canvas(canvas_id: str = Path(..., description="Canvas UUID to d
     return DeleteCanvasResponse(canvas_id=canvas_id, message="Canvas deleted successfully")
 
 
+@v1_router.post("/canvas/{canvas_id}/fork")
+async def fork_canvas(
+    request: ForkCanvasRequest,
+    canvas_id: str = Path(..., description="Canvas UUID to fork"),
+) -> CreateCanvasResponse:
+    """Fork a canvas without copying its messages.
+    Args:
+        canvas_id: Canvas UUID to fork
+        request: Optional title and description for the fork (defaults to those of the canvas)
+    Returns:
+        CreateCanvasResponse with the ID of the fork and success message
+    Raises:
+        HTTPException: 404 if canvas not found
+    """
+    canvas = registry.get(canvas_id)
+    if not canvas:
+        error_response = ErrorResponse(error="canvas_not_found", message="Canvas not found")
+        raise HTTPException(
+            status_code=404,
+            detail=error_response.model_dump(),
+        )
+    forked = canvas.fork(title=request.title, description=request.description)
+    registry.add(forked)
+    logger.info(f"Forked canvas {canvas_id} into {forked.canvas_id}")
+
+    # Trigger canvas created event
+    await event_dispatcher.canvas_created(forked.to_summary())
+
+    return CreateCanvasResponse(canvas_id=forked.canvas_id, message="Canvas forked successfully")
+
+
 @v1_router.post("/canvas/{canvas_id}/messages")
 async def commit_message(
     request: CommitMessageRequest,
@@ -258,12 +399,12 @@ async def commit_message(
             status_code=400,
             detail=error_response2.model_dump(),
         )
-    # Commit the message to the canvas
-    canvas.nodes[node_data["id"]] = node_data
+    # Commit the message to the canvas; the server links it into its parents' child_ids
+    stored_node = canvas.insert_node(node_data)
     logger.info(f"Committed message {node_data['id']} to canvas {canvas_id}")
 
-    # Trigger message committed event
-    await event_dispatcher.message_committed(canvas_id, node_data)
+    # Broadcast the stored node, whose images refer to the blob endpoint instead of being inlined
+    await event_dispatcher.message_committed(canvas_id, stored_node)
 
     return CreateMessageResponse(
         message_id=node_data["id"],
@@ -272,6 +413,50 @@ async def commit_message(
     )
 
 
+@v1_router.post("/canvas/{canvas_id}/messages/batch")
+async def commit_messages(
+    request: CommitMessagesRequest,
+    canvas_id: str = Path(..., description="Canvas UUID"),
+) -> CreateMessagesResponse:
+    """Commit a batch of new messages to a canvas in one request.
+    Args:
+        canvas_id: Canvas UUID to add messages to
+        request: Canvas commit messages event data, parents before children
+    Returns:
+        CreateMessagesResponse with the message IDs and success message
+    Raises:
+        HTTPException: 404 if canvas not found, 400 if any node already exists
+    """
+    canvas = registry.get(canvas_id)
+    if not canvas:
+        error_response = ErrorResponse(error="canvas_not_found", message="Canvas not found")
+        raise HTTPException(
+            status_code=404,
+            detail=error_response.model_dump(),
+        )
+    nodes_data = request.data["data"]
+    # check if any node id already exist before storing anything
+    node_ids = [node_data["id"] for node_data in nodes_data]
+    if len(set(node_ids)) != len(node_ids) or any(canvas.get_node(node_id) for node_id in node_ids):
+        error_response2 = ErrorResponse(error="node_already_exists", message="Node already exists")
+        raise HTTPException(
+            status_code=400,
+            detail=error_response2.model_dump(),
+        )
+    # Commit the messages to the canvas, linking each one to its parent
+    stored_nodes = canvas.insert_nodes(nodes_data)
+    logger.info(f"Committed {len(nodes_data)} messages to canvas {canvas_id}")
+
+    # Trigger a single messages committed event for the whole batch
+    await event_dispatcher.messages_committed(canvas_id, stored_nodes)
+
+    return CreateMessagesResponse(
+        message_ids=node_ids,
+        canvas_id=canvas_id,
+        message="Messages committed successfully",
+    )
+
+
 @v1_router.put("/canvas/{canvas_id}/messages/{message_id}")
 async def update_message(
     request: UpdateMessageRequest,
@@ -306,11 +491,12 @@ async def update_message(
     # Extract message data from the event
     node_data = request.data["data"]
     # Update the message in the canvas
-    canvas.update_message(message_id, node_data)
+    # Links are owned by the server, so broadcast the stored node rather than the request body
+    updated_node = canvas.update_message(message_id, node_data)
     logger.info(f"Updated message {message_id} in canvas {canvas_id}")
 
     # Trigger message updated event
-    await event_dispatcher.message_updated(canvas_id, node_data)
+    await event_dispatcher.message_updated(canvas_id, updated_node)
 
     return CreateMessageResponse(
         message_id=message_id,
@@ -319,6 +505,390 @@ async def update_message(
     )
 
 
+@v1_router.post("/canvas/{canvas_id}/messages/{message_id}/delta")
+async def apply_message_delta(
+    request: MessageDeltaRequest,
+    canvas_id: str = Path(..., description="Canvas UUID"),
+    message_id: str = Path(..., description="Message ID to change"),
+) -> CreateMessageResponse:
+    """Append text to a message and/or set meta keys without resending the whole message.
+    Args:
+        canvas_id: Canvas UUID containing the message
+        message_id: Message ID to change
+        request: Canvas message delta event data
+    Returns:
+        CreateMessageResponse with the message ID and success message
+    Raises:
+        HTTPException: 404 if canvas or message not found, 400 if the delta does not fit the message
+    """
+    canvas = registry.get(canvas_id)
+    if not canvas:
+        error_response = ErrorResponse(error="canvas_not_found", message="Canvas not found")
+        raise HTTPException(
+            status_code=404,
+            detail=error_response.model_dump(),
+        )
+    if canvas.get_node(message_id) is None:
+        error_response2 = ErrorResponse(error="message_not_found", message="Message not found")
+        raise HTTPException(
+            status_code=404,
+            detail=error_response2.model_dump(),
+        )
+    delta: MessageDelta = {**request.data["data"], "id": message_id}
+    try:
+        canvas.apply_message_delta(delta)
+    except ValueError as e:
+        error_response3 = ErrorResponse(error="invalid_delta", message=str(e))
+        raise HTTPException(
+            status_code=400,
+            detail=error_response3.model_dump(),
+        ) from e
+    logger.debug(f"Applied delta to message {message_id} in canvas {canvas_id}")
+
+    # Viewers receive the delta only, so streaming costs bandwidth proportional to the new text
+    await event_dispatcher.message_delta(canvas_id, delta)
+
+    return CreateMessageResponse(
+        message_id=message_id,
+        canvas_id=canvas_id,
+        message="Message delta applied successfully",
+    )
+
+
+@v1_router.delete("/canvas/{canvas_id}/messages/{message_id}")
+async def delete_message(
+    canvas_id: str = Path(..., description="Canvas UUID"),
+    message_id: str = Path(..., description="Message ID to delete"),
+) -> DeleteMessageResponse:
+    """Delete a message that has no children from a canvas.
+    Args:
+        canvas_id: Canvas UUID containing the message
+        message_id: Message ID to delete
+    Returns:
+        DeleteMessageResponse with the message ID and success message
+    Raises:
+        HTTPException: 404 if canvas or message not found, 409 if the message still has children
+    """
+    canvas = registry.get(canvas_id)
+    if not canvas:
+        error_response = ErrorResponse(error="canvas_not_found", message="Canvas not found")
+        raise HTTPException(
+            status_code=404,
+            detail=error_response.model_dump(),
+        )
+    node = canvas.get_node(message_id)
+    if node is None:
+        error_response2 = ErrorResponse(error="message_not_found", message="Message not found")
+        raise HTTPException(
+            status_code=404,
+            detail=error_response2.model_dump(),
+        )
+    if node["child_ids"]:
+        error_response3 = ErrorResponse(error="message_has_children", message="Message still has children")
+        raise HTTPException(
+            status_code=409,
+            detail=error_response3.model_dump(),
+        )
+    canvas.remove_node(message_id)
+    logger.info(f"Deleted message {message_id} from canvas {canvas_id}")
+
+    # Trigger message deleted event
+    await event_dispatcher.message_deleted(canvas_id, message_id)
+
+    return DeleteMessageResponse(
+        message_id=message_id,
+        canvas_id=canvas_id,
+        message="Message deleted successfully",
+    )
+
+
+@v1_router.get("/canvas/{canvas_id}/diff")
+def diff_messages(
+    canvas_id: str = Path(..., description="Canvas UUID"),
+    a: str = Query(..., description="Last message ID of the first history, e.g. a branch HEAD"),
+    b: str = Query(..., description="Last message ID of the second history, e.g. a branch HEAD"),
+) -> CanvasDiffResponse:
+    """Get the messages unique to each of two histories since their merge base.
+    Args:
+        canvas_id: Canvas UUID containing the messages
+        a: Last message ID of the first history
+        b: Last message ID of the second history
+    Returns:
+        CanvasDiffResponse with the merge base ID and the divergent messages of each history
+    Raises:
+        HTTPException: 404 if canvas or message not found
+    """
+    canvas = registry.get(canvas_id)
+    if not canvas:
+        error_response = ErrorResponse(error="canvas_not_found", message="Canvas not found")
+        raise HTTPException(
+            status_code=404,
+            detail=error_response.model_dump(),
+        )
+    for message_id in (a, b):
+        if canvas.get_node(message_id) is None:
+            error_response2 = ErrorResponse(error="message_not_found", message=f"Message '{message_id}' not found")
+            raise HTTPException(
+                status_code=404,
+                detail=error_response2.model_dump(),
+            )
+
+    return CanvasDiffResponse(data=canvas.diff_nodes(a, b))
+
+
+_BRANCH_HEADS = Query(..., description="Last message ID of a branch, e.g. a client's branch HEAD (repeatable)")
+
+
+@v1_router.get("/canvas/{canvas_id}/messages/{message_id}/branches")
+def get_message_branches(
+    canvas_id: str = Path(..., description="Canvas UUID"),
+    message_id: str = Path(..., description="Message ID"),
+    head: list[str] = _BRANCH_HEADS,
+) -> MessageBranchesResponse:
+    """Get which branch HEADs include a message in their history. Branches live in clients, so they send their HEADs.
+    Args:
+        canvas_id: Canvas UUID containing the message
+        message_id: Message ID to look up
+        head: Branch HEAD message IDs to check
+    Returns:
+        MessageBranchesResponse with the HEADs including the message, in request order
+    Raises:
+        HTTPException: 404 if canvas or message not found
+    """
+    canvas = registry.get(canvas_id)
+    if not canvas:
+        error_response = ErrorResponse(error="canvas_not_found", message="Canvas not found")
+        raise HTTPException(
+            status_code=404,
+            detail=error_response.model_dump(),
+        )
+    if canvas.get_node(message_id) is None:
+        error_response2 = ErrorResponse(error="message_not_found", message="Message not found")
+        raise HTTPException(
+            status_code=404,
+            detail=error_response2.model_dump(),
+        )
+    return MessageBranchesResponse(heads=canvas.heads_containing(message_id, head))
+
+
+@v1_router.get("/canvas/{canvas_id}/changes")
+def get_canvas_changes(
+    canvas_id: str = Path(..., description="Canvas UUID"),
+    since: int = Query(..., ge=0, description="Version the client has already seen"),
+) -> CanvasChangesResponse:
+    """Get the changes made to a canvas after a version.
+    Args:
+        canvas_id: Canvas UUID to read the changes of
+        since: Version the client has already seen (from a previous response)
+    Returns:
+        CanvasChangesResponse with the current version and either the changes since the given
+        version or, when they are no longer retained, a full snapshot of the canvas
+    Raises:
+        HTTPException: 404 if canvas not found
+    """
+    canvas = registry.get(canvas_id)
+    if not canvas:
+        error_response = ErrorResponse(error="canvas_not_found", message="Canvas not found")
+        raise HTTPException(
+            status_code=404,
+            detail=error_response.model_dump(),
+        )
+
+    changes = canvas.changes_since(since)
+    if changes is None:
+        snapshot = canvas.snapshot()
+        return CanvasChangesResponse(version=snapshot.version, snapshot=snapshot.to_canvas_data())
+    version = changes[-1]["version"] if changes else since
+    return CanvasChangesResponse(version=version, changes=changes)
+
+
+@v1_router.get("/canvas/{canvas_id}/search")
+def search_canvas(
+    canvas_id: str = Path(..., description="Canvas UUID"),
+    q: str = Query(..., min_length=1, description="Words to search for"),
+    limit: int = Query(20, ge=1, le=1000, description="Maximum number of results"),
+) -> CanvasSearchResponse:
+    """Search the text and tool results of a canvas's messages.
+    Args:
+        canvas_id: Canvas UUID to search
+        q: Words to search for (case-insensitive)
+        limit: Maximum number of results
+    Returns:
+        CanvasSearchResponse with the matching message IDs, best matches first, and snippets
+    Raises:
+        HTTPException: 404 if canvas not found
+    """
+    canvas = registry.get(canvas_id)
+    if not canvas:
+        error_response = ErrorResponse(error="canvas_not_found", message="Canvas not found")
+        raise HTTPException(
+            status_code=404,
+            detail=error_response.model_dump(),
+        )
+    return CanvasSearchResponse(hits=canvas.search(q, limit))
+
+
+def _search_filters(
+    role: Union[str, None] = Query(None, description="Only messages with one of these comma-separated roles"),
+    block_type: Union[str, None] = Query(None, description="Only messages with a block of one of these comma-separated types"),
+    since: Union[float, None] = Query(None, description="Only messages with a timestamp at or after this Unix time"),
+    until: Union[float, None] = Query(None, description="Only messages with a timestamp at or before this Unix time"),
+) -> SearchFilters:
+    """Get the search filters from the query parameters of a search request."""
+    filters: SearchFilters = {}
+    if role:
+        filters["roles"] = role.split(",")
+    if block_type:
+        filters["block_types"] = block_type.split(",")
+    if since is not None:
+        filters["since"] = since
+    if until is not None:
+        filters["until"] = until
+    return filters
+
+
+_SEARCH_FILTERS = Depends(_search_filters)
+
+
+@v1_router.get("/search")
+def search_canvases(
+    q: str = Query(..., min_length=1, description="Words to search for"),
+    limit: int = Query(20, ge=1, le=1000, description="Maximum number of results"),
+    filters: SearchFilters = _SEARCH_FILTERS,
+) -> RegistrySearchResponse:
+    """Search the messages of every canvas.
+    Args:
+        q: Words to search for (case-insensitive)
+        limit: Maximum number of results
+        filters: Role (e.g. role=user,assistant), block type (e.g. block_type=tool_use; "text"
+            includes plain string content) and timestamp (since, until) conditions
+    Returns:
+        RegistrySearchResponse with the matching messages and their canvas IDs, best matches first
+    """
+    return RegistrySearchResponse(hits=registry.search(q, limit, filters))
+
+
+_META_INDEX_KIND = Query("hash", description="hash for equality or sorted for numeric range conditions")
+
+
+@v1_router.put("/canvas/{canvas_id}/meta_indexes/{key}")
+def create_meta_index(
+    canvas_id: str = Path(..., description="Canvas UUID"),
+    key: str = Path(..., description="Meta key to index"),
+    kind: MetaIndexKind = _META_INDEX_KIND,
+) -> MetaIndexesResponse:
+    """Index the nodes of a canvas by a meta key, so nodes/query can filter on it. Creating an index that exists does nothing.
+    Args:
+        canvas_id: Canvas UUID to index
+        key: Meta key to index
+        kind: Kind of index to create
+    Returns:
+        MetaIndexesResponse with every index of the canvas
+    Raises:
+        HTTPException: 404 if canvas not found
+    """
+    canvas = registry.get(canvas_id)
+    if not canvas:
+        error_response = ErrorResponse(error="canvas_not_found", message="Canvas not found")
+        raise HTTPException(
+            status_code=404,
+            detail=error_response.model_dump(),
+        )
+    canvas.create_meta_index(key, kind)
+    return MetaIndexesResponse(indexes=[MetaIndexInfo(key=key, kind=kind) for key, kind in canvas.meta_indexes])
+
+
+@v1_router.delete("/canvas/{canvas_id}/meta_indexes/{key}")
+def drop_meta_index(
+    canvas_id: str = Path(..., description="Canvas UUID"),
+    key: str = Path(..., description="Indexed meta key"),
+    kind: MetaIndexKind = _META_INDEX_KIND,
+) -> MetaIndexesResponse:
+    """Remove a meta index of a canvas, if it exists.
+    Args:
+        canvas_id: Canvas UUID
+        key: Indexed meta key
+        kind: Kind of index to remove
+    Returns:
+        MetaIndexesResponse with the remaining indexes of the canvas
+    Raises:
+        HTTPException: 404 if canvas not found
+    """
+    canvas = registry.get(canvas_id)
+    if not canvas:
+        error_response = ErrorResponse(error="canvas_not_found", message="Canvas not found")
+        raise HTTPException(
+            status_code=404,
+            detail=error_response.model_dump(),
+        )
+    canvas.drop_meta_index(key, kind)
+    return MetaIndexesResponse(indexes=[MetaIndexInfo(key=key, kind=kind) for key, kind in canvas.meta_indexes])
+
+
+@v1_router.post("/canvas/{canvas_id}/nodes/query")
+def query_nodes(
+    request: QueryNodesRequest,
+    canvas_id: str = Path(..., description="Canvas UUID"),
+) -> QueryNodesResponse:
+    """Find the nodes of a canvas whose meta matches equality and numeric range conditions.
+    Args:
+        request: Values meta keys must equal, inclusive [low, high] bounds (null for open) and an optional limit
+        canvas_id: Canvas UUID to query
+    Returns:
+        QueryNodesResponse with the matching nodes, ordered by the first range key or oldest first
+    Raises:
+        HTTPException: 404 if canvas not found, 400 if the query has no conditions or a key has no index
+    """
+    canvas = registry.get(canvas_id)
+    if not canvas:
+        error_response = ErrorResponse(error="canvas_not_found", message="Canvas not found")
+        raise HTTPException(
+            status_code=404,
+            detail=error_response.model_dump(),
+        )
+    if not request.equals and not request.ranges:
+        error_response2 = ErrorResponse(error="invalid_query", message="A query needs at least one condition")
+        raise HTTPException(
+            status_code=400,
+            detail=error_response2.model_dump(),
+        )
+    # Keys are only queried through the indexes declared with PUT meta_indexes, never by scanning the canvas
+    try:
+        nodes = canvas.query_nodes(request.equals, request.ranges, request.limit)
+    except ValueError as e:
+        error_response3 = ErrorResponse(error="meta_key_not_indexed", message=str(e))
+        raise HTTPException(
+            status_code=400,
+            detail=error_response3.model_dump(),
+        ) from e
+    return QueryNodesResponse(nodes=nodes)
+
+
+@v1_router.get("/blobs/{digest}", response_class=Response)
+def get_blob(digest: str = Path(..., description="Blob digest from an image URL")) -> Response:
+    """Get the data of an image moved out of message content.
+    Args:
+        digest: Blob digest, the last segment of the image URL in the message
+    Returns:
+        The image bytes with their media type; blobs never change, so they may be cached forever
+    Raises:
+        HTTPException: 404 if blob not found
+    """
+    blob = blob_store.get(digest)
+    if blob is None:
+        error_response = ErrorResponse(error="blob_not_found", message="Blob not found")
+        raise HTTPException(
+            status_code=404,
+            detail=error_response.model_dump(),
+        )
+    data, media_type = blob
+    return Response(
+        content=data,
+        media_type=media_type,
+        headers={"Cache-Control": "public, max-age=31536000, immutable", "ETag": f'"{digest}"'},
+    )
+
+
 # ---- SSE Endpoints ----
 @v1_router.get("/canvas/sse")
 async def canvas_sse() -> StreamingResponse:
@@ -378,7 +948,9 @@ async def canvas_message_sse(canvas_id: str = Path(..., description="Canvas UUID
     Sends events when messages are added, updated, or deleted in a specific canvas.
     Events include:
     - message_committed: When a new message is added to the canvas
+    - messages_committed: When a batch of messages is added to the canvas
     - message_updated: When an existing message is updated
+    - message_delta: When text is appended to a message or meta keys are set (carries only the change)
     - message_deleted: When a message is deleted
 
     Args:
@@ -15,6 +15,7 @@ from collections.abc import AsyncGenerator
 
 from llm_canvas.types import (
     CanvasSummary,
+    MessageDelta,
     MessageNode,
 )
 
@@ -26,6 +27,8 @@ from ._types import (
     SSEGlobalEvent,
     SSEMessageCommittedEvent,
     SSEMessageDeletedEvent,
+    SSEMessageDeltaEvent,
+    SSEMessagesCommittedEvent,
     SSEMessageUpdatedEvent,
 )
 
@@ -153,6 +156,15 @@ class SSEEventDispatcher:
             SSEMessageCommittedEvent(type="message_committed", timestamp=time.time(), canvas_id=canvas_id, data=message_data),
         )
 
+    async def messages_committed(self, canvas_id: str, messages_data: list[MessageNode]) -> None:
+        """Broadcast that a batch of messages was committed to a canvas."""
+        await self.broadcast_canvas_event(
+            canvas_id,
+            SSEMessagesCommittedEvent(
+                type="messages_committed", timestamp=time.time(), canvas_id=canvas_id, data=messages_data
+            ),
+        )
+
     async def message_updated(self, canvas_id: str, message_data: MessageNode) -> None:
         """Broadcast that a message was updated in a canvas."""
         await self.broadcast_canvas_event(
@@ -160,6 +172,13 @@ class SSEEventDispatcher:
             SSEMessageUpdatedEvent(type="message_updated", timestamp=time.time(), canvas_id=canvas_id, data=message_data),
         )
 
+    async def message_delta(self, canvas_id: str, delta: MessageDelta) -> None:
+        """Broadcast an incremental change to a message in a canvas."""
+        await self.broadcast_canvas_event(
+            canvas_id,
+            SSEMessageDeltaEvent(type="message_delta", timestamp=time.time(), canvas_id=canvas_id, data=delta),
+        )
+
     async def message_deleted(self, canvas_id: str, message_id: str) -> None:
         """Broadcast that a message was deleted from a canvas."""
         await self.broadcast_canvas_event(
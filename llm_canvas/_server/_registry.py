@@ -2,15 +2,38 @@ from __future__ import annotations
 
 from typing import Union
 
+from llm_canvas.blob_store import BlobStore
 from llm_canvas.canvas_registry import CanvasRegistry
+from llm_canvas.content_store import ContentStore
 
 _local_registry: Union[CanvasRegistry, None] = None
+_local_content_store: Union[ContentStore, None] = None
+_local_blob_store: Union[BlobStore, None] = None
 
 
 def get_local_registry() -> CanvasRegistry:
     global _local_registry  # noqa: PLW0603
 
     if _local_registry is None:
-        _local_registry = CanvasRegistry()
+        _local_registry = CanvasRegistry(search=True)
 
     return _local_registry
+
+
+def get_local_content_store() -> ContentStore:
+    global _local_content_store  # noqa: PLW0603
+
+    if _local_content_store is None:
+        # Images are served from the blob endpoint instead of being inlined in canvas JSON
+        _local_content_store = ContentStore(blob_store=get_local_blob_store())
+
+    return _local_content_store
+
+
+def get_local_blob_store() -> BlobStore:
+    global _local_blob_store  # noqa: PLW0603
+
+    if _local_blob_store is None:
+        _local_blob_store = BlobStore()
+
+    return _local_blob_store
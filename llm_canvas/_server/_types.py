@@ -6,9 +6,11 @@ keeping them private to the server implementation.
 
 from __future__ import annotations
 
-from typing import Literal, TypedDict, Union
+from typing import Literal, Union
 
-from llm_canvas.types import CanvasSummary, MessageNode
+from typing_extensions import TypedDict
+
+from llm_canvas.types import CanvasSummary, MessageDelta, MessageNode
 
 # ---- SSE Event Types ----
 
@@ -17,7 +19,9 @@ SSEEventType = Literal[
     "canvas_updated",
     "canvas_deleted",
     "message_committed",
+    "messages_committed",
     "message_updated",
+    "message_delta",
     "message_deleted",
     "heartbeat",
     "error",
@@ -70,6 +74,15 @@ class SSEMessageCommittedEvent(TypedDict):
     data: MessageNode
 
 
+class SSEMessagesCommittedEvent(TypedDict):
+    """SSE event data for a batch of messages committed together."""
+
+    type: Literal["messages_committed"]
+    timestamp: float
+    canvas_id: str
+    data: list[MessageNode]
+
+
 class SSEMessageUpdatedEvent(TypedDict):
     """SSE event data for message updates."""
 
@@ -79,6 +92,15 @@ class SSEMessageUpdatedEvent(TypedDict):
     data: MessageNode
 
 
+class SSEMessageDeltaEvent(TypedDict):
+    """SSE event data for incremental message changes (only the new text and meta keys)."""
+
+    type: Literal["message_delta"]
+    timestamp: float
+    canvas_id: str
+    data: MessageDelta
+
+
 class SSEMessageDeletedEventData(TypedDict):
     """Data payload for message deleted events."""
 
@@ -120,7 +142,13 @@ SSEGlobalEvent = Union[SSECanvasCreatedEvent, SSECanvasUpdatedEvent, SSECanvasDe
 
 # Union type for all SSE canvas-specific message events
 SSECanvasEvent = Union[
-    SSEMessageCommittedEvent, SSEMessageUpdatedEvent, SSEMessageDeletedEvent, SSEHeartbeatEvent, SSEErrorEvent
+    SSEMessageCommittedEvent,
+    SSEMessagesCommittedEvent,
+    SSEMessageUpdatedEvent,
+    SSEMessageDeltaEvent,
+    SSEMessageDeletedEvent,
+    SSEHeartbeatEvent,
+    SSEErrorEvent,
 ]
 
 # Union type for all SSE events
@@ -0,0 +1,182 @@
+"""Out-of-line storage for image data.
+
+Base64 image blocks make message content large: every canvas fetch and every event that
+carries the message repeats the encoded image. A BlobStore keeps the decoded bytes of each
+distinct image once, keyed by a hash of the bytes and reference counted like the
+ContentStore, and image blocks refer to it with a URL source instead:
+
+    {"type": "image", "source": {"type": "url", "url": "/api/v1/blobs/<hash>"}}
+
+Blobs are immutable, so their URLs can be cached forever. A ContentStore created with a
+blob store moves the images of the content it interns into it (see ContentStore), and
+inline_blobs turns the URL references back into base64 images, e.g. for a client whose
+canvases are sent to an LLM API that cannot fetch the URLs.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import threading
+from typing import Callable, Union
+
+from anthropic.types import ImageBlockParam
+
+from llm_canvas.types import MessageBlock
+
+BlobFetcher = Callable[[str], Union[tuple[bytes, str], None]]
+
+
+def blob_digest(data: bytes) -> str:
+    """Compute the address of a blob."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def inline_blobs(
+    content: Union[str, list[MessageBlock]], fetch: BlobFetcher, url_prefix: str = "/api/v1/blobs/"
+) -> Union[str, list[MessageBlock]]:
+    """
+    Replace the blob URL references of message content with base64 images.
+
+    Args:
+        content: The message content
+        fetch: Gets the bytes and media type of a blob by digest, or None if it is missing
+        url_prefix: The URL blob digests are appended to in image references
+
+    Returns:
+        The content with base64 images in place of the blob URLs that could be fetched (the
+        same object when it has none)
+    """
+    if isinstance(content, str):
+        return content
+
+    inlined = False
+    blocks: list[MessageBlock] = []
+    for block in content:
+        if block["type"] != "image":
+            blocks.append(block)
+            continue
+        source = block["source"]
+        if source["type"] != "url" or not source["url"].startswith(url_prefix):
+            blocks.append(block)
+            continue
+        blob = fetch(source["url"][len(url_prefix) :])
+        if blob is None:
+            blocks.append(block)
+            continue
+        data, media_type = blob
+        encoded = base64.b64encode(data).decode()
+        image: ImageBlockParam = {
+            **block,
+            "source": {"type": "base64", "media_type": media_type, "data": encoded},  # type: ignore[typeddict-item]
+        }
+        blocks.append(image)
+        inlined = True
+    return blocks if inlined else content
+
+
+class _BlobEntry:
+    __slots__ = ("data", "media_type", "ref_count")
+
+    def __init__(self, data: bytes, media_type: str) -> None:
+        self.data = data
+        self.media_type = media_type
+        self.ref_count = 0
+
+
+class BlobStore:
+    """Thread-safe, reference-counted store of image data served by URL."""
+
+    def __init__(self, url_prefix: str = "/api/v1/blobs/") -> None:
+        """
+        Create a blob store.
+
+        Args:
+            url_prefix: The URL a blob digest is appended to in image references
+        """
+        self.url_prefix = url_prefix
+        self._entries: dict[str, _BlobEntry] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, digest: object) -> bool:
+        return digest in self._entries
+
+    def add(self, data: bytes, media_type: str) -> str:
+        """
+        Add a reference to a blob.
+
+        Args:
+            data: The blob bytes
+            media_type: The media type to serve the blob with, e.g. "image/png"
+
+        Returns:
+            The blob digest
+        """
+        digest = blob_digest(data)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                entry = self._entries[digest] = _BlobEntry(data, media_type)
+            entry.ref_count += 1
+        return digest
+
+    def release(self, digest: str) -> None:
+        """Drop one reference to a blob, freeing it when no references remain."""
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return
+            entry.ref_count -= 1
+            if entry.ref_count <= 0:
+                del self._entries[digest]
+
+    def get(self, digest: str) -> Union[tuple[bytes, str], None]:
+        """Get the bytes and media type of a blob by digest."""
+        with self._lock:
+            entry = self._entries.get(digest)
+            return (entry.data, entry.media_type) if entry is not None else None
+
+    def url(self, digest: str) -> str:
+        """Get the URL image blocks use to refer to a blob."""
+        return self.url_prefix + digest
+
+    def externalize(self, content: Union[str, list[MessageBlock]]) -> tuple[Union[str, list[MessageBlock]], list[str]]:
+        """
+        Move the base64 images of message content into the store.
+
+        A reference is added for each moved image; release them when the content is dropped.
+
+        Args:
+            content: The message content
+
+        Returns:
+            The content with URL references in place of base64 images (the same object when
+            it has none), and the digests of the moved images
+        """
+        if isinstance(content, str):
+            return content, []
+
+        digests: list[str] = []
+        blocks: list[MessageBlock] = []
+        for block in content:
+            if block["type"] != "image":
+                blocks.append(block)
+                continue
+            source = block["source"]
+            if source["type"] != "base64" or not isinstance(source["data"], str):
+                blocks.append(block)
+                continue
+            try:
+                data = base64.b64decode(source["data"], validate=True)
+            except (binascii.Error, ValueError):
+                blocks.append(block)
+                continue
+            digest = self.add(data, source["media_type"])
+            digests.append(digest)
+            image: ImageBlockParam = {**block, "source": {"type": "url", "url": self.url(digest)}}
+            blocks.append(image)
+        return (blocks, digests) if digests else (content, [])
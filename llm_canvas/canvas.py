@@ -1,26 +1,193 @@
 from __future__ import annotations
 
+import bisect
 import logging
 import threading
 import time
 import uuid
-from collections.abc import Iterable
-from typing import Any, Callable, Union
-
+import weakref
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Literal, Union
+
+from anthropic.types import MessageParam, TextBlockParam
+from openai.types.chat import ChatCompletionMessageParam
+
+from llm_canvas._ancestry import AncestryIndex
+from llm_canvas._collector import GarbageCollector
+from llm_canvas._layered import LayeredMapping
+from llm_canvas._meta_index import HashIndex, MetaIndex, SortedIndex, create_meta_index
+from llm_canvas._search import CorpusStatistics, SearchCorpus, SearchIndex, message_text, snippet, tokenize
+from llm_canvas.content_store import ContentStore
+from llm_canvas.ids import NodeIdFactory, ulid_bound, ulid_timestamp, uuid4_id
+from llm_canvas.node_store import CompactNodeStore, NodeStore
+from llm_canvas.openai_format import OpenAIMessage, from_openai_messages, to_openai_messages
+from llm_canvas.tokens import TokenCounter, approximate_token_count
 from llm_canvas.types import (
+    AnthropicPrompt,
+    BranchComparison,
+    BranchDiff,
     BranchInfo,
+    CanvasChange,
     CanvasCommitMessageEvent,
+    CanvasCommitMessagesEvent,
     CanvasData,
+    CanvasDeleteMessageEvent,
     CanvasEvent,
+    CanvasMessageDeltaEvent,
     CanvasSummary,
     CanvasUpdateMessageEvent,
     Message,
+    MessageBlock,
+    MessageDelta,
     MessageNode,
+    MetaIndexKind,
+    OpenAIPrompt,
+    SearchFilters,
+    SearchHit,
+    TruncationStrategy,
 )
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of locks that branch names are striped over
+_BRANCH_LOCK_STRIPES = 16
+
+# Number of recent changes kept for changes_since
+_CHANGELOG_SIZE = 1000
+
+
+class _SharedContentReferences:
+    """Content references held jointly by forked canvases and released by the last of them."""
+
+    __slots__ = ("digests", "holders")
+
+    _lock = threading.Lock()
+
+    def __init__(self, digests: Mapping[str, str]) -> None:
+        self.digests = digests
+        self.holders = 1
+
+    def acquire(self) -> None:
+        with self._lock:
+            self.holders += 1
+
+    def release(self, content_store: ContentStore) -> None:
+        with self._lock:
+            self.holders -= 1
+            if self.holders:
+                return
+        for digest in self.digests.values():
+            content_store.release(digest)
+
+
+def _append_text(
+    content: Union[str, list[MessageBlock]], text: str, block_index: Union[int, None]
+) -> Union[str, list[MessageBlock]]:
+    """Return message content with text appended, see MessageDelta."""
+    if isinstance(content, str):
+        if block_index is not None:
+            raise ValueError("block_index can only be used with a list of content blocks")
+        return content + text
+    if block_index is None:
+        raise ValueError("block_index is required to append to a list of content blocks")
+    if block_index == len(content):
+        return [*content, {"type": "text", "text": text}]
+    existing = content[block_index] if 0 <= block_index < len(content) else None
+    if existing is None or existing["type"] != "text":
+        raise ValueError(f"Content block {block_index} is not a text block")
+    block: TextBlockParam = {**existing, "text": existing["text"] + text}
+    return [*content[:block_index], block, *content[block_index + 1 :]]
+
+
+def _content_text(content: Union[str, list[MessageBlock]]) -> str:
+    """Get the text of message content, joining its text blocks."""
+    if isinstance(content, str):
+        return content
+    return "".join(block["text"] for block in content if block["type"] == "text")
+
+
+def _opens_turn(message: Message) -> bool:
+    """Check whether a history may start at a message: a user message that does not answer a tool call."""
+    content = message["content"]
+    return message["role"] == "user" and (isinstance(content, str) or all(block["type"] != "tool_result" for block in content))
+
+
+def _to_anthropic_message(message: Message) -> MessageParam:
+    """Convert a user or assistant message to the Anthropic Messages API format."""
+    return {"role": message["role"], "content": message["content"]}  # type: ignore[typeddict-item]
+
+
+class MessageStream:
+    """
+    A message being streamed into a canvas, see Branch.stream_message.
+
+    Text appended to the stream is buffered and appended to the message with a message
+    delta at most once per min_interval seconds, or once min_chars characters are buffered.
+    """
+
+    def __init__(self, canvas: Canvas, node: MessageNode, min_interval: float, min_chars: Union[int, None] = None) -> None:
+        self._canvas = canvas
+        self._node = node
+        self._min_interval = min_interval
+        self._min_chars = min_chars
+        self._content = ""
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._last_update = time.monotonic()
+        self._update_count = 0
+
+    @property
+    def node_id(self) -> str:
+        """Get the ID of the message being streamed."""
+        return self._node["id"]
+
+    @property
+    def content(self) -> str:
+        """Get the text streamed so far, including text not written to the canvas yet."""
+        return self._content + "".join(self._pending)
+
+    @property
+    def update_count(self) -> int:
+        """Get the number of updates written to the canvas so far."""
+        return self._update_count
+
+    def append(self, text: str) -> None:
+        """
+        Append a chunk of text, e.g. a text delta from a streaming LLM response.
+
+        Args:
+            text: The text to append
+        """
+        if not text:
+            return
+        self._pending.append(text)
+        self._pending_chars += len(text)
+        if (self._min_chars is not None and self._pending_chars >= self._min_chars) or (
+            time.monotonic() - self._last_update >= self._min_interval
+        ):
+            self.flush()
+
+    def flush(self) -> MessageNode:
+        """
+        Write the buffered text to the message now.
+
+        Returns:
+            The updated MessageNode
+        """
+        if not self._pending:
+            return self._node
+        text = "".join(self._pending)
+        self._content += text
+        self._pending.clear()
+        self._pending_chars = 0
+        self._node = self._canvas.apply_message_delta({"id": self._node["id"], "text": text})
+        self._last_update = time.monotonic()
+        self._update_count += 1
+        return self._node
+
 
 class Branch:
     """Represents a branch within a canvas for linear chat history."""
@@ -60,19 +227,75 @@ class Branch:
         Returns:
             The created MessageNode
         """
-        parent_node = None
+        # Hold the branch lock so concurrent commits to this branch chain instead of forking
+        with self._canvas._branch_lock(self.name):  # noqa: SLF001
+            # Add the message after the current HEAD using the canvas's internal method
+            node = self._canvas.add_message(message, self._branch_info["head_node_id"], meta)
 
-        # Get the current HEAD node if it exists
-        if self._branch_info["head_node_id"]:
-            parent_node = self._canvas.get_node(self._branch_info["head_node_id"])
+            # Update this branch's HEAD
+            self._branch_info["head_node_id"] = node["id"]
 
-        # Add the message using the canvas's internal method
-        node = self._canvas.add_message(message, parent_node["id"] if parent_node else None, meta)
+        return node
+
+    def commit_messages(self, messages: Iterable[Message], meta: Union[dict[str, Any], None] = None) -> list[MessageNode]:
+        """
+        Commit a chain of messages to this branch at once.
 
-        # Update this branch's HEAD
-        self._branch_info["head_node_id"] = node["id"]
+        This is the batch form of commit_message: the messages are appended after the HEAD in
+        order and reported with a single event, which makes importing long transcripts cheap.
 
-        return node
+        Args:
+            messages: The messages to commit, in conversation order
+            meta: Optional metadata applied to every message
+
+        Returns:
+            The created MessageNodes, in conversation order
+        """
+        with self._canvas._branch_lock(self.name):  # noqa: SLF001
+            nodes = self._canvas.add_messages(messages, self._branch_info["head_node_id"], meta)
+
+            # Update this branch's HEAD
+            if nodes:
+                self._branch_info["head_node_id"] = nodes[-1]["id"]
+
+        return nodes
+
+    @contextmanager
+    def stream_message(
+        self,
+        role: Literal["user", "assistant", "system"] = "assistant",
+        meta: Union[dict[str, Any], None] = None,
+        min_interval: float = 0.1,
+        min_chars: Union[int, None] = None,
+    ) -> Iterator[MessageStream]:
+        """
+        Commit a message whose text arrives in chunks, e.g. a streaming LLM response.
+
+        An empty message is committed on entry, so it shows up right away. Appended text is
+        sent as coalesced message deltas (at most one per min_interval seconds, or whenever
+        min_chars characters are buffered) instead of one update per chunk, and the remaining
+        text is sent on exit, also when the block raises. Each delta only carries the new text.
+
+        Example:
+            with branch.stream_message() as stream:
+                for text in response.text_stream:
+                    stream.append(text)
+
+        Args:
+            role: The role of the message
+            meta: Optional metadata for the message
+            min_interval: The minimum number of seconds between two updates
+            min_chars: Optional number of buffered characters that triggers an update sooner
+
+        Yields:
+            The MessageStream to append text to
+        """
+        node = self.commit_message({"content": "", "role": role}, meta)
+        stream = MessageStream(self._canvas, node, min_interval, min_chars)
+        try:
+            yield stream
+        finally:
+            stream.flush()
 
     def update_message(self, node_id: str, updated_message_node: MessageNode) -> MessageNode:
         """
@@ -101,6 +324,118 @@ class Branch:
             return self._canvas.get_node(self._branch_info["head_node_id"])
         return None
 
+    def history(self) -> list[MessageNode]:
+        """
+        Get the linear chat history of this branch.
+
+        Returns:
+            The MessageNodes from the root down to the HEAD node (empty if the branch has no commits)
+        """
+        if self._branch_info["head_node_id"]:
+            return self._canvas.get_path(self._branch_info["head_node_id"])
+        return []
+
+    def token_count(self) -> int:
+        """
+        Get the number of tokens in the history of this branch.
+
+        The total is kept by the canvas as messages are committed, so this does not count
+        the history again (see Canvas.token_counter).
+
+        Returns:
+            The token count of the messages from the root down to the HEAD node (0 if the branch has no commits)
+        """
+        if self._branch_info["head_node_id"]:
+            return self._canvas.path_token_count(self._branch_info["head_node_id"])
+        return 0
+
+    def to_anthropic_messages(
+        self, max_tokens: Union[int, None] = None, strategy: TruncationStrategy = "drop_oldest"
+    ) -> AnthropicPrompt:
+        """
+        Convert the history of this branch to Anthropic Messages API parameters.
+
+        See Canvas.to_anthropic_messages.
+
+        Args:
+            max_tokens: Optional token budget for the history
+            strategy: How to cut the history when it exceeds the budget
+
+        Returns:
+            The system prompt, messages and a report of the dropped messages
+        """
+        if self._branch_info["head_node_id"]:
+            return self._canvas.to_anthropic_messages(self._branch_info["head_node_id"], max_tokens, strategy)
+        return {"system": None, "messages": [], "token_count": 0, "dropped_node_ids": [], "dropped_token_count": 0}
+
+    def to_openai_messages(
+        self, max_tokens: Union[int, None] = None, strategy: TruncationStrategy = "drop_oldest"
+    ) -> OpenAIPrompt:
+        """
+        Convert the history of this branch to OpenAI Chat Completions messages.
+
+        See Canvas.to_openai_messages.
+
+        Args:
+            max_tokens: Optional token budget for the history
+            strategy: How to cut the history when it exceeds the budget
+
+        Returns:
+            The messages and a report of the dropped messages
+        """
+        if self._branch_info["head_node_id"]:
+            return self._canvas.to_openai_messages(self._branch_info["head_node_id"], max_tokens, strategy)
+        return {"messages": [], "token_count": 0, "dropped_node_ids": [], "dropped_token_count": 0}
+
+    def commit_openai_messages(
+        self, messages: Iterable[OpenAIMessage], meta: Union[dict[str, Any], None] = None
+    ) -> list[MessageNode]:
+        """
+        Commit messages in the OpenAI Chat Completions format, e.g. a response message.
+
+        The messages are converted with llm_canvas.openai_format.from_openai_messages, so
+        consecutive tool results are committed as one user message.
+
+        Args:
+            messages: The OpenAI messages, as request parameters or response messages
+            meta: Optional metadata applied to every message
+
+        Returns:
+            The created MessageNodes, in conversation order
+
+        Raises:
+            ValueError: If a message has a role without a canvas equivalent
+        """
+        return self.commit_messages(from_openai_messages(messages), meta)
+
+    def merge_base(self, other: Branch) -> Union[MessageNode, None]:
+        """
+        Get the latest message shared by the history of this branch and another branch.
+
+        Args:
+            other: The branch to compare with
+
+        Returns:
+            The fork point of both branches, or None if they share no history
+        """
+        if self.head_node_id is None or other.head_node_id is None:
+            return None
+        return self._canvas.merge_base(self.head_node_id, other.head_node_id)
+
+    def contains(self, node_id: str) -> bool:
+        """
+        Check whether a message is in the history of this branch, in O(log n) time.
+
+        Raises:
+            ValueError: If the message doesn't exist
+        """
+        if self.head_node_id is None:
+            if self._canvas.get_node(node_id) is None:
+                raise ValueError(f"Node with ID '{node_id}' does not exist")
+            return False
+        merge_base = self._canvas.merge_base(node_id, self.head_node_id)
+        return merge_base is not None and merge_base["id"] == node_id
+
     def checkout(self, name: str, description: Union[str, None] = None, create_if_not_exists: bool = False) -> Branch:
         """
         A convenient method to checkout a branch from this branch's canvas.
@@ -151,20 +486,126 @@ class Branch:
         )
 
 
+class CanvasSnapshot:
+    """A read-only view of a canvas as of one version, see Canvas.snapshot."""
+
+    def __init__(self, canvas: Canvas, nodes: Mapping[str, MessageNode]) -> None:
+        self.canvas_id = canvas.canvas_id
+        self.title = canvas.title
+        self.description = canvas.description
+        self.created_at = canvas.created_at
+        self.last_updated = canvas.last_updated
+        self.version = canvas.version
+        self._nodes = nodes
+
+    @property
+    def nodes(self) -> Mapping[str, MessageNode]:
+        """Get the nodes of the snapshot; they are shared with the canvas and must not be modified."""
+        return self._nodes
+
+    def get_node(self, node_id: str) -> Union[MessageNode, None]:
+        return self._nodes.get(node_id)
+
+    def to_canvas_data(self) -> CanvasData:
+        """Convert the snapshot to CanvasData format without copying the nodes."""
+        return {
+            "canvas_id": self.canvas_id,
+            "created_at": self.created_at,
+            "nodes": self._nodes,
+            "title": self.title,
+            "description": self.description,
+            "last_updated": self.last_updated,
+        }
+
+
 class Canvas:
-    """Represents a DAG of message nodes (LLM conversation branches)."""
+    """Represents a DAG of message nodes (LLM conversation branches).
+
+    A canvas can be shared between threads, e.g. a ThreadPoolExecutor fan-out where each
+    worker commits to its own branch. Two kinds of locks are used:
+
+    - Branch locks, striped by branch name, serialize commits and merges into the same
+      branch, so a branch HEAD is read and advanced atomically. They are held while the
+      commit event is emitted, so listeners see each branch's commits in order.
+    - A structural lock guards the node store, child links, indexes and the branch table.
+      It is only held for the few dictionary operations of a commit; building nodes,
+      hashing content and calling event listeners happen outside of it.
+
+    Commits to different branches do not wait for each other's branch locks, so the time a
+    worker spends between commits (e.g. waiting for an LLM response) overlaps with the
+    commits of other workers. The commits themselves hold the GIL, so more threads do not
+    make back-to-back commits faster (see benchmarks/concurrent_commits.py). Listeners may
+    run concurrently for different branches and must be thread-safe.
+    """
 
     def __init__(
         self,
         canvas_id: Union[str, None] = None,
         title: Union[str, None] = None,
         description: Union[str, None] = None,
+        node_store: Union[NodeStore, None] = None,
+        content_store: Union[ContentStore, None] = None,
     ) -> None:
+        """
+        Create a canvas.
+
+        Args:
+            canvas_id: Optional canvas ID (a UUID is generated when omitted)
+            title: Optional title for the canvas
+            description: Optional description for the canvas
+            node_store: Optional empty mapping used to store nodes, e.g. a CompactNodeStore
+                to reduce memory use (defaults to a plain dict)
+            content_store: Optional ContentStore used to deduplicate message content, which can
+                be shared between canvases (content is not deduplicated when omitted)
+        """
         self.canvas_id = canvas_id or str(uuid.uuid4())
         self.title = title
         self.description = description
         self.created_at = time.time()
-        self._nodes: dict[str, MessageNode] = {}
+        self.last_updated = self.created_at
+        # Sequence number of the last change to the nodes, identifies the state seen by a snapshot
+        self._version = 0
+        # The most recent changes, and the version before the oldest of them
+        self._changelog: deque[CanvasChange] = deque(maxlen=_CHANGELOG_SIZE)
+        self._changelog_start = 0
+        self._nodes: NodeStore = node_store if node_store is not None else {}
+        # IDs of the nodes without a parent, in insertion order, kept up to date for summaries
+        self._root_ids: dict[str, None] = {}
+        # IDs of the nodes without children (the HEADs of the conversations), in insertion order
+        self._leaf_ids: dict[str, None] = {}
+        self._ancestry = AncestryIndex()
+        self._content_store = content_store
+        self._content_digests: MutableMapping[str, str] = {}
+        # References to content of nodes shared with forks of this canvas
+        self._content_shares: list[_SharedContentReferences] = []
+        # Children inserted before their parent, keyed by the missing parent ID
+        self._orphan_child_ids: dict[str, list[str]] = {}
+        # Token counts of the messages, and totals of the paths from their roots down to them.
+        # A path total is only cached while the totals of its ancestors are cached too.
+        self._token_counter: TokenCounter = approximate_token_count
+        self._token_counts: MutableMapping[str, int] = {}
+        self._path_token_counts: MutableMapping[str, int] = {}
+        # Messages converted to provider formats, by format name and node ID
+        self._converted_messages: dict[str, LayeredMapping[str, Any]] = {}
+        # Full-text index, built on the first search and kept up to date from then on
+        self._search_index: Union[SearchIndex, None] = None
+        # Secondary indexes over node meta by key and kind (see create_meta_index). Forks
+        # rebuild theirs on their first query.
+        self._meta_index_keys: list[tuple[str, MetaIndexKind]] = []
+        self._meta_indexes: Union[dict[tuple[str, MetaIndexKind], MetaIndex], None] = {}
+        # Generates the IDs of new nodes, and the sorted IDs of the nodes with time-ordered
+        # IDs (see llm_canvas.ids), built on the first range scan
+        self._node_id_factory: NodeIdFactory = uuid4_id
+        self._time_ordered_ids: Union[list[str], None] = None
+
+        # Garbage collection roots besides branch HEADs (see collect_garbage)
+        self._gc = GarbageCollector()
+        self._pinned_node_ids: set[str] = set()
+        self._detached_branches: weakref.WeakSet[Branch] = weakref.WeakSet()
+
+        # Concurrency control (see the class docstring)
+        self._structure_lock = threading.RLock()
+        self._branch_locks = tuple(threading.RLock() for _ in range(_BRANCH_LOCK_STRIPES))
 
         # Branch management
         self._branches: dict[str, BranchInfo] = {}
@@ -175,6 +616,10 @@ class Canvas:
         self._event_listeners: list[Callable[[CanvasEvent], None]] = []
         self._event_lock = threading.Lock()
 
+    def _branch_lock(self, name: str) -> threading.RLock:
+        """Get the lock guarding commits to the named branch."""
+        return self._branch_locks[hash(name) % _BRANCH_LOCK_STRIPES]
+
     def _initialize_main_branch(self) -> None:
         """Initialize the main branch."""
         self._branches["main"] = {
@@ -208,12 +653,14 @@ class Canvas:
     @property
     def current_branch(self) -> Branch:
         """Get the current branch."""
-        return Branch(self, self._branches[self._current_branch])
+        with self._structure_lock:
+            return Branch(self, self._branches[self._current_branch])
 
     @property
     def branches(self) -> list[Branch]:
         """Get a list of all branches."""
-        return [Branch(self, info) for info in self._branches.values()]
+        with self._structure_lock:
+            return [Branch(self, info) for info in self._branches.values()]
 
     # ---- Public API ----
     def commit_message(self, message: Message, meta: Union[dict[str, Any], None] = None) -> MessageNode:
@@ -267,9 +714,6 @@ class Canvas:
         # Handle detached head checkout (when commit_message is provided without name)
         if commit_message and not name:
             message_id = commit_message["id"]
-            if message_id not in self._nodes:
-                raise ValueError(f"Message with ID '{message_id}' does not exist")
-
             # Create a temporary branch info for detached head
             detached_branch_info: BranchInfo = {
                 "name": f"detached-{message_id[:8]}",
@@ -277,36 +721,48 @@ class Canvas:
                 "head_node_id": message_id,
                 "created_at": time.time(),
             }
-            return Branch(self, detached_branch_info)
+            detached_branch = Branch(self, detached_branch_info)
+
+            with self._structure_lock:
+                if message_id not in self._nodes:
+                    raise ValueError(f"Message with ID '{message_id}' does not exist")
+
+                # Messages committed from a detached HEAD stay alive while the branch is in use
+                self._detached_branches.add(detached_branch)
+                self._gc.shade(message_id)
+            return detached_branch
 
         # Handle regular branch checkout
         if not name:
             raise ValueError("Either name or commit_message must be provided")
 
-        if name not in self._branches:
-            if not create_if_not_exists:
-                raise ValueError(f"Branch '{name}' does not exist")
-
-            # Determine the starting point for the new branch
-            head_node_id = None
-            if commit_message:
-                head_node_id = commit_message["id"]
-            elif self._current_branch in self._branches:
-                head_node_id = self._branches[self._current_branch]["head_node_id"]
-
-            # Create the new branch
-            self._branches[name] = {
-                "name": name,
-                "description": description or f"Branch {name}",
-                "head_node_id": head_node_id,
-                "created_at": time.time(),
-            }
-
-        # Switch to the branch
-        self._current_branch = name
-
-        # Return a Branch object
-        return Branch(self, self._branches[name])
+        with self._structure_lock:
+            if name not in self._branches:
+                if not create_if_not_exists:
+                    raise ValueError(f"Branch '{name}' does not exist")
+
+                # Determine the starting point for the new branch
+                head_node_id = None
+                if commit_message:
+                    head_node_id = commit_message["id"]
+                elif self._current_branch in self._branches:
+                    head_node_id = self._branches[self._current_branch]["head_node_id"]
+
+                # Create the new branch
+                self._branches[name] = {
+                    "name": name,
+                    "description": description or f"Branch {name}",
+                    "head_node_id": head_node_id,
+                    "created_at": time.time(),
+                }
+                if head_node_id is not None:
+                    self._gc.shade(head_node_id)
+
+            # Switch to the branch
+            self._current_branch = name
+
+            # Return a Branch object
+            return Branch(self, self._branches[name])
 
     def list_branches(self) -> list[BranchInfo]:
         """
@@ -315,25 +771,29 @@ class Canvas:
         Returns:
             List of branch information including name and latest commit
         """
-        return list(self._branches.values())
+        with self._structure_lock:
+            return list(self._branches.values())
 
     def delete_branch(self, name: str) -> None:
         """
         Delete a branch.
 
+        Messages that were only reachable from the branch are kept until collect_garbage runs.
+
         Args:
             name: Name of the branch to delete
 
         Raises:
             ValueError: If trying to delete the main branch or current branch
         """
-        if name == self._current_branch:
-            raise ValueError("Cannot delete the current branch. Switch to another branch first.")
+        with self._structure_lock:
+            if name == self._current_branch:
+                raise ValueError("Cannot delete the current branch. Switch to another branch first.")
 
-        if name not in self._branches:
-            raise ValueError(f"Branch '{name}' does not exist")
+            if name not in self._branches:
+                raise ValueError(f"Branch '{name}' does not exist")
 
-        del self._branches[name]
+            del self._branches[name]
 
     def merge(
         self,
@@ -353,7 +813,8 @@ class Canvas:
             The merge commit MessageNode
 
         Raises:
-            ValueError: If branches don't exist or merge is not possible
+            ValueError: If branches don't exist or merge is not possible, including when a
+                source branch is already part of the target branch (a redundant merge)
 
         The merge creates an explicit merge commit that references all source branches,
         preserving the full conversation history and branch structure.
@@ -365,52 +826,253 @@ class Canvas:
         if not source_branch_names:
             raise ValueError("At least one source branch must be specified")
 
-        # Validate all source branches
-        for source_branch_name in source_branch_names:
-            if source_branch_name not in self._branches:
-                raise ValueError(f"Source branch '{source_branch_name}' does not exist")
+        # The target HEAD must not move between reading it and committing the merge
+        with self._branch_lock(target_branch_name):
+            with self._structure_lock:
+                # Validate all source branches
+                for source_branch_name in source_branch_names:
+                    if source_branch_name not in self._branches:
+                        raise ValueError(f"Source branch '{source_branch_name}' does not exist")
 
-        # Validate target branch
-        if target_branch_name not in self._branches:
-            raise ValueError(f"Target branch '{target_branch_name}' does not exist")
+                # Validate target branch
+                if target_branch_name not in self._branches:
+                    raise ValueError(f"Target branch '{target_branch_name}' does not exist")
 
-        # Get target branch
-        target_branch = self._branches[target_branch_name]
-        target_head_id = target_branch["head_node_id"]
+                # Get target branch
+                target_branch = self._branches[target_branch_name]
+                target_head_id = target_branch["head_node_id"]
 
-        # Collect source branch information
-        source_branches = []
-        source_head_ids = []
+                # Collect source branch HEADs
+                source_head_ids = []
 
-        for source_branch_name in source_branch_names:
-            source_branch = self._branches[source_branch_name]
-            source_head_id = source_branch["head_node_id"]
+                for source_branch_name in source_branch_names:
+                    source_head_id = self._branches[source_branch_name]["head_node_id"]
 
-            if not source_head_id:
-                raise ValueError(f"Source branch '{source_branch_name}' has no commits")
+                    if not source_head_id:
+                        raise ValueError(f"Source branch '{source_branch_name}' has no commits")
 
-            source_branches.append(source_branch)
-            source_head_ids.append(source_head_id)
+                    if target_head_id and self._is_merged(source_head_id, target_head_id):
+                        raise ValueError(f"Source branch '{source_branch_name}' is already merged into '{target_branch_name}'")
 
-        # Create explicit merge commit that references all branches
-        merge_node = self.add_message(
-            message=merge_message,
-            parent_node_id=target_head_id,
-        )
+                    source_head_ids.append(source_head_id)
 
-        # Add all source HEADs as additional parents (for visualization)
-        for source_head_id in source_head_ids:
-            if source_head_id and source_head_id in self._nodes:
-                source_node = self._nodes[source_head_id]
-                if merge_node["id"] not in source_node["child_ids"]:
-                    source_node["child_ids"].append(merge_node["id"])
-                    self.update_message(source_head_id, source_node)
+            # Create explicit merge commit that references all branches. The source HEADs are
+            # recorded as additional parents (for visualization) and linked in the same commit.
+            merge_node = self._build_node(merge_message, target_head_id, None)
+            merge_node["merge_parent_ids"] = list(dict.fromkeys(source_head_ids))
+            merge_node = self._commit_node(merge_node)
 
-        # Update target branch HEAD
-        target_branch["head_node_id"] = merge_node["id"]
+            # Update target branch HEAD
+            target_branch["head_node_id"] = merge_node["id"]
 
         return merge_node
 
+    def merge_base(self, node_id_a: str, node_id_b: str) -> Union[MessageNode, None]:
+        """
+        Get the lowest common ancestor of two messages, i.e. where their histories fork.
+
+        A message counts as its own ancestor, so the merge base of a message and one of its
+        descendants is the message itself. Histories follow parent_id links (the conversation
+        context of a merge commit is its target branch), and the lookup uses the ancestry
+        index, taking O(log n) time instead of walking both parent chains.
+
+        Args:
+            node_id_a: The ID of the first message
+            node_id_b: The ID of the second message
+
+        Returns:
+            The merge base MessageNode, or None if the messages are in different trees
+
+        Raises:
+            ValueError: If either message doesn't exist
+        """
+        with self._structure_lock:
+            merge_base_id = self._merge_base_id(node_id_a, node_id_b)
+            return self._nodes[merge_base_id] if merge_base_id is not None else None
+
+    def branches_containing(self, node_id: str) -> list[str]:
+        """
+        Get the names of the branches whose history includes a message, e.g. before editing it.
+
+        Histories follow parent_id links, as for merge_base. Each branch is checked with the
+        ancestry index in O(log n) time instead of walking its history, so the cost grows with
+        the number of branches rather than with the size of the canvas.
+
+        Args:
+            node_id: The ID of the message
+
+        Returns:
+            The branch names, in creation order
+
+        Raises:
+            ValueError: If the message doesn't exist
+        """
+        with self._structure_lock:
+            heads = {name: info["head_node_id"] for name, info in self._branches.items() if info["head_node_id"] is not None}
+            contained = set(self.heads_containing(node_id, heads.values()))
+            return [name for name, head_node_id in heads.items() if head_node_id in contained]
+
+    def heads_containing(self, node_id: str, head_node_ids: Iterable[str]) -> list[str]:
+        """
+        Get which of some messages have a message in their history, e.g. the branch HEADs of a
+        client, whose branches the server does not track.
+
+        Each message is checked in O(log n) time, like in branches_containing.
+
+        Args:
+            node_id: The ID of the message
+            head_node_ids: The IDs of the messages to check; unknown IDs are skipped
+
+        Returns:
+            The IDs of the messages whose history includes the message, in the given order
+
+        Raises:
+            ValueError: If the message doesn't exist
+        """
+        with self._structure_lock:
+            if node_id not in self._nodes:
+                raise ValueError(f"Node with ID '{node_id}' does not exist")
+            return [
+                head_node_id
+                for head_node_id in head_node_ids
+                if head_node_id in self._nodes and self._merge_base_id(node_id, head_node_id) == node_id
+            ]
+
+    def compare_branches(self, branch_a: str, branch_b: str) -> BranchComparison:
+        """
+        Compare two branches through their merge base.
+
+        Args:
+            branch_a: The name of the first branch
+            branch_b: The name of the second branch
+
+        Returns:
+            The merge base ID and how many messages each branch has after it
+
+        Raises:
+            ValueError: If either branch doesn't exist
+        """
+        with self._structure_lock:
+            head_ids = []
+            for name in (branch_a, branch_b):
+                if name not in self._branches:
+                    raise ValueError(f"Branch '{name}' does not exist")
+                head_ids.append(self._branches[name]["head_node_id"])
+
+            head_id_a, head_id_b = head_ids
+            merge_base_id = None
+            if head_id_a is not None and head_id_b is not None:
+                merge_base_id = self._merge_base_id(head_id_a, head_id_b)
+
+            base_length = self._path_length(merge_base_id)
+            return {
+                "merge_base_id": merge_base_id,
+                "ahead": self._path_length(head_id_a) - base_length,
+                "behind": self._path_length(head_id_b) - base_length,
+            }
+
+    def diff(self, branch_a: str, branch_b: str) -> BranchDiff:
+        """
+        Get the messages unique to each of two branches since they forked.
+
+        Only the messages after the merge base are read, so the cost is proportional to how
+        far the branches diverged rather than to the size of the canvas.
+
+        Args:
+            branch_a: The name of the first branch
+            branch_b: The name of the second branch
+
+        Returns:
+            The merge base ID and the messages only on each branch, oldest first
+
+        Raises:
+            ValueError: If either branch doesn't exist
+        """
+        with self._structure_lock:
+            for name in (branch_a, branch_b):
+                if name not in self._branches:
+                    raise ValueError(f"Branch '{name}' does not exist")
+            return self.diff_nodes(self._branches[branch_a]["head_node_id"], self._branches[branch_b]["head_node_id"])
+
+    def diff_nodes(self, node_id_a: Union[str, None], node_id_b: Union[str, None]) -> BranchDiff:
+        """
+        Get the messages unique to each of the histories ending at two messages.
+
+        Args:
+            node_id_a: The ID of the last message of the first history (None for an empty history)
+            node_id_b: The ID of the last message of the second history (None for an empty history)
+
+        Returns:
+            The merge base ID and the messages only in each history, oldest first
+
+        Raises:
+            ValueError: If either message doesn't exist
+        """
+        with self._structure_lock:
+            merge_base_id = None
+            if node_id_a is not None and node_id_b is not None:
+                merge_base_id = self._merge_base_id(node_id_a, node_id_b)
+
+            return {
+                "merge_base_id": merge_base_id,
+                "a_nodes": self._path_after(node_id_a, merge_base_id),
+                "b_nodes": self._path_after(node_id_b, merge_base_id),
+            }
+
+    def _path_after(self, node_id: Union[str, None], ancestor_id: Union[str, None]) -> list[MessageNode]:
+        """Get the path down to a node that follows one of its ancestors. Callers hold the structural lock."""
+        if node_id is None:
+            return []
+        if node_id not in self._nodes:
+            raise ValueError(f"Node with ID '{node_id}' does not exist")
+
+        if self._index_node(node_id):
+            start_depth = self._ancestry.depth(ancestor_id) + 1 if ancestor_id is not None else 0
+            return [self._nodes[path_node_id] for path_node_id in self._ancestry.path(node_id, start_depth)]
+
+        path = self.get_path(node_id)
+        start = next((i + 1 for i, node in enumerate(path) if node["id"] == ancestor_id), 0)
+        return path[start:]
+
+    def _merge_base_id(self, node_id_a: str, node_id_b: str) -> Union[str, None]:
+        """Find the merge base of two nodes. Callers hold the structural lock."""
+        for node_id in (node_id_a, node_id_b):
+            if node_id not in self._nodes:
+                raise ValueError(f"Node with ID '{node_id}' does not exist")
+
+        if self._index_node(node_id_a) and self._index_node(node_id_b):
+            return self._ancestry.lowest_common_ancestor(node_id_a, node_id_b)
+
+        # A history with a missing ancestor is not indexed: compare the known paths instead
+        path_ids_a = {node["id"] for node in self.get_path(node_id_a)}
+        return next((node["id"] for node in reversed(self.get_path(node_id_b)) if node["id"] in path_ids_a), None)
+
+    def _path_length(self, node_id: Union[str, None]) -> int:
+        """Get the number of messages in the history ending at a node. Callers hold the structural lock."""
+        if node_id is None:
+            return 0
+        if self._index_node(node_id):
+            return self._ancestry.depth(node_id) + 1
+        return len(self.get_path(node_id))
+
+    def _is_merged(self, source_head_id: str, target_head_id: str) -> bool:
+        """
+        Check whether a source HEAD is already part of a target branch.
+
+        It is when it is in the target's history, or when a merge commit in that history
+        already lists it as a merge parent. Callers hold the structural lock.
+        """
+        if source_head_id not in self._nodes or target_head_id not in self._nodes:
+            return False
+        if self._merge_base_id(source_head_id, target_head_id) == source_head_id:
+            return True
+        return any(
+            child_id in self._nodes
+            and source_head_id in self._nodes[child_id].get("merge_parent_ids", ())
+            and self._merge_base_id(child_id, target_head_id) == child_id
+            for child_id in self._nodes[source_head_id]["child_ids"]
+        )
+
     def add_message(
         self,
         message: Message,
@@ -418,68 +1080,810 @@ class Canvas:
         meta: Union[dict[str, Any], None] = None,
         node_id: Union[str, None] = None,
     ) -> MessageNode:
-        node_id = node_id or str(uuid.uuid4())
-        _meta = {"timestamp": time.time()}
+        return self._commit_node(self._build_node(message, parent_node_id, meta, node_id))
 
-        if meta is not None:
-            _meta.update(meta)
-        node: MessageNode = MessageNode(
-            id=node_id,
-            message=message,
-            parent_id=parent_node_id if parent_node_id else None,
-            child_ids=[],
-            meta=_meta,
-        )
-        self._nodes[node_id] = node
-        if parent_node_id:
-            self._nodes[parent_node_id]["child_ids"].append(node_id)
-            self.update_message(parent_node_id, self._nodes[parent_node_id])
+    def _commit_node(self, node: MessageNode) -> MessageNode:
+        """
+        Store a new node, link it to its parents and emit a single commit_message event.
 
-        # Emit SSE event
+        Child links are structural: receivers derive them from the node's parent_id and
+        merge_parent_ids, so parents are not re-sent as update_message events.
+
+        Raises:
+            ValueError: If a parent node doesn't exist
+        """
+        node = self._intern_content(node)
+        token_count = self._token_counter(node["message"])
         event: CanvasCommitMessageEvent = {
             "event_type": "commit_message",
             "canvas_id": self.canvas_id,
             "timestamp": time.time(),
             "data": node,
         }
+        with self._structure_lock:
+            for parent_id in (node["parent_id"], *node.get("merge_parent_ids", ())):
+                if parent_id is not None and parent_id not in self._nodes:
+                    self._release_content(node["id"])
+                    raise ValueError(f"Node with ID '{parent_id}' does not exist")
+            self._store_new_node(node)
+            self._link_to_parents(node)
+            self._cache_token_count(node, token_count)
+            self._record_change(event)
+
+        # Emit SSE event
         self._emit_event(event)
 
         return node
 
-    def update_message(self, node_id: str, updated_message_node: MessageNode) -> MessageNode:
+    def add_messages(
+        self,
+        messages: Iterable[Message],
+        parent_node_id: Union[str, None] = None,
+        meta: Union[dict[str, Any], None] = None,
+    ) -> list[MessageNode]:
         """
-        Update an existing message in the canvas.
+        Add a chain of messages in a single step.
+
+        Each message becomes the child of the previous one and the first message becomes the
+        child of parent_node_id. The whole chain is reported with one commit_messages event;
+        the parent's new child link is implied by the first node's parent_id instead of being
+        sent as a separate update.
 
         Args:
-            node_id: The ID of the message node to update
-            message: The new message content
-            meta: Optional metadata to update (will be merged with existing meta)
+            messages: The messages to add, in conversation order
+            parent_node_id: The ID of the node the chain starts from (None for a new root)
+            meta: Optional metadata applied to every message
 
         Returns:
-            The updated MessageNode
+            The created MessageNodes, in conversation order
 
         Raises:
-            ValueError: If the node with the given ID doesn't exist
+            ValueError: If the parent node doesn't exist
         """
-        if node_id not in self._nodes:
-            raise ValueError(f"Node with ID '{node_id}' does not exist")
-
-        self._nodes[node_id] = updated_message_node
-
-        # Emit update event
-        event: CanvasUpdateMessageEvent = {
-            "event_type": "update_message",
+        with self._structure_lock:
+            if parent_node_id and parent_node_id not in self._nodes:
+                raise ValueError(f"Node with ID '{parent_node_id}' does not exist")
+
+        # Build the whole chain before touching the canvas so a failure leaves it unchanged
+        chain: list[MessageNode] = []
+        previous_id = parent_node_id
+        for message in messages:
+            node = self._build_node(message, previous_id, meta)
+            if chain:
+                chain[-1]["child_ids"].append(node["id"])
+            chain.append(node)
+            previous_id = node["id"]
+
+        if not chain:
+            return []
+
+        nodes = [self._intern_content(node) for node in chain]
+        token_counts = [self._token_counter(node["message"]) for node in nodes]
+        event: CanvasCommitMessagesEvent = {
+            "event_type": "commit_messages",
             "canvas_id": self.canvas_id,
             "timestamp": time.time(),
-            "data": self._nodes[node_id],
+            "data": nodes,
         }
+        with self._structure_lock:
+            # Linked first, so a parent removed since the check above leaves the canvas unchanged
+            self._link_to_parents(nodes[0])
+            for node, token_count in zip(nodes, token_counts):
+                self._store_new_node(node)
+                self._cache_token_count(node, token_count)
+            self._record_change(event)
+
         self._emit_event(event)
 
-        return self._nodes[node_id]
+        return nodes
+
+    def _build_node(
+        self,
+        message: Message,
+        parent_node_id: Union[str, None],
+        meta: Union[dict[str, Any], None],
+        node_id: Union[str, None] = None,
+    ) -> MessageNode:
+        """Create a new, not yet stored MessageNode."""
+        _meta = {"timestamp": time.time()}
+
+        if meta is not None:
+            _meta.update(meta)
+        return MessageNode(
+            id=node_id or self._node_id_factory(),
+            message=message,
+            parent_id=parent_node_id if parent_node_id else None,
+            child_ids=[],
+            meta=_meta,
+        )
+
+    @staticmethod
+    def _with_stored_links(node: MessageNode, stored_node: MessageNode) -> MessageNode:
+        """Return the node carrying the links of the stored node, copying it only if they differ."""
+        if (
+            node["parent_id"] == stored_node["parent_id"]
+            and node["child_ids"] == stored_node["child_ids"]
+            and node.get("merge_parent_ids") == stored_node.get("merge_parent_ids")
+        ):
+            return node
+
+        linked: MessageNode = {**node, "parent_id": stored_node["parent_id"], "child_ids": stored_node["child_ids"]}
+        linked.pop("merge_parent_ids", None)
+        if "merge_parent_ids" in stored_node:
+            linked["merge_parent_ids"] = stored_node["merge_parent_ids"]
+        return linked
+
+    def _link_to_parents(self, node: MessageNode, *, adopt_orphans: bool = False) -> None:
+        """
+        Add a node to the child_ids of its parent and merge parents that are in the canvas.
+
+        With adopt_orphans (used when inserting nodes received out of order), parents that are
+        not in the canvas yet remember the node so it is linked once they are inserted. Otherwise
+        every parent must exist. Callers hold the structural lock.
+
+        Raises:
+            ValueError: If a parent node doesn't exist and adopt_orphans is not set
+        """
+        for parent_id in (node["parent_id"], *node.get("merge_parent_ids", ())):
+            if parent_id is None:
+                continue
+            if parent_id not in self._nodes:
+                if not adopt_orphans:
+                    raise ValueError(f"Node with ID '{parent_id}' does not exist")
+                self._orphan_child_ids.setdefault(parent_id, []).append(node["id"])
+                continue
+            parent_node = self._nodes[parent_id]
+            if node["id"] not in parent_node["child_ids"]:
+                # Written back as a copy: the stored node may be shared with snapshots and forks
+                self._nodes[parent_id] = {**parent_node, "child_ids": [*parent_node["child_ids"], node["id"]]}
+                self._leaf_ids.pop(parent_id, None)
+
+    def _store_new_node(self, node: MessageNode) -> None:
+        """Store an interned node built by _build_node and add it to the canvas indexes.
+
+        Callers hold the structural lock.
+        """
+        self._nodes[node["id"]] = node
+        self._index_node(node["id"])
+        self._track_root(node)
+        self._track_leaf(node)
+        self._index_text(node)
+        self._index_meta(node)
+        self._index_time_ordered_id(node["id"])
+        self._gc.allocate(node["id"])
+
+    def _record_change(self, event: CanvasEvent) -> None:
+        """
+        Advance the version after changing nodes and add the change to the changelog.
+
+        Callers hold the structural lock, so versions follow the order of the changes.
+        """
+        self._version += 1
+        self.last_updated = event["timestamp"]
+        if len(self._changelog) == self._changelog.maxlen:
+            self._changelog_start = self._changelog[0]["version"]
+        self._changelog.append({"version": self._version, "event": event})
+
+    def _track_root(self, node: MessageNode) -> None:
+        """Add a stored node to the root IDs if it has no parent. Callers hold the structural lock."""
+        if node["parent_id"] is None:
+            self._root_ids[node["id"]] = None
+
+    def _track_leaf(self, node: MessageNode) -> None:
+        """Add a stored node to the leaf IDs if it has no children, or remove it. Callers hold the structural lock."""
+        if node["child_ids"]:
+            self._leaf_ids.pop(node["id"], None)
+        else:
+            self._leaf_ids[node["id"]] = None
+
+    def update_message(self, node_id: str, updated_message_node: MessageNode) -> MessageNode:
+        """
+        Update an existing message in the canvas.
+
+        Args:
+            node_id: The ID of the message node to update
+            message: The new message content
+            meta: Optional metadata to update (will be merged with existing meta)
+
+        Returns:
+            The updated MessageNode
+
+        Raises:
+            ValueError: If the node with the given ID doesn't exist
+
+        The node's links (parent_id, child_ids and merge_parent_ids) are owned by the canvas and
+        kept as stored, so an update built from a stale copy of the node cannot drop children.
+        """
+        token_count = self._token_counter(updated_message_node["message"])
+        with self._structure_lock:
+            if node_id not in self._nodes:
+                raise ValueError(f"Node with ID '{node_id}' does not exist")
+
+            updated_message_node = self._with_stored_links(updated_message_node, self._nodes[node_id])
+            self._release_content(node_id)
+            self._nodes[node_id] = self._intern_content(updated_message_node)
+            stored_node = self._nodes[node_id]
+            self._invalidate_cached(node_id)
+            self._cache_token_count(stored_node, token_count)
+            self._index_text(stored_node)
+            self._index_meta(stored_node)
+            event: CanvasUpdateMessageEvent = {
+                "event_type": "update_message",
+                "canvas_id": self.canvas_id,
+                "timestamp": time.time(),
+                "data": stored_node,
+            }
+            self._record_change(event)
+
+        # Emit update event
+        self._emit_event(event)
+
+        return stored_node
+
+    def apply_message_delta(self, delta: MessageDelta) -> MessageNode:
+        """
+        Append text to a message and/or set meta keys without replacing the whole node.
+
+        Emits a message_delta event carrying only the delta, so listeners such as the server
+        sync receive the new text instead of the whole message.
+
+        Args:
+            delta: The delta to apply
+
+        Returns:
+            The updated MessageNode
+
+        Raises:
+            ValueError: If the node doesn't exist or the delta doesn't fit its content
+        """
+        node_id = delta["id"]
+        with self._structure_lock:
+            if node_id not in self._nodes:
+                raise ValueError(f"Node with ID '{node_id}' does not exist")
+            node = self._nodes[node_id]
+            message = node["message"]
+            if "text" in delta:
+                message = {**message, "content": _append_text(message["content"], delta["text"], delta.get("block_index"))}
+            meta = {**(node["meta"] or {}), **delta["meta"]} if "meta" in delta else node["meta"]
+
+            self._release_content(node_id)
+            self._nodes[node_id] = self._intern_content({**node, "message": message, "meta": meta})
+            stored_node = self._nodes[node_id]
+            if "text" in delta:
+                # Counted and converted again when next needed, not once per streamed delta
+                self._invalidate_cached(node_id)
+                if self._search_index is not None and isinstance(node["message"]["content"], str):
+                    self._search_index.append(node_id, delta["text"])
+                else:
+                    self._index_text(stored_node)
+            if self._search_index is not None:
+                # The meta or content blocks the search filters look at may have changed
+                self._search_index.update_attributes(stored_node)
+            if "meta" in delta:
+                self._index_meta(stored_node)
+            event: CanvasMessageDeltaEvent = {
+                "event_type": "message_delta",
+                "canvas_id": self.canvas_id,
+                "timestamp": time.time(),
+                "data": delta,
+            }
+            self._record_change(event)
+
+        self._emit_event(event)
+
+        return stored_node
+
+    # ---- Token Counting ----
+    @property
+    def token_counter(self) -> TokenCounter:
+        """Get the function used to count the tokens of a message (see llm_canvas.tokens)."""
+        return self._token_counter
+
+    @token_counter.setter
+    def token_counter(self, token_counter: TokenCounter) -> None:
+        """Set the function used to count the tokens of a message, discarding the cached counts."""
+        with self._structure_lock:
+            self._token_counter = token_counter
+            self._token_counts = {}
+            self._path_token_counts = {}
+
+    def token_count(self, node_id: str) -> int:
+        """
+        Get the number of tokens of a message.
+
+        Messages are counted once when they are committed or updated, and the count is cached.
+
+        Args:
+            node_id: The ID of the message node
+
+        Returns:
+            The token count of the message
+
+        Raises:
+            ValueError: If the node with the given ID doesn't exist
+        """
+        with self._structure_lock:
+            if node_id not in self._nodes:
+                raise ValueError(f"Node with ID '{node_id}' does not exist")
+            return self._node_token_count(node_id)
+
+    def path_token_count(self, node_id: str) -> int:
+        """
+        Get the number of tokens of the conversation path from the root down to a message.
+
+        Path totals are maintained as messages are committed: a commit adds its own count to
+        the cached total of its parent, so the history is not counted again. Updating a message
+        invalidates the totals below it, which are recomputed from the nearest cached ancestor.
+
+        Args:
+            node_id: The ID of the last node of the path
+
+        Returns:
+            The token count of the messages from the root to the given node (inclusive)
+
+        Raises:
+            ValueError: If the node with the given ID doesn't exist
+        """
+        with self._structure_lock:
+            if node_id not in self._nodes:
+                raise ValueError(f"Node with ID '{node_id}' does not exist")
+
+            # Walk up to the nearest ancestor with a cached total, then fill in the totals below it
+            pending: list[str] = []
+            total = 0
+            current_id: Union[str, None] = node_id
+            while current_id is not None and current_id in self._nodes:
+                if current_id in self._path_token_counts:
+                    total = self._path_token_counts[current_id]
+                    break
+                pending.append(current_id)
+                current_id = self._nodes[current_id]["parent_id"]
+
+            for pending_id in reversed(pending):
+                total += self._node_token_count(pending_id)
+                self._path_token_counts[pending_id] = total
+            return total
+
+    def _node_token_count(self, node_id: str) -> int:
+        """Get the cached token count of a stored message, counting it if needed. Callers hold the structural lock."""
+        token_count = self._token_counts.get(node_id)
+        if token_count is None:
+            token_count = self._token_counts[node_id] = self._token_counter(self._nodes[node_id]["message"])
+        return token_count
+
+    def _cache_token_count(self, node: MessageNode, token_count: int) -> None:
+        """
+        Cache the token count of a stored message and, when its parent's total is known, its path total.
+
+        Callers hold the structural lock.
+        """
+        self._token_counts[node["id"]] = token_count
+        parent_id = node["parent_id"]
+        if parent_id is None:
+            self._path_token_counts[node["id"]] = token_count
+        elif parent_id in self._path_token_counts:
+            self._path_token_counts[node["id"]] = self._path_token_counts[parent_id] + token_count
+
+    def _invalidate_cached(self, node_id: str) -> None:
+        """
+        Drop the cached count and conversions of a message and the path totals that include it.
+
+        Callers hold the structural lock.
+        """
+        self._token_counts.pop(node_id, None)
+        for converted in self._converted_messages.values():
+            converted.pop(node_id, None)
+        self._path_token_counts.pop(node_id, None)
+        # Children may have partial totals, e.g. when they were inserted before this node
+        pending = list(self._nodes[node_id]["child_ids"]) if node_id in self._nodes else []
+        while pending:
+            current_id = pending.pop()
+            # Totals below a node are only cached while its own total is
+            if self._path_token_counts.pop(current_id, None) is not None and current_id in self._nodes:
+                pending.extend(self._nodes[current_id]["child_ids"])
+
+    # ---- Prompt Assembly ----
+    def to_anthropic_messages(
+        self, node_id: str, max_tokens: Union[int, None] = None, strategy: TruncationStrategy = "drop_oldest"
+    ) -> AnthropicPrompt:
+        """
+        Convert the conversation path leading to a message to Anthropic Messages API parameters.
+
+        System messages go to the system prompt, the others to the messages list, which share
+        their content with the stored messages (do not modify it). The token budget is checked
+        against the cached token counts, so assembling the prompt of the next turn only counts
+        the new messages; the rest of the path is read from the ancestry index.
+
+        When the path exceeds max_tokens, the oldest messages are dropped according to the
+        strategy. The kept messages then start at a user message that is not a tool result,
+        so the history never opens with an answer to a tool call that was cut.
+
+        Example:
+            prompt = canvas.to_anthropic_messages(head_id, max_tokens=100_000, strategy="keep_system")
+            client.messages.create(model=model, max_tokens=1024, system=prompt["system"] or NOT_GIVEN,
+                                   messages=prompt["messages"])
+
+        Args:
+            node_id: The ID of the last message of the conversation
+            max_tokens: Optional token budget for the messages, system messages included
+            strategy: How to cut the path when it exceeds the budget (see TruncationStrategy)
+
+        Returns:
+            The system prompt, messages and a report of the dropped messages
+
+        Raises:
+            ValueError: If the node with the given ID doesn't exist
+        """
+        with self._structure_lock:
+            kept, dropped = self._fit_path(node_id, max_tokens, strategy)
+            system_texts: list[str] = []
+            messages: list[MessageParam] = []
+            for node in kept:
+                if node["message"]["role"] == "system":
+                    system_texts.append(_content_text(node["message"]["content"]))
+                    continue
+                messages.append(_to_anthropic_message(node["message"]))
+
+            return {
+                "system": "\n\n".join(system_texts) if system_texts else None,
+                "messages": messages,
+                "token_count": sum(self._node_token_count(node["id"]) for node in kept),
+                "dropped_node_ids": [node["id"] for node in dropped],
+                "dropped_token_count": sum(self._node_token_count(node["id"]) for node in dropped),
+            }
+
+    def to_openai_messages(
+        self, node_id: str, max_tokens: Union[int, None] = None, strategy: TruncationStrategy = "drop_oldest"
+    ) -> OpenAIPrompt:
+        """
+        Convert the conversation path leading to a message to OpenAI Chat Completions messages.
+
+        Works like to_anthropic_messages: each message is converted once (with
+        llm_canvas.openai_format.to_openai_messages) and cached until it is updated, and the
+        path is cut to max_tokens with the same strategies. System messages stay in place.
+
+        Args:
+            node_id: The ID of the last message of the conversation
+            max_tokens: Optional token budget for the messages
+            strategy: How to cut the path when it exceeds the budget (see TruncationStrategy)
+
+        Returns:
+            The messages and a report of the dropped messages
+
+        Raises:
+            ValueError: If the node with the given ID doesn't exist
+        """
+        with self._structure_lock:
+            kept, dropped = self._fit_path(node_id, max_tokens, strategy)
+            converted = self._converted_messages.setdefault("openai", LayeredMapping())
+            messages: list[ChatCompletionMessageParam] = []
+            for node in kept:
+                if node["id"] not in converted:
+                    converted[node["id"]] = to_openai_messages(node["message"])
+                messages.extend(converted[node["id"]])
+
+            return {
+                "messages": messages,
+                "token_count": sum(self._node_token_count(node["id"]) for node in kept),
+                "dropped_node_ids": [node["id"] for node in dropped],
+                "dropped_token_count": sum(self._node_token_count(node["id"]) for node in dropped),
+            }
+
+    def _fit_path(
+        self, node_id: str, max_tokens: Union[int, None], strategy: TruncationStrategy
+    ) -> tuple[list[MessageNode], list[MessageNode]]:
+        """
+        Split the path leading to a message into the messages that fit a token budget and the dropped ones.
+
+        Callers hold the structural lock.
+
+        Returns:
+            The kept and the dropped messages, oldest first
+        """
+        path = self.get_path(node_id)
+        if max_tokens is None or self.path_token_count(node_id) <= max_tokens:
+            return path, []
+
+        def kept_anyway(node: MessageNode) -> bool:
+            return strategy == "keep_system" and node["message"]["role"] == "system"
+
+        budget = max_tokens - sum(self._node_token_count(node["id"]) for node in path if kept_anyway(node))
+        # Keep the newest messages that fit
+        cut = len(path)
+        while cut:
+            if not kept_anyway(path[cut - 1]):
+                token_count = self._node_token_count(path[cut - 1]["id"])
+                if token_count > budget:
+                    break
+                budget -= token_count
+            cut -= 1
+
+        kept: list[MessageNode] = [node for node in path[:cut] if kept_anyway(node)]
+        dropped = [node for node in path[:cut] if not kept_anyway(node)]
+        # Also drop the replies at the cut whose user turn was dropped
+        opened = False
+        for node in path[cut:]:
+            if node["message"]["role"] != "system" and not opened:
+                opened = _opens_turn(node["message"])
+                if not opened:
+                    dropped.append(node)
+                    continue
+            kept.append(node)
+        return kept, dropped
+
+    # ---- Search ----
+    def search(
+        self,
+        query: str,
+        limit: Union[int, None] = 20,
+        filters: Union[SearchFilters, None] = None,
+    ) -> list[SearchHit]:
+        """
+        Find the messages whose text or tool results contain the words of a query.
+
+        Messages matching more (and rarer) query words rank first. The index is built on the
+        first search and then kept up to date as messages are committed, updated, streamed and
+        removed, so later searches only visit the messages containing the query words.
+
+        Args:
+            query: The words to search for (case-insensitive)
+            limit: The maximum number of results (None for all of them)
+            filters: Optional conditions on the role, content blocks and timestamp of the messages
+
+        Returns:
+            The matching messages, best matches first, with a snippet around the first match
+        """
+        return self.search_terms(tokenize(query), limit, filters)
+
+    def search_terms(
+        self,
+        terms: list[str],
+        limit: Union[int, None] = 20,
+        filters: Union[SearchFilters, None] = None,
+        statistics: Union[CorpusStatistics, None] = None,
+    ) -> list[SearchHit]:
+        """
+        Search this canvas for tokenized query words, e.g. as one shard of a registry-wide search.
+
+        Args:
+            terms: The lowercase query terms (see llm_canvas._search.tokenize)
+            limit: The maximum number of results (None for all of them)
+            filters: Optional conditions on the role, content blocks and timestamp of the messages
+            statistics: The statistics to score with, e.g. those of a search corpus shared with
+                other canvases (defaults to those of this canvas)
+
+        Returns:
+            The matching messages, best matches first, with a snippet around the first match
+        """
+        with self._structure_lock:
+            index = self._get_search_index()
+            ranked = index.search(terms, limit, filters, statistics)
+            return [
+                {
+                    "node_id": node_id,
+                    "score": score,
+                    "snippet": snippet(message_text(self._nodes[node_id]["message"]), terms),
+                }
+                for node_id, score in ranked
+            ]
+
+    def _get_search_index(self) -> SearchIndex:
+        """Get the search index, building it on first use. Callers hold the structural lock."""
+        if self._search_index is None:
+            self._search_index = SearchIndex()
+            for node in self._nodes.values():
+                self._search_index.add(node)
+        return self._search_index
+
+    def attach_search_corpus(self, corpus: Union[SearchCorpus, None]) -> None:
+        """
+        Make the search index report to a corpus shared with other canvases (or stop it).
+
+        The index is built first if needed, so the corpus learns about every message of the
+        canvas. An existing index only sends its statistics.
+
+        Args:
+            corpus: The corpus to report to, keyed by the canvas ID (None to stop reporting)
+        """
+        with self._structure_lock:
+            if corpus is None:
+                if self._search_index is not None:
+                    self._search_index.attach(None)
+                return
+            self._get_search_index().attach(corpus, self.canvas_id)
+
+    def _index_text(self, node: MessageNode) -> None:
+        """Add a stored node's text to the search index, if it was built. Callers hold the structural lock."""
+        if self._search_index is not None:
+            self._search_index.add(node)
+
+    # ---- Meta Indexes ----
+    def create_meta_index(self, key: str, kind: MetaIndexKind = "hash") -> None:
+        """
+        Index the nodes by the value of a meta key, so query_nodes can filter on it without a scan.
+
+        Hash indexes answer equality conditions (e.g. status == "error") and sorted indexes
+        numeric range conditions (e.g. latency between 1 and 5 seconds). A key may have both.
+        The index is kept up to date as nodes are committed, updated and removed. Creating an
+        index that exists does nothing.
+
+        Args:
+            key: The meta key to index
+            kind: "hash" for equality or "sorted" for numeric range conditions
+        """
+        with self._structure_lock:
+            if (key, kind) in self._meta_index_keys:
+                return
+            self._meta_index_keys.append((key, kind))
+            if self._meta_indexes is not None:
+                self._meta_indexes[key, kind] = self._build_meta_index(key, kind)
+
+    def drop_meta_index(self, key: str, kind: MetaIndexKind = "hash") -> None:
+        """Remove an index created with create_meta_index, if it exists."""
+        with self._structure_lock:
+            if (key, kind) in self._meta_index_keys:
+                self._meta_index_keys.remove((key, kind))
+            if self._meta_indexes is not None:
+                self._meta_indexes.pop((key, kind), None)
 
     @property
-    def nodes(self) -> dict[str, MessageNode]:
-        """Get all nodes in the canvas."""
+    def meta_indexes(self) -> list[tuple[str, MetaIndexKind]]:
+        """Get the key and kind of every meta index, in creation order."""
+        return list(self._meta_index_keys)
+
+    def query_nodes(
+        self,
+        equals: Union[dict[str, Any], None] = None,
+        ranges: Union[dict[str, tuple[Union[float, None], Union[float, None]]], None] = None,
+        limit: Union[int, None] = None,
+    ) -> list[MessageNode]:
+        """
+        Find the nodes whose meta meets every condition, using the meta indexes.
+
+        Args:
+            equals: Values meta keys must be equal to; each key needs a hash index
+            ranges: Inclusive (low, high) bounds numeric meta keys must be within, None for an
+                open bound; each key needs a sorted index
+            limit: Optional maximum number of nodes
+
+        Returns:
+            The nodes ordered by the value of the first range key, or oldest first (by meta
+            timestamp) without range conditions
+
+        Raises:
+            ValueError: If there are no conditions or a key has no index of the needed kind
+        """
+        if not equals and not ranges:
+            raise ValueError("A query needs at least one condition")
+
+        with self._structure_lock:
+            ordered_ids: Union[list[str], None] = None
+            candidate_ids: Union[set[str], None] = None
+            for key, (low, high) in (ranges or {}).items():
+                node_ids = self._sorted_meta_index(key).range(low, high)
+                if ordered_ids is None:
+                    ordered_ids = node_ids
+                else:
+                    candidate_ids = set(node_ids) if candidate_ids is None else candidate_ids.intersection(node_ids)
+            for key, value in (equals or {}).items():
+                equal_ids = self._hash_meta_index(key).equal(value)
+                candidate_ids = equal_ids if candidate_ids is None else candidate_ids & equal_ids
+
+            if ordered_ids is None:
+                ordered_ids = sorted(candidate_ids or (), key=self._node_timestamp)
+            elif candidate_ids is not None:
+                ordered_ids = [node_id for node_id in ordered_ids if node_id in candidate_ids]
+            return [self._nodes[node_id] for node_id in ordered_ids[:limit]]
+
+    def _meta_index(self, key: str, kind: MetaIndexKind) -> MetaIndex:
+        """Get an index, building the indexes of a fork on first use. Callers hold the structural lock."""
+        if (key, kind) not in self._meta_index_keys:
+            raise ValueError(f"Meta key '{key}' has no {kind} index")
+        if self._meta_indexes is None:
+            self._meta_indexes = {
+                (index_key, index_kind): self._build_meta_index(index_key, index_kind)
+                for index_key, index_kind in self._meta_index_keys
+            }
+        return self._meta_indexes[key, kind]
+
+    def _hash_meta_index(self, key: str) -> HashIndex:
+        """Get the hash index of a meta key. Callers hold the structural lock."""
+        index = self._meta_index(key, "hash")
+        if isinstance(index, HashIndex):
+            return index
+        raise ValueError(f"Meta key '{key}' has no hash index")
+
+    def _sorted_meta_index(self, key: str) -> SortedIndex:
+        """Get the sorted index of a meta key. Callers hold the structural lock."""
+        index = self._meta_index(key, "sorted")
+        if isinstance(index, SortedIndex):
+            return index
+        raise ValueError(f"Meta key '{key}' has no sorted index")
+
+    def _build_meta_index(self, key: str, kind: MetaIndexKind) -> MetaIndex:
+        """Index the stored nodes by a meta key. Callers hold the structural lock."""
+        index = create_meta_index(kind)
+        for node in self._nodes.values():
+            meta = node["meta"] or {}
+            if key in meta:
+                index.add(node["id"], meta[key])
+        return index
+
+    def _index_meta(self, node: MessageNode) -> None:
+        """Update the meta indexes, if they were built, for a stored node. Callers hold the structural lock."""
+        if not self._meta_indexes:
+            return
+        meta = node["meta"] or {}
+        for (key, _kind), index in self._meta_indexes.items():
+            if key in meta:
+                index.add(node["id"], meta[key])
+            else:
+                index.remove(node["id"])
+
+    def _node_timestamp(self, node_id: str) -> float:
+        timestamp = (self._nodes[node_id]["meta"] or {}).get("timestamp")
+        return timestamp if isinstance(timestamp, (int, float)) else 0.0
+
+    # ---- Time-Ordered IDs ----
+    @property
+    def node_id_factory(self) -> NodeIdFactory:
+        """Get the function generating the IDs of new nodes (see llm_canvas.ids)."""
+        return self._node_id_factory
+
+    @node_id_factory.setter
+    def node_id_factory(self, node_id_factory: NodeIdFactory) -> None:
+        """Set the function generating the IDs of new nodes, e.g. llm_canvas.ids.ulid for time-ordered IDs."""
+        self._node_id_factory = node_id_factory
+
+    def nodes_between(self, since: float, until: Union[float, None] = None) -> list[MessageNode]:
+        """
+        Get the nodes created in a time range, found by a range scan over their sorted IDs.
+
+        Only nodes with time-ordered IDs (ULIDs, see llm_canvas.ids) are found; use a sorted
+        meta index on "timestamp" (see create_meta_index) for canvases with other IDs. The
+        sorted IDs are built on the first call and kept up to date from then on.
+
+        Args:
+            since: Start of the range (Unix time, inclusive)
+            until: Optional end of the range (Unix time, exclusive)
+
+        Returns:
+            The nodes, oldest first
+        """
+        with self._structure_lock:
+            if self._time_ordered_ids is None:
+                self._time_ordered_ids = sorted(node_id for node_id in self._nodes if ulid_timestamp(node_id) is not None)
+            node_ids = self._time_ordered_ids
+            start = bisect.bisect_left(node_ids, ulid_bound(since))
+            end = bisect.bisect_left(node_ids, ulid_bound(until)) if until is not None else len(node_ids)
+            return [self._nodes[node_id] for node_id in node_ids[start:end]]
+
+    def _index_time_ordered_id(self, node_id: str) -> None:
+        """Add a stored node's ID to the sorted IDs, if they were built and it is time-ordered."""
+        node_ids = self._time_ordered_ids
+        if node_ids is None or ulid_timestamp(node_id) is None:
+            return
+        position = bisect.bisect_left(node_ids, node_id)
+        if position == len(node_ids) or node_ids[position] != node_id:
+            node_ids.insert(position, node_id)
+
+    def _unindex_time_ordered_id(self, node_id: str) -> None:
+        """Remove a node's ID from the sorted IDs, if they were built."""
+        node_ids = self._time_ordered_ids
+        if node_ids is None:
+            return
+        position = bisect.bisect_left(node_ids, node_id)
+        if position < len(node_ids) and node_ids[position] == node_id:
+            del node_ids[position]
+
+    @property
+    def nodes(self) -> NodeStore:
+        """Get all nodes in the canvas.
+
+        This is the live node store; iterate over it only while no other thread commits. Nodes
+        may be shared with snapshots and forks, so treat them as read-only and change them with
+        update_message.
+        """
         return self._nodes
 
     def get_node(self, node_id: str) -> Union[MessageNode, None]:
@@ -488,47 +1892,515 @@ class Canvas:
     def iter_nodes(self) -> Iterable[MessageNode]:
         return self._nodes.values()
 
+    def insert_node(self, node: MessageNode) -> MessageNode:
+        """
+        Insert a fully formed node (e.g. one received from a client) without emitting events.
+
+        Commits do not carry updates for the nodes they extend, so the node is also added to
+        the child_ids of its parent and merge parents. Commits to different branches may be
+        delivered out of order, so a node whose parent is not in the canvas yet is linked
+        when the parent is inserted.
+
+        The insertion is still recorded in the changelog, see changes_since.
+
+        Args:
+            node: The MessageNode to store
+
+        Returns:
+            The stored MessageNode
+        """
+        with self._structure_lock:
+            node = self._insert_node(node)
+            event: CanvasCommitMessageEvent = {
+                "event_type": "commit_message",
+                "canvas_id": self.canvas_id,
+                "timestamp": time.time(),
+                "data": node,
+            }
+            self._record_change(event)
+            return node
+
+    def _insert_node(self, node: MessageNode) -> MessageNode:
+        """Store a fully formed node and link it. Callers hold the structural lock."""
+        orphan_child_ids = self._orphan_child_ids.pop(node["id"], None)
+        if orphan_child_ids:
+            missing_child_ids = [child_id for child_id in orphan_child_ids if child_id not in node["child_ids"]]
+            node = {**node, "child_ids": [*node["child_ids"], *missing_child_ids]}
+
+        self._release_content(node["id"])
+        node = self._intern_content(node)
+        self._nodes[node["id"]] = node
+        self._index_node(node["id"])
+        self._link_to_parents(node, adopt_orphans=True)
+        # The node may replace a stored one or complete the paths of its orphaned children
+        self._invalidate_cached(node["id"])
+        self._root_ids.pop(node["id"], None)
+        self._track_root(node)
+        self._track_leaf(node)
+        self._index_text(node)
+        self._index_meta(node)
+        self._index_time_ordered_id(node["id"])
+        self._gc.allocate(node["id"])
+        return node
+
+    def insert_nodes(self, nodes: list[MessageNode]) -> list[MessageNode]:
+        """
+        Insert a batch of fully formed nodes (e.g. one commit_messages event) without emitting events.
+
+        Args:
+            nodes: The MessageNodes to store, parents before children
+
+        Returns:
+            The stored MessageNodes
+        """
+        with self._structure_lock:
+            stored_nodes = [self._insert_node(node) for node in nodes]
+            if stored_nodes:
+                event: CanvasCommitMessagesEvent = {
+                    "event_type": "commit_messages",
+                    "canvas_id": self.canvas_id,
+                    "timestamp": time.time(),
+                    "data": stored_nodes,
+                }
+                self._record_change(event)
+            return stored_nodes
+
+    def remove_node(self, node_id: str) -> None:
+        """
+        Remove a node (e.g. one reported by a delete_message event) without emitting events.
+
+        Args:
+            node_id: The ID of the node to remove
+
+        Raises:
+            ValueError: If the node doesn't exist or still has children
+        """
+        with self._structure_lock:
+            if node_id not in self._nodes:
+                raise ValueError(f"Node with ID '{node_id}' does not exist")
+            if self._nodes[node_id]["child_ids"]:
+                raise ValueError(f"Node with ID '{node_id}' still has children")
+            self._remove_nodes([node_id])
+
+    # ---- Garbage Collection ----
+    def pin(self, node_id: str) -> None:
+        """
+        Keep a message and its history alive even if no branch leads to it.
+
+        Args:
+            node_id: The ID of the message to pin
+
+        Raises:
+            ValueError: If the node with the given ID doesn't exist
+        """
+        with self._structure_lock:
+            if node_id not in self._nodes:
+                raise ValueError(f"Node with ID '{node_id}' does not exist")
+            self._pinned_node_ids.add(node_id)
+            self._gc.shade(node_id)
+
+    def unpin(self, node_id: str) -> None:
+        """Stop pinning a message, so it is collected once no branch leads to it."""
+        with self._structure_lock:
+            self._pinned_node_ids.discard(node_id)
+
+    @property
+    def pinned_node_ids(self) -> frozenset[str]:
+        """Get the IDs of the pinned messages."""
+        with self._structure_lock:
+            return frozenset(self._pinned_node_ids)
+
+    @property
+    def garbage_collection_in_progress(self) -> bool:
+        """Whether an incremental collection cycle was started and has not finished yet."""
+        with self._structure_lock:
+            return self._gc.in_progress
+
+    def collect_garbage(self, budget: Union[int, None] = None) -> list[str]:
+        """
+        Remove the messages that can no longer be reached.
+
+        A message is reachable when it is in the history (including merged histories) of a
+        branch HEAD, of a detached checkout that is still referenced, or of a pinned message.
+        Unreachable messages are removed in bulk and a delete_message event is emitted for
+        each of them, descendants before ancestors.
+
+        Without a budget a whole mark-and-sweep cycle runs at once. With a budget, at most
+        that many messages are marked or swept per call and the cycle resumes on the next
+        call, so a long-lived canvas can be collected a little at a time (for example after
+        every few commits). Messages committed while a cycle is in progress are kept.
+
+        Args:
+            budget: The maximum number of messages to visit in this call (None for a full cycle)
+
+        Returns:
+            The IDs of the removed messages
+        """
+        with self._structure_lock:
+            in_progress = self._gc.in_progress
+
+        if not in_progress:
+            # Hold every branch lock while reading the roots so no commit is between storing
+            # its node and moving its branch HEAD
+            with ExitStack() as stack:
+                for lock in self._branch_locks:
+                    stack.enter_context(lock)
+                stack.enter_context(self._structure_lock)
+                if not self._gc.in_progress:
+                    self._gc.start(self._gc_root_ids())
+
+        with self._structure_lock:
+            garbage = self._gc.step(self._nodes, budget)
+            events = self._remove_nodes(garbage)
+
+        for event in events:
+            self._emit_event(event)
+
+        return garbage
+
+    def _gc_root_ids(self) -> list[str]:
+        """Get the IDs garbage collection starts marking from. Callers hold the structural lock."""
+        head_ids = [info["head_node_id"] for info in self._branches.values()]
+        head_ids.extend(branch.head_node_id for branch in self._detached_branches)
+        return [node_id for node_id in (*head_ids, *self._pinned_node_ids) if node_id is not None]
+
+    def _remove_nodes(self, node_ids: list[str]) -> list[CanvasDeleteMessageEvent]:
+        """
+        Remove nodes and unlink them from surviving parents. Callers hold the structural lock.
+
+        Returns:
+            The delete_message events recorded in the changelog, one per node
+        """
+        removed_ids = set(node_ids)
+        for node_id in node_ids:
+            node = self._nodes[node_id]
+            for parent_id in (node["parent_id"], *node.get("merge_parent_ids", ())):
+                if parent_id is None or parent_id in removed_ids or parent_id not in self._nodes:
+                    continue
+                parent_node = self._nodes[parent_id]
+                if node_id in parent_node["child_ids"]:
+                    child_ids = [child_id for child_id in parent_node["child_ids"] if child_id != node_id]
+                    self._nodes[parent_id] = {**parent_node, "child_ids": child_ids}
+                    if not child_ids:
+                        self._leaf_ids[parent_id] = None
+
+        for node_id in node_ids:
+            del self._nodes[node_id]
+            self._release_content(node_id)
+            self._ancestry.discard(node_id)
+            self._orphan_child_ids.pop(node_id, None)
+            self._root_ids.pop(node_id, None)
+            self._leaf_ids.pop(node_id, None)
+            self._token_counts.pop(node_id, None)
+            self._path_token_counts.pop(node_id, None)
+            for converted in self._converted_messages.values():
+                converted.pop(node_id, None)
+            if self._search_index is not None:
+                self._search_index.remove(node_id)
+            for index in (self._meta_indexes or {}).values():
+                index.remove(node_id)
+            self._unindex_time_ordered_id(node_id)
+
+        events: list[CanvasDeleteMessageEvent] = []
+        for node_id in node_ids:
+            event: CanvasDeleteMessageEvent = {
+                "event_type": "delete_message",
+                "canvas_id": self.canvas_id,
+                "timestamp": time.time(),
+                "data": node_id,
+            }
+            self._record_change(event)
+            events.append(event)
+        return events
+
+    def get_path(self, node_id: str) -> list[MessageNode]:
+        """
+        Get the conversation path from the root down to a node.
+
+        The path is read from the ancestry index maintained by add_message instead of
+        walking parent_id links one node at a time.
+
+        Args:
+            node_id: The ID of the last node of the path
+
+        Returns:
+            The MessageNodes from the root to the given node (inclusive)
+
+        Raises:
+            ValueError: If the node with the given ID doesn't exist
+        """
+        with self._structure_lock:
+            if node_id not in self._nodes:
+                raise ValueError(f"Node with ID '{node_id}' does not exist")
+
+            if self._index_node(node_id):
+                return [self._nodes[path_node_id] for path_node_id in self._ancestry.path(node_id)]
+
+            # An ancestor has not been received yet: return the part of the path that is known
+            path = []
+            current_id: Union[str, None] = node_id
+            while current_id is not None and current_id in self._nodes:
+                path.append(self._nodes[current_id])
+                current_id = path[-1]["parent_id"]
+            return path[::-1]
+
+    def _index_node(self, node_id: str) -> bool:
+        """
+        Add a node and its unindexed ancestors to the ancestry index, root first.
+
+        Chains leading to a parent that is not in the canvas (e.g. a node received out of order)
+        are left unindexed, so they are not mistaken for roots.
+
+        Returns:
+            Whether the node is indexed
+        """
+        pending: list[str] = []
+        current_id: Union[str, None] = node_id
+        while current_id is not None and current_id in self._nodes and current_id not in self._ancestry:
+            pending.append(current_id)
+            current_id = self._nodes[current_id]["parent_id"]
+
+        if current_id is not None and current_id not in self._ancestry:
+            return False
+
+        for pending_id in reversed(pending):
+            self._ancestry.add(pending_id, self._nodes[pending_id]["parent_id"])
+        return True
+
+    def _intern_content(self, node: MessageNode) -> MessageNode:
+        """Replace a node's content with the shared copy from the content store, if one is configured."""
+        if self._content_store is None:
+            return node
+
+        message = node["message"]
+        digest, content = self._content_store.intern(message["content"])
+        self._content_digests[node["id"]] = digest
+        if content is message["content"]:
+            return node
+        return {**node, "message": {**message, "content": content}}
+
+    def _release_content(self, node_id: str) -> None:
+        """Drop a node's reference on its content in the content store."""
+        # References of nodes shared with forks are released with their share
+        shared = isinstance(self._content_digests, LayeredMapping) and not self._content_digests.is_local(node_id)
+        digest = self._content_digests.pop(node_id, None)
+        if digest is not None and self._content_store is not None and not shared:
+            self._content_store.release(digest)
+
+    def release_content(self) -> None:
+        """Release every content reference this canvas holds in its content store.
+
+        Call this when discarding a canvas that shares a long-lived ContentStore.
+        """
+        with self._structure_lock:
+            if self._content_store is not None:
+                digests = self._content_digests
+                local_digests = digests.local_mapping() if isinstance(digests, LayeredMapping) else digests
+                for digest in local_digests.values():
+                    self._content_store.release(digest)
+                for share in self._content_shares:
+                    share.release(self._content_store)
+            self._content_digests = {}
+            self._content_shares = []
+
+    def fork(
+        self,
+        canvas_id: Union[str, None] = None,
+        title: Union[str, None] = None,
+        description: Union[str, None] = None,
+    ) -> Canvas:
+        """
+        Create a copy of this canvas in constant time, e.g. to run A/B prompt experiments.
+
+        The fork shares the existing nodes with this canvas instead of copying them: both
+        canvases read through the same frozen node layers and write their own changes to
+        separate layers, so memory only grows with the commits made after forking. Branches
+        and pinned messages are copied; event listeners are not.
+
+        Content shared with a ContentStore stays referenced until every canvas sharing it has
+        called release_content.
+
+        Args:
+            canvas_id: Optional ID for the fork (a UUID is generated when omitted)
+            title: Optional title for the fork (defaults to this canvas's title)
+            description: Optional description for the fork (defaults to this canvas's description)
+
+        Returns:
+            The forked Canvas
+        """
+        forked = Canvas(
+            canvas_id=canvas_id,
+            title=title if title is not None else self.title,
+            description=description if description is not None else self.description,
+            content_store=self._content_store,
+        )
+
+        with self._structure_lock:
+            forked._nodes = self._layered_nodes().fork()
+            forked._ancestry = self._ancestry.fork()
+
+            if isinstance(self._content_digests, LayeredMapping):
+                local_digests = self._content_digests.local_mapping()
+            else:
+                local_digests = self._content_digests
+                self._content_digests = LayeredMapping(local_digests)
+            if local_digests:
+                # The references taken since the last fork become jointly held
+                self._content_shares.append(_SharedContentReferences(local_digests))
+            forked._content_digests = self._content_digests.fork()
+            for share in self._content_shares:
+                share.acquire()
+            forked._content_shares = list(self._content_shares)
+
+            self._token_counts = self._layered(self._token_counts)
+            self._path_token_counts = self._layered(self._path_token_counts)
+            forked._token_counter = self._token_counter
+            forked._node_id_factory = self._node_id_factory
+            forked._token_counts = self._token_counts.fork()
+            forked._path_token_counts = self._path_token_counts.fork()
+            for name, converted in self._converted_messages.items():
+                forked._converted_messages[name] = converted.fork()
+
+            forked._branches = {name: info.copy() for name, info in self._branches.items()}
+            forked._current_branch = self._current_branch
+            forked._pinned_node_ids = set(self._pinned_node_ids)
+            forked._root_ids = dict(self._root_ids)
+            forked._leaf_ids = dict(self._leaf_ids)
+            forked.last_updated = self.last_updated
+            forked._version = forked._changelog_start = self._version
+            forked._orphan_child_ids = {node_id: list(child_ids) for node_id, child_ids in self._orphan_child_ids.items()}
+            forked._meta_index_keys = list(self._meta_index_keys)
+            forked._meta_indexes = None if self._meta_index_keys else {}
+
+        return forked
+
+    @staticmethod
+    def _layered(mapping: MutableMapping[str, Any]) -> LayeredMapping[str, Any]:
+        """Wrap a mapping in a LayeredMapping so it can be forked, unless it already is one."""
+        return mapping if isinstance(mapping, LayeredMapping) else LayeredMapping(mapping)
+
+    def _layered_nodes(self) -> LayeredMapping[str, MessageNode]:
+        """Get the node store as a LayeredMapping, wrapping it on first use. Callers hold the structural lock."""
+        if not isinstance(self._nodes, LayeredMapping):
+            compact = isinstance(self._nodes, CompactNodeStore)
+            self._nodes = LayeredMapping(self._nodes, top_factory=CompactNodeStore if compact else dict)
+        return self._nodes
+
+    @property
+    def version(self) -> int:
+        """Get the sequence number of the last change to the nodes (0 before the first change)."""
+        return self._version
+
+    def changes_since(self, version: int) -> Union[list[CanvasChange], None]:
+        """
+        Get the changes made after a version, e.g. to bring a replica of the canvas up to date.
+
+        Only the most recent changes are kept. When some of the requested changes are no
+        longer available (or the version is ahead of the canvas), None is returned and the
+        caller should start over from a snapshot.
+
+        Args:
+            version: The version the caller has seen, e.g. that of a snapshot or the last change
+
+        Returns:
+            The changes in the order they were made, or None if they are not all available
+        """
+        with self._structure_lock:
+            if version < self._changelog_start or version > self._version:
+                return None
+            changes: list[CanvasChange] = []
+            # Read from the newest end so the cost grows with the number of changes returned
+            for change in reversed(self._changelog):
+                if change["version"] <= version:
+                    break
+                changes.append(change)
+        changes.reverse()
+        return changes
+
+    def snapshot(self) -> CanvasSnapshot:
+        """
+        Get a read-only, consistent view of the canvas without copying its nodes.
+
+        The nodes written since the previous snapshot or fork are frozen into a layer that
+        is shared with the canvas, which writes to a new layer from then on. A snapshot can
+        therefore be read or serialized while other threads keep committing, and it always
+        shows the nodes as of its version.
+
+        Returns:
+            The CanvasSnapshot
+        """
+        with self._structure_lock:
+            return CanvasSnapshot(self, self._layered_nodes().snapshot())
+
     def to_summary(self) -> CanvasSummary:
-        """Create a summary representation of the canvas."""
+        """
+        Create a summary representation of the canvas.
 
-        # find all root nodes
-        # a root node is a node that has no parent
-        root_ids = [node_id for node_id, node in self._nodes.items() if node["parent_id"] is None]
-        return {
+        The root IDs, leaf IDs, node count, last update time and token totals are maintained as
+        nodes are added, updated and removed, so a summary does not scan the nodes. Branch
+        token totals are only included when a branch has commits, and the token totals of the
+        conversation HEADs (messages without children) when the canvas has messages. Canvases
+        that only receive commits, like the ones on the server, have no branches but do have HEADs.
+        """
+        with self._structure_lock:
+            root_ids = list(self._root_ids)
+            node_count = len(self._nodes)
+            last_updated = self.last_updated
+            branch_token_counts = {
+                name: self.path_token_count(info["head_node_id"])
+                for name, info in self._branches.items()
+                if info["head_node_id"]
+            }
+            head_token_counts = {leaf_id: self.path_token_count(leaf_id) for leaf_id in self._leaf_ids}
+        summary: CanvasSummary = {
             "canvas_id": self.canvas_id,
             "created_at": self.created_at,
             "root_ids": root_ids,
-            "node_count": len(self._nodes),
+            "node_count": node_count,
             "title": self.title,
             "description": self.description,
-            "meta": {"last_updated": time.time()},
+            "meta": {"last_updated": last_updated},
         }
+        if branch_token_counts:
+            summary["branch_token_counts"] = branch_token_counts
+        if head_token_counts:
+            summary["head_token_counts"] = head_token_counts
+        return summary
 
     def to_canvas_data(self) -> CanvasData:
-        """Convert the canvas to CanvasData format."""
-
-        return {
-            "canvas_id": self.canvas_id,
-            "created_at": self.created_at,
-            "nodes": dict(self._nodes),
-            "title": self.title,
-            "description": self.description,
-            "last_updated": time.time(),
-        }
+        """Convert the canvas to CanvasData format, with a copy of the nodes that may be modified."""
+        snapshot = self.snapshot()
+        return {**snapshot.to_canvas_data(), "nodes": dict(snapshot.nodes.items())}
 
     @classmethod
-    def from_canvas_data(cls, data: CanvasData) -> Canvas:
+    def from_canvas_data(
+        cls,
+        data: CanvasData,
+        node_store: Union[NodeStore, None] = None,
+        content_store: Union[ContentStore, None] = None,
+    ) -> Canvas:
         """Create a Canvas instance from CanvasData."""
         canvas = cls(
             canvas_id=data["canvas_id"],
             title=data.get("title"),
             description=data.get("description"),
+            node_store=node_store,
+            content_store=content_store,
         )
 
-        # Set the creation time from the data
+        # Set the creation and last update times from the data
         canvas.created_at = data["created_at"]
+        canvas.last_updated = data.get("last_updated") or data["created_at"]
 
         # Load all nodes
-        canvas._nodes = dict(data["nodes"])
+        for node_id, node in data["nodes"].items():
+            canvas._nodes[node_id] = canvas._intern_content(node)
+        for node_id, node in canvas._nodes.items():
+            canvas._index_node(node_id)
+            canvas._track_root(node)
+            canvas._track_leaf(node)
+            # Loaded canvases have no branches yet, so keep their conversations alive
+            if not node["child_ids"]:
+                canvas._pinned_node_ids.add(node_id)
 
         return canvas
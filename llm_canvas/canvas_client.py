@@ -12,24 +12,52 @@ This module provides a simplified, one-stop solution for users to:
 
 from __future__ import annotations
 
+import atexit
 import logging
 import threading
+from http import HTTPStatus
 from typing import Union
 
 from httpx import Timeout
 
+from llm_canvas.blob_store import inline_blobs
 from llm_canvas.canvas_registry import CanvasRegistry
-from llm_canvas.types import CanvasCommitMessageEvent, CanvasEvent, CanvasUpdateMessageEvent
+from llm_canvas.content_store import ContentStore
+from llm_canvas.event_queue import EventQueue
+from llm_canvas.types import (
+    CanvasCommitMessageEvent,
+    CanvasCommitMessagesEvent,
+    CanvasDeleteMessageEvent,
+    CanvasEvent,
+    CanvasMessageDeltaEvent,
+    CanvasUpdateMessageEvent,
+    MessageNode,
+)
 from llm_canvas_generated_client.llm_canvas_api_client import Client
+from llm_canvas_generated_client.llm_canvas_api_client.api.v1 import (
+    apply_message_delta_api_v1_canvas_canvas_id_messages_message_id_delta_post as message_delta_api,
+)
 from llm_canvas_generated_client.llm_canvas_api_client.api.v1 import (
     commit_message_api_v1_canvas_canvas_id_messages_post as commit_message_api,
 )
+from llm_canvas_generated_client.llm_canvas_api_client.api.v1 import (
+    commit_messages_api_v1_canvas_canvas_id_messages_batch_post as commit_messages_api,
+)
 from llm_canvas_generated_client.llm_canvas_api_client.api.v1 import (
     create_canvas_api_v1_canvas_post as create_canvas_api,
 )
 from llm_canvas_generated_client.llm_canvas_api_client.api.v1 import (
     delete_canvas_api_v1_canvas_canvas_id_delete as delete_canvas_api,
 )
+from llm_canvas_generated_client.llm_canvas_api_client.api.v1 import (
+    delete_message_api_v1_canvas_canvas_id_messages_message_id_delete as delete_message_api,
+)
+from llm_canvas_generated_client.llm_canvas_api_client.api.v1 import (
+    fork_canvas_api_v1_canvas_canvas_id_fork_post as fork_canvas_api,
+)
+from llm_canvas_generated_client.llm_canvas_api_client.api.v1 import (
+    get_blob_api_v1_blobs_digest_get as get_blob_api,
+)
 from llm_canvas_generated_client.llm_canvas_api_client.api.v1 import (
     get_canvas_api_v1_canvas_get as get_canvas_api,
 )
@@ -45,16 +73,30 @@ from llm_canvas_generated_client.llm_canvas_api_client.api.v1 import (
 from llm_canvas_generated_client.llm_canvas_api_client.models.canvas_commit_message_event import (
     CanvasCommitMessageEvent as GeneratedCanvasCommitMessageEvent,
 )
+from llm_canvas_generated_client.llm_canvas_api_client.models.canvas_commit_messages_event import (
+    CanvasCommitMessagesEvent as GeneratedCanvasCommitMessagesEvent,
+)
+from llm_canvas_generated_client.llm_canvas_api_client.models.canvas_message_delta_event import (
+    CanvasMessageDeltaEvent as GeneratedCanvasMessageDeltaEvent,
+)
 from llm_canvas_generated_client.llm_canvas_api_client.models.canvas_update_message_event import (
     CanvasUpdateMessageEvent as GeneratedCanvasUpdateMessageEvent,
 )
 from llm_canvas_generated_client.llm_canvas_api_client.models.commit_message_request import (
     CommitMessageRequest,
 )
+from llm_canvas_generated_client.llm_canvas_api_client.models.commit_messages_request import (
+    CommitMessagesRequest,
+)
 from llm_canvas_generated_client.llm_canvas_api_client.models.create_canvas_request import CreateCanvasRequest
 from llm_canvas_generated_client.llm_canvas_api_client.models.create_canvas_response import CreateCanvasResponse
+from llm_canvas_generated_client.llm_canvas_api_client.models.create_message_response import CreateMessageResponse
+from llm_canvas_generated_client.llm_canvas_api_client.models.delete_message_response import DeleteMessageResponse
+from llm_canvas_generated_client.llm_canvas_api_client.models.fork_canvas_request import ForkCanvasRequest
 from llm_canvas_generated_client.llm_canvas_api_client.models.http_validation_error import HTTPValidationError
+from llm_canvas_generated_client.llm_canvas_api_client.models.message_delta_request import MessageDeltaRequest
 from llm_canvas_generated_client.llm_canvas_api_client.models.update_message_request import UpdateMessageRequest
+from llm_canvas_generated_client.llm_canvas_api_client.types import Unset
 
 from .canvas import Canvas, CanvasData, CanvasSummary
 
@@ -73,9 +115,14 @@ class CanvasClient:
         client = CanvasClient()
         canvas = client.create_canvas("My Chat", "A conversation about AI")
         client.add_message(canvas.canvas_id, "Hello!", "user")
+
+    By default, each commit waits until it has been sent to the server. With
+    background_events=True, commits only queue their events and a background thread sends
+    them, in commit order for each canvas. Reads from the server (e.g. get_canvas) wait for
+    the queued events first; call flush() to wait for them explicitly.
     """
 
-    def __init__(self, server_host: str = "127.0.0.1", server_port: int = 8000) -> None:
+    def __init__(self, server_host: str = "127.0.0.1", server_port: int = 8000, background_events: bool = False) -> None:
         self.registry = CanvasRegistry()
         self._server_thread: Union[threading.Thread, None] = None
         self._server_running = False
@@ -87,6 +134,14 @@ class CanvasClient:
 
         # Event tracking for canvases
         self._event_lock = threading.Lock()
+        self._event_queue: Union[EventQueue, None] = None
+        if background_events:
+            self._event_queue = EventQueue(self._on_canvas_event)
+            # Send the events still queued when the program exits
+            atexit.register(self.close)
+
+        # Message content shared by the canvases this client loads
+        self._content_store = ContentStore()
 
         if not self.check_server_health():
             self._prompt_user_to_start_server()
@@ -98,9 +153,14 @@ class CanvasClient:
             try:
                 if event["event_type"] == "commit_message":
                     self._call_commit_message_api(event)
+                elif event["event_type"] == "commit_messages":
+                    self._call_commit_messages_api(event)
                 elif event["event_type"] == "update_message":
                     self._call_update_message_api(event)
-                # Ignore delete_message events for now
+                elif event["event_type"] == "message_delta":
+                    self._call_message_delta_api(event)
+                elif event["event_type"] == "delete_message":
+                    self._call_delete_message_api(event)
             except Exception:
                 logger.exception("Error calling API endpoint for canvas event")
 
@@ -120,6 +180,22 @@ class CanvasClient:
         except Exception as e:
             logger.warning("Failed to call commit message API: %s", e)
 
+    def _call_commit_messages_api(self, event: CanvasCommitMessagesEvent) -> None:
+        """Call the batch commit messages API endpoint."""
+        canvas_id = event["canvas_id"]
+
+        try:
+            request = CommitMessagesRequest(data=GeneratedCanvasCommitMessagesEvent.from_dict(event))
+            response = commit_messages_api.sync(canvas_id=canvas_id, client=self._api_client, body=request)
+
+            if response:
+                logger.debug("Successfully called commit messages API for canvas %s", canvas_id)
+            else:
+                logger.warning("Failed to call commit messages API")
+
+        except Exception as e:
+            logger.warning("Failed to call commit messages API: %s", e)
+
     def _call_update_message_api(self, event: CanvasUpdateMessageEvent) -> None:
         """Call the update message API endpoint."""
         canvas_id = event["canvas_id"]
@@ -139,9 +215,70 @@ class CanvasClient:
         except Exception as e:
             logger.warning("Failed to call update message API: %s", e)
 
+    def _call_message_delta_api(self, event: CanvasMessageDeltaEvent) -> None:
+        """Call the message delta API endpoint."""
+        canvas_id = event["canvas_id"]
+        message_id = event["data"]["id"]
+
+        try:
+            request = MessageDeltaRequest(data=GeneratedCanvasMessageDeltaEvent.from_dict(event))
+            response = message_delta_api.sync(canvas_id=canvas_id, message_id=message_id, client=self._api_client, body=request)
+
+            if isinstance(response, CreateMessageResponse):
+                logger.debug("Successfully called message delta API for canvas %s", canvas_id)
+            else:
+                logger.warning("Failed to call message delta API")
+
+        except Exception as e:
+            logger.warning("Failed to call message delta API: %s", e)
+
+    def _call_delete_message_api(self, event: CanvasDeleteMessageEvent) -> None:
+        """Call the delete message API endpoint."""
+        canvas_id = event["canvas_id"]
+        message_id = event["data"]
+
+        try:
+            response = delete_message_api.sync(canvas_id=canvas_id, message_id=message_id, client=self._api_client)
+
+            if isinstance(response, DeleteMessageResponse):
+                logger.debug("Successfully called delete message API for canvas %s", canvas_id)
+            else:
+                logger.warning("Failed to call delete message API")
+
+        except Exception as e:
+            logger.warning("Failed to call delete message API: %s", e)
+
     def _setup_canvas_event_tracking(self, canvas: Canvas) -> None:
         """Set up event tracking for a canvas by adding our event listener."""
-        canvas.add_event_listener(self._on_canvas_event)
+        canvas.add_event_listener(self._event_queue if self._event_queue is not None else self._on_canvas_event)
+
+    def flush(self, timeout: Union[float, None] = None) -> bool:
+        """Wait until the queued canvas events have been sent to the server (see background_events).
+
+        Args:
+            timeout: The maximum number of seconds to wait (None to wait as long as needed)
+
+        Returns:
+            True if all events were sent, False if the timeout expired first
+        """
+        if self._event_queue is None:
+            return True
+        return self._event_queue.flush(timeout)
+
+    def close(self, timeout: Union[float, None] = None) -> bool:
+        """Send the queued canvas events and stop the background thread.
+
+        Events committed afterwards are sent on the committing thread.
+
+        Args:
+            timeout: The maximum number of seconds to wait for the queued events
+
+        Returns:
+            True if all events were sent, False if the timeout expired first
+        """
+        if self._event_queue is None:
+            return True
+        return self._event_queue.close(timeout)
 
     def check_server_health(self) -> bool:
         """Check if the server is running and healthy.
@@ -223,6 +360,50 @@ class CanvasClient:
             msg = f"Failed to create canvas via API: {e}"
             raise RuntimeError(msg) from e
 
+    def fork_canvas(
+        self,
+        canvas: Canvas,
+        title: Union[str, None] = None,
+        description: Union[str, None] = None,
+    ) -> Canvas:
+        """Fork a canvas on the server and locally without copying its messages.
+
+        The local fork keeps the branches of the canvas, so experiments can continue from them.
+
+        Args:
+            canvas: The canvas to fork
+            title: Optional title for the fork (defaults to the canvas title)
+            description: Optional description for the fork (defaults to the canvas description)
+
+        Returns:
+            The forked Canvas instance
+
+        Raises:
+            RuntimeError: If server is not running or the fork fails
+        """
+        if not self._ensure_server_running():
+            error_msg = "Canvas server is not running. Please start the server manually using 'llm-canvas server'."
+            raise RuntimeError(error_msg)
+
+        # The server forks its own copy, which must have every message committed so far
+        self.flush()
+        try:
+            request = ForkCanvasRequest(title=title, description=description)
+            response = fork_canvas_api.sync(canvas_id=canvas.canvas_id, client=self._api_client, body=request)
+
+            if isinstance(response, CreateCanvasResponse):
+                forked = canvas.fork(canvas_id=response.canvas_id, title=title, description=description)
+                self._setup_canvas_event_tracking(forked)
+                logger.info("Forked canvas %s into %s", canvas.canvas_id, response.canvas_id)
+                return forked
+
+            msg = "Failed to fork canvas: No response from API"
+            raise RuntimeError(msg)
+
+        except Exception as e:
+            msg = f"Failed to fork canvas via API: {e}"
+            raise RuntimeError(msg) from e
+
     def get_canvas(self, canvas_id: str) -> Union[Canvas, None]:
         """Get a canvas by ID.
 
@@ -232,6 +413,7 @@ class CanvasClient:
         Returns:
             The Canvas instance if found, None otherwise
         """
+        self.flush()
         # Call API to get canvas
         try:
             canvas_data_response = get_canvas_api.sync(client=self._api_client, canvas_id=canvas_id)
@@ -244,9 +426,10 @@ class CanvasClient:
                         description=canvas_data_response.data.description,
                         created_at=canvas_data_response.data.created_at,
                         last_updated=canvas_data_response.data.last_updated,
-                        nodes=canvas_data_response.data.nodes.to_dict(),
+                        nodes=self._inline_blobs(canvas_data_response.data.nodes.to_dict()),
                         canvas_id=canvas_data_response.data.canvas_id,
-                    )
+                    ),
+                    content_store=self._content_store,
                 )
                 self._setup_canvas_event_tracking(canvas)
                 return canvas
@@ -256,6 +439,26 @@ class CanvasClient:
             logger.warning("Failed to get canvas %s via API: %s", canvas_id, e)
             return None
 
+    def _inline_blobs(self, nodes: dict[str, MessageNode]) -> dict[str, MessageNode]:
+        """Replace the blob URLs of server-stored images with base64 images, fetching each blob once."""
+        blobs: dict[str, Union[tuple[bytes, str], None]] = {}
+
+        def fetch(digest: str) -> Union[tuple[bytes, str], None]:
+            if digest not in blobs:
+                response = get_blob_api.sync_detailed(digest, client=self._api_client)
+                if response.status_code == HTTPStatus.OK:
+                    blobs[digest] = (response.content, response.headers.get("content-type", "image/png"))
+                else:
+                    logger.warning("Failed to get blob %s via API", digest)
+                    blobs[digest] = None
+            return blobs[digest]
+
+        for node in nodes.values():
+            content = inline_blobs(node["message"]["content"], fetch)
+            if content is not node["message"]["content"]:
+                node["message"] = {**node["message"], "content": content}
+        return nodes
+
     def list_canvases(self) -> list[Canvas]:
         """List all canvases in the registry.
 
@@ -299,23 +502,29 @@ class CanvasClient:
                 summaries.append(summary)
             return summaries
 
+        self.flush()
         # Call API to get canvas summaries
         try:
             response = list_canvases_api.sync(client=self._api_client)
 
             if response:
-                return [
-                    {
-                        "canvas_id": c.canvas_id,
-                        "created_at": c.created_at,
-                        "root_ids": c.root_ids,
-                        "node_count": c.node_count,
-                        "title": c.title,
-                        "description": c.description,
-                        "meta": c.meta.to_dict() if c.meta else {},
-                    }
-                    for c in response.canvases
-                ]
+                summaries = []
+                for c in response.canvases:
+                    summary = CanvasSummary(
+                        canvas_id=c.canvas_id,
+                        created_at=c.created_at,
+                        root_ids=c.root_ids,
+                        node_count=c.node_count,
+                        title=c.title,
+                        description=c.description,
+                        meta=c.meta.to_dict() if c.meta else {},
+                    )
+                    if not isinstance(c.branch_token_counts, Unset):
+                        summary["branch_token_counts"] = dict(c.branch_token_counts.additional_properties)
+                    if not isinstance(c.head_token_counts, Unset):
+                        summary["head_token_counts"] = dict(c.head_token_counts.additional_properties)
+                    summaries.append(summary)
+                return summaries
             logger.warning("Failed to get canvas summaries: No response from API")
             return []
 
@@ -338,6 +547,7 @@ class CanvasClient:
                 return None
             return canvas.to_canvas_data()
 
+        self.flush()
         # Call API to get canvas data
         try:
             canvas_data_response = get_canvas_api.sync(client=self._api_client, canvas_id=canvas_id)
@@ -348,7 +558,7 @@ class CanvasClient:
                     description=canvas_data_response.data.description,
                     created_at=canvas_data_response.data.created_at,
                     last_updated=canvas_data_response.data.last_updated,
-                    nodes=canvas_data_response.data.nodes.to_dict(),
+                    nodes=self._inline_blobs(canvas_data_response.data.nodes.to_dict()),
                 )
             return None
 
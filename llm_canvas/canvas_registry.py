@@ -2,29 +2,51 @@
 
 from __future__ import annotations
 
+import builtins
+import heapq
+import threading
 import time
 from typing import Union
 
+from llm_canvas._search import SearchCorpus, tokenize
 from llm_canvas.canvas import Canvas
+from llm_canvas.types import RegistrySearchHit, SearchFilters
 
 
 class CanvasRegistry:
     """Simple in-memory registry for managing Canvas instances."""
 
-    def __init__(self) -> None:
+    def __init__(self, search: bool = False) -> None:
+        """
+        Create an empty registry.
+
+        Args:
+            search: Whether to index the messages of every canvas for registry-wide search (see search)
+        """
         self._canvases: dict[str, Canvas] = {}
         self._last_updated: dict[str, float] = {}
+        self._search_corpus: Union[SearchCorpus, None] = SearchCorpus() if search else None
+        # Canvases not reporting to the search corpus yet. They are attached on the next
+        # search, so adding a canvas (e.g. a fork) does not index its messages.
+        self._unattached_ids: set[str] = set()
+        self._lock = threading.Lock()
 
     def add(self, canvas: Canvas) -> None:
         """Add a canvas to the registry."""
-        self._canvases[canvas.canvas_id] = canvas
-        self._last_updated[canvas.canvas_id] = time.time()
+        with self._lock:
+            replaced = self._canvases.get(canvas.canvas_id)
+            self._canvases[canvas.canvas_id] = canvas
+            self._last_updated[canvas.canvas_id] = time.time()
+            if self._search_corpus is not None and replaced is not canvas:
+                if replaced is not None:
+                    replaced.attach_search_corpus(None)
+                self._unattached_ids.add(canvas.canvas_id)
 
     def get(self, canvas_id: str) -> Union[Canvas, None]:
         """Get a canvas by ID."""
         return self._canvases.get(canvas_id)
 
-    def list(self) -> list[Canvas]:
+    def list(self) -> builtins.list[Canvas]:
         """List all canvases in the registry."""
         return list(self._canvases.values())
 
@@ -33,12 +55,15 @@ class CanvasRegistry:
 
         Returns True if removed, False if not found.
         """
-        if canvas_id in self._canvases:
-            del self._canvases[canvas_id]
-            if canvas_id in self._last_updated:
-                del self._last_updated[canvas_id]
-            return True
-        return False
+        with self._lock:
+            canvas = self._canvases.pop(canvas_id, None)
+            self._last_updated.pop(canvas_id, None)
+            self._unattached_ids.discard(canvas_id)
+            if canvas is None:
+                return False
+            if self._search_corpus is not None:
+                canvas.attach_search_corpus(None)
+        return True
 
     def touch(self, canvas_id: str) -> None:
         """Update the last_updated timestamp for a canvas."""
@@ -48,3 +73,51 @@ class CanvasRegistry:
     def last_updated(self, canvas_id: str) -> Union[float, None]:
         """Get the last updated timestamp for a canvas."""
         return self._last_updated.get(canvas_id)
+
+    def search(
+        self,
+        query: str,
+        limit: Union[int, None] = 20,
+        filters: Union[SearchFilters, None] = None,
+    ) -> builtins.list[RegistrySearchHit]:
+        """
+        Find the messages of any canvas in the registry containing the words of a query.
+
+        Every canvas keeps its own index and reports its term statistics to the registry, so
+        only the canvases containing a query word are searched, and their results are scored
+        against the whole registry and merged as if they came from a single index. Canvases
+        added since the last search are indexed first.
+
+        Args:
+            query: The words to search for (case-insensitive)
+            limit: The maximum number of results (None for all of them)
+            filters: Optional conditions on the role, content blocks and timestamp of the messages
+
+        Returns:
+            The matching messages, best matches first, with the ID of their canvas
+
+        Raises:
+            ValueError: If the registry was not created with search=True
+        """
+        if self._search_corpus is None:
+            raise ValueError("Search is not enabled for this registry")
+
+        with self._lock:
+            for canvas_id in self._unattached_ids:
+                self._canvases[canvas_id].attach_search_corpus(self._search_corpus)
+            self._unattached_ids.clear()
+
+        terms = tokenize(query)
+        canvas_ids, statistics = self._search_corpus.lookup(terms)
+        hits: list[RegistrySearchHit] = []
+        for canvas_id in canvas_ids:
+            canvas = self._canvases.get(canvas_id)
+            if canvas is None:
+                continue
+            hits.extend(
+                {"canvas_id": canvas_id, "node_id": hit["node_id"], "score": hit["score"], "snippet": hit["snippet"]}
+                for hit in canvas.search_terms(terms, limit, filters, statistics)
+            )
+        if limit is None:
+            return sorted(hits, key=lambda hit: hit["score"], reverse=True)
+        return heapq.nlargest(limit, hits, key=lambda hit: hit["score"])
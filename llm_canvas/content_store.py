@@ -0,0 +1,112 @@
+"""Content-addressed storage for message content.
+
+A ContentStore keeps one copy of each distinct Message content payload (a string or a
+list of blocks), keyed by a hash of its canonical JSON form and reference counted by the
+nodes that use it. Canvases sharing a store therefore hold repeated prompts only once.
+
+Stored content is shared between nodes and must be treated as immutable: replace a
+node's content through Canvas.update_message instead of modifying it in place.
+
+With a BlobStore, base64 images are moved out of the stored content into the blob store
+and replaced by URL references, so the content (and everything that serializes it) stays
+small. The images are released with the content.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from typing import Union
+
+from llm_canvas.blob_store import BlobStore
+from llm_canvas.types import MessageBlock
+
+MessageContent = Union[str, list[MessageBlock]]
+
+
+def content_digest(content: MessageContent) -> str:
+    """Compute the content address of a message content payload."""
+    if isinstance(content, str):
+        payload = b"s" + content.encode("utf-8")
+    else:
+        payload = b"j" + json.dumps(content, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class _ContentEntry:
+    __slots__ = ("blob_digests", "content", "ref_count")
+
+    def __init__(self, content: MessageContent, blob_digests: list[str]) -> None:
+        self.content = content
+        self.blob_digests = blob_digests
+        self.ref_count = 0
+
+
+class ContentStore:
+    """Thread-safe, reference-counted store of deduplicated message content."""
+
+    def __init__(self, blob_store: Union[BlobStore, None] = None) -> None:
+        """
+        Create a content store.
+
+        Args:
+            blob_store: Optional BlobStore to move base64 images into (images stay inline when omitted)
+        """
+        self.blob_store = blob_store
+        self._entries: dict[str, _ContentEntry] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, digest: object) -> bool:
+        return digest in self._entries
+
+    def intern(self, content: MessageContent) -> tuple[str, MessageContent]:
+        """
+        Add a reference to a content payload.
+
+        Args:
+            content: The message content to store
+
+        Returns:
+            The content digest and the canonical (shared) content object to store in the node,
+            with URL references in place of base64 images when there is a blob store
+        """
+        digest = content_digest(content)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                blob_digests: list[str] = []
+                if self.blob_store is not None:
+                    content, blob_digests = self.blob_store.externalize(content)
+                entry = self._entries[digest] = _ContentEntry(content, blob_digests)
+            entry.ref_count += 1
+            return digest, entry.content
+
+    def release(self, digest: str) -> None:
+        """Drop one reference to a content payload, freeing it when no references remain."""
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return
+            entry.ref_count -= 1
+            if entry.ref_count > 0:
+                return
+            del self._entries[digest]
+        if self.blob_store is not None:
+            for blob_digest in entry.blob_digests:
+                self.blob_store.release(blob_digest)
+
+    def get(self, digest: str) -> Union[MessageContent, None]:
+        """Get a content payload by digest."""
+        with self._lock:
+            entry = self._entries.get(digest)
+            return entry.content if entry is not None else None
+
+    def ref_count(self, digest: str) -> int:
+        """Get the number of references held on a content payload."""
+        with self._lock:
+            entry = self._entries.get(digest)
+            return entry.ref_count if entry is not None else 0
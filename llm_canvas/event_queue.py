@@ -0,0 +1,221 @@
+"""Background delivery of canvas events.
+
+Canvas listeners are called on the thread that made the change, so a slow listener (e.g.
+one that forwards every commit to a server over HTTP) slows down every commit. An
+EventQueue is a listener that only queues the event; background worker threads then call
+the wrapped listener:
+
+    events = EventQueue(forward_to_server)
+    canvas.add_event_listener(events)
+    ...
+    events.close()  # deliver what is left and stop the workers
+
+Events of one canvas always go to the same worker, so they are delivered in the order
+they were queued. Events of different canvases may be delivered concurrently when there
+is more than one worker. Events emitted after close are still queued until the worker of
+their canvas has stopped, and then delivered on the thread that emitted them, so the order
+holds across close too.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Literal, Union
+
+from llm_canvas.types import CanvasEvent
+
+logger = logging.getLogger(__name__)
+
+# What to do with an event when the queue is full:
+# - "block": wait for the workers to make room (no event is lost)
+# - "drop_newest": discard the new event
+# - "drop_oldest": discard the oldest queued event to make room for the new one
+OverflowPolicy = Literal["block", "drop_newest", "drop_oldest"]
+
+# Queued in place of an event to stop a worker
+_STOP = object()
+
+
+class EventQueue:
+    """A canvas event listener that delivers events to another listener from background threads."""
+
+    def __init__(
+        self,
+        listener: Callable[[CanvasEvent], None],
+        maxsize: int = 1000,
+        overflow: OverflowPolicy = "block",
+        workers: int = 1,
+    ) -> None:
+        """
+        Create the queue and start its workers.
+
+        Args:
+            listener: The listener to call with each event
+            maxsize: The maximum number of events waiting per worker
+            overflow: What to do with an event when the queue is full (see OverflowPolicy)
+            workers: The number of worker threads; events of one canvas always go to the same one
+
+        Raises:
+            ValueError: If maxsize or workers is not positive
+        """
+        if maxsize < 1 or workers < 1:
+            raise ValueError("maxsize and workers must be positive")
+
+        self._listener = listener
+        self._overflow = overflow
+        self._queues: list[queue.Queue[object]] = [queue.Queue(maxsize) for _ in range(workers)]
+        self._dropped_count = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        # Whether the worker of each queue has stopped, after which whoever queues an event
+        # delivers what is left. Reentrant, since a listener may emit events itself.
+        self._stopped = [False] * workers
+        self._stop_lock = threading.RLock()
+        self._threads = [
+            threading.Thread(target=self._run, args=(i,), name=f"canvas-events-{i}", daemon=True) for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    @property
+    def dropped_count(self) -> int:
+        """Get the number of events discarded because the queue was full."""
+        return self._dropped_count
+
+    @property
+    def closed(self) -> bool:
+        """Whether close has been called."""
+        return self._closed
+
+    def __call__(self, event: CanvasEvent) -> None:
+        """
+        Queue an event for delivery.
+
+        After close, once the worker of the canvas has stopped, the event (and anything
+        still queued before it) is delivered on the calling thread instead.
+        """
+        index = hash(event["canvas_id"]) % len(self._queues)
+        self._put(self._queues[index], event)
+        if self._closed:
+            self._deliver_if_stopped(index)
+
+    def flush(self, timeout: Union[float, None] = None) -> bool:
+        """
+        Wait until every queued event has been delivered.
+
+        Args:
+            timeout: The maximum number of seconds to wait (None to wait as long as needed)
+
+        Returns:
+            True if all events were delivered, False if the timeout expired first
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        for events in self._queues:
+            with events.all_tasks_done:
+                while events.unfinished_tasks:
+                    remaining = deadline - time.monotonic() if deadline is not None else None
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    events.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Union[float, None] = None) -> bool:
+        """
+        Deliver the queued events and stop the workers.
+
+        If the timeout expires, the workers keep delivering in the background until their
+        queues are drained, and events emitted meanwhile are queued behind the others.
+
+        Args:
+            timeout: The maximum number of seconds to wait for the queued events
+
+        Returns:
+            True if all events were delivered, False if the timeout expired first
+        """
+        if self._closed:
+            return True
+        self._closed = True
+        delivered = self.flush(timeout)
+        if not delivered:
+            # Let the workers finish in the background, they stop once their queue is drained
+            for events in self._queues:
+                threading.Thread(target=events.put, args=(_STOP,), daemon=True).start()
+            return False
+        for events in self._queues:
+            events.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        return True
+
+    def _put(self, events: queue.Queue[object], event: CanvasEvent) -> None:
+        """Queue an event, applying the overflow policy when the queue is full."""
+        if self._overflow == "block":
+            events.put(event)
+            return
+        while True:
+            try:
+                events.put_nowait(event)
+            except queue.Full:
+                pass
+            else:
+                return
+
+            with self._lock:
+                self._dropped_count += 1
+            if self._overflow == "drop_newest":
+                logger.warning("Event queue is full, dropping %s event", event["event_type"])
+                return
+            try:
+                dropped = events.get_nowait()
+            except queue.Empty:
+                continue
+            events.task_done()
+            logger.warning("Event queue is full, dropping queued %s event", dropped["event_type"])  # type: ignore[index]
+
+    def _run(self, index: int) -> None:
+        """Deliver events from one queue until the stop marker and whatever was queued after it."""
+        events = self._queues[index]
+        stopping = False
+        while True:
+            try:
+                event = events.get_nowait() if stopping else events.get()
+            except queue.Empty:
+                with self._stop_lock:
+                    # An event queued since get_nowait is delivered here rather than by its caller
+                    if events.empty():
+                        self._stopped[index] = True
+                        return
+                continue
+            try:
+                if event is _STOP:
+                    stopping = True
+                else:
+                    self._deliver(event)  # type: ignore[arg-type]
+            finally:
+                events.task_done()
+
+    def _deliver_if_stopped(self, index: int) -> None:
+        """Deliver the events left in a queue on the calling thread, if its worker has stopped."""
+        with self._stop_lock:
+            if not self._stopped[index]:
+                return
+            events = self._queues[index]
+            while True:
+                try:
+                    event = events.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    self._deliver(event)  # type: ignore[arg-type]
+                finally:
+                    events.task_done()
+
+    def _deliver(self, event: CanvasEvent) -> None:
+        """Call the listener, logging its errors so one failing event does not stop the worker."""
+        try:
+            self._listener(event)
+        except Exception:
+            logger.exception("Error delivering %s event", event["event_type"])
@@ -0,0 +1,85 @@
+"""Node ID schemes.
+
+Canvases give new nodes random UUID4 strings by default. ULIDs are an alternative: 26
+characters instead of 36, and ordered by creation time, so sorting node IDs sorts the nodes
+by age and "the nodes created since T" is a range scan over the sorted IDs:
+
+    canvas.node_id_factory = ulid
+    recent = canvas.nodes_between(time.time() - 3600)
+
+Both are plain strings, so canvases can hold nodes with either kind of ID.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from typing import Callable, Union
+
+NodeIdFactory = Callable[[], str]
+
+# Crockford's base32 alphabet, in ascending order so encoded IDs sort like their values
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_DECODING = {character: value for value, character in enumerate(_ALPHABET)}
+ULID_LENGTH = 26
+_TIMESTAMP_BITS = 48
+_RANDOM_BITS = 80
+
+_lock = threading.Lock()
+_last_timestamp = -1
+_last_random = 0
+
+
+def uuid4_id() -> str:
+    """Generate a random UUID4 string, the default node ID."""
+    return str(uuid.uuid4())
+
+
+def _encode(value: int) -> str:
+    characters = []
+    for _ in range(ULID_LENGTH):
+        characters.append(_ALPHABET[value & 31])
+        value >>= 5
+    return "".join(reversed(characters))
+
+
+def ulid() -> str:
+    """
+    Generate a ULID: a 48-bit millisecond timestamp followed by 80 random bits, in base32.
+
+    IDs generated in the same millisecond by this process increase monotonically, so they
+    sort in generation order too.
+    """
+    global _last_timestamp, _last_random
+
+    timestamp = int(time.time() * 1000)
+    with _lock:
+        if timestamp <= _last_timestamp and _last_random + 1 < 1 << _RANDOM_BITS:
+            timestamp = _last_timestamp
+            random = _last_random + 1
+        else:
+            random = int.from_bytes(os.urandom(_RANDOM_BITS // 8), "big")
+        _last_timestamp, _last_random = timestamp, random
+    return _encode(timestamp << _RANDOM_BITS | random)
+
+
+def ulid_timestamp(node_id: str) -> Union[float, None]:
+    """Get the creation time (Unix time) of a ULID, or None if the ID is not a ULID."""
+    if len(node_id) != ULID_LENGTH:
+        return None
+    value = 0
+    for character in node_id:
+        digit = _DECODING.get(character)
+        if digit is None:
+            return None
+        value = value << 5 | digit
+    if value >> (_TIMESTAMP_BITS + _RANDOM_BITS):
+        return None
+    return (value >> _RANDOM_BITS) / 1000
+
+
+def ulid_bound(timestamp: float) -> str:
+    """Get the smallest ULID of a time, e.g. the lower bound of a range scan over sorted IDs."""
+    return _encode(max(int(timestamp * 1000), 0) << _RANDOM_BITS)
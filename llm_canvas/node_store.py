@@ -0,0 +1,97 @@
+"""Node storage backends for Canvas.
+
+A node store is any mutable mapping from node ID to MessageNode. The default store is a
+plain dict. CompactNodeStore keeps each node in a slotted record and rebuilds the
+MessageNode mapping on access, which trades a little read time for a much smaller
+resident footprint on servers holding many nodes.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator, MutableMapping
+from typing import Any, Union
+
+from llm_canvas.types import Message, MessageBlock, MessageNode
+
+NodeStore = MutableMapping[str, MessageNode]
+
+# Marker for nodes whose meta is None (as opposed to a meta dict without extra keys)
+_NULL_META: dict[str, Any] = {}
+_EMPTY_CHILD_IDS: tuple[str, ...] = ()
+
+
+class _NodeRecord:
+    """Packed representation of a MessageNode (the node ID is the store key)."""
+
+    __slots__ = ("child_ids", "content", "extra_meta", "merge_parent_ids", "parent_id", "role", "timestamp")
+
+    def __init__(self, node: MessageNode) -> None:
+        message = node["message"]
+        self.content: Union[str, list[MessageBlock]] = message["content"]
+        self.role: str = sys.intern(message["role"])
+        self.parent_id = node["parent_id"]
+        self.child_ids = tuple(node["child_ids"]) if node["child_ids"] else _EMPTY_CHILD_IDS
+        merge_parent_ids = node.get("merge_parent_ids")
+        self.merge_parent_ids = tuple(merge_parent_ids) if merge_parent_ids is not None else None
+
+        meta = node["meta"]
+        self.timestamp: Union[float, None] = None
+        self.extra_meta: Union[dict[str, Any], None] = None
+        if meta is None:
+            self.extra_meta = _NULL_META
+        else:
+            extra = dict(meta)
+            self.timestamp = extra.pop("timestamp", None)
+            if extra:
+                self.extra_meta = extra
+
+    def to_node(self, node_id: str) -> MessageNode:
+        meta: Union[dict[str, Any], None]
+        if self.extra_meta is _NULL_META:
+            meta = None
+        else:
+            meta = {} if self.timestamp is None else {"timestamp": self.timestamp}
+            if self.extra_meta:
+                meta.update(self.extra_meta)
+
+        message: Message = {"content": self.content, "role": self.role}  # type: ignore[typeddict-item]
+        node: MessageNode = {
+            "id": node_id,
+            "message": message,
+            "parent_id": self.parent_id,
+            "child_ids": list(self.child_ids),
+            "meta": meta,
+        }
+        if self.merge_parent_ids is not None:
+            node["merge_parent_ids"] = list(self.merge_parent_ids)
+        return node
+
+
+class CompactNodeStore(MutableMapping[str, MessageNode]):
+    """Memory-compact node store backed by slotted records.
+
+    Each read returns a freshly built MessageNode, so changes to a returned node are only
+    persisted by assigning it back to the store (Canvas.update_message does this).
+    """
+
+    def __init__(self) -> None:
+        self._records: dict[str, _NodeRecord] = {}
+
+    def __getitem__(self, node_id: str) -> MessageNode:
+        return self._records[node_id].to_node(node_id)
+
+    def __setitem__(self, node_id: str, node: MessageNode) -> None:
+        self._records[node_id] = _NodeRecord(node)
+
+    def __delitem__(self, node_id: str) -> None:
+        del self._records[node_id]
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._records
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
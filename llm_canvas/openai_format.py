@@ -0,0 +1,202 @@
+"""Conversion between canvas messages and the OpenAI Chat Completions format.
+
+Canvas messages use Anthropic content blocks. OpenAI represents the same conversation
+differently: tool calls are a tool_calls list on the assistant message instead of
+tool_use blocks, and each tool result is a separate "tool" message instead of a
+tool_result block in a user message. These functions convert in both directions:
+
+    nodes = branch.commit_openai_messages([response.choices[0].message])
+    prompt = branch.to_openai_messages(max_tokens=100_000)
+    client.chat.completions.create(model=model, messages=prompt["messages"])
+
+Canvases cache the converted form of each message, so a history is only converted once.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping
+from typing import Any, Union
+
+from anthropic.types import ImageBlockParam
+from openai.types.chat import (
+    ChatCompletionContentPartParam,
+    ChatCompletionMessage,
+    ChatCompletionMessageFunctionToolCallParam,
+    ChatCompletionMessageParam,
+)
+
+from llm_canvas.types import Message, MessageBlock
+
+OpenAIMessage = Union[ChatCompletionMessageParam, ChatCompletionMessage]
+
+
+def _text(content: Union[str, Iterable[Mapping[str, Any]], None]) -> str:
+    """Join the text of string or list content in either format."""
+    if content is None:
+        return ""
+    if isinstance(content, str):
+        return content
+    return "".join(part["text"] for part in content if part.get("type") == "text")
+
+
+def _image_url(block: ImageBlockParam) -> str:
+    """Get the URL of an image block, as a data URL for inline images."""
+    source = block["source"]
+    if source["type"] == "url":
+        return source["url"]
+    if source["type"] == "base64":
+        return f"data:{source['media_type']};base64,{source['data']}"
+    raise ValueError(f"Images with a '{source['type']}' source cannot be converted")
+
+
+def _image_block(url: str) -> MessageBlock:
+    """Create an image block from an OpenAI image URL, decoding data URLs."""
+    if url.startswith("data:") and ";base64," in url:
+        media_type, data = url[len("data:") :].split(";base64,", 1)
+        return {"type": "image", "source": {"type": "base64", "media_type": media_type, "data": data}}  # type: ignore[typeddict-item]
+    return {"type": "image", "source": {"type": "url", "url": url}}
+
+
+def to_openai_messages(message: Message) -> list[ChatCompletionMessageParam]:
+    """
+    Convert a canvas message to OpenAI Chat Completions messages.
+
+    A user message with tool results becomes one "tool" message per result, followed by a
+    user message with the rest of its content. Tool uses of an assistant message become its
+    tool_calls. Blocks that OpenAI cannot represent there (e.g. images in assistant
+    messages) are left out.
+
+    Args:
+        message: The canvas message
+
+    Returns:
+        The OpenAI messages, in conversation order
+
+    Raises:
+        ValueError: If an image has a source without a URL form (e.g. an uploaded file)
+    """
+    content = message["content"]
+    if message["role"] == "system":
+        return [{"role": "system", "content": _text(content)}]
+
+    if message["role"] == "assistant":
+        if isinstance(content, str):
+            return [{"role": "assistant", "content": content}]
+        tool_calls: list[ChatCompletionMessageFunctionToolCallParam] = [
+            {
+                "id": block["id"],
+                "type": "function",
+                "function": {"name": block["name"], "arguments": json.dumps(block["input"])},
+            }
+            for block in content
+            if block["type"] == "tool_use"
+        ]
+        text = _text(content)
+        if not tool_calls:
+            return [{"role": "assistant", "content": text}]
+        return [{"role": "assistant", "content": text or None, "tool_calls": tool_calls}]
+
+    if isinstance(content, str):
+        return [{"role": "user", "content": content}]
+    messages: list[ChatCompletionMessageParam] = [
+        {"role": "tool", "tool_call_id": block["tool_use_id"], "content": _text(block.get("content"))}
+        for block in content
+        if block["type"] == "tool_result"
+    ]
+    parts: list[ChatCompletionContentPartParam] = []
+    for block in content:
+        if block["type"] == "text":
+            parts.append({"type": "text", "text": block["text"]})
+        elif block["type"] == "image":
+            parts.append({"type": "image_url", "image_url": {"url": _image_url(block)}})
+    if parts or not messages:
+        messages.append({"role": "user", "content": parts})
+    return messages
+
+
+def _from_user_content(content: Union[str, Iterable[Mapping[str, Any]], None]) -> Union[str, list[MessageBlock]]:
+    """Convert the content of an OpenAI user message."""
+    if isinstance(content, str):
+        return content
+    blocks: list[MessageBlock] = []
+    for part in content or ():
+        if part["type"] == "text":
+            blocks.append({"type": "text", "text": part["text"]})
+        elif part["type"] == "image_url":
+            blocks.append(_image_block(part["image_url"]["url"]))
+    return blocks
+
+
+def _from_assistant_message(message: dict[str, Any]) -> Union[str, list[MessageBlock]]:
+    """Convert the content and tool calls of an OpenAI assistant message."""
+    text = _text(message.get("content")) or message.get("refusal") or ""
+    tool_calls = [call for call in message.get("tool_calls") or () if call["type"] == "function"]
+    if not tool_calls:
+        return text
+    blocks: list[MessageBlock] = [{"type": "text", "text": text}] if text else []
+    blocks.extend(
+        {
+            "type": "tool_use",
+            "id": call["id"],
+            "name": call["function"]["name"],
+            "input": json.loads(call["function"]["arguments"] or "{}"),
+        }
+        for call in tool_calls
+    )
+    return blocks
+
+
+def from_openai_messages(messages: Iterable[OpenAIMessage]) -> list[Message]:
+    """
+    Convert OpenAI Chat Completions messages (e.g. a response message) to canvas messages.
+
+    Consecutive "tool" messages become a single user message with one tool_result block
+    each, and the tool_calls of an assistant message become tool_use blocks. Developer
+    messages become system messages.
+
+    Args:
+        messages: The OpenAI messages, as request parameters or response messages
+
+    Returns:
+        The canvas messages, in conversation order
+
+    Raises:
+        ValueError: If a message has a role without a canvas equivalent (e.g. "function")
+    """
+    converted: list[Message] = []
+    for openai_message in messages:
+        message: dict[str, Any] = (
+            openai_message.model_dump(exclude_none=True)
+            if isinstance(openai_message, ChatCompletionMessage)
+            else dict(openai_message)
+        )
+        role = message["role"]
+        content = message.get("content")
+
+        if role in ("system", "developer"):
+            converted.append({"role": "system", "content": _text(content)})
+        elif role == "tool":
+            block: MessageBlock = {
+                "type": "tool_result",
+                "tool_use_id": message["tool_call_id"],
+                "content": _text(content),
+            }
+            previous = converted[-1] if converted else None
+            # Results of the same assistant turn share one user message
+            if (
+                previous is not None
+                and previous["role"] == "user"
+                and isinstance(previous["content"], list)
+                and all(existing["type"] == "tool_result" for existing in previous["content"])
+            ):
+                previous["content"].append(block)
+            else:
+                converted.append({"role": "user", "content": [block]})
+        elif role == "user":
+            converted.append({"role": "user", "content": _from_user_content(content)})
+        elif role == "assistant":
+            converted.append({"role": "assistant", "content": _from_assistant_message(message)})
+        else:
+            raise ValueError(f"Messages with role '{role}' cannot be converted")
+    return converted
@@ -0,0 +1,65 @@
+"""Token counting for canvas messages.
+
+A token counter is a function returning the number of tokens of a message. Canvases
+count each message once when it is committed or updated and cache the result, together
+with the running total of every conversation path, so the size of a branch is known
+without counting its history again:
+
+    canvas.token_counter = my_tokenizer_based_counter
+    canvas.current_branch.token_count()
+
+The default counter is a cheap offline approximation (about four characters per token);
+plug in the tokenizer of the model you use when exact counts matter.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Callable, Union
+
+from llm_canvas.types import Message, MessageBlock
+
+TokenCounter = Callable[[Message], int]
+
+# Average number of characters per token of English text for common LLM tokenizers
+_CHARS_PER_TOKEN = 4
+
+# Tokens charged for an image, the cost of a large image for Anthropic models
+_IMAGE_TOKENS = 1600
+
+
+def _text_tokens(text: str) -> int:
+    return -(-len(text) // _CHARS_PER_TOKEN)
+
+
+def _content_tokens(content: Union[str, list[MessageBlock]]) -> int:
+    if isinstance(content, str):
+        return _text_tokens(content)
+
+    tokens = 0
+    for block in content:
+        if block["type"] == "text":
+            tokens += _text_tokens(block["text"])
+        elif block["type"] == "image":
+            tokens += _IMAGE_TOKENS
+        elif block["type"] == "tool_use":
+            tokens += _text_tokens(block["name"]) + _text_tokens(json.dumps(block["input"]))
+        elif block["type"] == "tool_result":
+            tokens += _content_tokens(block.get("content") or "")  # type: ignore[arg-type]
+    return tokens
+
+
+def approximate_token_count(message: Message) -> int:
+    """
+    Estimate the number of tokens of a message without a tokenizer.
+
+    Text is counted as one token per four characters, tool inputs by the length of their
+    JSON, and each image as a fixed number of tokens.
+
+    Args:
+        message: The message to count
+
+    Returns:
+        The estimated token count
+    """
+    return _content_tokens(message["content"])
@@ -6,9 +6,12 @@ including API request/response types and core data structures.
 
 from __future__ import annotations
 
-from typing import Any, Literal, TypedDict, Union
+from collections.abc import Mapping
+from typing import Any, Literal, Union
 
-from anthropic.types import ImageBlockParam, TextBlockParam, ToolResultBlockParam, ToolUseBlockParam
+from anthropic.types import ImageBlockParam, MessageParam, TextBlockParam, ToolResultBlockParam, ToolUseBlockParam
+from openai.types.chat import ChatCompletionMessageParam
+from typing_extensions import NotRequired, TypedDict
 
 # ---- Core Data Types ----
 
@@ -31,6 +34,8 @@ class MessageNode(TypedDict):
     parent_id: Union[str, None]
     child_ids: list[str]
     meta: Union[dict[str, Any], None]
+    # Additional parents of a merge commit (the merged source branch HEADs)
+    merge_parent_ids: NotRequired[list[str]]
 
 
 class CanvasSummary(TypedDict):
@@ -43,6 +48,12 @@ class CanvasSummary(TypedDict):
     title: Union[str, None]
     description: Union[str, None]
     meta: dict[str, Any]
+    # Token count of the history of each branch with commits, by name. Only canvases with such
+    # branches have it, which leaves out the canvases on the server: branches are client-side.
+    branch_token_counts: NotRequired[dict[str, int]]
+    # Token count of the history of each message without children (a conversation HEAD), by
+    # message ID. Every canvas with messages has it, including the canvases on the server.
+    head_token_counts: NotRequired[dict[str, int]]
 
 
 class CanvasData(TypedDict):
@@ -53,10 +64,10 @@ class CanvasData(TypedDict):
     description: Union[str, None]
     canvas_id: str
     created_at: float
-    nodes: dict[str, MessageNode]
+    nodes: Mapping[str, MessageNode]
 
 
-CanvasEventType = Literal["commit_message", "update_message", "delete_message"]
+CanvasEventType = Literal["commit_message", "commit_messages", "update_message", "message_delta", "delete_message"]
 
 
 class CanvasCommitMessageEvent(TypedDict):
@@ -68,6 +79,15 @@ class CanvasCommitMessageEvent(TypedDict):
     data: MessageNode
 
 
+class CanvasCommitMessagesEvent(TypedDict):
+    """Event data for a batch of messages committed together."""
+
+    event_type: Literal["commit_messages"]
+    canvas_id: str
+    timestamp: float
+    data: list[MessageNode]
+
+
 class CanvasUpdateMessageEvent(TypedDict):
     """Event data for canvas message updates."""
 
@@ -77,6 +97,26 @@ class CanvasUpdateMessageEvent(TypedDict):
     data: MessageNode
 
 
+class MessageDelta(TypedDict):
+    """An incremental change to a stored message, e.g. the next tokens of a streamed response."""
+
+    id: str  # ID of the message node
+    # Text appended to the content, or to the text block at block_index when the content is a list of blocks
+    text: NotRequired[str]
+    # Index of the text block to append to; the block count appends a new text block
+    block_index: NotRequired[int]
+    meta: NotRequired[dict[str, Any]]  # Meta keys to set
+
+
+class CanvasMessageDeltaEvent(TypedDict):
+    """Event data for incremental message changes."""
+
+    event_type: Literal["message_delta"]
+    canvas_id: str
+    timestamp: float
+    data: MessageDelta
+
+
 class CanvasDeleteMessageEvent(TypedDict):
     """Event data for canvas message deletions."""
 
@@ -86,7 +126,71 @@ class CanvasDeleteMessageEvent(TypedDict):
     data: str  # Node ID that was deleted
 
 
-CanvasEvent = Union[CanvasCommitMessageEvent, CanvasUpdateMessageEvent, CanvasDeleteMessageEvent]
+CanvasEvent = Union[
+    CanvasCommitMessageEvent,
+    CanvasCommitMessagesEvent,
+    CanvasUpdateMessageEvent,
+    CanvasMessageDeltaEvent,
+    CanvasDeleteMessageEvent,
+]
+
+
+class CanvasChange(TypedDict):
+    """A change in a canvas changelog."""
+
+    version: int  # Version of the canvas after the change
+    event: CanvasEvent
+
+
+# How to fit a history into a token budget when it is too long:
+# - "drop_oldest": drop the oldest messages, system messages included
+# - "keep_system": always keep the system messages and drop the oldest other messages
+TruncationStrategy = Literal["drop_oldest", "keep_system"]
+
+# Hash indexes answer equality queries on a meta key, sorted indexes numeric range queries
+MetaIndexKind = Literal["hash", "sorted"]
+
+
+class AnthropicPrompt(TypedDict):
+    """A conversation history converted to the Anthropic Messages API format."""
+
+    system: Union[str, None]  # Text of the kept system messages, for the system parameter
+    messages: list[MessageParam]
+    token_count: int  # Token count of the kept messages, system messages included
+    dropped_node_ids: list[str]  # IDs of the messages cut to fit the token budget, oldest first
+    dropped_token_count: int
+
+
+class OpenAIPrompt(TypedDict):
+    """A conversation history converted to the OpenAI Chat Completions format."""
+
+    messages: list[ChatCompletionMessageParam]
+    token_count: int  # Token count of the kept messages
+    dropped_node_ids: list[str]  # IDs of the messages cut to fit the token budget, oldest first
+    dropped_token_count: int
+
+
+class SearchHit(TypedDict):
+    """A message matching a search query."""
+
+    node_id: str
+    score: float  # Relevance of the message to the query (BM25), higher is better
+    snippet: str  # Text around the first match
+
+
+class RegistrySearchHit(SearchHit):
+    """A message of one of the canvases of a registry matching a search query."""
+
+    canvas_id: str
+
+
+class SearchFilters(TypedDict, total=False):
+    """Conditions messages must meet to be returned by a search."""
+
+    roles: list[str]  # Message roles, e.g. ["assistant"]
+    block_types: list[str]  # Content block types of which the message has at least one ("text" for string content)
+    since: float  # Earliest meta timestamp (Unix time)
+    until: float  # Latest meta timestamp (Unix time)
 
 
 class BranchInfo(TypedDict):
@@ -96,3 +200,19 @@ class BranchInfo(TypedDict):
     description: Union[str, None]
     head_node_id: Union[str, None]
     created_at: float
+
+
+class BranchComparison(TypedDict):
+    """How two branches relate to each other through their merge base."""
+
+    merge_base_id: Union[str, None]  # None when the branches share no history
+    ahead: int  # Messages on the first branch after the merge base
+    behind: int  # Messages on the second branch after the merge base
+
+
+class BranchDiff(TypedDict):
+    """Messages unique to each of two histories since their merge base."""
+
+    merge_base_id: Union[str, None]  # None when the histories share no messages
+    a_nodes: list[MessageNode]  # Messages only in the first history, oldest first
+    b_nodes: list[MessageNode]  # Messages only in the second history, oldest first
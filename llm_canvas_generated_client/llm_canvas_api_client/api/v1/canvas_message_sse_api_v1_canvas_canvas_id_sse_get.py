@@ -59,7 +59,9 @@ def sync_detailed(
     Sends events when messages are added, updated, or deleted in a specific canvas.
     Events include:
     - message_committed: When a new message is added to the canvas
+    - messages_committed: When a batch of messages is added to the canvas
     - message_updated: When an existing message is updated
+    - message_delta: When text is appended to a message or meta keys are set (carries only the change)
     - message_deleted: When a message is deleted
 
     Args:
@@ -103,7 +105,9 @@ def sync(
     Sends events when messages are added, updated, or deleted in a specific canvas.
     Events include:
     - message_committed: When a new message is added to the canvas
+    - messages_committed: When a batch of messages is added to the canvas
     - message_updated: When an existing message is updated
+    - message_delta: When text is appended to a message or meta keys are set (carries only the change)
     - message_deleted: When a message is deleted
 
     Args:
@@ -142,7 +146,9 @@ async def asyncio_detailed(
     Sends events when messages are added, updated, or deleted in a specific canvas.
     Events include:
     - message_committed: When a new message is added to the canvas
+    - messages_committed: When a batch of messages is added to the canvas
     - message_updated: When an existing message is updated
+    - message_delta: When text is appended to a message or meta keys are set (carries only the change)
     - message_deleted: When a message is deleted
 
     Args:
@@ -184,7 +190,9 @@ async def asyncio(
     Sends events when messages are added, updated, or deleted in a specific canvas.
     Events include:
     - message_committed: When a new message is added to the canvas
+    - messages_committed: When a batch of messages is added to the canvas
     - message_updated: When an existing message is updated
+    - message_delta: When text is appended to a message or meta keys are set (carries only the change)
     - message_deleted: When a message is deleted
 
     Args:
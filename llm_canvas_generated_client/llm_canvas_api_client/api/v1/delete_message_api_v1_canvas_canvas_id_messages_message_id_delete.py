@@ -0,0 +1,204 @@
+from http import HTTPStatus
+from typing import Any, Optional, Union
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.delete_message_response import DeleteMessageResponse
+from ...models.http_validation_error import HTTPValidationError
+from ...types import Response
+
+
+def _get_kwargs(
+    canvas_id: str,
+    message_id: str,
+) -> dict[str, Any]:
+    _kwargs: dict[str, Any] = {
+        "method": "delete",
+        "url": f"/api/v1/canvas/{canvas_id}/messages/{message_id}",
+    }
+
+    return _kwargs
+
+
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[Union[DeleteMessageResponse, HTTPValidationError]]:
+    if response.status_code == 200:
+        response_200 = DeleteMessageResponse.from_dict(response.json())
+
+        return response_200
+    if response.status_code == 422:
+        response_422 = HTTPValidationError.from_dict(response.json())
+
+        return response_422
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[Union[DeleteMessageResponse, HTTPValidationError]]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    canvas_id: str,
+    message_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+) -> Response[Union[DeleteMessageResponse, HTTPValidationError]]:
+    """Delete Message
+
+     Delete a message that has no children from a canvas.
+    Args:
+        canvas_id: Canvas UUID containing the message
+        message_id: Message ID to delete
+    Returns:
+        DeleteMessageResponse with the message ID and success message
+    Raises:
+        HTTPException: 404 if canvas or message not found, 409 if the message still has children
+
+    Args:
+        canvas_id (str): Canvas UUID
+        message_id (str): Message ID to delete
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[DeleteMessageResponse, HTTPValidationError]]
+    """
+
+    kwargs = _get_kwargs(
+        canvas_id=canvas_id,
+        message_id=message_id,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    canvas_id: str,
+    message_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+) -> Optional[Union[DeleteMessageResponse, HTTPValidationError]]:
+    """Delete Message
+
+     Delete a message that has no children from a canvas.
+    Args:
+        canvas_id: Canvas UUID containing the message
+        message_id: Message ID to delete
+    Returns:
+        DeleteMessageResponse with the message ID and success message
+    Raises:
+        HTTPException: 404 if canvas or message not found, 409 if the message still has children
+
+    Args:
+        canvas_id (str): Canvas UUID
+        message_id (str): Message ID to delete
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[DeleteMessageResponse, HTTPValidationError]
+    """
+
+    return sync_detailed(
+        canvas_id=canvas_id,
+        message_id=message_id,
+        client=client,
+    ).parsed
+
+
+async def asyncio_detailed(
+    canvas_id: str,
+    message_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+) -> Response[Union[DeleteMessageResponse, HTTPValidationError]]:
+    """Delete Message
+
+     Delete a message that has no children from a canvas.
+    Args:
+        canvas_id: Canvas UUID containing the message
+        message_id: Message ID to delete
+    Returns:
+        DeleteMessageResponse with the message ID and success message
+    Raises:
+        HTTPException: 404 if canvas or message not found, 409 if the message still has children
+
+    Args:
+        canvas_id (str): Canvas UUID
+        message_id (str): Message ID to delete
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[DeleteMessageResponse, HTTPValidationError]]
+    """
+
+    kwargs = _get_kwargs(
+        canvas_id=canvas_id,
+        message_id=message_id,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    canvas_id: str,
+    message_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+) -> Optional[Union[DeleteMessageResponse, HTTPValidationError]]:
+    """Delete Message
+
+     Delete a message that has no children from a canvas.
+    Args:
+        canvas_id: Canvas UUID containing the message
+        message_id: Message ID to delete
+    Returns:
+        DeleteMessageResponse with the message ID and success message
+    Raises:
+        HTTPException: 404 if canvas or message not found, 409 if the message still has children
+
+    Args:
+        canvas_id (str): Canvas UUID
+        message_id (str): Message ID to delete
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[DeleteMessageResponse, HTTPValidationError]
+    """
+
+    return (
+        await asyncio_detailed(
+            canvas_id=canvas_id,
+            message_id=message_id,
+            client=client,
+        )
+    ).parsed
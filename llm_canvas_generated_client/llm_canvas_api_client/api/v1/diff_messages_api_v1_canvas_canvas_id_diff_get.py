@@ -0,0 +1,231 @@
+from http import HTTPStatus
+from typing import Any, Optional, Union
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.canvas_diff_response import CanvasDiffResponse
+from ...models.http_validation_error import HTTPValidationError
+from ...types import UNSET, Response
+
+
+def _get_kwargs(
+    canvas_id: str,
+    *,
+    a: str,
+    b: str,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+
+    params["a"] = a
+
+    params["b"] = b
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": f"/api/v1/canvas/{canvas_id}/diff",
+        "params": params,
+    }
+
+    return _kwargs
+
+
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[Union[CanvasDiffResponse, HTTPValidationError]]:
+    if response.status_code == 200:
+        response_200 = CanvasDiffResponse.from_dict(response.json())
+
+        return response_200
+    if response.status_code == 422:
+        response_422 = HTTPValidationError.from_dict(response.json())
+
+        return response_422
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[Union[CanvasDiffResponse, HTTPValidationError]]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    a: str,
+    b: str,
+) -> Response[Union[CanvasDiffResponse, HTTPValidationError]]:
+    """Diff Messages
+
+     Get the messages unique to each of two histories since their merge base.
+    Args:
+        canvas_id: Canvas UUID containing the messages
+        a: Last message ID of the first history
+        b: Last message ID of the second history
+    Returns:
+        CanvasDiffResponse with the merge base ID and the divergent messages of each history
+    Raises:
+        HTTPException: 404 if canvas or message not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        a (str): Last message ID of the first history, e.g. a branch HEAD
+        b (str): Last message ID of the second history, e.g. a branch HEAD
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[CanvasDiffResponse, HTTPValidationError]]
+    """
+
+    kwargs = _get_kwargs(
+        canvas_id=canvas_id,
+        a=a,
+        b=b,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    a: str,
+    b: str,
+) -> Optional[Union[CanvasDiffResponse, HTTPValidationError]]:
+    """Diff Messages
+
+     Get the messages unique to each of two histories since their merge base.
+    Args:
+        canvas_id: Canvas UUID containing the messages
+        a: Last message ID of the first history
+        b: Last message ID of the second history
+    Returns:
+        CanvasDiffResponse with the merge base ID and the divergent messages of each history
+    Raises:
+        HTTPException: 404 if canvas or message not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        a (str): Last message ID of the first history, e.g. a branch HEAD
+        b (str): Last message ID of the second history, e.g. a branch HEAD
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[CanvasDiffResponse, HTTPValidationError]
+    """
+
+    return sync_detailed(
+        canvas_id=canvas_id,
+        client=client,
+        a=a,
+        b=b,
+    ).parsed
+
+
+async def asyncio_detailed(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    a: str,
+    b: str,
+) -> Response[Union[CanvasDiffResponse, HTTPValidationError]]:
+    """Diff Messages
+
+     Get the messages unique to each of two histories since their merge base.
+    Args:
+        canvas_id: Canvas UUID containing the messages
+        a: Last message ID of the first history
+        b: Last message ID of the second history
+    Returns:
+        CanvasDiffResponse with the merge base ID and the divergent messages of each history
+    Raises:
+        HTTPException: 404 if canvas or message not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        a (str): Last message ID of the first history, e.g. a branch HEAD
+        b (str): Last message ID of the second history, e.g. a branch HEAD
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[CanvasDiffResponse, HTTPValidationError]]
+    """
+
+    kwargs = _get_kwargs(
+        canvas_id=canvas_id,
+        a=a,
+        b=b,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    a: str,
+    b: str,
+) -> Optional[Union[CanvasDiffResponse, HTTPValidationError]]:
+    """Diff Messages
+
+     Get the messages unique to each of two histories since their merge base.
+    Args:
+        canvas_id: Canvas UUID containing the messages
+        a: Last message ID of the first history
+        b: Last message ID of the second history
+    Returns:
+        CanvasDiffResponse with the merge base ID and the divergent messages of each history
+    Raises:
+        HTTPException: 404 if canvas or message not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        a (str): Last message ID of the first history, e.g. a branch HEAD
+        b (str): Last message ID of the second history, e.g. a branch HEAD
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[CanvasDiffResponse, HTTPValidationError]
+    """
+
+    return (
+        await asyncio_detailed(
+            canvas_id=canvas_id,
+            client=client,
+            a=a,
+            b=b,
+        )
+    ).parsed
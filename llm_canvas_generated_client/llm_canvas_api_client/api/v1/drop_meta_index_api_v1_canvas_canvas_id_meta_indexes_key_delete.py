@@ -0,0 +1,254 @@
+from http import HTTPStatus
+from typing import Any, Optional, Union
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.drop_meta_index_api_v1_canvas_canvas_id_meta_indexes_key_delete_kind import (
+    DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind,
+)
+from ...models.http_validation_error import HTTPValidationError
+from ...models.meta_indexes_response import MetaIndexesResponse
+from ...types import UNSET, Response, Unset
+
+
+def _get_kwargs(
+    canvas_id: str,
+    key: str,
+    *,
+    kind: Union[
+        Unset, DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind
+    ] = DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind.HASH,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+
+    json_kind: Union[Unset, str] = UNSET
+    if not isinstance(kind, Unset):
+        json_kind = kind.value
+
+    params["kind"] = json_kind
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
+    _kwargs: dict[str, Any] = {
+        "method": "delete",
+        "url": f"/api/v1/canvas/{canvas_id}/meta_indexes/{key}",
+        "params": params,
+    }
+
+    return _kwargs
+
+
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[Union[HTTPValidationError, MetaIndexesResponse]]:
+    if response.status_code == 200:
+        response_200 = MetaIndexesResponse.from_dict(response.json())
+
+        return response_200
+    if response.status_code == 422:
+        response_422 = HTTPValidationError.from_dict(response.json())
+
+        return response_422
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[Union[HTTPValidationError, MetaIndexesResponse]]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    canvas_id: str,
+    key: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    kind: Union[
+        Unset, DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind
+    ] = DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind.HASH,
+) -> Response[Union[HTTPValidationError, MetaIndexesResponse]]:
+    """Drop Meta Index
+
+     Remove a meta index of a canvas, if it exists.
+    Args:
+        canvas_id: Canvas UUID
+        key: Indexed meta key
+        kind: Kind of index to remove
+    Returns:
+        MetaIndexesResponse with the remaining indexes of the canvas
+    Raises:
+        HTTPException: 404 if canvas not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        key (str): Indexed meta key
+        kind (Union[Unset, DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind]): hash for
+            equality or sorted for numeric range conditions Default:
+            DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind.HASH.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[HTTPValidationError, MetaIndexesResponse]]
+    """
+
+    kwargs = _get_kwargs(
+        canvas_id=canvas_id,
+        key=key,
+        kind=kind,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    canvas_id: str,
+    key: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    kind: Union[
+        Unset, DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind
+    ] = DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind.HASH,
+) -> Optional[Union[HTTPValidationError, MetaIndexesResponse]]:
+    """Drop Meta Index
+
+     Remove a meta index of a canvas, if it exists.
+    Args:
+        canvas_id: Canvas UUID
+        key: Indexed meta key
+        kind: Kind of index to remove
+    Returns:
+        MetaIndexesResponse with the remaining indexes of the canvas
+    Raises:
+        HTTPException: 404 if canvas not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        key (str): Indexed meta key
+        kind (Union[Unset, DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind]): hash for
+            equality or sorted for numeric range conditions Default:
+            DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind.HASH.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[HTTPValidationError, MetaIndexesResponse]
+    """
+
+    return sync_detailed(
+        canvas_id=canvas_id,
+        key=key,
+        client=client,
+        kind=kind,
+    ).parsed
+
+
+async def asyncio_detailed(
+    canvas_id: str,
+    key: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    kind: Union[
+        Unset, DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind
+    ] = DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind.HASH,
+) -> Response[Union[HTTPValidationError, MetaIndexesResponse]]:
+    """Drop Meta Index
+
+     Remove a meta index of a canvas, if it exists.
+    Args:
+        canvas_id: Canvas UUID
+        key: Indexed meta key
+        kind: Kind of index to remove
+    Returns:
+        MetaIndexesResponse with the remaining indexes of the canvas
+    Raises:
+        HTTPException: 404 if canvas not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        key (str): Indexed meta key
+        kind (Union[Unset, DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind]): hash for
+            equality or sorted for numeric range conditions Default:
+            DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind.HASH.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[HTTPValidationError, MetaIndexesResponse]]
+    """
+
+    kwargs = _get_kwargs(
+        canvas_id=canvas_id,
+        key=key,
+        kind=kind,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    canvas_id: str,
+    key: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    kind: Union[
+        Unset, DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind
+    ] = DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind.HASH,
+) -> Optional[Union[HTTPValidationError, MetaIndexesResponse]]:
+    """Drop Meta Index
+
+     Remove a meta index of a canvas, if it exists.
+    Args:
+        canvas_id: Canvas UUID
+        key: Indexed meta key
+        kind: Kind of index to remove
+    Returns:
+        MetaIndexesResponse with the remaining indexes of the canvas
+    Raises:
+        HTTPException: 404 if canvas not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        key (str): Indexed meta key
+        kind (Union[Unset, DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind]): hash for
+            equality or sorted for numeric range conditions Default:
+            DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind.HASH.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[HTTPValidationError, MetaIndexesResponse]
+    """
+
+    return (
+        await asyncio_detailed(
+            canvas_id=canvas_id,
+            key=key,
+            client=client,
+            kind=kind,
+        )
+    ).parsed
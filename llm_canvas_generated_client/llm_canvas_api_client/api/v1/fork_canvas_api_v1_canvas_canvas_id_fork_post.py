@@ -0,0 +1,213 @@
+from http import HTTPStatus
+from typing import Any, Optional, Union
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.create_canvas_response import CreateCanvasResponse
+from ...models.fork_canvas_request import ForkCanvasRequest
+from ...models.http_validation_error import HTTPValidationError
+from ...types import Response
+
+
+def _get_kwargs(
+    canvas_id: str,
+    *,
+    body: ForkCanvasRequest,
+) -> dict[str, Any]:
+    headers: dict[str, Any] = {}
+
+    _kwargs: dict[str, Any] = {
+        "method": "post",
+        "url": f"/api/v1/canvas/{canvas_id}/fork",
+    }
+
+    _kwargs["json"] = body.to_dict()
+
+    headers["Content-Type"] = "application/json"
+
+    _kwargs["headers"] = headers
+    return _kwargs
+
+
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[Union[CreateCanvasResponse, HTTPValidationError]]:
+    if response.status_code == 200:
+        response_200 = CreateCanvasResponse.from_dict(response.json())
+
+        return response_200
+    if response.status_code == 422:
+        response_422 = HTTPValidationError.from_dict(response.json())
+
+        return response_422
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[Union[CreateCanvasResponse, HTTPValidationError]]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: ForkCanvasRequest,
+) -> Response[Union[CreateCanvasResponse, HTTPValidationError]]:
+    """Fork Canvas
+
+     Fork a canvas without copying its messages.
+    Args:
+        canvas_id: Canvas UUID to fork
+        request: Optional title and description for the fork (defaults to those of the canvas)
+    Returns:
+        CreateCanvasResponse with the ID of the fork and success message
+    Raises:
+        HTTPException: 404 if canvas not found
+
+    Args:
+        canvas_id (str): Canvas UUID to fork
+        body (ForkCanvasRequest): Request type for POST /api/v1/canvas/{canvas_id}/fork
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[CreateCanvasResponse, HTTPValidationError]]
+    """
+
+    kwargs = _get_kwargs(
+        canvas_id=canvas_id,
+        body=body,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: ForkCanvasRequest,
+) -> Optional[Union[CreateCanvasResponse, HTTPValidationError]]:
+    """Fork Canvas
+
+     Fork a canvas without copying its messages.
+    Args:
+        canvas_id: Canvas UUID to fork
+        request: Optional title and description for the fork (defaults to those of the canvas)
+    Returns:
+        CreateCanvasResponse with the ID of the fork and success message
+    Raises:
+        HTTPException: 404 if canvas not found
+
+    Args:
+        canvas_id (str): Canvas UUID to fork
+        body (ForkCanvasRequest): Request type for POST /api/v1/canvas/{canvas_id}/fork
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[CreateCanvasResponse, HTTPValidationError]
+    """
+
+    return sync_detailed(
+        canvas_id=canvas_id,
+        client=client,
+        body=body,
+    ).parsed
+
+
+async def asyncio_detailed(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: ForkCanvasRequest,
+) -> Response[Union[CreateCanvasResponse, HTTPValidationError]]:
+    """Fork Canvas
+
+     Fork a canvas without copying its messages.
+    Args:
+        canvas_id: Canvas UUID to fork
+        request: Optional title and description for the fork (defaults to those of the canvas)
+    Returns:
+        CreateCanvasResponse with the ID of the fork and success message
+    Raises:
+        HTTPException: 404 if canvas not found
+
+    Args:
+        canvas_id (str): Canvas UUID to fork
+        body (ForkCanvasRequest): Request type for POST /api/v1/canvas/{canvas_id}/fork
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[CreateCanvasResponse, HTTPValidationError]]
+    """
+
+    kwargs = _get_kwargs(
+        canvas_id=canvas_id,
+        body=body,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: ForkCanvasRequest,
+) -> Optional[Union[CreateCanvasResponse, HTTPValidationError]]:
+    """Fork Canvas
+
+     Fork a canvas without copying its messages.
+    Args:
+        canvas_id: Canvas UUID to fork
+        request: Optional title and description for the fork (defaults to those of the canvas)
+    Returns:
+        CreateCanvasResponse with the ID of the fork and success message
+    Raises:
+        HTTPException: 404 if canvas not found
+
+    Args:
+        canvas_id (str): Canvas UUID to fork
+        body (ForkCanvasRequest): Request type for POST /api/v1/canvas/{canvas_id}/fork
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[CreateCanvasResponse, HTTPValidationError]
+    """
+
+    return (
+        await asyncio_detailed(
+            canvas_id=canvas_id,
+            client=client,
+            body=body,
+        )
+    ).parsed
@@ -0,0 +1,185 @@
+from http import HTTPStatus
+from typing import Any, Optional, Union, cast
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.http_validation_error import HTTPValidationError
+from ...types import Response
+
+
+def _get_kwargs(
+    digest: str,
+) -> dict[str, Any]:
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": f"/api/v1/blobs/{digest}",
+    }
+
+    return _kwargs
+
+
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[Union[Any, HTTPValidationError]]:
+    if response.status_code == 200:
+        response_200 = cast(Any, None)
+        return response_200
+    if response.status_code == 422:
+        response_422 = HTTPValidationError.from_dict(response.json())
+
+        return response_422
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[Union[Any, HTTPValidationError]]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    digest: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+) -> Response[Union[Any, HTTPValidationError]]:
+    """Get Blob
+
+     Get the data of an image moved out of message content.
+    Args:
+        digest: Blob digest, the last segment of the image URL in the message
+    Returns:
+        The image bytes with their media type; blobs never change, so they may be cached forever
+    Raises:
+        HTTPException: 404 if blob not found
+
+    Args:
+        digest (str): Blob digest from an image URL
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[Any, HTTPValidationError]]
+    """
+
+    kwargs = _get_kwargs(
+        digest=digest,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    digest: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+) -> Optional[Union[Any, HTTPValidationError]]:
+    """Get Blob
+
+     Get the data of an image moved out of message content.
+    Args:
+        digest: Blob digest, the last segment of the image URL in the message
+    Returns:
+        The image bytes with their media type; blobs never change, so they may be cached forever
+    Raises:
+        HTTPException: 404 if blob not found
+
+    Args:
+        digest (str): Blob digest from an image URL
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[Any, HTTPValidationError]
+    """
+
+    return sync_detailed(
+        digest=digest,
+        client=client,
+    ).parsed
+
+
+async def asyncio_detailed(
+    digest: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+) -> Response[Union[Any, HTTPValidationError]]:
+    """Get Blob
+
+     Get the data of an image moved out of message content.
+    Args:
+        digest: Blob digest, the last segment of the image URL in the message
+    Returns:
+        The image bytes with their media type; blobs never change, so they may be cached forever
+    Raises:
+        HTTPException: 404 if blob not found
+
+    Args:
+        digest (str): Blob digest from an image URL
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[Any, HTTPValidationError]]
+    """
+
+    kwargs = _get_kwargs(
+        digest=digest,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    digest: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+) -> Optional[Union[Any, HTTPValidationError]]:
+    """Get Blob
+
+     Get the data of an image moved out of message content.
+    Args:
+        digest: Blob digest, the last segment of the image URL in the message
+    Returns:
+        The image bytes with their media type; blobs never change, so they may be cached forever
+    Raises:
+        HTTPException: 404 if blob not found
+
+    Args:
+        digest (str): Blob digest from an image URL
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[Any, HTTPValidationError]
+    """
+
+    return (
+        await asyncio_detailed(
+            digest=digest,
+            client=client,
+        )
+    ).parsed
@@ -0,0 +1,216 @@
+from http import HTTPStatus
+from typing import Any, Optional, Union
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.canvas_changes_response import CanvasChangesResponse
+from ...models.http_validation_error import HTTPValidationError
+from ...types import UNSET, Response
+
+
+def _get_kwargs(
+    canvas_id: str,
+    *,
+    since: int,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+
+    params["since"] = since
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": f"/api/v1/canvas/{canvas_id}/changes",
+        "params": params,
+    }
+
+    return _kwargs
+
+
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[Union[CanvasChangesResponse, HTTPValidationError]]:
+    if response.status_code == 200:
+        response_200 = CanvasChangesResponse.from_dict(response.json())
+
+        return response_200
+    if response.status_code == 422:
+        response_422 = HTTPValidationError.from_dict(response.json())
+
+        return response_422
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[Union[CanvasChangesResponse, HTTPValidationError]]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    since: int,
+) -> Response[Union[CanvasChangesResponse, HTTPValidationError]]:
+    """Get Canvas Changes
+
+     Get the changes made to a canvas after a version.
+    Args:
+        canvas_id: Canvas UUID to read the changes of
+        since: Version the client has already seen (from a previous response)
+    Returns:
+        CanvasChangesResponse with the current version and either the changes since the given
+        version or, when they are no longer retained, a full snapshot of the canvas
+    Raises:
+        HTTPException: 404 if canvas not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        since (int): Version the client has already seen
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[CanvasChangesResponse, HTTPValidationError]]
+    """
+
+    kwargs = _get_kwargs(
+        canvas_id=canvas_id,
+        since=since,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    since: int,
+) -> Optional[Union[CanvasChangesResponse, HTTPValidationError]]:
+    """Get Canvas Changes
+
+     Get the changes made to a canvas after a version.
+    Args:
+        canvas_id: Canvas UUID to read the changes of
+        since: Version the client has already seen (from a previous response)
+    Returns:
+        CanvasChangesResponse with the current version and either the changes since the given
+        version or, when they are no longer retained, a full snapshot of the canvas
+    Raises:
+        HTTPException: 404 if canvas not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        since (int): Version the client has already seen
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[CanvasChangesResponse, HTTPValidationError]
+    """
+
+    return sync_detailed(
+        canvas_id=canvas_id,
+        client=client,
+        since=since,
+    ).parsed
+
+
+async def asyncio_detailed(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    since: int,
+) -> Response[Union[CanvasChangesResponse, HTTPValidationError]]:
+    """Get Canvas Changes
+
+     Get the changes made to a canvas after a version.
+    Args:
+        canvas_id: Canvas UUID to read the changes of
+        since: Version the client has already seen (from a previous response)
+    Returns:
+        CanvasChangesResponse with the current version and either the changes since the given
+        version or, when they are no longer retained, a full snapshot of the canvas
+    Raises:
+        HTTPException: 404 if canvas not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        since (int): Version the client has already seen
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[CanvasChangesResponse, HTTPValidationError]]
+    """
+
+    kwargs = _get_kwargs(
+        canvas_id=canvas_id,
+        since=since,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    since: int,
+) -> Optional[Union[CanvasChangesResponse, HTTPValidationError]]:
+    """Get Canvas Changes
+
+     Get the changes made to a canvas after a version.
+    Args:
+        canvas_id: Canvas UUID to read the changes of
+        since: Version the client has already seen (from a previous response)
+    Returns:
+        CanvasChangesResponse with the current version and either the changes since the given
+        version or, when they are no longer retained, a full snapshot of the canvas
+    Raises:
+        HTTPException: 404 if canvas not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        since (int): Version the client has already seen
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[CanvasChangesResponse, HTTPValidationError]
+    """
+
+    return (
+        await asyncio_detailed(
+            canvas_id=canvas_id,
+            client=client,
+            since=since,
+        )
+    ).parsed
@@ -0,0 +1,235 @@
+from http import HTTPStatus
+from typing import Any, Optional, Union
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.http_validation_error import HTTPValidationError
+from ...models.message_branches_response import MessageBranchesResponse
+from ...types import UNSET, Response
+
+
+def _get_kwargs(
+    canvas_id: str,
+    message_id: str,
+    *,
+    head: list[str],
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+
+    json_head = head
+
+    params["head"] = json_head
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": f"/api/v1/canvas/{canvas_id}/messages/{message_id}/branches",
+        "params": params,
+    }
+
+    return _kwargs
+
+
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[Union[HTTPValidationError, MessageBranchesResponse]]:
+    if response.status_code == 200:
+        response_200 = MessageBranchesResponse.from_dict(response.json())
+
+        return response_200
+    if response.status_code == 422:
+        response_422 = HTTPValidationError.from_dict(response.json())
+
+        return response_422
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[Union[HTTPValidationError, MessageBranchesResponse]]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    canvas_id: str,
+    message_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    head: list[str],
+) -> Response[Union[HTTPValidationError, MessageBranchesResponse]]:
+    """Get Message Branches
+
+     Get which branch HEADs include a message in their history. Branches live in clients, so they send
+    their HEADs.
+    Args:
+        canvas_id: Canvas UUID containing the message
+        message_id: Message ID to look up
+        head: Branch HEAD message IDs to check
+    Returns:
+        MessageBranchesResponse with the HEADs including the message, in request order
+    Raises:
+        HTTPException: 404 if canvas or message not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        message_id (str): Message ID
+        head (list[str]): Last message ID of a branch, e.g. a client's branch HEAD (repeatable)
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[HTTPValidationError, MessageBranchesResponse]]
+    """
+
+    kwargs = _get_kwargs(
+        canvas_id=canvas_id,
+        message_id=message_id,
+        head=head,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    canvas_id: str,
+    message_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    head: list[str],
+) -> Optional[Union[HTTPValidationError, MessageBranchesResponse]]:
+    """Get Message Branches
+
+     Get which branch HEADs include a message in their history. Branches live in clients, so they send
+    their HEADs.
+    Args:
+        canvas_id: Canvas UUID containing the message
+        message_id: Message ID to look up
+        head: Branch HEAD message IDs to check
+    Returns:
+        MessageBranchesResponse with the HEADs including the message, in request order
+    Raises:
+        HTTPException: 404 if canvas or message not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        message_id (str): Message ID
+        head (list[str]): Last message ID of a branch, e.g. a client's branch HEAD (repeatable)
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[HTTPValidationError, MessageBranchesResponse]
+    """
+
+    return sync_detailed(
+        canvas_id=canvas_id,
+        message_id=message_id,
+        client=client,
+        head=head,
+    ).parsed
+
+
+async def asyncio_detailed(
+    canvas_id: str,
+    message_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    head: list[str],
+) -> Response[Union[HTTPValidationError, MessageBranchesResponse]]:
+    """Get Message Branches
+
+     Get which branch HEADs include a message in their history. Branches live in clients, so they send
+    their HEADs.
+    Args:
+        canvas_id: Canvas UUID containing the message
+        message_id: Message ID to look up
+        head: Branch HEAD message IDs to check
+    Returns:
+        MessageBranchesResponse with the HEADs including the message, in request order
+    Raises:
+        HTTPException: 404 if canvas or message not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        message_id (str): Message ID
+        head (list[str]): Last message ID of a branch, e.g. a client's branch HEAD (repeatable)
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[HTTPValidationError, MessageBranchesResponse]]
+    """
+
+    kwargs = _get_kwargs(
+        canvas_id=canvas_id,
+        message_id=message_id,
+        head=head,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    canvas_id: str,
+    message_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    head: list[str],
+) -> Optional[Union[HTTPValidationError, MessageBranchesResponse]]:
+    """Get Message Branches
+
+     Get which branch HEADs include a message in their history. Branches live in clients, so they send
+    their HEADs.
+    Args:
+        canvas_id: Canvas UUID containing the message
+        message_id: Message ID to look up
+        head: Branch HEAD message IDs to check
+    Returns:
+        MessageBranchesResponse with the HEADs including the message, in request order
+    Raises:
+        HTTPException: 404 if canvas or message not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        message_id (str): Message ID
+        head (list[str]): Last message ID of a branch, e.g. a client's branch HEAD (repeatable)
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[HTTPValidationError, MessageBranchesResponse]
+    """
+
+    return (
+        await asyncio_detailed(
+            canvas_id=canvas_id,
+            message_id=message_id,
+            client=client,
+            head=head,
+        )
+    ).parsed
@@ -0,0 +1,217 @@
+from http import HTTPStatus
+from typing import Any, Optional, Union
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.http_validation_error import HTTPValidationError
+from ...models.query_nodes_request import QueryNodesRequest
+from ...models.query_nodes_response import QueryNodesResponse
+from ...types import Response
+
+
+def _get_kwargs(
+    canvas_id: str,
+    *,
+    body: QueryNodesRequest,
+) -> dict[str, Any]:
+    headers: dict[str, Any] = {}
+
+    _kwargs: dict[str, Any] = {
+        "method": "post",
+        "url": f"/api/v1/canvas/{canvas_id}/nodes/query",
+    }
+
+    _kwargs["json"] = body.to_dict()
+
+    headers["Content-Type"] = "application/json"
+
+    _kwargs["headers"] = headers
+    return _kwargs
+
+
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[Union[HTTPValidationError, QueryNodesResponse]]:
+    if response.status_code == 200:
+        response_200 = QueryNodesResponse.from_dict(response.json())
+
+        return response_200
+    if response.status_code == 422:
+        response_422 = HTTPValidationError.from_dict(response.json())
+
+        return response_422
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[Union[HTTPValidationError, QueryNodesResponse]]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: QueryNodesRequest,
+) -> Response[Union[HTTPValidationError, QueryNodesResponse]]:
+    """Query Nodes
+
+     Find the nodes of a canvas whose meta matches equality and numeric range conditions.
+    Args:
+        request: Values meta keys must equal, inclusive [low, high] bounds (null for open) and an
+    optional limit
+        canvas_id: Canvas UUID to query
+    Returns:
+        QueryNodesResponse with the matching nodes, ordered by the first range key or oldest first
+    Raises:
+        HTTPException: 404 if canvas not found, 400 if the query has no conditions or a key has no index
+
+    Args:
+        canvas_id (str): Canvas UUID
+        body (QueryNodesRequest): Request type for POST /api/v1/canvas/{canvas_id}/nodes/query
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[HTTPValidationError, QueryNodesResponse]]
+    """
+
+    kwargs = _get_kwargs(
+        canvas_id=canvas_id,
+        body=body,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: QueryNodesRequest,
+) -> Optional[Union[HTTPValidationError, QueryNodesResponse]]:
+    """Query Nodes
+
+     Find the nodes of a canvas whose meta matches equality and numeric range conditions.
+    Args:
+        request: Values meta keys must equal, inclusive [low, high] bounds (null for open) and an
+    optional limit
+        canvas_id: Canvas UUID to query
+    Returns:
+        QueryNodesResponse with the matching nodes, ordered by the first range key or oldest first
+    Raises:
+        HTTPException: 404 if canvas not found, 400 if the query has no conditions or a key has no index
+
+    Args:
+        canvas_id (str): Canvas UUID
+        body (QueryNodesRequest): Request type for POST /api/v1/canvas/{canvas_id}/nodes/query
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[HTTPValidationError, QueryNodesResponse]
+    """
+
+    return sync_detailed(
+        canvas_id=canvas_id,
+        client=client,
+        body=body,
+    ).parsed
+
+
+async def asyncio_detailed(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: QueryNodesRequest,
+) -> Response[Union[HTTPValidationError, QueryNodesResponse]]:
+    """Query Nodes
+
+     Find the nodes of a canvas whose meta matches equality and numeric range conditions.
+    Args:
+        request: Values meta keys must equal, inclusive [low, high] bounds (null for open) and an
+    optional limit
+        canvas_id: Canvas UUID to query
+    Returns:
+        QueryNodesResponse with the matching nodes, ordered by the first range key or oldest first
+    Raises:
+        HTTPException: 404 if canvas not found, 400 if the query has no conditions or a key has no index
+
+    Args:
+        canvas_id (str): Canvas UUID
+        body (QueryNodesRequest): Request type for POST /api/v1/canvas/{canvas_id}/nodes/query
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[HTTPValidationError, QueryNodesResponse]]
+    """
+
+    kwargs = _get_kwargs(
+        canvas_id=canvas_id,
+        body=body,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: QueryNodesRequest,
+) -> Optional[Union[HTTPValidationError, QueryNodesResponse]]:
+    """Query Nodes
+
+     Find the nodes of a canvas whose meta matches equality and numeric range conditions.
+    Args:
+        request: Values meta keys must equal, inclusive [low, high] bounds (null for open) and an
+    optional limit
+        canvas_id: Canvas UUID to query
+    Returns:
+        QueryNodesResponse with the matching nodes, ordered by the first range key or oldest first
+    Raises:
+        HTTPException: 404 if canvas not found, 400 if the query has no conditions or a key has no index
+
+    Args:
+        canvas_id (str): Canvas UUID
+        body (QueryNodesRequest): Request type for POST /api/v1/canvas/{canvas_id}/nodes/query
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[HTTPValidationError, QueryNodesResponse]
+    """
+
+    return (
+        await asyncio_detailed(
+            canvas_id=canvas_id,
+            client=client,
+            body=body,
+        )
+    ).parsed
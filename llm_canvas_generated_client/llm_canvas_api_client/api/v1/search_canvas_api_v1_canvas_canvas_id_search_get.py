@@ -0,0 +1,231 @@
+from http import HTTPStatus
+from typing import Any, Optional, Union
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.canvas_search_response import CanvasSearchResponse
+from ...models.http_validation_error import HTTPValidationError
+from ...types import UNSET, Response, Unset
+
+
+def _get_kwargs(
+    canvas_id: str,
+    *,
+    q: str,
+    limit: Union[Unset, int] = 20,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+
+    params["q"] = q
+
+    params["limit"] = limit
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": f"/api/v1/canvas/{canvas_id}/search",
+        "params": params,
+    }
+
+    return _kwargs
+
+
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[Union[CanvasSearchResponse, HTTPValidationError]]:
+    if response.status_code == 200:
+        response_200 = CanvasSearchResponse.from_dict(response.json())
+
+        return response_200
+    if response.status_code == 422:
+        response_422 = HTTPValidationError.from_dict(response.json())
+
+        return response_422
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[Union[CanvasSearchResponse, HTTPValidationError]]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    q: str,
+    limit: Union[Unset, int] = 20,
+) -> Response[Union[CanvasSearchResponse, HTTPValidationError]]:
+    """Search Canvas
+
+     Search the text and tool results of a canvas's messages.
+    Args:
+        canvas_id: Canvas UUID to search
+        q: Words to search for (case-insensitive)
+        limit: Maximum number of results
+    Returns:
+        CanvasSearchResponse with the matching message IDs, best matches first, and snippets
+    Raises:
+        HTTPException: 404 if canvas not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        q (str): Words to search for
+        limit (Union[Unset, int]): Maximum number of results Default: 20.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[CanvasSearchResponse, HTTPValidationError]]
+    """
+
+    kwargs = _get_kwargs(
+        canvas_id=canvas_id,
+        q=q,
+        limit=limit,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    q: str,
+    limit: Union[Unset, int] = 20,
+) -> Optional[Union[CanvasSearchResponse, HTTPValidationError]]:
+    """Search Canvas
+
+     Search the text and tool results of a canvas's messages.
+    Args:
+        canvas_id: Canvas UUID to search
+        q: Words to search for (case-insensitive)
+        limit: Maximum number of results
+    Returns:
+        CanvasSearchResponse with the matching message IDs, best matches first, and snippets
+    Raises:
+        HTTPException: 404 if canvas not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        q (str): Words to search for
+        limit (Union[Unset, int]): Maximum number of results Default: 20.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[CanvasSearchResponse, HTTPValidationError]
+    """
+
+    return sync_detailed(
+        canvas_id=canvas_id,
+        client=client,
+        q=q,
+        limit=limit,
+    ).parsed
+
+
+async def asyncio_detailed(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    q: str,
+    limit: Union[Unset, int] = 20,
+) -> Response[Union[CanvasSearchResponse, HTTPValidationError]]:
+    """Search Canvas
+
+     Search the text and tool results of a canvas's messages.
+    Args:
+        canvas_id: Canvas UUID to search
+        q: Words to search for (case-insensitive)
+        limit: Maximum number of results
+    Returns:
+        CanvasSearchResponse with the matching message IDs, best matches first, and snippets
+    Raises:
+        HTTPException: 404 if canvas not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        q (str): Words to search for
+        limit (Union[Unset, int]): Maximum number of results Default: 20.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[CanvasSearchResponse, HTTPValidationError]]
+    """
+
+    kwargs = _get_kwargs(
+        canvas_id=canvas_id,
+        q=q,
+        limit=limit,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    canvas_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    q: str,
+    limit: Union[Unset, int] = 20,
+) -> Optional[Union[CanvasSearchResponse, HTTPValidationError]]:
+    """Search Canvas
+
+     Search the text and tool results of a canvas's messages.
+    Args:
+        canvas_id: Canvas UUID to search
+        q: Words to search for (case-insensitive)
+        limit: Maximum number of results
+    Returns:
+        CanvasSearchResponse with the matching message IDs, best matches first, and snippets
+    Raises:
+        HTTPException: 404 if canvas not found
+
+    Args:
+        canvas_id (str): Canvas UUID
+        q (str): Words to search for
+        limit (Union[Unset, int]): Maximum number of results Default: 20.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[CanvasSearchResponse, HTTPValidationError]
+    """
+
+    return (
+        await asyncio_detailed(
+            canvas_id=canvas_id,
+            client=client,
+            q=q,
+            limit=limit,
+        )
+    ).parsed
@@ -0,0 +1,306 @@
+from http import HTTPStatus
+from typing import Any, Optional, Union
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.http_validation_error import HTTPValidationError
+from ...models.registry_search_response import RegistrySearchResponse
+from ...types import UNSET, Response, Unset
+
+
+def _get_kwargs(
+    *,
+    q: str,
+    limit: Union[Unset, int] = 20,
+    role: Union[None, Unset, str] = UNSET,
+    block_type: Union[None, Unset, str] = UNSET,
+    since: Union[None, Unset, float] = UNSET,
+    until: Union[None, Unset, float] = UNSET,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+
+    params["q"] = q
+
+    params["limit"] = limit
+
+    json_role: Union[None, Unset, str]
+    if isinstance(role, Unset):
+        json_role = UNSET
+    else:
+        json_role = role
+    params["role"] = json_role
+
+    json_block_type: Union[None, Unset, str]
+    if isinstance(block_type, Unset):
+        json_block_type = UNSET
+    else:
+        json_block_type = block_type
+    params["block_type"] = json_block_type
+
+    json_since: Union[None, Unset, float]
+    if isinstance(since, Unset):
+        json_since = UNSET
+    else:
+        json_since = since
+    params["since"] = json_since
+
+    json_until: Union[None, Unset, float]
+    if isinstance(until, Unset):
+        json_until = UNSET
+    else:
+        json_until = until
+    params["until"] = json_until
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": "/api/v1/search",
+        "params": params,
+    }
+
+    return _kwargs
+
+
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[Union[HTTPValidationError, RegistrySearchResponse]]:
+    if response.status_code == 200:
+        response_200 = RegistrySearchResponse.from_dict(response.json())
+
+        return response_200
+    if response.status_code == 422:
+        response_422 = HTTPValidationError.from_dict(response.json())
+
+        return response_422
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[Union[HTTPValidationError, RegistrySearchResponse]]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    q: str,
+    limit: Union[Unset, int] = 20,
+    role: Union[None, Unset, str] = UNSET,
+    block_type: Union[None, Unset, str] = UNSET,
+    since: Union[None, Unset, float] = UNSET,
+    until: Union[None, Unset, float] = UNSET,
+) -> Response[Union[HTTPValidationError, RegistrySearchResponse]]:
+    r"""Search Canvases
+
+     Search the messages of every canvas.
+    Args:
+        q: Words to search for (case-insensitive)
+        limit: Maximum number of results
+        filters: Role (e.g. role=user,assistant), block type (e.g. block_type=tool_use; \"text\"
+            includes plain string content) and timestamp (since, until) conditions
+    Returns:
+        RegistrySearchResponse with the matching messages and their canvas IDs, best matches first
+
+    Args:
+        q (str): Words to search for
+        limit (Union[Unset, int]): Maximum number of results Default: 20.
+        role (Union[None, Unset, str]): Only messages with one of these comma-separated roles
+        block_type (Union[None, Unset, str]): Only messages with a block of one of these comma-
+            separated types
+        since (Union[None, Unset, float]): Only messages with a timestamp at or after this Unix
+            time
+        until (Union[None, Unset, float]): Only messages with a timestamp at or before this Unix
+            time
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[HTTPValidationError, RegistrySearchResponse]]
+    """
+
+    kwargs = _get_kwargs(
+        q=q,
+        limit=limit,
+        role=role,
+        block_type=block_type,
+        since=since,
+        until=until,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    q: str,
+    limit: Union[Unset, int] = 20,
+    role: Union[None, Unset, str] = UNSET,
+    block_type: Union[None, Unset, str] = UNSET,
+    since: Union[None, Unset, float] = UNSET,
+    until: Union[None, Unset, float] = UNSET,
+) -> Optional[Union[HTTPValidationError, RegistrySearchResponse]]:
+    r"""Search Canvases
+
+     Search the messages of every canvas.
+    Args:
+        q: Words to search for (case-insensitive)
+        limit: Maximum number of results
+        filters: Role (e.g. role=user,assistant), block type (e.g. block_type=tool_use; \"text\"
+            includes plain string content) and timestamp (since, until) conditions
+    Returns:
+        RegistrySearchResponse with the matching messages and their canvas IDs, best matches first
+
+    Args:
+        q (str): Words to search for
+        limit (Union[Unset, int]): Maximum number of results Default: 20.
+        role (Union[None, Unset, str]): Only messages with one of these comma-separated roles
+        block_type (Union[None, Unset, str]): Only messages with a block of one of these comma-
+            separated types
+        since (Union[None, Unset, float]): Only messages with a timestamp at or after this Unix
+            time
+        until (Union[None, Unset, float]): Only messages with a timestamp at or before this Unix
+            time
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[HTTPValidationError, RegistrySearchResponse]
+    """
+
+    return sync_detailed(
+        client=client,
+        q=q,
+        limit=limit,
+        role=role,
+        block_type=block_type,
+        since=since,
+        until=until,
+    ).parsed
+
+
+async def asyncio_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    q: str,
+    limit: Union[Unset, int] = 20,
+    role: Union[None, Unset, str] = UNSET,
+    block_type: Union[None, Unset, str] = UNSET,
+    since: Union[None, Unset, float] = UNSET,
+    until: Union[None, Unset, float] = UNSET,
+) -> Response[Union[HTTPValidationError, RegistrySearchResponse]]:
+    r"""Search Canvases
+
+     Search the messages of every canvas.
+    Args:
+        q: Words to search for (case-insensitive)
+        limit: Maximum number of results
+        filters: Role (e.g. role=user,assistant), block type (e.g. block_type=tool_use; \"text\"
+            includes plain string content) and timestamp (since, until) conditions
+    Returns:
+        RegistrySearchResponse with the matching messages and their canvas IDs, best matches first
+
+    Args:
+        q (str): Words to search for
+        limit (Union[Unset, int]): Maximum number of results Default: 20.
+        role (Union[None, Unset, str]): Only messages with one of these comma-separated roles
+        block_type (Union[None, Unset, str]): Only messages with a block of one of these comma-
+            separated types
+        since (Union[None, Unset, float]): Only messages with a timestamp at or after this Unix
+            time
+        until (Union[None, Unset, float]): Only messages with a timestamp at or before this Unix
+            time
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[HTTPValidationError, RegistrySearchResponse]]
+    """
+
+    kwargs = _get_kwargs(
+        q=q,
+        limit=limit,
+        role=role,
+        block_type=block_type,
+        since=since,
+        until=until,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    q: str,
+    limit: Union[Unset, int] = 20,
+    role: Union[None, Unset, str] = UNSET,
+    block_type: Union[None, Unset, str] = UNSET,
+    since: Union[None, Unset, float] = UNSET,
+    until: Union[None, Unset, float] = UNSET,
+) -> Optional[Union[HTTPValidationError, RegistrySearchResponse]]:
+    r"""Search Canvases
+
+     Search the messages of every canvas.
+    Args:
+        q: Words to search for (case-insensitive)
+        limit: Maximum number of results
+        filters: Role (e.g. role=user,assistant), block type (e.g. block_type=tool_use; \"text\"
+            includes plain string content) and timestamp (since, until) conditions
+    Returns:
+        RegistrySearchResponse with the matching messages and their canvas IDs, best matches first
+
+    Args:
+        q (str): Words to search for
+        limit (Union[Unset, int]): Maximum number of results Default: 20.
+        role (Union[None, Unset, str]): Only messages with one of these comma-separated roles
+        block_type (Union[None, Unset, str]): Only messages with a block of one of these comma-
+            separated types
+        since (Union[None, Unset, float]): Only messages with a timestamp at or after this Unix
+            time
+        until (Union[None, Unset, float]): Only messages with a timestamp at or before this Unix
+            time
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[HTTPValidationError, RegistrySearchResponse]
+    """
+
+    return (
+        await asyncio_detailed(
+            client=client,
+            q=q,
+            limit=limit,
+            role=role,
+            block_type=block_type,
+            since=since,
+            until=until,
+        )
+    ).parsed
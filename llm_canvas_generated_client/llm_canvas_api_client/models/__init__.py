@@ -2,12 +2,22 @@
 
 from .base_64_image_source_param import Base64ImageSourceParam
 from .base_64_image_source_param_media_type import Base64ImageSourceParamMediaType
+from .branch_diff import BranchDiff
 from .cache_control_ephemeral_param import CacheControlEphemeralParam
+from .canvas_change import CanvasChange
+from .canvas_changes_response import CanvasChangesResponse
 from .canvas_commit_message_event import CanvasCommitMessageEvent
+from .canvas_commit_messages_event import CanvasCommitMessagesEvent
 from .canvas_data import CanvasData
 from .canvas_data_nodes import CanvasDataNodes
+from .canvas_delete_message_event import CanvasDeleteMessageEvent
+from .canvas_diff_response import CanvasDiffResponse
 from .canvas_list_response import CanvasListResponse
+from .canvas_message_delta_event import CanvasMessageDeltaEvent
+from .canvas_search_response import CanvasSearchResponse
 from .canvas_summary import CanvasSummary
+from .canvas_summary_branch_token_counts import CanvasSummaryBranchTokenCounts
+from .canvas_summary_head_token_counts import CanvasSummaryHeadTokenCounts
 from .canvas_summary_meta import CanvasSummaryMeta
 from .canvas_update_message_event import CanvasUpdateMessageEvent
 from .citation_char_location_param import CitationCharLocationParam
@@ -17,19 +27,43 @@ from .citation_search_result_location_param import CitationSearchResultLocationP
 from .citation_web_search_result_location_param import CitationWebSearchResultLocationParam
 from .citations_config_param import CitationsConfigParam
 from .commit_message_request import CommitMessageRequest
+from .commit_messages_request import CommitMessagesRequest
 from .create_canvas_request import CreateCanvasRequest
 from .create_canvas_response import CreateCanvasResponse
 from .create_message_response import CreateMessageResponse
+from .create_messages_response import CreateMessagesResponse
+from .create_meta_index_api_v1_canvas_canvas_id_meta_indexes_key_put_kind import (
+    CreateMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyPutKind,
+)
 from .delete_canvas_response import DeleteCanvasResponse
+from .delete_message_response import DeleteMessageResponse
+from .drop_meta_index_api_v1_canvas_canvas_id_meta_indexes_key_delete_kind import (
+    DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind,
+)
+from .fork_canvas_request import ForkCanvasRequest
 from .get_canvas_response import GetCanvasResponse
 from .health_check_response import HealthCheckResponse
 from .health_check_response_server_type import HealthCheckResponseServerType
 from .http_validation_error import HTTPValidationError
 from .image_block_param import ImageBlockParam
 from .message import Message
+from .message_branches_response import MessageBranchesResponse
+from .message_delta import MessageDelta
+from .message_delta_meta import MessageDeltaMeta
+from .message_delta_request import MessageDeltaRequest
 from .message_node import MessageNode
 from .message_node_meta_type_0 import MessageNodeMetaType0
 from .message_role import MessageRole
+from .meta_index_info import MetaIndexInfo
+from .meta_index_info_kind import MetaIndexInfoKind
+from .meta_indexes_response import MetaIndexesResponse
+from .query_nodes_request import QueryNodesRequest
+from .query_nodes_request_equals import QueryNodesRequestEquals
+from .query_nodes_request_ranges import QueryNodesRequestRanges
+from .query_nodes_response import QueryNodesResponse
+from .registry_search_hit import RegistrySearchHit
+from .registry_search_response import RegistrySearchResponse
+from .search_hit import SearchHit
 from .search_result_block_param import SearchResultBlockParam
 from .sse_canvas_created_event import SSECanvasCreatedEvent
 from .sse_canvas_deleted_event import SSECanvasDeletedEvent
@@ -42,7 +76,9 @@ from .sse_heartbeat_event import SSEHeartbeatEvent
 from .sse_message_committed_event import SSEMessageCommittedEvent
 from .sse_message_deleted_event import SSEMessageDeletedEvent
 from .sse_message_deleted_event_data import SSEMessageDeletedEventData
+from .sse_message_delta_event import SSEMessageDeltaEvent
 from .sse_message_updated_event import SSEMessageUpdatedEvent
+from .sse_messages_committed_event import SSEMessagesCommittedEvent
 from .text_block_param import TextBlockParam
 from .tool_result_block_param import ToolResultBlockParam
 from .tool_use_block_param import ToolUseBlockParam
@@ -53,12 +89,22 @@ from .validation_error import ValidationError
 __all__ = (
     "Base64ImageSourceParam",
     "Base64ImageSourceParamMediaType",
+    "BranchDiff",
     "CacheControlEphemeralParam",
+    "CanvasChange",
+    "CanvasChangesResponse",
     "CanvasCommitMessageEvent",
+    "CanvasCommitMessagesEvent",
     "CanvasData",
     "CanvasDataNodes",
+    "CanvasDeleteMessageEvent",
+    "CanvasDiffResponse",
     "CanvasListResponse",
+    "CanvasMessageDeltaEvent",
+    "CanvasSearchResponse",
     "CanvasSummary",
+    "CanvasSummaryBranchTokenCounts",
+    "CanvasSummaryHeadTokenCounts",
     "CanvasSummaryMeta",
     "CanvasUpdateMessageEvent",
     "CitationCharLocationParam",
@@ -68,19 +114,39 @@ __all__ = (
     "CitationSearchResultLocationParam",
     "CitationWebSearchResultLocationParam",
     "CommitMessageRequest",
+    "CommitMessagesRequest",
     "CreateCanvasRequest",
     "CreateCanvasResponse",
     "CreateMessageResponse",
+    "CreateMessagesResponse",
+    "CreateMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyPutKind",
     "DeleteCanvasResponse",
+    "DeleteMessageResponse",
+    "DropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDeleteKind",
+    "ForkCanvasRequest",
     "GetCanvasResponse",
     "HealthCheckResponse",
     "HealthCheckResponseServerType",
     "HTTPValidationError",
     "ImageBlockParam",
     "Message",
+    "MessageBranchesResponse",
+    "MessageDelta",
+    "MessageDeltaMeta",
+    "MessageDeltaRequest",
     "MessageNode",
     "MessageNodeMetaType0",
     "MessageRole",
+    "MetaIndexesResponse",
+    "MetaIndexInfo",
+    "MetaIndexInfoKind",
+    "QueryNodesRequest",
+    "QueryNodesRequestEquals",
+    "QueryNodesRequestRanges",
+    "QueryNodesResponse",
+    "RegistrySearchHit",
+    "RegistrySearchResponse",
+    "SearchHit",
     "SearchResultBlockParam",
     "SSECanvasCreatedEvent",
     "SSECanvasDeletedEvent",
@@ -93,6 +159,8 @@ __all__ = (
     "SSEMessageCommittedEvent",
     "SSEMessageDeletedEvent",
     "SSEMessageDeletedEventData",
+    "SSEMessageDeltaEvent",
+    "SSEMessagesCommittedEvent",
     "SSEMessageUpdatedEvent",
     "TextBlockParam",
     "ToolResultBlockParam",
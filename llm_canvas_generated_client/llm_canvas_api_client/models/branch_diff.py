@@ -0,0 +1,105 @@
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+if TYPE_CHECKING:
+    from ..models.message_node import MessageNode
+
+
+T = TypeVar("T", bound="BranchDiff")
+
+
+@_attrs_define
+class BranchDiff:
+    """Messages unique to each of two histories since their merge base.
+
+    Attributes:
+        merge_base_id (Union[None, str]):
+        a_nodes (list['MessageNode']):
+        b_nodes (list['MessageNode']):
+    """
+
+    merge_base_id: Union[None, str]
+    a_nodes: list["MessageNode"]
+    b_nodes: list["MessageNode"]
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        merge_base_id: Union[None, str]
+        merge_base_id = self.merge_base_id
+
+        a_nodes = []
+        for a_nodes_item_data in self.a_nodes:
+            a_nodes_item = a_nodes_item_data.to_dict()
+            a_nodes.append(a_nodes_item)
+
+        b_nodes = []
+        for b_nodes_item_data in self.b_nodes:
+            b_nodes_item = b_nodes_item_data.to_dict()
+            b_nodes.append(b_nodes_item)
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "merge_base_id": merge_base_id,
+                "a_nodes": a_nodes,
+                "b_nodes": b_nodes,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.message_node import MessageNode
+
+        d = dict(src_dict)
+
+        def _parse_merge_base_id(data: object) -> Union[None, str]:
+            if data is None:
+                return data
+            return cast(Union[None, str], data)
+
+        merge_base_id = _parse_merge_base_id(d.pop("merge_base_id"))
+
+        a_nodes = []
+        _a_nodes = d.pop("a_nodes")
+        for a_nodes_item_data in _a_nodes:
+            a_nodes_item = MessageNode.from_dict(a_nodes_item_data)
+
+            a_nodes.append(a_nodes_item)
+
+        b_nodes = []
+        _b_nodes = d.pop("b_nodes")
+        for b_nodes_item_data in _b_nodes:
+            b_nodes_item = MessageNode.from_dict(b_nodes_item_data)
+
+            b_nodes.append(b_nodes_item)
+
+        branch_diff = cls(
+            merge_base_id=merge_base_id,
+            a_nodes=a_nodes,
+            b_nodes=b_nodes,
+        )
+
+        branch_diff.additional_properties = d
+        return branch_diff
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,151 @@
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+if TYPE_CHECKING:
+    from ..models.canvas_commit_message_event import CanvasCommitMessageEvent
+    from ..models.canvas_commit_messages_event import CanvasCommitMessagesEvent
+    from ..models.canvas_delete_message_event import CanvasDeleteMessageEvent
+    from ..models.canvas_message_delta_event import CanvasMessageDeltaEvent
+    from ..models.canvas_update_message_event import CanvasUpdateMessageEvent
+
+
+T = TypeVar("T", bound="CanvasChange")
+
+
+@_attrs_define
+class CanvasChange:
+    """A change in a canvas changelog.
+
+    Attributes:
+        version (int):
+        event (Union['CanvasCommitMessageEvent', 'CanvasCommitMessagesEvent', 'CanvasDeleteMessageEvent',
+            'CanvasMessageDeltaEvent', 'CanvasUpdateMessageEvent']):
+    """
+
+    version: int
+    event: Union[
+        "CanvasCommitMessageEvent",
+        "CanvasCommitMessagesEvent",
+        "CanvasDeleteMessageEvent",
+        "CanvasMessageDeltaEvent",
+        "CanvasUpdateMessageEvent",
+    ]
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        from ..models.canvas_commit_message_event import CanvasCommitMessageEvent
+        from ..models.canvas_commit_messages_event import CanvasCommitMessagesEvent
+        from ..models.canvas_message_delta_event import CanvasMessageDeltaEvent
+        from ..models.canvas_update_message_event import CanvasUpdateMessageEvent
+
+        version = self.version
+
+        event: dict[str, Any]
+        if isinstance(self.event, CanvasCommitMessageEvent):
+            event = self.event.to_dict()
+        elif isinstance(self.event, CanvasCommitMessagesEvent):
+            event = self.event.to_dict()
+        elif isinstance(self.event, CanvasUpdateMessageEvent):
+            event = self.event.to_dict()
+        elif isinstance(self.event, CanvasMessageDeltaEvent):
+            event = self.event.to_dict()
+        else:
+            event = self.event.to_dict()
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "version": version,
+                "event": event,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.canvas_commit_message_event import CanvasCommitMessageEvent
+        from ..models.canvas_commit_messages_event import CanvasCommitMessagesEvent
+        from ..models.canvas_delete_message_event import CanvasDeleteMessageEvent
+        from ..models.canvas_message_delta_event import CanvasMessageDeltaEvent
+        from ..models.canvas_update_message_event import CanvasUpdateMessageEvent
+
+        d = dict(src_dict)
+        version = d.pop("version")
+
+        def _parse_event(
+            data: object,
+        ) -> Union[
+            "CanvasCommitMessageEvent",
+            "CanvasCommitMessagesEvent",
+            "CanvasDeleteMessageEvent",
+            "CanvasMessageDeltaEvent",
+            "CanvasUpdateMessageEvent",
+        ]:
+            try:
+                if not isinstance(data, dict):
+                    raise TypeError()
+                event_type_0 = CanvasCommitMessageEvent.from_dict(data)
+
+                return event_type_0
+            except:  # noqa: E722
+                pass
+            try:
+                if not isinstance(data, dict):
+                    raise TypeError()
+                event_type_1 = CanvasCommitMessagesEvent.from_dict(data)
+
+                return event_type_1
+            except:  # noqa: E722
+                pass
+            try:
+                if not isinstance(data, dict):
+                    raise TypeError()
+                event_type_2 = CanvasUpdateMessageEvent.from_dict(data)
+
+                return event_type_2
+            except:  # noqa: E722
+                pass
+            try:
+                if not isinstance(data, dict):
+                    raise TypeError()
+                event_type_3 = CanvasMessageDeltaEvent.from_dict(data)
+
+                return event_type_3
+            except:  # noqa: E722
+                pass
+            if not isinstance(data, dict):
+                raise TypeError()
+            event_type_4 = CanvasDeleteMessageEvent.from_dict(data)
+
+            return event_type_4
+
+        event = _parse_event(d.pop("event"))
+
+        canvas_change = cls(
+            version=version,
+            event=event,
+        )
+
+        canvas_change.additional_properties = d
+        return canvas_change
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
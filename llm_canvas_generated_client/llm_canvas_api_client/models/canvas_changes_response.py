@@ -0,0 +1,141 @@
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+
+if TYPE_CHECKING:
+    from ..models.canvas_change import CanvasChange
+    from ..models.canvas_data import CanvasData
+
+
+T = TypeVar("T", bound="CanvasChangesResponse")
+
+
+@_attrs_define
+class CanvasChangesResponse:
+    """Response type for GET /api/v1/canvas/{canvas_id}/changes
+
+    Attributes:
+        version (int):
+        changes (Union[None, Unset, list['CanvasChange']]):
+        snapshot (Union['CanvasData', None, Unset]):
+    """
+
+    version: int
+    changes: Union[None, Unset, list["CanvasChange"]] = UNSET
+    snapshot: Union["CanvasData", None, Unset] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        from ..models.canvas_data import CanvasData
+
+        version = self.version
+
+        changes: Union[None, Unset, list[dict[str, Any]]]
+        if isinstance(self.changes, Unset):
+            changes = UNSET
+        elif isinstance(self.changes, list):
+            changes = []
+            for changes_type_0_item_data in self.changes:
+                changes_type_0_item = changes_type_0_item_data.to_dict()
+                changes.append(changes_type_0_item)
+
+        else:
+            changes = self.changes
+
+        snapshot: Union[None, Unset, dict[str, Any]]
+        if isinstance(self.snapshot, Unset):
+            snapshot = UNSET
+        elif isinstance(self.snapshot, CanvasData):
+            snapshot = self.snapshot.to_dict()
+        else:
+            snapshot = self.snapshot
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "version": version,
+            }
+        )
+        if changes is not UNSET:
+            field_dict["changes"] = changes
+        if snapshot is not UNSET:
+            field_dict["snapshot"] = snapshot
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.canvas_change import CanvasChange
+        from ..models.canvas_data import CanvasData
+
+        d = dict(src_dict)
+        version = d.pop("version")
+
+        def _parse_changes(data: object) -> Union[None, Unset, list["CanvasChange"]]:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            try:
+                if not isinstance(data, list):
+                    raise TypeError()
+                changes_type_0 = []
+                _changes_type_0 = data
+                for changes_type_0_item_data in _changes_type_0:
+                    changes_type_0_item = CanvasChange.from_dict(changes_type_0_item_data)
+
+                    changes_type_0.append(changes_type_0_item)
+
+                return changes_type_0
+            except:  # noqa: E722
+                pass
+            return cast(Union[None, Unset, list["CanvasChange"]], data)
+
+        changes = _parse_changes(d.pop("changes", UNSET))
+
+        def _parse_snapshot(data: object) -> Union["CanvasData", None, Unset]:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            try:
+                if not isinstance(data, dict):
+                    raise TypeError()
+                snapshot_type_0 = CanvasData.from_dict(data)
+
+                return snapshot_type_0
+            except:  # noqa: E722
+                pass
+            return cast(Union["CanvasData", None, Unset], data)
+
+        snapshot = _parse_snapshot(d.pop("snapshot", UNSET))
+
+        canvas_changes_response = cls(
+            version=version,
+            changes=changes,
+            snapshot=snapshot,
+        )
+
+        canvas_changes_response.additional_properties = d
+        return canvas_changes_response
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,100 @@
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+if TYPE_CHECKING:
+    from ..models.message_node import MessageNode
+
+
+T = TypeVar("T", bound="CanvasCommitMessagesEvent")
+
+
+@_attrs_define
+class CanvasCommitMessagesEvent:
+    """Event data for a batch of messages committed together.
+
+    Attributes:
+        event_type (Literal['commit_messages']):
+        canvas_id (str):
+        timestamp (float):
+        data (list['MessageNode']):
+    """
+
+    event_type: Literal["commit_messages"]
+    canvas_id: str
+    timestamp: float
+    data: list["MessageNode"]
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        event_type = self.event_type
+
+        canvas_id = self.canvas_id
+
+        timestamp = self.timestamp
+
+        data = []
+        for data_item_data in self.data:
+            data_item = data_item_data.to_dict()
+            data.append(data_item)
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "event_type": event_type,
+                "canvas_id": canvas_id,
+                "timestamp": timestamp,
+                "data": data,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.message_node import MessageNode
+
+        d = dict(src_dict)
+        event_type = cast(Literal["commit_messages"], d.pop("event_type"))
+        if event_type != "commit_messages":
+            raise ValueError(f"event_type must match const 'commit_messages', got '{event_type}'")
+
+        canvas_id = d.pop("canvas_id")
+
+        timestamp = d.pop("timestamp")
+
+        data = []
+        _data = d.pop("data")
+        for data_item_data in _data:
+            data_item = MessageNode.from_dict(data_item_data)
+
+            data.append(data_item)
+
+        canvas_commit_messages_event = cls(
+            event_type=event_type,
+            canvas_id=canvas_id,
+            timestamp=timestamp,
+            data=data,
+        )
+
+        canvas_commit_messages_event.additional_properties = d
+        return canvas_commit_messages_event
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,86 @@
+from collections.abc import Mapping
+from typing import Any, Literal, TypeVar, cast
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+T = TypeVar("T", bound="CanvasDeleteMessageEvent")
+
+
+@_attrs_define
+class CanvasDeleteMessageEvent:
+    """Event data for canvas message deletions.
+
+    Attributes:
+        event_type (Literal['delete_message']):
+        canvas_id (str):
+        timestamp (float):
+        data (str):
+    """
+
+    event_type: Literal["delete_message"]
+    canvas_id: str
+    timestamp: float
+    data: str
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        event_type = self.event_type
+
+        canvas_id = self.canvas_id
+
+        timestamp = self.timestamp
+
+        data = self.data
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "event_type": event_type,
+                "canvas_id": canvas_id,
+                "timestamp": timestamp,
+                "data": data,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        event_type = cast(Literal["delete_message"], d.pop("event_type"))
+        if event_type != "delete_message":
+            raise ValueError(f"event_type must match const 'delete_message', got '{event_type}'")
+
+        canvas_id = d.pop("canvas_id")
+
+        timestamp = d.pop("timestamp")
+
+        data = d.pop("data")
+
+        canvas_delete_message_event = cls(
+            event_type=event_type,
+            canvas_id=canvas_id,
+            timestamp=timestamp,
+            data=data,
+        )
+
+        canvas_delete_message_event.additional_properties = d
+        return canvas_delete_message_event
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,66 @@
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+if TYPE_CHECKING:
+    from ..models.branch_diff import BranchDiff
+
+
+T = TypeVar("T", bound="CanvasDiffResponse")
+
+
+@_attrs_define
+class CanvasDiffResponse:
+    """Response type for GET /api/v1/canvas/{canvas_id}/diff
+
+    Attributes:
+        data (BranchDiff): Messages unique to each of two histories since their merge base.
+    """
+
+    data: "BranchDiff"
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = self.data.to_dict()
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "data": data,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.branch_diff import BranchDiff
+
+        d = dict(src_dict)
+        data = BranchDiff.from_dict(d.pop("data"))
+
+        canvas_diff_response = cls(
+            data=data,
+        )
+
+        canvas_diff_response.additional_properties = d
+        return canvas_diff_response
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
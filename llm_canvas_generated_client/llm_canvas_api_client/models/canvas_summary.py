@@ -4,7 +4,11 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import UNSET, Unset
+
 if TYPE_CHECKING:
+    from ..models.canvas_summary_branch_token_counts import CanvasSummaryBranchTokenCounts
+    from ..models.canvas_summary_head_token_counts import CanvasSummaryHeadTokenCounts
     from ..models.canvas_summary_meta import CanvasSummaryMeta
 
 
@@ -23,6 +27,8 @@ class CanvasSummary:
         title (Union[None, str]):
         description (Union[None, str]):
         meta (CanvasSummaryMeta):
+        branch_token_counts (Union[Unset, CanvasSummaryBranchTokenCounts]):
+        head_token_counts (Union[Unset, CanvasSummaryHeadTokenCounts]):
     """
 
     canvas_id: str
@@ -32,6 +38,8 @@ class CanvasSummary:
     title: Union[None, str]
     description: Union[None, str]
     meta: "CanvasSummaryMeta"
+    branch_token_counts: Union[Unset, "CanvasSummaryBranchTokenCounts"] = UNSET
+    head_token_counts: Union[Unset, "CanvasSummaryHeadTokenCounts"] = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
@@ -51,6 +59,14 @@ class CanvasSummary:
 
         meta = self.meta.to_dict()
 
+        branch_token_counts: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.branch_token_counts, Unset):
+            branch_token_counts = self.branch_token_counts.to_dict()
+
+        head_token_counts: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.head_token_counts, Unset):
+            head_token_counts = self.head_token_counts.to_dict()
+
         field_dict: dict[str, Any] = {}
         field_dict.update(self.additional_properties)
         field_dict.update(
@@ -64,11 +80,17 @@ class CanvasSummary:
                 "meta": meta,
             }
         )
+        if branch_token_counts is not UNSET:
+            field_dict["branch_token_counts"] = branch_token_counts
+        if head_token_counts is not UNSET:
+            field_dict["head_token_counts"] = head_token_counts
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.canvas_summary_branch_token_counts import CanvasSummaryBranchTokenCounts
+        from ..models.canvas_summary_head_token_counts import CanvasSummaryHeadTokenCounts
         from ..models.canvas_summary_meta import CanvasSummaryMeta
 
         d = dict(src_dict)
@@ -96,6 +118,20 @@ class CanvasSummary:
 
         meta = CanvasSummaryMeta.from_dict(d.pop("meta"))
 
+        _branch_token_counts = d.pop("branch_token_counts", UNSET)
+        branch_token_counts: Union[Unset, CanvasSummaryBranchTokenCounts]
+        if isinstance(_branch_token_counts, Unset):
+            branch_token_counts = UNSET
+        else:
+            branch_token_counts = CanvasSummaryBranchTokenCounts.from_dict(_branch_token_counts)
+
+        _head_token_counts = d.pop("head_token_counts", UNSET)
+        head_token_counts: Union[Unset, CanvasSummaryHeadTokenCounts]
+        if isinstance(_head_token_counts, Unset):
+            head_token_counts = UNSET
+        else:
+            head_token_counts = CanvasSummaryHeadTokenCounts.from_dict(_head_token_counts)
+
         canvas_summary = cls(
             canvas_id=canvas_id,
             created_at=created_at,
@@ -104,6 +140,8 @@ class CanvasSummary:
             title=title,
             description=description,
             meta=meta,
+            branch_token_counts=branch_token_counts,
+            head_token_counts=head_token_counts,
         )
 
         canvas_summary.additional_properties = d
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class CreateMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyPutKind(str, Enum):
+    HASH = "hash"
+    SORTED = "sorted"
+
+    def __str__(self) -> str:
+        return str(self.value)
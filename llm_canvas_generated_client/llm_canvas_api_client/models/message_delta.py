@@ -0,0 +1,102 @@
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+
+if TYPE_CHECKING:
+    from ..models.message_delta_meta import MessageDeltaMeta
+
+
+T = TypeVar("T", bound="MessageDelta")
+
+
+@_attrs_define
+class MessageDelta:
+    """An incremental change to a stored message, e.g. the next tokens of a streamed response.
+
+    Attributes:
+        id (str):
+        text (Union[Unset, str]):
+        block_index (Union[Unset, int]):
+        meta (Union[Unset, MessageDeltaMeta]):
+    """
+
+    id: str
+    text: Union[Unset, str] = UNSET
+    block_index: Union[Unset, int] = UNSET
+    meta: Union[Unset, "MessageDeltaMeta"] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        id = self.id
+
+        text = self.text
+
+        block_index = self.block_index
+
+        meta: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.meta, Unset):
+            meta = self.meta.to_dict()
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "id": id,
+            }
+        )
+        if text is not UNSET:
+            field_dict["text"] = text
+        if block_index is not UNSET:
+            field_dict["block_index"] = block_index
+        if meta is not UNSET:
+            field_dict["meta"] = meta
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.message_delta_meta import MessageDeltaMeta
+
+        d = dict(src_dict)
+        id = d.pop("id")
+
+        text = d.pop("text", UNSET)
+
+        block_index = d.pop("block_index", UNSET)
+
+        _meta = d.pop("meta", UNSET)
+        meta: Union[Unset, MessageDeltaMeta]
+        if isinstance(_meta, Unset):
+            meta = UNSET
+        else:
+            meta = MessageDeltaMeta.from_dict(_meta)
+
+        message_delta = cls(
+            id=id,
+            text=text,
+            block_index=block_index,
+            meta=meta,
+        )
+
+        message_delta.additional_properties = d
+        return message_delta
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,66 @@
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+if TYPE_CHECKING:
+    from ..models.canvas_message_delta_event import CanvasMessageDeltaEvent
+
+
+T = TypeVar("T", bound="MessageDeltaRequest")
+
+
+@_attrs_define
+class MessageDeltaRequest:
+    """Request type for POST /api/v1/canvas/{canvas_id}/messages/{message_id}/delta
+
+    Attributes:
+        data (CanvasMessageDeltaEvent): Event data for incremental message changes.
+    """
+
+    data: "CanvasMessageDeltaEvent"
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = self.data.to_dict()
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "data": data,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.canvas_message_delta_event import CanvasMessageDeltaEvent
+
+        d = dict(src_dict)
+        data = CanvasMessageDeltaEvent.from_dict(d.pop("data"))
+
+        message_delta_request = cls(
+            data=data,
+        )
+
+        message_delta_request.additional_properties = d
+        return message_delta_request
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import UNSET, Unset
+
 if TYPE_CHECKING:
     from ..models.message import Message
     from ..models.message_node_meta_type_0 import MessageNodeMetaType0
@@ -22,6 +24,7 @@ class MessageNode:
         parent_id (Union[None, str]):
         child_ids (list[str]):
         meta (Union['MessageNodeMetaType0', None]):
+        merge_parent_ids (Union[Unset, list[str]]):
     """
 
     id: str
@@ -29,6 +32,7 @@ class MessageNode:
     parent_id: Union[None, str]
     child_ids: list[str]
     meta: Union["MessageNodeMetaType0", None]
+    merge_parent_ids: Union[Unset, list[str]] = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
@@ -49,6 +53,10 @@ class MessageNode:
         else:
             meta = self.meta
 
+        merge_parent_ids: Union[Unset, list[str]] = UNSET
+        if not isinstance(self.merge_parent_ids, Unset):
+            merge_parent_ids = self.merge_parent_ids
+
         field_dict: dict[str, Any] = {}
         field_dict.update(self.additional_properties)
         field_dict.update(
@@ -60,6 +68,8 @@ class MessageNode:
                 "meta": meta,
             }
         )
+        if merge_parent_ids is not UNSET:
+            field_dict["merge_parent_ids"] = merge_parent_ids
 
         return field_dict
 
@@ -97,12 +107,15 @@ class MessageNode:
 
         meta = _parse_meta(d.pop("meta"))
 
+        merge_parent_ids = cast(list[str], d.pop("merge_parent_ids", UNSET))
+
         message_node = cls(
             id=id,
             message=message,
             parent_id=parent_id,
             child_ids=child_ids,
             meta=meta,
+            merge_parent_ids=merge_parent_ids,
         )
 
         message_node.additional_properties = d
@@ -0,0 +1,70 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..models.meta_index_info_kind import MetaIndexInfoKind
+
+T = TypeVar("T", bound="MetaIndexInfo")
+
+
+@_attrs_define
+class MetaIndexInfo:
+    """A meta key a canvas is indexed by, and the kind of the index
+
+    Attributes:
+        key (str):
+        kind (MetaIndexInfoKind):
+    """
+
+    key: str
+    kind: MetaIndexInfoKind
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        key = self.key
+
+        kind = self.kind.value
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "key": key,
+                "kind": kind,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        key = d.pop("key")
+
+        kind = MetaIndexInfoKind(d.pop("kind"))
+
+        meta_index_info = cls(
+            key=key,
+            kind=kind,
+        )
+
+        meta_index_info.additional_properties = d
+        return meta_index_info
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,74 @@
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+if TYPE_CHECKING:
+    from ..models.meta_index_info import MetaIndexInfo
+
+
+T = TypeVar("T", bound="MetaIndexesResponse")
+
+
+@_attrs_define
+class MetaIndexesResponse:
+    """Response type for PUT and DELETE /api/v1/canvas/{canvas_id}/meta_indexes/{key}
+
+    Attributes:
+        indexes (list['MetaIndexInfo']):
+    """
+
+    indexes: list["MetaIndexInfo"]
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        indexes = []
+        for indexes_item_data in self.indexes:
+            indexes_item = indexes_item_data.to_dict()
+            indexes.append(indexes_item)
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "indexes": indexes,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.meta_index_info import MetaIndexInfo
+
+        d = dict(src_dict)
+        indexes = []
+        _indexes = d.pop("indexes")
+        for indexes_item_data in _indexes:
+            indexes_item = MetaIndexInfo.from_dict(indexes_item_data)
+
+            indexes.append(indexes_item)
+
+        meta_indexes_response = cls(
+            indexes=indexes,
+        )
+
+        meta_indexes_response.additional_properties = d
+        return meta_indexes_response
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,111 @@
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+
+if TYPE_CHECKING:
+    from ..models.query_nodes_request_equals import QueryNodesRequestEquals
+    from ..models.query_nodes_request_ranges import QueryNodesRequestRanges
+
+
+T = TypeVar("T", bound="QueryNodesRequest")
+
+
+@_attrs_define
+class QueryNodesRequest:
+    """Request type for POST /api/v1/canvas/{canvas_id}/nodes/query
+
+    Attributes:
+        equals (Union[Unset, QueryNodesRequestEquals]):
+        ranges (Union[Unset, QueryNodesRequestRanges]):
+        limit (Union[None, Unset, int]):
+    """
+
+    equals: Union[Unset, "QueryNodesRequestEquals"] = UNSET
+    ranges: Union[Unset, "QueryNodesRequestRanges"] = UNSET
+    limit: Union[None, Unset, int] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        equals: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.equals, Unset):
+            equals = self.equals.to_dict()
+
+        ranges: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.ranges, Unset):
+            ranges = self.ranges.to_dict()
+
+        limit: Union[None, Unset, int]
+        if isinstance(self.limit, Unset):
+            limit = UNSET
+        else:
+            limit = self.limit
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update({})
+        if equals is not UNSET:
+            field_dict["equals"] = equals
+        if ranges is not UNSET:
+            field_dict["ranges"] = ranges
+        if limit is not UNSET:
+            field_dict["limit"] = limit
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.query_nodes_request_equals import QueryNodesRequestEquals
+        from ..models.query_nodes_request_ranges import QueryNodesRequestRanges
+
+        d = dict(src_dict)
+        _equals = d.pop("equals", UNSET)
+        equals: Union[Unset, QueryNodesRequestEquals]
+        if isinstance(_equals, Unset):
+            equals = UNSET
+        else:
+            equals = QueryNodesRequestEquals.from_dict(_equals)
+
+        _ranges = d.pop("ranges", UNSET)
+        ranges: Union[Unset, QueryNodesRequestRanges]
+        if isinstance(_ranges, Unset):
+            ranges = UNSET
+        else:
+            ranges = QueryNodesRequestRanges.from_dict(_ranges)
+
+        def _parse_limit(data: object) -> Union[None, Unset, int]:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            return cast(Union[None, Unset, int], data)
+
+        limit = _parse_limit(d.pop("limit", UNSET))
+
+        query_nodes_request = cls(
+            equals=equals,
+            ranges=ranges,
+            limit=limit,
+        )
+
+        query_nodes_request.additional_properties = d
+        return query_nodes_request
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,66 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union, cast
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+T = TypeVar("T", bound="QueryNodesRequestRanges")
+
+
+@_attrs_define
+class QueryNodesRequestRanges:
+    """ """
+
+    additional_properties: dict[str, list[Union[None, float]]] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        field_dict: dict[str, Any] = {}
+        for prop_name, prop in self.additional_properties.items():
+            field_dict[prop_name] = []
+            for additional_property_item_data in prop:
+                additional_property_item: Union[None, float]
+                additional_property_item = additional_property_item_data
+                field_dict[prop_name].append(additional_property_item)
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        query_nodes_request_ranges = cls()
+
+        additional_properties = {}
+        for prop_name, prop_dict in d.items():
+            additional_property = []
+            _additional_property = prop_dict
+            for additional_property_item_data in _additional_property:
+
+                def _parse_additional_property_item(data: object) -> Union[None, float]:
+                    if data is None:
+                        return data
+                    return cast(Union[None, float], data)
+
+                additional_property_item = _parse_additional_property_item(additional_property_item_data)
+
+                additional_property.append(additional_property_item)
+
+            additional_properties[prop_name] = additional_property
+
+        query_nodes_request_ranges.additional_properties = additional_properties
+        return query_nodes_request_ranges
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> list[Union[None, float]]:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: list[Union[None, float]]) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,84 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+T = TypeVar("T", bound="RegistrySearchHit")
+
+
+@_attrs_define
+class RegistrySearchHit:
+    """A message of one of the canvases of a registry matching a search query.
+
+    Attributes:
+        node_id (str):
+        score (float):
+        snippet (str):
+        canvas_id (str):
+    """
+
+    node_id: str
+    score: float
+    snippet: str
+    canvas_id: str
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        node_id = self.node_id
+
+        score = self.score
+
+        snippet = self.snippet
+
+        canvas_id = self.canvas_id
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "node_id": node_id,
+                "score": score,
+                "snippet": snippet,
+                "canvas_id": canvas_id,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        node_id = d.pop("node_id")
+
+        score = d.pop("score")
+
+        snippet = d.pop("snippet")
+
+        canvas_id = d.pop("canvas_id")
+
+        registry_search_hit = cls(
+            node_id=node_id,
+            score=score,
+            snippet=snippet,
+            canvas_id=canvas_id,
+        )
+
+        registry_search_hit.additional_properties = d
+        return registry_search_hit
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
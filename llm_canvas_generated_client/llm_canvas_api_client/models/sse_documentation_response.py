@@ -12,7 +12,9 @@ if TYPE_CHECKING:
     from ..models.sse_heartbeat_event import SSEHeartbeatEvent
     from ..models.sse_message_committed_event import SSEMessageCommittedEvent
     from ..models.sse_message_deleted_event import SSEMessageDeletedEvent
+    from ..models.sse_message_delta_event import SSEMessageDeltaEvent
     from ..models.sse_message_updated_event import SSEMessageUpdatedEvent
+    from ..models.sse_messages_committed_event import SSEMessagesCommittedEvent
 
 
 T = TypeVar("T", bound="SSEDocumentationResponse")
@@ -24,7 +26,8 @@ class SSEDocumentationResponse:
 
     Attributes:
         events (list[Union['SSECanvasCreatedEvent', 'SSECanvasDeletedEvent', 'SSECanvasUpdatedEvent', 'SSEErrorEvent',
-            'SSEHeartbeatEvent', 'SSEMessageCommittedEvent', 'SSEMessageDeletedEvent', 'SSEMessageUpdatedEvent']]):
+            'SSEHeartbeatEvent', 'SSEMessageCommittedEvent', 'SSEMessageDeletedEvent', 'SSEMessageDeltaEvent',
+            'SSEMessageUpdatedEvent', 'SSEMessagesCommittedEvent']]):
     """
 
     events: list[
@@ -36,7 +39,9 @@ class SSEDocumentationResponse:
             "SSEHeartbeatEvent",
             "SSEMessageCommittedEvent",
             "SSEMessageDeletedEvent",
+            "SSEMessageDeltaEvent",
             "SSEMessageUpdatedEvent",
+            "SSEMessagesCommittedEvent",
         ]
     ]
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
@@ -48,7 +53,9 @@ class SSEDocumentationResponse:
         from ..models.sse_error_event import SSEErrorEvent
         from ..models.sse_heartbeat_event import SSEHeartbeatEvent
         from ..models.sse_message_committed_event import SSEMessageCommittedEvent
+        from ..models.sse_message_delta_event import SSEMessageDeltaEvent
         from ..models.sse_message_updated_event import SSEMessageUpdatedEvent
+        from ..models.sse_messages_committed_event import SSEMessagesCommittedEvent
 
         events = []
         for events_item_data in self.events:
@@ -65,8 +72,12 @@ class SSEDocumentationResponse:
                 events_item = events_item_data.to_dict()
             elif isinstance(events_item_data, SSEMessageCommittedEvent):
                 events_item = events_item_data.to_dict()
+            elif isinstance(events_item_data, SSEMessagesCommittedEvent):
+                events_item = events_item_data.to_dict()
             elif isinstance(events_item_data, SSEMessageUpdatedEvent):
                 events_item = events_item_data.to_dict()
+            elif isinstance(events_item_data, SSEMessageDeltaEvent):
+                events_item = events_item_data.to_dict()
             else:
                 events_item = events_item_data.to_dict()
 
@@ -91,7 +102,9 @@ class SSEDocumentationResponse:
         from ..models.sse_heartbeat_event import SSEHeartbeatEvent
         from ..models.sse_message_committed_event import SSEMessageCommittedEvent
         from ..models.sse_message_deleted_event import SSEMessageDeletedEvent
+        from ..models.sse_message_delta_event import SSEMessageDeltaEvent
         from ..models.sse_message_updated_event import SSEMessageUpdatedEvent
+        from ..models.sse_messages_committed_event import SSEMessagesCommittedEvent
 
         d = dict(src_dict)
         events = []
@@ -108,7 +121,9 @@ class SSEDocumentationResponse:
                 "SSEHeartbeatEvent",
                 "SSEMessageCommittedEvent",
                 "SSEMessageDeletedEvent",
+                "SSEMessageDeltaEvent",
                 "SSEMessageUpdatedEvent",
+                "SSEMessagesCommittedEvent",
             ]:
                 try:
                     if not isinstance(data, dict):
@@ -161,16 +176,32 @@ class SSEDocumentationResponse:
                 try:
                     if not isinstance(data, dict):
                         raise TypeError()
-                    events_item_type_6 = SSEMessageUpdatedEvent.from_dict(data)
+                    events_item_type_6 = SSEMessagesCommittedEvent.from_dict(data)
 
                     return events_item_type_6
                 except:  # noqa: E722
                     pass
+                try:
+                    if not isinstance(data, dict):
+                        raise TypeError()
+                    events_item_type_7 = SSEMessageUpdatedEvent.from_dict(data)
+
+                    return events_item_type_7
+                except:  # noqa: E722
+                    pass
+                try:
+                    if not isinstance(data, dict):
+                        raise TypeError()
+                    events_item_type_8 = SSEMessageDeltaEvent.from_dict(data)
+
+                    return events_item_type_8
+                except:  # noqa: E722
+                    pass
                 if not isinstance(data, dict):
                     raise TypeError()
-                events_item_type_7 = SSEMessageDeletedEvent.from_dict(data)
+                events_item_type_9 = SSEMessageDeletedEvent.from_dict(data)
 
-                return events_item_type_7
+                return events_item_type_9
 
             events_item = _parse_events_item(events_item_data)
 
@@ -0,0 +1,92 @@
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+if TYPE_CHECKING:
+    from ..models.message_delta import MessageDelta
+
+
+T = TypeVar("T", bound="SSEMessageDeltaEvent")
+
+
+@_attrs_define
+class SSEMessageDeltaEvent:
+    """SSE event data for incremental message changes (only the new text and meta keys).
+
+    Attributes:
+        type_ (Literal['message_delta']):
+        timestamp (float):
+        canvas_id (str):
+        data (MessageDelta): An incremental change to a stored message, e.g. the next tokens of a streamed response.
+    """
+
+    type_: Literal["message_delta"]
+    timestamp: float
+    canvas_id: str
+    data: "MessageDelta"
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        type_ = self.type_
+
+        timestamp = self.timestamp
+
+        canvas_id = self.canvas_id
+
+        data = self.data.to_dict()
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "type": type_,
+                "timestamp": timestamp,
+                "canvas_id": canvas_id,
+                "data": data,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.message_delta import MessageDelta
+
+        d = dict(src_dict)
+        type_ = cast(Literal["message_delta"], d.pop("type"))
+        if type_ != "message_delta":
+            raise ValueError(f"type must match const 'message_delta', got '{type_}'")
+
+        timestamp = d.pop("timestamp")
+
+        canvas_id = d.pop("canvas_id")
+
+        data = MessageDelta.from_dict(d.pop("data"))
+
+        sse_message_delta_event = cls(
+            type_=type_,
+            timestamp=timestamp,
+            canvas_id=canvas_id,
+            data=data,
+        )
+
+        sse_message_delta_event.additional_properties = d
+        return sse_message_delta_event
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,100 @@
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+if TYPE_CHECKING:
+    from ..models.message_node import MessageNode
+
+
+T = TypeVar("T", bound="SSEMessagesCommittedEvent")
+
+
+@_attrs_define
+class SSEMessagesCommittedEvent:
+    """SSE event data for a batch of messages committed together.
+
+    Attributes:
+        type_ (Literal['messages_committed']):
+        timestamp (float):
+        canvas_id (str):
+        data (list['MessageNode']):
+    """
+
+    type_: Literal["messages_committed"]
+    timestamp: float
+    canvas_id: str
+    data: list["MessageNode"]
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        type_ = self.type_
+
+        timestamp = self.timestamp
+
+        canvas_id = self.canvas_id
+
+        data = []
+        for data_item_data in self.data:
+            data_item = data_item_data.to_dict()
+            data.append(data_item)
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "type": type_,
+                "timestamp": timestamp,
+                "canvas_id": canvas_id,
+                "data": data,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.message_node import MessageNode
+
+        d = dict(src_dict)
+        type_ = cast(Literal["messages_committed"], d.pop("type"))
+        if type_ != "messages_committed":
+            raise ValueError(f"type must match const 'messages_committed', got '{type_}'")
+
+        timestamp = d.pop("timestamp")
+
+        canvas_id = d.pop("canvas_id")
+
+        data = []
+        _data = d.pop("data")
+        for data_item_data in _data:
+            data_item = MessageNode.from_dict(data_item_data)
+
+            data.append(data_item)
+
+        sse_messages_committed_event = cls(
+            type_=type_,
+            timestamp=timestamp,
+            canvas_id=canvas_id,
+            data=data,
+        )
+
+        sse_messages_committed_event.additional_properties = d
+        return sse_messages_committed_event
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
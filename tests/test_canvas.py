@@ -1,11 +1,26 @@
 """Tests for Canvas API implementation."""
 
+import base64
+import gc
+import random
+import threading
+import time
 import uuid
+from typing import Callable, Union
 
 import pytest
+from openai.types.chat import ChatCompletionMessage
 
+from llm_canvas.blob_store import BlobStore, blob_digest, inline_blobs
 from llm_canvas.canvas import Canvas
-from llm_canvas.types import Message, MessageNode
+from llm_canvas.canvas_registry import CanvasRegistry
+from llm_canvas.content_store import ContentStore, content_digest
+from llm_canvas.event_queue import EventQueue
+from llm_canvas.ids import ulid, ulid_bound, ulid_timestamp
+from llm_canvas.node_store import CompactNodeStore
+from llm_canvas.openai_format import from_openai_messages, to_openai_messages
+from llm_canvas.tokens import approximate_token_count
+from llm_canvas.types import CanvasEvent, Message, MessageNode
 
 
 class TestCanvasAPI:
@@ -744,3 +759,2021 @@ class TestCanvasAPI:
         test_branch_info = next(b for b in branches if b["name"] == "test-branch")
         assert test_branch_info["description"] == "Test description"
         assert test_branch_info["head_node_id"] == head_msg["id"]
+
+    def test_get_path_returns_root_to_node(self, canvas: Canvas) -> None:
+        """Test that get_path returns the conversation from the root down to the node."""
+        main_branch = canvas.checkout(name="main", create_if_not_exists=True)
+        msg1 = main_branch.commit_message({"content": "Question", "role": "user"})
+        msg2 = main_branch.commit_message({"content": "Answer", "role": "assistant"})
+        msg3 = main_branch.commit_message({"content": "Follow-up", "role": "user"})
+
+        assert [node["id"] for node in canvas.get_path(msg3["id"])] == [msg1["id"], msg2["id"], msg3["id"]]
+        assert [node["id"] for node in canvas.get_path(msg1["id"])] == [msg1["id"]]
+
+    def test_get_path_shares_prefix_between_siblings(self, canvas: Canvas) -> None:
+        """Test that sibling branches see the shared prefix and only their own messages.
+
+        Graph structure:
+            main:    A ── B ── C (HEAD)
+                          │
+            feature:      └── D ── E (HEAD)
+        """
+        main_branch = canvas.checkout(name="main", create_if_not_exists=True)
+        msg_a = main_branch.commit_message({"content": "A", "role": "user"})
+        msg_b = main_branch.commit_message({"content": "B", "role": "assistant"})
+        msg_c = main_branch.commit_message({"content": "C", "role": "user"})
+
+        feature_branch = canvas.checkout(name="feature", create_if_not_exists=True, commit_message=msg_b)
+        msg_d = feature_branch.commit_message({"content": "D", "role": "user"})
+        msg_e = feature_branch.commit_message({"content": "E", "role": "assistant"})
+
+        assert [node["id"] for node in main_branch.history()] == [msg_a["id"], msg_b["id"], msg_c["id"]]
+        assert [node["id"] for node in feature_branch.history()] == [msg_a["id"], msg_b["id"], msg_d["id"], msg_e["id"]]
+
+    def test_branch_history_empty_branch(self, canvas: Canvas) -> None:
+        """Test that a branch without commits has an empty history."""
+        empty_branch = canvas.checkout(name="empty", create_if_not_exists=True)
+        assert empty_branch.history() == []
+
+    def test_get_path_nonexistent_node(self, canvas: Canvas) -> None:
+        """Test that get_path raises for unknown nodes."""
+        with pytest.raises(ValueError, match="Node with ID 'missing' does not exist"):
+            canvas.get_path("missing")
+
+    def test_get_path_after_from_canvas_data(self, canvas: Canvas) -> None:
+        """Test that the ancestry index is rebuilt when loading canvas data, regardless of node order."""
+        main_branch = canvas.checkout(name="main", create_if_not_exists=True)
+        msg1 = main_branch.commit_message({"content": "Question", "role": "user"})
+        msg2 = main_branch.commit_message({"content": "Answer", "role": "assistant"})
+        msg3 = main_branch.commit_message({"content": "Follow-up", "role": "user"})
+
+        data = canvas.to_canvas_data()
+        data["nodes"] = dict(reversed(list(data["nodes"].items())))
+        loaded = Canvas.from_canvas_data(data)
+
+        assert [node["id"] for node in loaded.get_path(msg3["id"])] == [msg1["id"], msg2["id"], msg3["id"]]
+
+
+class TestCompactNodeStore:
+    """Test suite for Canvas backed by CompactNodeStore."""
+
+    @pytest.fixture
+    def canvas(self) -> Canvas:
+        """Create a test canvas with a compact node store."""
+        return Canvas(title="Compact Canvas", node_store=CompactNodeStore())
+
+    def test_commit_and_get_node(self, canvas: Canvas) -> None:
+        """Test that committed nodes read back as MessageNode mappings."""
+        main_branch = canvas.checkout(name="main")
+        user_msg = main_branch.commit_message({"content": "Hello", "role": "user"}, meta={"model": "test"})
+        assistant_msg = main_branch.commit_message({"content": "Hi there", "role": "assistant"})
+
+        stored = canvas.get_node(user_msg["id"])
+        assert stored == {
+            "id": user_msg["id"],
+            "message": {"content": "Hello", "role": "user"},
+            "parent_id": None,
+            "child_ids": [assistant_msg["id"]],
+            "meta": user_msg["meta"],
+        }
+        assert stored["meta"] is not None
+        assert stored["meta"]["model"] == "test"
+        assert [node["id"] for node in canvas.iter_nodes()] == [user_msg["id"], assistant_msg["id"]]
+
+    def test_merge_links_source_heads(self, canvas: Canvas) -> None:
+        """Test that merge child links are persisted in the compact store."""
+        main_branch = canvas.checkout(name="main")
+        main_branch.commit_message({"content": "Main", "role": "user"})
+        feature_branch = canvas.checkout(name="feature", create_if_not_exists=True)
+        feature_msg = feature_branch.commit_message({"content": "Feature", "role": "assistant"})
+
+        merge_node = canvas.merge("feature", {"role": "system", "content": "Merge"}, "main")
+
+        assert merge_node["id"] in canvas.nodes[feature_msg["id"]]["child_ids"]
+        assert canvas.nodes[merge_node["id"]]["merge_parent_ids"] == [feature_msg["id"]]
+
+    def test_update_message(self, canvas: Canvas) -> None:
+        """Test that updates are written back to the compact store."""
+        main_branch = canvas.checkout(name="main")
+        msg = main_branch.commit_message({"content": "Draft", "role": "assistant"})
+
+        updated = canvas.get_node(msg["id"])
+        assert updated is not None
+        updated["message"]["content"] = "Final"
+        main_branch.update_message(msg["id"], updated)
+
+        stored = canvas.get_node(msg["id"])
+        assert stored is not None
+        assert stored["message"]["content"] == "Final"
+
+    def test_null_meta_round_trip(self, canvas: Canvas) -> None:
+        """Test that a node without meta keeps meta as None."""
+        node: MessageNode = {
+            "id": "node-1",
+            "message": {"content": "Imported", "role": "user"},
+            "parent_id": None,
+            "child_ids": [],
+            "meta": None,
+        }
+        canvas.insert_node(node)
+
+        assert canvas.get_node("node-1") == node
+
+    def test_to_canvas_data_round_trip(self, canvas: Canvas) -> None:
+        """Test that canvas data produced from a compact store loads into either store."""
+        main_branch = canvas.checkout(name="main")
+        main_branch.commit_message({"content": "Question", "role": "user"})
+        answer = main_branch.commit_message({"content": "Answer", "role": "assistant"})
+
+        data = canvas.to_canvas_data()
+        loaded = Canvas.from_canvas_data(data)
+        loaded_compact = Canvas.from_canvas_data(data, node_store=CompactNodeStore())
+
+        assert loaded.nodes == data["nodes"]
+        assert dict(loaded_compact.nodes) == data["nodes"]
+        assert [node["id"] for node in loaded_compact.get_path(answer["id"])][-1] == answer["id"]
+
+
+class TestContentStore:
+    """Test suite for content deduplication through a shared ContentStore."""
+
+    @pytest.fixture
+    def content_store(self) -> ContentStore:
+        """Create an empty content store."""
+        return ContentStore()
+
+    def test_same_content_is_stored_once(self, content_store: ContentStore) -> None:
+        """Test that a prompt committed to several canvases and branches is stored once."""
+        prompt = "Analyze how market changes will impact this stakeholder group. " * 20
+        canvases = [Canvas(title=f"Canvas {i}", content_store=content_store) for i in range(3)]
+
+        nodes = []
+        for canvas in canvases:
+            for branch_name in ("customers", "investors"):
+                branch = canvas.checkout(name=branch_name, create_if_not_exists=True)
+                # Commit an equal but distinct string object each time
+                nodes.append(branch.commit_message({"content": prompt.encode().decode(), "role": "user"}))
+
+        assert len(content_store) == 1
+        digest = content_digest(prompt)
+        assert content_store.ref_count(digest) == len(nodes)
+        assert all(node["message"]["content"] is nodes[0]["message"]["content"] for node in nodes)
+
+    def test_block_content_is_deduplicated(self, content_store: ContentStore) -> None:
+        """Test that equal block lists share storage regardless of key order."""
+        canvas = Canvas(content_store=content_store)
+        branch = canvas.checkout(name="main")
+        first = branch.commit_message({"content": [{"type": "text", "text": "Hi"}], "role": "user"})
+        second = branch.commit_message({"content": [{"text": "Hi", "type": "text"}], "role": "user"})
+
+        assert len(content_store) == 1
+        assert second["message"]["content"] is first["message"]["content"]
+
+    def test_update_releases_previous_content(self, content_store: ContentStore) -> None:
+        """Test that updating a node moves its reference to the new content."""
+        canvas = Canvas(content_store=content_store)
+        branch = canvas.checkout(name="main")
+        node = branch.commit_message({"content": "Draft", "role": "assistant"})
+
+        branch.update_message(node["id"], {**node, "message": {"content": "Final", "role": "assistant"}})
+
+        assert content_digest("Draft") not in content_store
+        assert content_store.ref_count(content_digest("Final")) == 1
+
+    def test_release_content(self, content_store: ContentStore) -> None:
+        """Test that releasing a canvas frees content no other canvas references."""
+        kept = Canvas(content_store=content_store)
+        discarded = Canvas(content_store=content_store)
+        kept.checkout(name="main").commit_message({"content": "Shared", "role": "user"})
+        discarded.checkout(name="main").commit_message({"content": "Shared", "role": "user"})
+        discarded.checkout(name="main").commit_message({"content": "Only here", "role": "user"})
+
+        discarded.release_content()
+
+        assert content_store.ref_count(content_digest("Shared")) == 1
+        assert content_digest("Only here") not in content_store
+
+    def test_from_canvas_data_shares_content(self, content_store: ContentStore) -> None:
+        """Test that loading canvas data deduplicates content against the store."""
+        source = Canvas()
+        branch = source.checkout(name="main")
+        branch.commit_message({"content": "Repeated", "role": "user"})
+        branch.commit_message({"content": "Repeated", "role": "user"})
+
+        Canvas.from_canvas_data(source.to_canvas_data(), content_store=content_store)
+        Canvas.from_canvas_data(source.to_canvas_data(), content_store=content_store)
+
+        assert len(content_store) == 1
+        assert content_store.ref_count(content_digest("Repeated")) == 4
+
+
+class TestBatchCommit:
+    """Test suite for committing chains of messages in one step."""
+
+    @pytest.fixture
+    def canvas(self) -> Canvas:
+        """Create a test canvas."""
+        return Canvas(title="Batch Canvas")
+
+    def test_commit_messages_appends_chain(self, canvas: Canvas) -> None:
+        """Test that commit_messages chains the messages after the branch HEAD."""
+        branch = canvas.checkout(name="main")
+        first = branch.commit_message({"content": "System prompt", "role": "system"})
+
+        nodes = branch.commit_messages(
+            [{"content": f"Turn {i}", "role": "user" if i % 2 == 0 else "assistant"} for i in range(4)]
+        )
+
+        assert [node["message"]["content"] for node in nodes] == ["Turn 0", "Turn 1", "Turn 2", "Turn 3"]
+        assert nodes[0]["parent_id"] == first["id"]
+        assert all(child["parent_id"] == parent["id"] for parent, child in zip(nodes, nodes[1:]))
+        assert canvas.nodes[first["id"]]["child_ids"] == [nodes[0]["id"]]
+        assert branch.head_node_id == nodes[-1]["id"]
+        assert [node["id"] for node in branch.history()] == [first["id"]] + [node["id"] for node in nodes]
+
+    def test_commit_messages_emits_single_event(self, canvas: Canvas) -> None:
+        """Test that a batch produces exactly one commit_messages event."""
+        branch = canvas.checkout(name="main")
+        branch.commit_message({"content": "Start", "role": "user"})
+
+        events: list[CanvasEvent] = []
+        canvas.add_event_listener(events.append)
+        nodes = branch.commit_messages([{"content": "A", "role": "assistant"}, {"content": "B", "role": "user"}])
+
+        assert len(events) == 1
+        assert events[0]["event_type"] == "commit_messages"
+        assert events[0]["data"] == nodes
+
+    def test_commit_messages_empty(self, canvas: Canvas) -> None:
+        """Test that an empty batch changes nothing and emits nothing."""
+        branch = canvas.checkout(name="main")
+        events: list[CanvasEvent] = []
+        canvas.add_event_listener(events.append)
+
+        assert branch.commit_messages([]) == []
+        assert branch.head_node_id is None
+        assert events == []
+
+    def test_add_messages_unknown_parent(self, canvas: Canvas) -> None:
+        """Test that a batch with an unknown parent leaves the canvas unchanged."""
+        with pytest.raises(ValueError, match="Node with ID 'missing' does not exist"):
+            canvas.add_messages([{"content": "Orphan", "role": "user"}], parent_node_id="missing")
+        assert len(canvas.nodes) == 0
+
+    def test_insert_nodes_links_parents(self, canvas: Canvas) -> None:
+        """Test that inserting a received batch links the first node to its existing parent."""
+        source = Canvas()
+        branch = source.checkout(name="main")
+        root = branch.commit_message({"content": "Root", "role": "user"})
+        canvas.insert_node({**root, "child_ids": []})
+
+        events: list[CanvasEvent] = []
+        source.add_event_listener(events.append)
+        nodes = branch.commit_messages([{"content": "A", "role": "assistant"}, {"content": "B", "role": "user"}])
+
+        canvas.insert_nodes(events[0]["data"])  # type: ignore[arg-type]
+
+        assert canvas.nodes[root["id"]]["child_ids"] == [nodes[0]["id"]]
+        assert canvas.nodes[nodes[0]["id"]]["child_ids"] == [nodes[1]["id"]]
+
+
+class TestCommitProtocol:
+    """Test suite for the single-event commit protocol."""
+
+    @pytest.fixture
+    def canvas(self) -> Canvas:
+        """Create a test canvas."""
+        return Canvas(title="Protocol Canvas")
+
+    def test_commit_emits_only_commit_event(self, canvas: Canvas) -> None:
+        """Test that committing a child does not re-send its parent."""
+        branch = canvas.checkout(name="main")
+        first = branch.commit_message({"content": "Hello", "role": "user"})
+
+        events: list[CanvasEvent] = []
+        canvas.add_event_listener(events.append)
+        second = branch.commit_message({"content": "Hi", "role": "assistant"})
+
+        assert [event["event_type"] for event in events] == ["commit_message"]
+        assert canvas.nodes[first["id"]]["child_ids"] == [second["id"]]
+
+    def test_merge_emits_single_event_with_merge_parents(self, canvas: Canvas) -> None:
+        """Test that a merge commit carries its source HEADs instead of updating them."""
+        main_branch = canvas.checkout(name="main")
+        main_msg = main_branch.commit_message({"content": "Main", "role": "user"})
+        feature_branch = canvas.checkout(name="feature", create_if_not_exists=True)
+        feature_msg = feature_branch.commit_message({"content": "Feature", "role": "assistant"})
+
+        events: list[CanvasEvent] = []
+        canvas.add_event_listener(events.append)
+        merge_node = canvas.merge("feature", {"role": "system", "content": "Merge"}, "main")
+
+        assert [event["event_type"] for event in events] == ["commit_message"]
+        assert merge_node["parent_id"] == main_msg["id"]
+        assert merge_node["merge_parent_ids"] == [feature_msg["id"]]
+        assert merge_node["id"] in canvas.nodes[feature_msg["id"]]["child_ids"]
+
+    def test_update_message_keeps_stored_links(self, canvas: Canvas) -> None:
+        """Test that an update built from a stale copy does not drop children."""
+        branch = canvas.checkout(name="main")
+        first = branch.commit_message({"content": "Draft", "role": "user"})
+        stale_copy: MessageNode = {**first, "child_ids": []}
+        second = branch.commit_message({"content": "Reply", "role": "assistant"})
+
+        updated = branch.update_message(first["id"], {**stale_copy, "message": {"content": "Final", "role": "user"}})
+
+        assert updated["message"]["content"] == "Final"
+        assert updated["child_ids"] == [second["id"]]
+
+    def test_commit_with_missing_parent_is_rejected(self, canvas: Canvas) -> None:
+        """Test that a local commit is not stored when its parent does not exist."""
+        events: list[CanvasEvent] = []
+        canvas.add_event_listener(events.append)
+
+        with pytest.raises(ValueError, match="Node with ID 'missing' does not exist"):
+            canvas.add_message({"content": "Hello", "role": "user"}, parent_node_id="missing")
+
+        assert len(canvas.nodes) == 0
+        assert events == []
+
+    def test_insert_node_derives_child_links(self, canvas: Canvas) -> None:
+        """Test that receivers rebuild child_ids from parent_id and merge_parent_ids."""
+        source = Canvas()
+        received: list[CanvasEvent] = []
+        source.add_event_listener(received.append)
+
+        main_branch = source.checkout(name="main")
+        main_branch.commit_message({"content": "Question", "role": "user"})
+        feature_branch = source.checkout(name="feature", create_if_not_exists=True)
+        feature_branch.commit_message({"content": "Alternative", "role": "assistant"})
+        main_branch.commit_message({"content": "Answer", "role": "assistant"})
+        source.merge("feature", {"role": "system", "content": "Merge"}, "main")
+
+        for event in received:
+            assert event["event_type"] == "commit_message"
+            canvas.insert_node({**event["data"], "child_ids": []})  # type: ignore[typeddict-item]
+
+        assert dict(canvas.nodes) == dict(source.nodes)
+
+
+class TestConcurrentCommits:
+    """Test suite for committing to one canvas from several threads."""
+
+    THREADS = 8
+    COMMITS_PER_THREAD = 200
+
+    def _run_threads(self, target: Callable[[int], None]) -> None:
+        threads = [threading.Thread(target=target, args=(i,)) for i in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_commits_to_separate_branches(self) -> None:
+        """Test that each branch keeps a linear history under concurrent commits."""
+        canvas = Canvas(node_store=CompactNodeStore())
+        root = canvas.checkout(name="main").commit_message({"content": "Prompt", "role": "user"})
+        branches = [
+            canvas.checkout(name=f"worker-{i}", create_if_not_exists=True, commit_message=root) for i in range(self.THREADS)
+        ]
+
+        def worker(index: int) -> None:
+            for i in range(self.COMMITS_PER_THREAD):
+                branches[index].commit_message({"content": f"{index}-{i}", "role": "assistant"})
+
+        self._run_threads(worker)
+
+        assert len(canvas.nodes) == 1 + self.THREADS * self.COMMITS_PER_THREAD
+        assert len(canvas.nodes[root["id"]]["child_ids"]) == self.THREADS
+        for index, branch in enumerate(branches):
+            history = branch.history()
+            assert [node["message"]["content"] for node in history[1:]] == [
+                f"{index}-{i}" for i in range(self.COMMITS_PER_THREAD)
+            ]
+
+    def test_commits_to_same_branch(self) -> None:
+        """Test that concurrent commits to one branch form a single chain."""
+        canvas = Canvas()
+        branch = canvas.checkout(name="main")
+
+        def worker(index: int) -> None:
+            for i in range(self.COMMITS_PER_THREAD):
+                branch.commit_message({"content": f"{index}-{i}", "role": "user"})
+
+        self._run_threads(worker)
+
+        history = branch.history()
+        assert len(history) == self.THREADS * self.COMMITS_PER_THREAD
+        assert all(len(node["child_ids"]) == 1 for node in history[:-1])
+
+    def test_insert_node_links_parent_delivered_late(self) -> None:
+        """Test that a child inserted before its parent is linked once the parent arrives."""
+        source = Canvas()
+        branch = source.checkout(name="main")
+        parent = branch.commit_message({"content": "Parent", "role": "user"})
+        child = branch.commit_message({"content": "Child", "role": "assistant"})
+
+        canvas = Canvas()
+        canvas.insert_node({**child, "child_ids": []})
+        canvas.insert_node({**parent, "child_ids": []})
+
+        assert canvas.nodes[parent["id"]]["child_ids"] == [child["id"]]
+        assert [node["id"] for node in canvas.get_path(child["id"])] == [parent["id"], child["id"]]
+
+
+class TestMergeBase:
+    """Test suite for merge base lookups and branch comparisons."""
+
+    @pytest.fixture
+    def canvas(self) -> Canvas:
+        """Create a canvas with a main branch and a feature branch forked from it.
+
+        main:    m0 ── m1 ── m2
+                        └── f0 ── f1 (feature)
+        """
+        canvas = Canvas(title="Merge Base Canvas")
+        main_branch = canvas.checkout(name="main")
+        main_branch.commit_message({"content": "m0", "role": "user"})
+        main_branch.commit_message({"content": "m1", "role": "assistant"})
+        feature_branch = canvas.checkout(name="feature", create_if_not_exists=True)
+        main_branch.commit_message({"content": "m2", "role": "user"})
+        feature_branch.commit_message({"content": "f0", "role": "user"})
+        feature_branch.commit_message({"content": "f1", "role": "assistant"})
+        return canvas
+
+    def test_merge_base_of_branches(self, canvas: Canvas) -> None:
+        """Test that the merge base is the message the branches forked from."""
+        main_branch = canvas.checkout(name="main")
+        feature_branch = canvas.checkout(name="feature")
+
+        merge_base = main_branch.merge_base(feature_branch)
+
+        assert merge_base is not None
+        assert merge_base["message"]["content"] == "m1"
+
+    def test_merge_base_of_ancestor_is_ancestor(self, canvas: Canvas) -> None:
+        """Test that a message is the merge base of itself and its descendants."""
+        history = canvas.checkout(name="feature").history()
+
+        for node in history:
+            merge_base = canvas.merge_base(node["id"], history[-1]["id"])
+            assert merge_base is not None
+            assert merge_base["id"] == node["id"]
+
+    def test_merge_base_of_unrelated_messages(self, canvas: Canvas) -> None:
+        """Test that messages in different trees have no merge base."""
+        root = canvas.add_message({"content": "Unrelated", "role": "user"})
+        head_node = canvas.checkout(name="main").get_head_node()
+        assert head_node is not None
+
+        assert canvas.merge_base(root["id"], head_node["id"]) is None
+
+    def test_merge_base_of_unknown_message(self, canvas: Canvas) -> None:
+        """Test that unknown messages are rejected."""
+        head_node = canvas.checkout(name="main").get_head_node()
+        assert head_node is not None
+
+        with pytest.raises(ValueError, match="does not exist"):
+            canvas.merge_base(head_node["id"], "nonexistent")
+
+    def test_merge_base_matches_parent_walk(self) -> None:
+        """Test the index against walking parent links on a randomly branched canvas."""
+        rng = random.Random(7)  # noqa: S311
+        canvas = Canvas()
+        node_ids: list[str] = []
+        for i in range(300):
+            parent_id = rng.choice(node_ids) if node_ids and rng.random() < 0.3 else (node_ids[-1] if node_ids else None)
+            node_ids.append(canvas.add_message({"content": str(i), "role": "user"}, parent_id)["id"])
+
+        def ancestors(node_id: Union[str, None]) -> list[str]:
+            result = []
+            while node_id is not None:
+                result.append(node_id)
+                node_id = canvas.nodes[node_id]["parent_id"]
+            return result
+
+        for _ in range(200):
+            node_id_a, node_id_b = rng.choice(node_ids), rng.choice(node_ids)
+            ancestors_a = set(ancestors(node_id_a))
+            expected = next(node_id for node_id in ancestors(node_id_b) if node_id in ancestors_a)
+            merge_base = canvas.merge_base(node_id_a, node_id_b)
+            assert merge_base is not None
+            assert merge_base["id"] == expected
+
+    def test_compare_branches(self, canvas: Canvas) -> None:
+        """Test that comparisons count the messages after the merge base."""
+        comparison = canvas.compare_branches("feature", "main")
+
+        assert comparison["ahead"] == 2
+        assert comparison["behind"] == 1
+        assert comparison["merge_base_id"] == canvas.checkout(name="main").history()[1]["id"]
+
+    def test_compare_branch_without_commits(self) -> None:
+        """Test that an empty branch shares no history."""
+        canvas = Canvas()
+        canvas.checkout(name="empty", create_if_not_exists=True)
+        canvas.checkout(name="main").commit_message({"content": "Hello", "role": "user"})
+
+        assert canvas.compare_branches("main", "empty") == {"merge_base_id": None, "ahead": 1, "behind": 0}
+
+    def test_merge_rejects_branch_in_target_history(self, canvas: Canvas) -> None:
+        """Test that merging a branch whose HEAD the target already contains is rejected."""
+        canvas.checkout(name="behind", create_if_not_exists=True, commit_message=canvas.checkout(name="main").history()[0])
+
+        with pytest.raises(ValueError, match="already merged"):
+            canvas.merge("behind", {"content": "Merge", "role": "user"}, "main")
+
+    def test_merge_rejects_repeated_merge(self, canvas: Canvas) -> None:
+        """Test that merging the same source HEAD twice is rejected."""
+        canvas.merge("feature", {"content": "Merge", "role": "user"}, "main")
+        canvas.checkout(name="main").commit_message({"content": "After merge", "role": "assistant"})
+
+        with pytest.raises(ValueError, match="already merged"):
+            canvas.merge("feature", {"content": "Merge again", "role": "user"}, "main")
+
+        canvas.checkout(name="feature").commit_message({"content": "f2", "role": "user"})
+        merge_node = canvas.merge("feature", {"content": "Merge again", "role": "user"}, "main")
+        assert merge_node["parent_id"] is not None
+
+    def test_branches_containing(self, canvas: Canvas) -> None:
+        """Test that a message is contained in the branches whose history includes it."""
+        main_history = canvas.checkout(name="main").history()
+        feature_history = canvas.checkout(name="feature").history()
+        assert canvas.branches_containing(main_history[0]["id"]) == ["main", "feature"]
+        assert canvas.branches_containing(main_history[-1]["id"]) == ["main"]
+        assert canvas.branches_containing(feature_history[-1]["id"]) == ["feature"]
+        assert canvas.checkout(name="feature").contains(main_history[1]["id"])
+        assert not canvas.checkout(name="feature").contains(main_history[2]["id"])
+        heads = [feature_history[-1]["id"], "missing", main_history[-1]["id"]]
+        assert canvas.heads_containing(main_history[0]["id"], heads) == [heads[0], heads[2]]
+        assert canvas.heads_containing(main_history[-1]["id"], heads) == [heads[2]]
+
+        fresh = Canvas()
+        detached = fresh.add_message({"content": "Not on a branch", "role": "user"})
+        assert fresh.branches_containing(detached["id"]) == []
+        assert not fresh.checkout(name="main").contains(detached["id"])
+        with pytest.raises(ValueError, match="does not exist"):
+            canvas.branches_containing("missing")
+
+
+class TestBranchDiff:
+    """Test suite for diffs between branches."""
+
+    @pytest.fixture
+    def canvas(self) -> Canvas:
+        """Create a canvas where "investors" forks from "main" after the first message."""
+        canvas = Canvas(title="Diff Canvas")
+        main_branch = canvas.checkout(name="main")
+        main_branch.commit_message({"content": "Prompt", "role": "user"})
+        investors_branch = canvas.checkout(name="investors", create_if_not_exists=True)
+        main_branch.commit_message({"content": "Main answer", "role": "assistant"})
+        investors_branch.commit_message({"content": "Investor answer", "role": "assistant"})
+        investors_branch.commit_message({"content": "Investor follow-up", "role": "user"})
+        return canvas
+
+    def test_diff_returns_messages_after_fork(self, canvas: Canvas) -> None:
+        """Test that each side lists only its own messages since the fork point."""
+        diff = canvas.diff("investors", "main")
+
+        assert diff["merge_base_id"] == canvas.checkout(name="main").history()[0]["id"]
+        assert [node["message"]["content"] for node in diff["a_nodes"]] == ["Investor answer", "Investor follow-up"]
+        assert [node["message"]["content"] for node in diff["b_nodes"]] == ["Main answer"]
+
+    def test_diff_with_ancestor(self, canvas: Canvas) -> None:
+        """Test that a history containing the other one is the only side with messages."""
+        history = canvas.checkout(name="investors").history()
+
+        diff = canvas.diff_nodes(history[-1]["id"], history[0]["id"])
+
+        assert diff["merge_base_id"] == history[0]["id"]
+        assert diff["a_nodes"] == history[1:]
+        assert diff["b_nodes"] == []
+
+    def test_diff_of_unrelated_histories(self, canvas: Canvas) -> None:
+        """Test that unrelated histories are returned in full."""
+        root = canvas.add_message({"content": "Unrelated", "role": "user"})
+        main_history = canvas.checkout(name="main").history()
+
+        diff = canvas.diff_nodes(main_history[-1]["id"], root["id"])
+
+        assert diff == {"merge_base_id": None, "a_nodes": main_history, "b_nodes": [root]}
+
+    def test_diff_unknown_branch(self, canvas: Canvas) -> None:
+        """Test that unknown branches are rejected."""
+        with pytest.raises(ValueError, match="Branch 'nonexistent' does not exist"):
+            canvas.diff("main", "nonexistent")
+
+
+class TestGarbageCollection:
+    """Test suite for collecting messages that no branch leads to."""
+
+    @pytest.fixture
+    def content_store(self) -> ContentStore:
+        """Create a content store for the canvas."""
+        return ContentStore()
+
+    @pytest.fixture
+    def canvas(self, content_store: ContentStore) -> Canvas:
+        """Create a canvas where "experiment" forks from "main" after the first message."""
+        canvas = Canvas(title="GC Canvas", content_store=content_store)
+        main_branch = canvas.checkout(name="main")
+        main_branch.commit_message({"content": "Prompt", "role": "user"})
+        experiment_branch = canvas.checkout(name="experiment", create_if_not_exists=True)
+        main_branch.commit_message({"content": "Main answer", "role": "assistant"})
+        experiment_branch.commit_message({"content": "Experiment answer", "role": "assistant"})
+        experiment_branch.commit_message({"content": "Experiment follow-up", "role": "user"})
+        canvas.checkout(name="main")
+        return canvas
+
+    def test_collects_deleted_branch(self, canvas: Canvas, content_store: ContentStore) -> None:
+        """Test that only the messages unique to a deleted branch are removed."""
+        experiment_history = canvas.checkout(name="experiment").history()
+        canvas.checkout(name="main")
+        canvas.delete_branch("experiment")
+        events: list[CanvasEvent] = []
+        canvas.add_event_listener(events.append)
+
+        removed = canvas.collect_garbage()
+
+        assert removed == [experiment_history[2]["id"], experiment_history[1]["id"]]
+        assert [event["data"] for event in events if event["event_type"] == "delete_message"] == removed
+        assert len(canvas.nodes) == 2
+        assert canvas.nodes[experiment_history[0]["id"]]["child_ids"] == [canvas.checkout(name="main").history()[1]["id"]]
+        assert len(content_store) == 2
+
+    def test_nothing_to_collect(self, canvas: Canvas) -> None:
+        """Test that reachable messages are kept, including merged histories."""
+        canvas.merge("experiment", {"content": "Merge", "role": "user"}, "main")
+        canvas.delete_branch("experiment")
+
+        assert canvas.collect_garbage() == []
+        assert len(canvas.nodes) == 5
+
+    def test_pinned_messages_survive(self, canvas: Canvas) -> None:
+        """Test that pinning keeps a message and its history alive until unpinned."""
+        experiment_head = canvas.checkout(name="experiment").get_head_node()
+        assert experiment_head is not None
+        canvas.checkout(name="main")
+        canvas.pin(experiment_head["id"])
+        canvas.delete_branch("experiment")
+
+        assert canvas.collect_garbage() == []
+
+        canvas.unpin(experiment_head["id"])
+        assert len(canvas.collect_garbage()) == 2
+
+    def test_detached_checkout_survives_while_referenced(self, canvas: Canvas) -> None:
+        """Test that messages committed from a detached HEAD live as long as its branch."""
+        root = canvas.checkout(name="main").history()[0]
+        detached_branch = canvas.checkout(commit_message=root)
+        detached_msg = detached_branch.commit_message({"content": "Detached", "role": "assistant"})
+
+        assert canvas.collect_garbage() == []
+
+        del detached_branch
+        gc.collect()
+        assert canvas.collect_garbage() == [detached_msg["id"]]
+
+    def test_incremental_collection(self, canvas: Canvas) -> None:
+        """Test that a budgeted cycle keeps messages committed while it runs."""
+        canvas.delete_branch("experiment")
+        main_branch = canvas.checkout(name="main")
+
+        removed: list[str] = []
+        removed.extend(canvas.collect_garbage(budget=1))
+        assert canvas.garbage_collection_in_progress
+        new_msg = main_branch.commit_message({"content": "During collection", "role": "user"})
+        while canvas.garbage_collection_in_progress:
+            removed.extend(canvas.collect_garbage(budget=1))
+
+        assert len(removed) == 2
+        assert new_msg["id"] in canvas.nodes
+        assert [node["message"]["content"] for node in main_branch.history()] == [
+            "Prompt",
+            "Main answer",
+            "During collection",
+        ]
+
+    def test_branch_created_during_cycle_survives(self, canvas: Canvas) -> None:
+        """Test that a message that becomes a branch HEAD during a cycle is kept."""
+        experiment_head = canvas.checkout(name="experiment").get_head_node()
+        canvas.checkout(name="main")
+        canvas.delete_branch("experiment")
+
+        canvas.collect_garbage(budget=1)
+        canvas.checkout(name="revived", create_if_not_exists=True, commit_message=experiment_head)
+        canvas.checkout(name="main")
+        while canvas.garbage_collection_in_progress:
+            canvas.collect_garbage(budget=1)
+
+        assert len(canvas.nodes) == 4
+
+    def test_commits_after_collection(self, canvas: Canvas) -> None:
+        """Test that the canvas keeps working on the surviving messages."""
+        root = canvas.checkout(name="main").history()[0]
+        canvas.delete_branch("experiment")
+        canvas.collect_garbage()
+
+        retry_branch = canvas.checkout(name="retry", create_if_not_exists=True, commit_message=root)
+        retry_msg = retry_branch.commit_message({"content": "Retry", "role": "assistant"})
+
+        assert [node["id"] for node in retry_branch.history()] == [root["id"], retry_msg["id"]]
+        assert canvas.diff("retry", "main")["merge_base_id"] == root["id"]
+
+    def test_receiver_applies_delete_events(self, canvas: Canvas) -> None:
+        """Test that replaying delete_message events with remove_node mirrors the collection."""
+        receiver = Canvas.from_canvas_data(canvas.to_canvas_data())
+        canvas.delete_branch("experiment")
+        events: list[CanvasEvent] = []
+        canvas.add_event_listener(events.append)
+        canvas.collect_garbage()
+
+        for event in events:
+            assert event["event_type"] == "delete_message"
+            receiver.remove_node(event["data"])  # type: ignore[arg-type]
+
+        assert dict(receiver.nodes) == dict(canvas.nodes)
+
+    def test_remove_node_with_children(self, canvas: Canvas) -> None:
+        """Test that a node with children cannot be removed on its own."""
+        root = canvas.checkout(name="main").history()[0]
+
+        with pytest.raises(ValueError, match="still has children"):
+            canvas.remove_node(root["id"])
+
+    def test_loaded_canvas_is_pinned(self, canvas: Canvas) -> None:
+        """Test that a canvas loaded without branches does not lose its messages."""
+        loaded = Canvas.from_canvas_data(canvas.to_canvas_data())
+
+        assert loaded.collect_garbage() == []
+        assert len(loaded.nodes) == 4
+
+
+class TestCanvasFork:
+    """Test suite for copy-on-write canvas forks."""
+
+    @pytest.fixture(params=["dict", "compact"])
+    def canvas(self, request: pytest.FixtureRequest) -> Canvas:
+        """Create a canvas with a short conversation on main."""
+        node_store = CompactNodeStore() if request.param == "compact" else None
+        canvas = Canvas(title="Base", node_store=node_store, content_store=ContentStore())
+        main_branch = canvas.checkout(name="main")
+        main_branch.commit_message({"content": "Prompt", "role": "user"})
+        main_branch.commit_message({"content": "Answer", "role": "assistant"})
+        return canvas
+
+    def test_fork_copies_state(self, canvas: Canvas) -> None:
+        """Test that a fork starts with the same nodes and branches under a new ID."""
+        forked = canvas.fork(title="Variant")
+
+        assert forked.canvas_id != canvas.canvas_id
+        assert forked.title == "Variant"
+        assert dict(forked.nodes) == dict(canvas.nodes)
+        assert forked.checkout(name="main").history() == canvas.checkout(name="main").history()
+
+    def test_fork_and_parent_diverge(self, canvas: Canvas) -> None:
+        """Test that commits after forking are only visible in the canvas they were made in."""
+        forked = canvas.fork()
+        head_id = canvas.checkout(name="main").head_node_id
+        assert head_id is not None
+
+        parent_msg = canvas.checkout(name="main").commit_message({"content": "Parent", "role": "user"})
+        fork_msg = forked.checkout(name="main").commit_message({"content": "Fork", "role": "user"})
+
+        assert fork_msg["id"] not in canvas.nodes
+        assert parent_msg["id"] not in forked.nodes
+        assert canvas.nodes[head_id]["child_ids"] == [parent_msg["id"]]
+        assert forked.nodes[head_id]["child_ids"] == [fork_msg["id"]]
+        assert [node["message"]["content"] for node in forked.checkout(name="main").history()] == [
+            "Prompt",
+            "Answer",
+            "Fork",
+        ]
+
+    def test_update_in_fork(self, canvas: Canvas) -> None:
+        """Test that updating a shared node in a fork leaves the parent unchanged."""
+        forked = canvas.fork()
+        head = forked.checkout(name="main").get_head_node()
+        assert head is not None
+
+        forked.update_message(head["id"], {**head, "message": {"content": "Changed", "role": "assistant"}})
+
+        assert canvas.nodes[head["id"]]["message"]["content"] == "Answer"
+        assert forked.nodes[head["id"]]["message"]["content"] == "Changed"
+
+    def test_repeated_forks(self, canvas: Canvas) -> None:
+        """Test that chains of forks stay independent as their layers are compacted."""
+        current = canvas
+        contents = ["Prompt", "Answer"]
+        for i in range(20):
+            current = current.fork()
+            current.checkout(name="main").commit_message({"content": f"Turn {i}", "role": "user"})
+            contents.append(f"Turn {i}")
+
+        assert [node["message"]["content"] for node in current.checkout(name="main").history()] == contents
+        assert len(current.nodes) == len(contents)
+        assert len(canvas.nodes) == 2
+
+    def test_garbage_collection_in_fork(self, canvas: Canvas) -> None:
+        """Test that collecting messages in a fork keeps them in the parent."""
+        experiment_branch = canvas.checkout(name="experiment", create_if_not_exists=True)
+        experiment_msg = experiment_branch.commit_message({"content": "Experiment", "role": "user"})
+        canvas.checkout(name="main")
+        forked = canvas.fork()
+
+        forked.delete_branch("experiment")
+        assert forked.collect_garbage() == [experiment_msg["id"]]
+
+        assert experiment_msg["id"] in canvas.nodes
+        assert canvas.checkout(name="experiment").get_head_node() == experiment_msg
+
+    def test_shared_content_released_by_last_fork(self) -> None:
+        """Test that content shared with a fork lives until both canvases release it."""
+        content_store = ContentStore()
+        canvas = Canvas(content_store=content_store)
+        canvas.checkout(name="main").commit_message({"content": "Shared", "role": "user"})
+        forked = canvas.fork()
+        forked.checkout(name="main").commit_message({"content": "Fork only", "role": "user"})
+
+        canvas.release_content()
+        assert content_store.ref_count(content_digest("Shared")) == 1
+
+        forked.release_content()
+        assert len(content_store) == 0
+
+
+class TestCanvasSummary:
+    """Test suite for incrementally maintained canvas summaries."""
+
+    @staticmethod
+    def scanned_root_ids(canvas: Canvas) -> list[str]:
+        """Find the root IDs by scanning every node."""
+        return [node_id for node_id, node in canvas.nodes.items() if node["parent_id"] is None]
+
+    @staticmethod
+    def scanned_leaf_ids(canvas: Canvas) -> set[str]:
+        """Find the IDs of the nodes without children by scanning every node."""
+        return {node_id for node_id, node in canvas.nodes.items() if not node["child_ids"]}
+
+    def test_summary_tracks_roots_and_count(self) -> None:
+        """Test that root IDs and the node count follow commits and removals."""
+        canvas = Canvas()
+        first_root = canvas.add_message({"content": "First", "role": "user"})
+        reply = canvas.add_message({"content": "Reply", "role": "assistant"}, parent_node_id=first_root["id"])
+        second_root = canvas.add_message({"content": "Second", "role": "user"})
+
+        summary = canvas.to_summary()
+        assert summary["root_ids"] == [first_root["id"], second_root["id"]]
+        assert summary["node_count"] == 3
+
+        canvas.remove_node(reply["id"])
+        canvas.remove_node(first_root["id"])
+        summary = canvas.to_summary()
+        assert summary["root_ids"] == [second_root["id"]]
+        assert summary["node_count"] == 1
+
+    def test_last_updated_follows_activity(self) -> None:
+        """Test that the summary reports the time of the last change instead of the current time."""
+        canvas = Canvas()
+        assert canvas.to_summary()["meta"]["last_updated"] == canvas.created_at
+
+        node = canvas.add_message({"content": "Hello", "role": "user"})
+        committed_at = canvas.to_summary()["meta"]["last_updated"]
+        assert committed_at >= canvas.created_at
+        assert canvas.to_summary()["meta"]["last_updated"] == committed_at
+
+        canvas.update_message(node["id"], {**node, "message": {"content": "Hi", "role": "user"}})
+        assert canvas.to_summary()["meta"]["last_updated"] >= committed_at
+        assert canvas.to_canvas_data()["last_updated"] == canvas.to_summary()["meta"]["last_updated"]
+
+    def test_summary_matches_scan(self) -> None:
+        """Test that the maintained roots match a full scan after random operations."""
+        rng = random.Random(11)  # noqa: S311
+        canvas = Canvas()
+        for _ in range(200):
+            node_ids = list(canvas.nodes)
+            if node_ids and rng.random() < 0.2:
+                leaf_ids = [node_id for node_id in node_ids if not canvas.nodes[node_id]["child_ids"]]
+                canvas.remove_node(rng.choice(leaf_ids))
+            else:
+                parent_id = rng.choice(node_ids) if node_ids and rng.random() < 0.8 else None
+                canvas.add_message({"content": "x", "role": "user"}, parent_node_id=parent_id)
+
+        assert canvas.to_summary()["root_ids"] == self.scanned_root_ids(canvas)
+        assert set(canvas.to_summary()["head_token_counts"]) == self.scanned_leaf_ids(canvas)
+        assert canvas.to_summary()["node_count"] == len(canvas.nodes)
+
+    def test_summary_of_inserted_loaded_and_forked_canvases(self) -> None:
+        """Test that inserting nodes, loading canvas data and forking keep the roots."""
+        source = Canvas()
+        root = source.add_message({"content": "Root", "role": "user"})
+        source.add_message({"content": "Child", "role": "assistant"}, parent_node_id=root["id"])
+
+        replica = Canvas(canvas_id=source.canvas_id)
+        for node in reversed(list(source.nodes.values())):
+            replica.insert_node(node)
+        loaded = Canvas.from_canvas_data(source.to_canvas_data())
+        forked = source.fork()
+        forked.add_message({"content": "Fork root", "role": "user"})
+
+        assert replica.to_summary()["root_ids"] == [root["id"]]
+        assert loaded.to_summary()["root_ids"] == [root["id"]]
+        assert loaded.to_summary()["meta"]["last_updated"] == source.last_updated
+        assert source.to_summary()["root_ids"] == [root["id"]]
+        assert forked.to_summary()["root_ids"] == self.scanned_root_ids(forked)
+        assert len(forked.to_summary()["root_ids"]) == 2
+        for canvas in (replica, loaded, source, forked):
+            assert set(canvas.to_summary()["head_token_counts"]) == self.scanned_leaf_ids(canvas)
+
+
+class TestCanvasSnapshot:
+    """Test suite for read-only canvas snapshots."""
+
+    @pytest.fixture(params=["dict", "compact"])
+    def canvas(self, request: pytest.FixtureRequest) -> Canvas:
+        """Create a canvas with a short conversation on main."""
+        node_store = CompactNodeStore() if request.param == "compact" else None
+        canvas = Canvas(title="Snapshots", node_store=node_store)
+        main_branch = canvas.checkout(name="main")
+        main_branch.commit_message({"content": "Prompt", "role": "user"})
+        main_branch.commit_message({"content": "Answer", "role": "assistant"})
+        return canvas
+
+    def test_snapshot_is_unaffected_by_later_changes(self, canvas: Canvas) -> None:
+        """Test that commits, updates and removals after a snapshot do not show in it."""
+        main_branch = canvas.checkout(name="main")
+        head = main_branch.get_head_node()
+        assert head is not None
+        snapshot = canvas.snapshot()
+        expected = {node_id: {**node, "child_ids": list(node["child_ids"])} for node_id, node in canvas.nodes.items()}
+
+        reply = main_branch.commit_message({"content": "Follow-up", "role": "user"})
+        canvas.update_message(head["id"], {**head, "message": {"content": "Changed", "role": "assistant"}})
+        canvas.remove_node(reply["id"])
+        canvas.add_message({"content": "New root", "role": "user"})
+
+        assert dict(snapshot.nodes) == expected
+        assert snapshot.get_node(reply["id"]) is None
+        assert snapshot.version < canvas.version
+        assert len(canvas.snapshot().nodes) == len(canvas.nodes)
+
+    def test_reads_after_snapshot_do_not_copy_nodes(self) -> None:
+        """Test that nodes frozen by a snapshot are read as they are, and changed by writing back copies."""
+        canvas = Canvas()
+        main_branch = canvas.checkout(name="main")
+        root = main_branch.commit_message({"content": "Prompt", "role": "user"})
+        snapshot = canvas.snapshot()
+        assert canvas.get_node(root["id"]) is snapshot.get_node(root["id"])
+
+        reply = main_branch.commit_message({"content": "Answer", "role": "assistant"})
+        stored_root = canvas.get_node(root["id"])
+        assert stored_root is not None
+        assert stored_root["child_ids"] == [reply["id"]]
+        assert snapshot.nodes[root["id"]]["child_ids"] == []
+
+    def test_version_counts_changes(self, canvas: Canvas) -> None:
+        """Test that the version advances with each change and snapshots report it."""
+        version = canvas.version
+        assert canvas.snapshot().version == version
+
+        node = canvas.add_message({"content": "Hello", "role": "user"})
+        canvas.update_message(node["id"], {**node, "message": {"content": "Hi", "role": "user"}})
+        assert canvas.version == version + 2
+        assert canvas.snapshot().version == version + 2
+
+    def test_canvas_data_from_snapshot(self, canvas: Canvas) -> None:
+        """Test that CanvasData is read from a snapshot and to_canvas_data still returns a copy."""
+        snapshot_data = canvas.snapshot().to_canvas_data()
+        data = canvas.to_canvas_data()
+
+        assert dict(snapshot_data["nodes"]) == data["nodes"]
+        assert snapshot_data["last_updated"] == data["last_updated"] == canvas.last_updated
+        data["nodes"].clear()
+        assert len(canvas.nodes) == 2
+
+    def test_many_snapshots(self, canvas: Canvas) -> None:
+        """Test that interleaving commits and snapshots keeps every snapshot exact."""
+        main_branch = canvas.checkout(name="main")
+        snapshots = []
+        for i in range(100):
+            main_branch.commit_message({"content": f"Message {i}", "role": "user"})
+            snapshots.append((canvas.snapshot(), len(canvas.nodes)))
+
+        for snapshot, node_count in snapshots:
+            assert len(snapshot.nodes) == len(list(snapshot.nodes)) == node_count
+        head_id = main_branch.head_node_id
+        assert head_id is not None
+        assert [node["id"] for node in canvas.get_path(head_id)] == list(canvas.nodes)
+
+    def test_snapshot_while_committing(self, canvas: Canvas) -> None:
+        """Test that snapshots taken while another thread commits are consistent."""
+        main_branch = canvas.checkout(name="main")
+        stop = threading.Event()
+
+        def commit() -> None:
+            while not stop.is_set():
+                main_branch.commit_message({"content": "More", "role": "assistant"})
+
+        worker = threading.Thread(target=commit)
+        worker.start()
+        try:
+            for _ in range(50):
+                snapshot = canvas.snapshot()
+                nodes = snapshot.nodes
+                leaf_ids = [node_id for node_id, node in nodes.items() if not node["child_ids"]]
+                assert len(leaf_ids) == 1
+                assert all(child_id in nodes for node in nodes.values() for child_id in node["child_ids"])
+        finally:
+            stop.set()
+            worker.join()
+
+
+class TestChangelog:
+    """Test suite for change versions and changes_since."""
+
+    @staticmethod
+    def apply_change(replica: Canvas, event: CanvasEvent) -> None:
+        """Apply a changelog event to a replica the way the server applies client events."""
+        if event["event_type"] == "commit_message":
+            replica.insert_node(event["data"])
+        elif event["event_type"] == "commit_messages":
+            replica.insert_nodes(event["data"])
+        elif event["event_type"] == "update_message":
+            replica.update_message(event["data"]["id"], event["data"])
+        elif event["event_type"] == "message_delta":
+            replica.apply_message_delta(event["data"])
+        else:
+            replica.remove_node(event["data"])
+
+    def test_each_change_advances_the_version(self) -> None:
+        """Test that commits, batches, updates and removals each add one change."""
+        canvas = Canvas()
+        assert canvas.version == 0
+        assert canvas.changes_since(0) == []
+
+        node = canvas.add_message({"content": "Hello", "role": "user"})
+        batch = canvas.add_messages([{"content": "A", "role": "assistant"}, {"content": "B", "role": "user"}], node["id"])
+        canvas.update_message(node["id"], {**node, "message": {"content": "Hi", "role": "user"}})
+        canvas.remove_node(batch[-1]["id"])
+
+        changes = canvas.changes_since(0)
+        assert changes is not None
+        assert [change["version"] for change in changes] == [1, 2, 3, 4]
+        assert [change["event"]["event_type"] for change in changes] == [
+            "commit_message",
+            "commit_messages",
+            "update_message",
+            "delete_message",
+        ]
+        assert canvas.version == 4
+        assert canvas.changes_since(2) == changes[2:]
+        assert canvas.changes_since(4) == []
+
+    def test_replica_catches_up(self) -> None:
+        """Test that replaying changes_since on a snapshot reproduces the canvas."""
+        canvas = Canvas()
+        main_branch = canvas.checkout(name="main")
+        main_branch.commit_message({"content": "Prompt", "role": "user"})
+        snapshot = canvas.snapshot()
+        replica = Canvas.from_canvas_data(canvas.to_canvas_data())
+
+        head = main_branch.commit_message({"content": "Answer", "role": "assistant"})
+        main_branch.commit_messages([{"content": "More", "role": "user"}, {"content": "Done", "role": "assistant"}])
+        canvas.update_message(head["id"], {**head, "message": {"content": "Better answer", "role": "assistant"}})
+        detached = canvas.add_message({"content": "Abandoned", "role": "user"})
+        canvas.remove_node(detached["id"])
+
+        changes = canvas.changes_since(snapshot.version)
+        assert changes is not None
+        for change in changes:
+            self.apply_change(replica, change["event"])
+        assert dict(replica.nodes) == dict(canvas.nodes)
+
+    def test_changes_beyond_the_window(self) -> None:
+        """Test that changes_since returns None once the requested changes are dropped."""
+        canvas = Canvas()
+        for i in range(1100):
+            canvas.add_message({"content": f"Message {i}", "role": "user"})
+
+        assert canvas.changes_since(0) is None
+        assert canvas.changes_since(canvas.version + 1) is None
+        recent = canvas.changes_since(canvas.version - 10)
+        assert recent is not None
+        assert len(recent) == 10
+        oldest_kept = canvas.version - 1000
+        assert canvas.changes_since(oldest_kept) is not None
+        assert canvas.changes_since(oldest_kept - 1) is None
+
+    def test_fork_starts_a_new_changelog(self) -> None:
+        """Test that a fork keeps the version but not the changes made before it."""
+        canvas = Canvas()
+        canvas.add_message({"content": "Hello", "role": "user"})
+        forked = canvas.fork()
+
+        assert forked.version == canvas.version == 1
+        assert forked.changes_since(0) is None
+        assert forked.changes_since(1) == []
+        forked.add_message({"content": "Fork", "role": "user"})
+        changes = forked.changes_since(1)
+        assert changes is not None
+        assert [change["version"] for change in changes] == [2]
+
+
+class TestEventQueue:
+    """Test suite for background event delivery."""
+
+    def test_commits_do_not_wait_for_listener(self) -> None:
+        """Test that a slow listener runs in the background and receives events in order."""
+        received: list[CanvasEvent] = []
+
+        def slow_listener(event: CanvasEvent) -> None:
+            time.sleep(0.02)
+            received.append(event)
+
+        events = EventQueue(slow_listener)
+        canvas = Canvas()
+        canvas.add_event_listener(events)
+        main_branch = canvas.checkout(name="main")
+
+        start = time.monotonic()
+        nodes = [main_branch.commit_message({"content": f"Message {i}", "role": "user"}) for i in range(10)]
+        assert time.monotonic() - start < 0.1
+
+        assert events.flush(timeout=5)
+        assert [event["data"]["id"] for event in received] == [node["id"] for node in nodes]  # type: ignore[index]
+        events.close()
+
+    def test_order_per_canvas_with_several_workers(self) -> None:
+        """Test that each canvas's events keep their order when workers run in parallel."""
+        received: dict[str, list[str]] = {}
+        lock = threading.Lock()
+
+        def listener(event: CanvasEvent) -> None:
+            with lock:
+                received.setdefault(event["canvas_id"], []).append(event["data"]["id"])  # type: ignore[index]
+
+        events = EventQueue(listener, workers=4)
+        canvases = [Canvas() for _ in range(8)]
+        expected: dict[str, list[str]] = {}
+        for canvas in canvases:
+            canvas.add_event_listener(events)
+        for i in range(20):
+            for canvas in canvases:
+                node = canvas.add_message({"content": f"Message {i}", "role": "user"})
+                expected.setdefault(canvas.canvas_id, []).append(node["id"])
+
+        assert events.close(timeout=5)
+        assert received == expected
+
+    @pytest.mark.parametrize("overflow", ["drop_newest", "drop_oldest"])
+    def test_overflow_policies(self, overflow: str) -> None:
+        """Test that a full queue drops the newest or the oldest waiting events."""
+        started = threading.Event()
+        release = threading.Event()
+        received: list[str] = []
+
+        def blocked_listener(event: CanvasEvent) -> None:
+            started.set()
+            release.wait(5)
+            received.append(event["data"]["message"]["content"])  # type: ignore[index]
+
+        events = EventQueue(blocked_listener, maxsize=2, overflow=overflow)  # type: ignore[arg-type]
+        canvas = Canvas()
+        canvas.add_event_listener(events)
+        canvas.add_message({"content": "0", "role": "user"})
+        # Once the worker holds the first event, the queue has room for two more
+        assert started.wait(5)
+        for i in range(1, 5):
+            canvas.add_message({"content": str(i), "role": "user"})
+        release.set()
+
+        assert events.close(timeout=5)
+        assert events.dropped_count == 2
+        assert received == (["0", "1", "2"] if overflow == "drop_newest" else ["0", "3", "4"])
+
+    def test_listener_errors_and_close(self) -> None:
+        """Test that a failing event does not stop delivery and events after close are delivered directly."""
+        received: list[str] = []
+
+        def listener(event: CanvasEvent) -> None:
+            content = event["data"]["message"]["content"]  # type: ignore[index]
+            if content == "bad":
+                raise RuntimeError(content)
+            received.append(content)
+
+        events = EventQueue(listener)
+        canvas = Canvas()
+        canvas.add_event_listener(events)
+        for content in ("first", "bad", "second"):
+            canvas.add_message({"content": content, "role": "user"})
+        assert events.close(timeout=5)
+        assert events.closed
+
+        canvas.add_message({"content": "after close", "role": "user"})
+        assert received == ["first", "second", "after close"]
+
+    def test_close_timeout_keeps_order(self) -> None:
+        """Test that events emitted after a close that timed out wait for the events queued before them."""
+        started = threading.Event()
+        release = threading.Event()
+        received: list[str] = []
+
+        def blocked_listener(event: CanvasEvent) -> None:
+            started.set()
+            release.wait(5)
+            received.append(event["data"]["message"]["content"])  # type: ignore[index]
+
+        events = EventQueue(blocked_listener)
+        canvas = Canvas()
+        canvas.add_event_listener(events)
+        for content in ("0", "1", "2"):
+            canvas.add_message({"content": content, "role": "user"})
+        assert started.wait(5)
+        assert not events.close(timeout=0.01)
+
+        canvas.add_message({"content": "3", "role": "user"})
+        assert received == []
+        release.set()
+        assert events.flush(timeout=5)
+        canvas.add_message({"content": "4", "role": "user"})
+        assert events.flush(timeout=5)
+        assert received == ["0", "1", "2", "3", "4"]
+
+    def test_invalid_arguments(self) -> None:
+        """Test that the queue size and worker count must be positive."""
+        with pytest.raises(ValueError, match="must be positive"):
+            EventQueue(lambda _event: None, maxsize=0)
+
+
+class TestStreamMessage:
+    """Test suite for streaming messages into a branch."""
+
+    @staticmethod
+    def record_events(canvas: Canvas) -> list[CanvasEvent]:
+        """Collect the events emitted by a canvas."""
+        events: list[CanvasEvent] = []
+        canvas.add_event_listener(events.append)
+        return events
+
+    def test_updates_are_coalesced(self) -> None:
+        """Test that many chunks produce one commit and a single final delta."""
+        canvas = Canvas()
+        events = self.record_events(canvas)
+        main_branch = canvas.checkout(name="main")
+
+        with main_branch.stream_message(min_interval=60) as stream:
+            for i in range(1000):
+                stream.append(f"{i} ")
+
+        expected = "".join(f"{i} " for i in range(1000))
+        assert [event["event_type"] for event in events] == ["commit_message", "message_delta"]
+        assert events[-1]["data"] == {"id": stream.node_id, "text": expected}
+        assert stream.update_count == 1
+        assert main_branch.head_node_id == stream.node_id
+        assert canvas.nodes[stream.node_id]["message"] == {"content": expected, "role": "assistant"}
+
+    def test_updates_by_buffered_characters(self) -> None:
+        """Test that min_chars triggers an update once enough text is buffered."""
+        canvas = Canvas()
+        events = self.record_events(canvas)
+        main_branch = canvas.checkout(name="main")
+
+        with main_branch.stream_message(min_interval=60, min_chars=10) as stream:
+            for _ in range(25):
+                stream.append("ab")
+                assert len(stream.content) - len(canvas.nodes[stream.node_id]["message"]["content"]) < 10
+
+        delta_events = [event for event in events if event["event_type"] == "message_delta"]
+        assert [event["data"]["text"] for event in delta_events] == ["ababababab"] * 5  # type: ignore[typeddict-item]
+        assert canvas.nodes[stream.node_id]["message"]["content"] == "ab" * 25
+
+    def test_partial_text_is_kept_on_error(self) -> None:
+        """Test that the text received before an error is written to the message."""
+        canvas = Canvas()
+        main_branch = canvas.checkout(name="main")
+        main_branch.commit_message({"content": "Question", "role": "user"})
+
+        def stream_until_error() -> None:
+            with main_branch.stream_message(min_interval=60) as stream:
+                stream.append("Partial ")
+                stream.append("answer")
+                raise RuntimeError("connection lost")
+
+        with pytest.raises(RuntimeError, match="connection lost"):
+            stream_until_error()
+
+        history = main_branch.history()
+        assert [node["message"]["content"] for node in history] == ["Question", "Partial answer"]
+
+
+class TestMessageDelta:
+    """Test suite for incremental message deltas."""
+
+    def test_append_text_and_set_meta(self) -> None:
+        """Test that a delta appends to string content and merges meta keys."""
+        canvas = Canvas()
+        events: list[CanvasEvent] = []
+        canvas.add_event_listener(events.append)
+        node = canvas.add_message({"content": "Hello", "role": "assistant"}, meta={"model": "a"})
+
+        updated = canvas.apply_message_delta({"id": node["id"], "text": ", world", "meta": {"stop_reason": "end_turn"}})
+
+        assert updated["message"] == {"content": "Hello, world", "role": "assistant"}
+        assert updated["meta"] is not None
+        assert updated["meta"]["model"] == "a"
+        assert updated["meta"]["stop_reason"] == "end_turn"
+        assert canvas.nodes[node["id"]] == updated
+        assert events[-1] == {
+            "event_type": "message_delta",
+            "canvas_id": canvas.canvas_id,
+            "timestamp": events[-1]["timestamp"],
+            "data": {"id": node["id"], "text": ", world", "meta": {"stop_reason": "end_turn"}},
+        }
+
+    def test_append_to_blocks(self) -> None:
+        """Test that a delta appends to a text block or adds a new one."""
+        canvas = Canvas()
+        node = canvas.add_message(
+            {
+                "content": [
+                    {"type": "text", "text": "Let me check"},
+                    {"type": "tool_use", "id": "tool_1", "name": "search", "input": {}},
+                ],
+                "role": "assistant",
+            }
+        )
+
+        canvas.apply_message_delta({"id": node["id"], "text": " the weather.", "block_index": 0})
+        updated = canvas.apply_message_delta({"id": node["id"], "text": "Sunny.", "block_index": 2})
+
+        content = updated["message"]["content"]
+        assert isinstance(content, list)
+        assert content[0] == {"type": "text", "text": "Let me check the weather."}
+        assert content[1]["type"] == "tool_use"
+        assert content[2] == {"type": "text", "text": "Sunny."}
+
+    def test_invalid_deltas(self) -> None:
+        """Test that deltas that do not fit the content are rejected without changes."""
+        canvas = Canvas()
+        text_node = canvas.add_message({"content": "Hello", "role": "user"})
+        block_node = canvas.add_message(
+            {"content": [{"type": "tool_use", "id": "tool_1", "name": "search", "input": {}}], "role": "assistant"}
+        )
+        version = canvas.version
+
+        with pytest.raises(ValueError, match="does not exist"):
+            canvas.apply_message_delta({"id": "missing", "text": "x"})
+        with pytest.raises(ValueError, match="only be used with a list"):
+            canvas.apply_message_delta({"id": text_node["id"], "text": "x", "block_index": 0})
+        with pytest.raises(ValueError, match="block_index is required"):
+            canvas.apply_message_delta({"id": block_node["id"], "text": "x"})
+        with pytest.raises(ValueError, match="not a text block"):
+            canvas.apply_message_delta({"id": block_node["id"], "text": "x", "block_index": 0})
+        assert canvas.version == version
+
+    def test_deltas_in_changelog(self) -> None:
+        """Test that a replica catches up on a streamed message from its deltas."""
+        canvas = Canvas()
+        replica = Canvas.from_canvas_data(canvas.to_canvas_data())
+        with canvas.checkout(name="main").stream_message(min_interval=0) as stream:
+            for word in ("Deltas ", "carry ", "only ", "new ", "text"):
+                stream.append(word)
+
+        changes = canvas.changes_since(0)
+        assert changes is not None
+        for change in changes:
+            TestChangelog.apply_change(replica, change["event"])
+        assert replica.nodes[stream.node_id]["message"]["content"] == "Deltas carry only new text"
+
+
+class TestTokenCounts:
+    """Test cached message token counts and branch totals."""
+
+    @staticmethod
+    def counting_words(calls: list[str]) -> Callable[[Message], int]:
+        """Create a token counter that counts words and records the messages it counted."""
+
+        def count(message: Message) -> int:
+            assert isinstance(message["content"], str)
+            calls.append(message["content"])
+            return len(message["content"].split())
+
+        return count
+
+    def test_approximate_token_count(self) -> None:
+        """Test the default approximation for text and content blocks."""
+        assert approximate_token_count({"content": "", "role": "user"}) == 0
+        assert approximate_token_count({"content": "abcd", "role": "user"}) == 1
+        assert approximate_token_count({"content": "abcde", "role": "user"}) == 2
+        blocks: Message = {
+            "content": [
+                {"type": "text", "text": "abcdefgh"},
+                {"type": "tool_use", "id": "tool_1", "name": "find", "input": {}},
+                {"type": "tool_result", "tool_use_id": "tool_1", "content": "abcd"},
+            ],
+            "role": "assistant",
+        }
+        assert approximate_token_count(blocks) == 2 + 1 + 1 + 1
+
+    def test_messages_are_counted_once(self) -> None:
+        """Test that branch totals come from cached counts instead of counting the history again."""
+        calls: list[str] = []
+        canvas = Canvas()
+        canvas.token_counter = self.counting_words(calls)
+        main = canvas.checkout(name="main")
+        assert main.token_count() == 0
+        assert "branch_token_counts" not in canvas.to_summary()
+
+        main.commit_message({"content": "one two", "role": "user"})
+        main.commit_messages([{"content": "three", "role": "assistant"}, {"content": "four five six", "role": "user"}])
+        side = main.checkout(name="side", create_if_not_exists=True)
+        side.commit_message({"content": "seven", "role": "assistant"})
+
+        assert main.token_count() == 6
+        assert side.token_count() == 7
+        assert main.token_count() == 6
+        assert len(calls) == 4
+        assert canvas.to_summary()["branch_token_counts"] == {"main": 6, "side": 7}
+        # The HEAD of main has a child on side, so only the HEAD of side is a conversation leaf
+        assert canvas.to_summary()["head_token_counts"] == {side.head_node_id: 7}
+
+    def test_updates_refresh_totals(self) -> None:
+        """Test that updates and deltas change the totals of the paths through the message."""
+        calls: list[str] = []
+        canvas = Canvas()
+        canvas.token_counter = self.counting_words(calls)
+        main = canvas.checkout(name="main")
+        first = main.commit_message({"content": "one", "role": "user"})
+        second = main.commit_message({"content": "two", "role": "assistant"})
+        assert main.token_count() == 2
+
+        canvas.update_message(first["id"], {**first, "message": {"content": "one one one", "role": "user"}})
+        assert canvas.token_count(first["id"]) == 3
+        assert main.token_count() == 4
+
+        canvas.apply_message_delta({"id": second["id"], "text": " more"})
+        canvas.apply_message_delta({"id": second["id"], "text": " words"})
+        assert main.token_count() == 6
+        assert calls.count("two more words") == 1
+
+    def test_nodes_inserted_out_of_order(self) -> None:
+        """Test that a path total is completed once a missing parent is inserted."""
+        source = Canvas()
+        root = source.add_message({"content": "one two", "role": "user"})
+        child = source.add_message({"content": "three", "role": "assistant"}, parent_node_id=root["id"])
+
+        replica = Canvas()
+        replica.insert_node(source.nodes[child["id"]])
+        assert replica.path_token_count(child["id"]) == replica.token_count(child["id"])
+        replica.insert_node(source.nodes[root["id"]])
+        assert replica.path_token_count(child["id"]) == source.path_token_count(child["id"])
+
+    def test_fork_keeps_counts(self) -> None:
+        """Test that forks share cached counts and update them independently."""
+        calls: list[str] = []
+        canvas = Canvas()
+        canvas.token_counter = self.counting_words(calls)
+        head = canvas.checkout(name="main").commit_message({"content": "one two", "role": "user"})
+        assert canvas.path_token_count(head["id"]) == 2
+
+        forked = canvas.fork()
+        forked.update_message(head["id"], {**head, "message": {"content": "one", "role": "user"}})
+        assert forked.checkout(name="main").token_count() == 1
+        assert canvas.checkout(name="main").token_count() == 2
+        assert calls == ["one two", "one"]
+
+    def test_missing_node(self) -> None:
+        """Test that counting a missing node raises."""
+        canvas = Canvas()
+        with pytest.raises(ValueError, match="does not exist"):
+            canvas.token_count("missing")
+        with pytest.raises(ValueError, match="does not exist"):
+            canvas.path_token_count("missing")
+
+
+class TestAnthropicMessages:
+    """Test converting branch histories to Anthropic Messages API parameters."""
+
+    @staticmethod
+    def build_branch(canvas: Canvas) -> list[MessageNode]:
+        """Commit a system prompt and three turns, counting four tokens per message."""
+        canvas.token_counter = lambda _message: 4
+        main = canvas.checkout(name="main")
+        nodes = [main.commit_message({"content": "Be terse.", "role": "system"})]
+        for turn in range(3):
+            nodes.append(main.commit_message({"content": f"question {turn}", "role": "user"}))
+            nodes.append(main.commit_message({"content": f"answer {turn}", "role": "assistant"}))
+        return nodes
+
+    def test_whole_history(self) -> None:
+        """Test that system messages go to the system prompt and the rest to messages."""
+        canvas = Canvas()
+        nodes = self.build_branch(canvas)
+
+        prompt = canvas.checkout(name="main").to_anthropic_messages()
+        assert prompt["system"] == "Be terse."
+        assert prompt["messages"] == [
+            {"role": node["message"]["role"], "content": node["message"]["content"]} for node in nodes[1:]
+        ]
+        assert prompt["token_count"] == canvas.path_token_count(nodes[-1]["id"])
+        assert prompt["dropped_node_ids"] == []
+        assert Canvas().checkout(name="main").to_anthropic_messages()["messages"] == []
+
+    def test_drop_oldest(self) -> None:
+        """Test that the oldest messages are dropped, system prompt included."""
+        canvas = Canvas()
+        nodes = self.build_branch(canvas)
+
+        prompt = canvas.checkout(name="main").to_anthropic_messages(max_tokens=17)
+        assert prompt["system"] is None
+        assert [message["content"] for message in prompt["messages"]] == [
+            "question 1",
+            "answer 1",
+            "question 2",
+            "answer 2",
+        ]
+        assert prompt["token_count"] == 16
+        assert prompt["dropped_node_ids"] == [node["id"] for node in nodes[:3]]
+        assert prompt["dropped_token_count"] == 12
+
+    def test_keep_system(self) -> None:
+        """Test that system messages are kept and the history opens with a user turn."""
+        canvas = Canvas()
+        nodes = self.build_branch(canvas)
+
+        prompt = canvas.checkout(name="main").to_anthropic_messages(max_tokens=16, strategy="keep_system")
+        assert prompt["system"] == "Be terse."
+        # The answer of turn 1 fits too, but its question does not
+        assert [message["content"] for message in prompt["messages"]] == ["question 2", "answer 2"]
+        assert prompt["dropped_node_ids"] == [node["id"] for node in nodes[1:5]]
+
+    def test_updates_show_in_next_prompt(self) -> None:
+        """Test that a prompt built after a message changes has the new content."""
+        canvas = Canvas()
+        nodes = self.build_branch(canvas)
+        main = canvas.checkout(name="main")
+        first = main.to_anthropic_messages()["messages"]
+
+        canvas.apply_message_delta({"id": nodes[-1]["id"], "text": "!"})
+        second = main.to_anthropic_messages()["messages"]
+        assert first[:-1] == second[:-1]
+        assert first[-1]["content"] == "answer 2"
+        assert second[-1]["content"] == "answer 2!"
+
+
+class TestOpenAIFormat:
+    """Test converting messages to and from the OpenAI Chat Completions format."""
+
+    def test_tool_calls_round_trip(self) -> None:
+        """Test that tool calls and results survive a round trip through both formats."""
+        history: list[Message] = [
+            {"content": "Be terse.", "role": "system"},
+            {"content": "Weather in Paris and Rome?", "role": "user"},
+            {
+                "content": [
+                    {"type": "text", "text": "Checking."},
+                    {"type": "tool_use", "id": "call_1", "name": "weather", "input": {"city": "Paris"}},
+                    {"type": "tool_use", "id": "call_2", "name": "weather", "input": {"city": "Rome"}},
+                ],
+                "role": "assistant",
+            },
+            {
+                "content": [
+                    {"type": "tool_result", "tool_use_id": "call_1", "content": "Sunny"},
+                    {"type": "tool_result", "tool_use_id": "call_2", "content": "Rainy"},
+                ],
+                "role": "user",
+            },
+            {"content": "Sunny in Paris, rainy in Rome.", "role": "assistant"},
+        ]
+
+        openai_messages = [converted for message in history for converted in to_openai_messages(message)]
+        assert [message["role"] for message in openai_messages] == ["system", "user", "assistant", "tool", "tool", "assistant"]
+        assert openai_messages[2]["tool_calls"][1]["function"] == {"name": "weather", "arguments": '{"city": "Rome"}'}
+        assert openai_messages[4] == {"role": "tool", "tool_call_id": "call_2", "content": "Rainy"}
+        assert from_openai_messages(openai_messages) == history
+
+    def test_response_message(self) -> None:
+        """Test converting a response message and images."""
+        response = ChatCompletionMessage.model_validate(
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [{"id": "call_1", "type": "function", "function": {"name": "now", "arguments": ""}}],
+            }
+        )
+        assert from_openai_messages([response]) == [
+            {"content": [{"type": "tool_use", "id": "call_1", "name": "now", "input": {}}], "role": "assistant"}
+        ]
+
+        image: Message = {
+            "content": [{"type": "image", "source": {"type": "base64", "media_type": "image/png", "data": "aGk="}}],
+            "role": "user",
+        }
+        converted = to_openai_messages(image)
+        assert converted == [
+            {"role": "user", "content": [{"type": "image_url", "image_url": {"url": "data:image/png;base64,aGk="}}]}
+        ]
+        assert from_openai_messages(converted) == [image]
+
+        with pytest.raises(ValueError, match="cannot be converted"):
+            from_openai_messages([{"role": "function", "name": "f", "content": "x"}])
+
+    def test_branch_history(self) -> None:
+        """Test committing OpenAI messages and emitting a cached, truncated history."""
+        canvas = Canvas()
+        canvas.token_counter = lambda _message: 4
+        main = canvas.checkout(name="main")
+        nodes = main.commit_openai_messages(
+            [
+                {"role": "system", "content": "Be terse."},
+                {"role": "user", "content": "Hi"},
+                {"role": "assistant", "content": "Hello"},
+                {"role": "user", "content": "Bye"},
+            ]
+        )
+        assert [node["message"]["role"] for node in nodes] == ["system", "user", "assistant", "user"]
+
+        first = main.to_openai_messages()
+        assert first["messages"] == [
+            {"role": "system", "content": "Be terse."},
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": "Hello"},
+            {"role": "user", "content": "Bye"},
+        ]
+        assert all(a is b for a, b in zip(first["messages"], main.to_openai_messages()["messages"]))
+
+        truncated = main.to_openai_messages(max_tokens=8, strategy="keep_system")
+        assert truncated["messages"] == [{"role": "system", "content": "Be terse."}, {"role": "user", "content": "Bye"}]
+        assert truncated["dropped_node_ids"] == [nodes[1]["id"], nodes[2]["id"]]
+
+
+class TestBlobStore:
+    """Test moving images out of message content into a BlobStore."""
+
+    @staticmethod
+    def image_message(data: bytes, text: str = "Look") -> Message:
+        """Create a user message with a base64 image."""
+        encoded = base64.b64encode(data).decode()
+        return {
+            "content": [
+                {"type": "text", "text": text},
+                {"type": "image", "source": {"type": "base64", "media_type": "image/png", "data": encoded}},
+            ],
+            "role": "user",
+        }
+
+    def test_images_are_stored_once(self) -> None:
+        """Test that interned content refers to the blob store instead of inlining images."""
+        blob_store = BlobStore()
+        canvas = Canvas(content_store=ContentStore(blob_store=blob_store))
+        branch = canvas.checkout(name="main")
+        first = branch.commit_message(self.image_message(b"image bytes"))
+        second = branch.commit_message(self.image_message(b"image bytes", text="Again"))
+
+        digest = blob_digest(b"image bytes")
+        assert first["message"]["content"][1] == {"type": "image", "source": {"type": "url", "url": f"/api/v1/blobs/{digest}"}}
+        assert second["message"]["content"][1] == first["message"]["content"][1]
+        assert blob_store.get(digest) == (b"image bytes", "image/png")
+        assert len(blob_store) == 1
+
+        canvas.remove_node(second["id"])
+        assert digest in blob_store
+        canvas.remove_node(first["id"])
+        assert digest not in blob_store
+
+    def test_content_without_images(self) -> None:
+        """Test that content without base64 images is stored as it is."""
+        blob_store = BlobStore()
+        url_image: Message = {
+            "content": [{"type": "image", "source": {"type": "url", "url": "https://example.com/a.png"}}],
+            "role": "user",
+        }
+        assert blob_store.externalize(url_image["content"]) == (url_image["content"], [])
+        invalid = self.image_message(b"")
+        invalid["content"][1]["source"]["data"] = "not base64!"
+        assert blob_store.externalize(invalid["content"]) == (invalid["content"], [])
+        assert len(blob_store) == 0
+
+        # Without a blob store images stay inline
+        node = Canvas(content_store=ContentStore()).add_message(self.image_message(b"image bytes"))
+        assert node["message"]["content"][1]["source"]["type"] == "base64"
+
+    def test_inline_blobs(self) -> None:
+        """Test that blob URL references can be turned back into base64 images."""
+        blob_store = BlobStore()
+        message = self.image_message(b"image bytes")
+        content, _ = blob_store.externalize(message["content"])
+        assert inline_blobs(content, blob_store.get) == message["content"]
+
+        # References that cannot be fetched, and other URLs, are kept
+        assert inline_blobs(content, lambda _digest: None) is content
+        url_image: Message = {
+            "content": [{"type": "image", "source": {"type": "url", "url": "https://example.com/a.png"}}],
+            "role": "user",
+        }
+        assert inline_blobs(url_image["content"], blob_store.get) is url_image["content"]
+
+
+class TestSearch:
+    """Test the incrementally maintained full-text search of a canvas."""
+
+    def test_ranking_and_snippets(self) -> None:
+        """Test that messages with more occurrences of rarer words rank first."""
+        canvas = Canvas()
+        weather = canvas.add_message({"content": "The weather in Paris is sunny today.", "role": "assistant"})
+        hotels = canvas.add_message({"content": "Paris hotels: Paris has many.", "role": "user"})
+        long = canvas.add_message({"content": "filler " * 20 + "needle " + "filler " * 20, "role": "user"})
+        canvas.add_message({"content": "Stock prices fell.", "role": "user"})
+        tool = canvas.add_message(
+            {"content": [{"type": "tool_result", "tool_use_id": "t1", "content": "Sunny, 25C"}], "role": "user"}
+        )
+
+        hits = canvas.search("PARIS")
+        assert [hit["node_id"] for hit in hits] == [hotels["id"], weather["id"]]
+        assert hits[1]["snippet"] == "The weather in Paris is sunny today."
+        needle = canvas.search("needle")[0]
+        assert needle["node_id"] == long["id"]
+        assert needle["snippet"].startswith("…")
+        assert needle["snippet"].endswith("…")
+        assert canvas.search("sunny paris")[0]["node_id"] == weather["id"]
+        assert [hit["node_id"] for hit in canvas.search("25c")] == [tool["id"]]
+        assert canvas.search("paris", limit=1)[0]["node_id"] == hotels["id"]
+        assert canvas.search("missing") == []
+
+    def test_index_follows_changes(self) -> None:
+        """Test that commits, updates, streamed deltas and removals after the first search are indexed."""
+        canvas = Canvas()
+        branch = canvas.checkout(name="main")
+        assert canvas.search("anything") == []
+
+        node = branch.commit_message({"content": "Draft about apples", "role": "user"})
+        assert [hit["node_id"] for hit in canvas.search("apples")] == [node["id"]]
+        canvas.update_message(node["id"], {**node, "message": {"content": "Notes on pears", "role": "user"}})
+        assert canvas.search("apples") == []
+
+        with branch.stream_message(min_interval=0) as stream:
+            for chunk in ("The capital is Par", "is, ", "famous for bread"):
+                stream.append(chunk)
+        assert [hit["node_id"] for hit in canvas.search("paris")] == [stream.node_id]
+        assert canvas.search("par") == []
+        assert [hit["node_id"] for hit in canvas.search("bread")] == [stream.node_id]
+
+        canvas.remove_node(stream.node_id)
+        assert canvas.search("paris") == []
+
+    def test_fork_builds_its_own_index(self) -> None:
+        """Test that a fork finds shared messages and only its own later changes."""
+        canvas = Canvas()
+        shared = canvas.add_message({"content": "shared words", "role": "user"})
+        assert canvas.search("shared")
+
+        forked = canvas.fork()
+        forked.add_message({"content": "forked words", "role": "user"}, parent_node_id=shared["id"])
+        assert len(forked.search("words")) == 2
+        assert [hit["node_id"] for hit in canvas.search("words")] == [shared["id"]]
+
+    def test_filters(self) -> None:
+        """Test that search filters select messages by role, block type and timestamp."""
+        canvas = Canvas()
+        question = canvas.add_message({"content": "Which tool reads files?", "role": "user"}, meta={"timestamp": 100.0})
+        call = canvas.add_message(
+            {
+                "content": [
+                    {"type": "text", "text": "The read tool"},
+                    {"type": "tool_use", "id": "t1", "name": "read", "input": {}},
+                ],
+                "role": "assistant",
+            },
+            meta={"timestamp": 200.0},
+        )
+
+        assert [hit["node_id"] for hit in canvas.search("tool", filters={"roles": ["user"]})] == [question["id"]]
+        assert [hit["node_id"] for hit in canvas.search("tool", filters={"block_types": ["tool_use"]})] == [call["id"]]
+        assert len(canvas.search("tool", filters={"block_types": ["text"]})) == 2
+        assert [hit["node_id"] for hit in canvas.search("tool", filters={"since": 150.0})] == [call["id"]]
+        assert [hit["node_id"] for hit in canvas.search("tool", filters={"until": 150.0})] == [question["id"]]
+
+    def test_filters_follow_deltas(self) -> None:
+        """Test that filters see the meta changed by message deltas."""
+        canvas = Canvas()
+        node = canvas.add_message({"content": "Streaming", "role": "assistant"}, meta={"timestamp": 10.0})
+        assert canvas.search("streaming", filters={"since": 100.0}) == []
+
+        canvas.apply_message_delta({"id": node["id"], "meta": {"timestamp": 200.0}})
+        assert [hit["node_id"] for hit in canvas.search("streaming", filters={"since": 100.0})] == [node["id"]]
+
+        canvas.apply_message_delta({"id": node["id"], "text": " answer", "meta": {"timestamp": 50.0}})
+        assert canvas.search("answer", filters={"since": 100.0}) == []
+        assert [hit["node_id"] for hit in canvas.search("answer", filters={"until": 100.0})] == [node["id"]]
+
+
+class TestRegistrySearch:
+    """Test searching every canvas of a registry."""
+
+    def test_merges_canvases_with_corpus_statistics(self) -> None:
+        """Test that hits of all canvases are ranked together and scored as if from a single index."""
+        registry = CanvasRegistry(search=True)
+        first, second, unrelated = Canvas(), Canvas(), Canvas()
+        for canvas in (first, second, unrelated):
+            registry.add(canvas)
+        rare = first.add_message({"content": "zebra crossing", "role": "user"})
+        first.add_message({"content": "plain words", "role": "user"})
+        both = second.add_message({"content": "zebra zebra crossing", "role": "assistant"})
+        unrelated.add_message({"content": "nothing here", "role": "user"})
+
+        hits = registry.search("zebra")
+        assert [(hit["canvas_id"], hit["node_id"]) for hit in hits] == [
+            (second.canvas_id, both["id"]),
+            (first.canvas_id, rare["id"]),
+        ]
+
+        single = Canvas()
+        for canvas in (first, second, unrelated):
+            for node in canvas.nodes.values():
+                single.add_message(node["message"])
+        assert [hit["score"] for hit in hits] == pytest.approx([hit["score"] for hit in single.search("zebra")])
+
+        assert [hit["node_id"] for hit in registry.search("zebra", filters={"roles": ["user"]})] == [rare["id"]]
+        assert len(registry.search("zebra crossing", limit=1)) == 1
+
+    def test_only_candidate_canvases_are_searched(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that canvases without a query word are not searched."""
+        registry = CanvasRegistry(search=True)
+        match, other = Canvas(), Canvas()
+        registry.add(match)
+        registry.add(other)
+        match.add_message({"content": "needle", "role": "user"})
+        other.add_message({"content": "haystack", "role": "user"})
+
+        searched: list[str] = []
+        for canvas in (match, other):
+
+            def record(*args: object, canvas: Canvas = canvas, original: Callable[..., object] = canvas.search_terms) -> object:
+                searched.append(canvas.canvas_id)
+                return original(*args)
+
+            monkeypatch.setattr(canvas, "search_terms", record)
+        assert len(registry.search("needle")) == 1
+        assert searched == [match.canvas_id]
+
+    def test_index_follows_registry_and_canvas_changes(self) -> None:
+        """Test that existing, later, removed and forked messages are found correctly."""
+        registry = CanvasRegistry(search=True)
+        canvas = Canvas()
+        existing = canvas.add_message({"content": "existing message", "role": "user"})
+        registry.add(canvas)
+        assert [hit["node_id"] for hit in registry.search("existing")] == [existing["id"]]
+
+        later = canvas.add_message({"content": "later message", "role": "user"}, parent_node_id=existing["id"])
+        assert {hit["node_id"] for hit in registry.search("message")} == {existing["id"], later["id"]}
+        canvas.remove_node(later["id"])
+        assert registry.search("later") == []
+
+        forked = canvas.fork()
+        registry.add(forked)
+        assert {hit["canvas_id"] for hit in registry.search("existing")} == {canvas.canvas_id, forked.canvas_id}
+
+        assert registry.remove(canvas.canvas_id)
+        assert [hit["canvas_id"] for hit in registry.search("existing")] == [forked.canvas_id]
+        assert canvas.search("existing")[0]["node_id"] == existing["id"]
+
+    def test_canvases_are_indexed_on_the_next_search(self) -> None:
+        """Test that adding a canvas does not index it, and an existing index is reused."""
+        registry = CanvasRegistry(search=True)
+        canvas = Canvas()
+        message = canvas.add_message({"content": "shared words", "role": "user"})
+        forked = canvas.fork()
+        registry.add(forked)
+        assert forked._search_index is None  # noqa: SLF001
+
+        canvas.search("words")
+        index = canvas._search_index  # noqa: SLF001
+        registry.add(canvas)
+        hits = registry.search("words")
+        assert canvas._search_index is index  # noqa: SLF001
+        assert {(hit["canvas_id"], hit["node_id"]) for hit in hits} == {
+            (canvas.canvas_id, message["id"]),
+            (forked.canvas_id, message["id"]),
+        }
+        single = Canvas()
+        single.add_message(message["message"])
+        single.add_message(message["message"])
+        scores = [hit["score"] for hit in single.search("words")]
+        assert [hit["score"] for hit in hits] == pytest.approx(scores)
+
+        # Replacing a canvas takes its messages out of the statistics
+        registry.add(canvas.fork(canvas_id=forked.canvas_id))
+        assert [hit["score"] for hit in registry.search("words")] == pytest.approx(scores)
+
+    def test_search_must_be_enabled(self) -> None:
+        """Test that a registry without search rejects searches."""
+        with pytest.raises(ValueError, match="not enabled"):
+            CanvasRegistry().search("anything")
+
+
+class TestMetaIndexes:
+    """Test secondary indexes over node meta."""
+
+    def test_equality_and_range_queries(self) -> None:
+        """Test that queries combine hash and sorted indexes and order their results."""
+        canvas = Canvas()
+        canvas.create_meta_index("status")
+        canvas.create_meta_index("latency", "sorted")
+        slow_error = canvas.add_message(
+            {"content": "a", "role": "assistant"}, meta={"status": "error", "latency": 4.0, "timestamp": 1.0}
+        )
+        fast_error = canvas.add_message(
+            {"content": "b", "role": "assistant"}, meta={"status": "error", "latency": 0.5, "timestamp": 2.0}
+        )
+        slow_ok = canvas.add_message(
+            {"content": "c", "role": "assistant"}, meta={"status": "ok", "latency": 3.0, "timestamp": 3.0}
+        )
+        canvas.add_message({"content": "d", "role": "user"}, meta={"latency": "n/a"})
+
+        def ids(nodes: list[MessageNode]) -> list[str]:
+            return [node["id"] for node in nodes]
+
+        assert ids(canvas.query_nodes(equals={"status": "error"})) == [slow_error["id"], fast_error["id"]]
+        assert ids(canvas.query_nodes(ranges={"latency": (1.0, None)})) == [slow_ok["id"], slow_error["id"]]
+        assert ids(canvas.query_nodes(ranges={"latency": (None, 3.0)})) == [fast_error["id"], slow_ok["id"]]
+        assert ids(canvas.query_nodes(equals={"status": "error"}, ranges={"latency": (1.0, 5.0)})) == [slow_error["id"]]
+        assert ids(canvas.query_nodes(ranges={"latency": (0.0, None)}, limit=1)) == [fast_error["id"]]
+        assert canvas.query_nodes(equals={"status": "missing"}) == []
+        with pytest.raises(ValueError, match="has no hash index"):
+            canvas.query_nodes(equals={"model": "gpt"})
+        with pytest.raises(ValueError, match="has no sorted index"):
+            canvas.query_nodes(ranges={"status": (0, 1)})
+        with pytest.raises(ValueError, match="at least one condition"):
+            canvas.query_nodes()
+
+    def test_indexes_follow_changes(self) -> None:
+        """Test that indexes created before or after writes see updates, deltas and removals."""
+        canvas = Canvas()
+        node = canvas.add_message({"content": "a", "role": "assistant"}, meta={"status": "pending"})
+        canvas.create_meta_index("status")
+        assert [found["id"] for found in canvas.query_nodes(equals={"status": "pending"})] == [node["id"]]
+
+        canvas.apply_message_delta({"id": node["id"], "meta": {"status": "error"}})
+        assert canvas.query_nodes(equals={"status": "pending"}) == []
+        assert [found["id"] for found in canvas.query_nodes(equals={"status": "error"})] == [node["id"]]
+
+        updated = canvas.get_node(node["id"])
+        assert updated is not None
+        canvas.update_message(node["id"], {**updated, "meta": {"status": "ok"}})
+        assert [found["id"] for found in canvas.query_nodes(equals={"status": "ok"})] == [node["id"]]
+
+        canvas.remove_node(node["id"])
+        assert canvas.query_nodes(equals={"status": "ok"}) == []
+        canvas.drop_meta_index("status")
+        assert canvas.meta_indexes == []
+
+    def test_fork_keeps_declared_indexes(self) -> None:
+        """Test that a fork indexes shared nodes and only its own later changes."""
+        canvas = Canvas()
+        canvas.create_meta_index("model")
+        shared = canvas.add_message({"content": "a", "role": "assistant"}, meta={"model": "small"})
+
+        forked = canvas.fork()
+        forked.add_message({"content": "b", "role": "assistant"}, parent_node_id=shared["id"], meta={"model": "small"})
+        assert forked.meta_indexes == [("model", "hash")]
+        assert len(forked.query_nodes(equals={"model": "small"})) == 2
+        assert [found["id"] for found in canvas.query_nodes(equals={"model": "small"})] == [shared["id"]]
+
+
+class TestTimeOrderedIds:
+    """Test ULID node IDs and range scans over them."""
+
+    def test_ulids_are_compact_and_ordered(self) -> None:
+        """Test that ULIDs sort in generation order and encode their creation time."""
+        before = time.time()
+        node_ids = [ulid() for _ in range(1000)]
+        assert all(len(node_id) == 26 for node_id in node_ids)
+        assert node_ids == sorted(node_ids)
+        assert len(set(node_ids)) == len(node_ids)
+        timestamp = ulid_timestamp(node_ids[0])
+        assert timestamp is not None
+        assert before - 0.001 <= timestamp <= time.time()
+        assert ulid_bound(timestamp) <= node_ids[0]
+        assert ulid_timestamp(str(uuid.uuid4())) is None
+
+    def test_nodes_between(self) -> None:
+        """Test that range scans find nodes by the time encoded in their IDs."""
+        canvas = Canvas()
+        legacy = canvas.add_message({"content": "uuid", "role": "user"})
+        canvas.node_id_factory = ulid
+        old_id = ulid_bound(1000.0)[:-1] + "1"
+        old = canvas.add_message({"content": "old", "role": "user"}, node_id=old_id)
+        assert canvas.nodes_between(0, 2000.0) == [old]
+
+        start = time.time()
+        recent = canvas.add_message({"content": "recent", "role": "user"}, parent_node_id=legacy["id"])
+        assert recent["id"] > old["id"]
+        assert [node["id"] for node in canvas.nodes_between(start - 1)] == [recent["id"]]
+        assert [node["id"] for node in canvas.nodes_between(0)] == [old["id"], recent["id"]]
+
+        canvas.remove_node(recent["id"])
+        assert canvas.nodes_between(start - 1) == []
+        forked = canvas.fork()
+        assert forked.node_id_factory is ulid
+        assert forked.nodes_between(0) == [old]
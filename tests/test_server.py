@@ -0,0 +1,467 @@
+"""Tests for the v1 API endpoints of the local server."""
+
+import base64
+import time
+import uuid
+from collections.abc import Iterator
+from typing import Any, Union
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from llm_canvas._server._api import registry, v1_router
+from llm_canvas.canvas import Canvas
+from llm_canvas.types import MessageNode
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Create a test client for the v1 API."""
+    app = FastAPI()
+    app.include_router(v1_router)
+    return TestClient(app)
+
+
+@pytest.fixture
+def canvas(client: TestClient) -> Iterator[Canvas]:
+    """Create a canvas on the server, removed from its registry after the test."""
+    canvas_id = client.post("/api/v1/canvas", json={"title": "Test Canvas"}).json()["canvas_id"]
+    canvas = registry.get(canvas_id)
+    assert canvas is not None
+    yield canvas
+    registry.remove(canvas_id)
+
+
+def message_node(content: str, parent_id: Union[str, None] = None, meta: Union[dict[str, Any], None] = None) -> MessageNode:
+    """Create a user message node as a client sends it."""
+    return {
+        "id": str(uuid.uuid4()),
+        "message": {"content": content, "role": "user"},
+        "parent_id": parent_id,
+        "child_ids": [],
+        "meta": meta,
+    }
+
+
+def event(event_type: str, canvas: Canvas, data: Any) -> dict[str, Any]:
+    """Create the event a request sends."""
+    return {"event_type": event_type, "canvas_id": canvas.canvas_id, "timestamp": time.time(), "data": data}
+
+
+class TestGetCanvas:
+    """Test fetching a full canvas."""
+
+    def test_get_canvas(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that the nodes are returned as stored and in order, also when they span several snapshot layers."""
+        first = canvas.insert_node(message_node("Hello", meta={"timestamp": 1.0, "status": "ok"}))
+        second = canvas.insert_node(message_node("Hi there", parent_id=first["id"]))
+        reply = canvas.insert_node(message_node("How are you?", parent_id=second["id"]))
+        canvas.snapshot()
+        canvas.update_message(first["id"], {**first, "message": {"content": "Hello again", "role": "user"}})
+        third = canvas.insert_node({**message_node("Merged", parent_id=second["id"]), "merge_parent_ids": [first["id"]]})
+        response = client.get("/api/v1/canvas", params={"canvas_id": canvas.canvas_id})
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["canvas_id"] == canvas.canvas_id
+        assert data["title"] == "Test Canvas"
+        assert list(data["nodes"]) == [first["id"], second["id"], reply["id"], third["id"]]
+        assert data["nodes"] == dict(canvas.nodes)
+        assert data["nodes"][first["id"]]["message"]["content"] == "Hello again"
+        assert data["nodes"][third["id"]]["merge_parent_ids"] == [first["id"]]
+
+    def test_unknown_canvas(self, client: TestClient) -> None:
+        """Test that fetching a missing canvas is rejected."""
+        response = client.get("/api/v1/canvas", params={"canvas_id": "missing"})
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["error"] == "canvas_not_found"
+
+
+class TestCommitMessages:
+    """Test committing a batch of messages in one request."""
+
+    def test_commit_batch(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that a batch is stored with its nodes linked to their parents."""
+        first = message_node("Hello")
+        second = message_node("Hi there", parent_id=first["id"])
+        response = client.post(
+            f"/api/v1/canvas/{canvas.canvas_id}/messages/batch",
+            json={"data": event("commit_messages", canvas, [first, second])},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["message_ids"] == [first["id"], second["id"]]
+        stored = canvas.get_node(first["id"])
+        assert stored is not None
+        assert stored["child_ids"] == [second["id"]]
+        assert canvas.get_node(second["id"]) is not None
+
+    def test_existing_node_rejects_batch(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that a batch with a stored node is rejected without storing any of its nodes."""
+        first = message_node("Hello")
+        canvas.insert_node(first)
+        second = message_node("Hi there", parent_id=first["id"])
+        response = client.post(
+            f"/api/v1/canvas/{canvas.canvas_id}/messages/batch",
+            json={"data": event("commit_messages", canvas, [second, first])},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"] == "node_already_exists"
+        assert canvas.get_node(second["id"]) is None
+
+    def test_unknown_canvas(self, client: TestClient) -> None:
+        """Test that a batch for a missing canvas is rejected."""
+        response = client.post(
+            "/api/v1/canvas/missing/messages/batch",
+            json={"data": {"event_type": "commit_messages", "canvas_id": "missing", "timestamp": 0.0, "data": []}},
+        )
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["error"] == "canvas_not_found"
+
+
+class TestDiff:
+    """Test diffing two histories."""
+
+    def test_diff(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that each history's messages since the merge base are returned."""
+        base = canvas.insert_node(message_node("Hello"))
+        left = canvas.insert_node(message_node("Left", parent_id=base["id"]))
+        right = canvas.insert_node(message_node("Right", parent_id=base["id"]))
+        right_child = canvas.insert_node(message_node("Right again", parent_id=right["id"]))
+        response = client.get(f"/api/v1/canvas/{canvas.canvas_id}/diff", params={"a": left["id"], "b": right_child["id"]})
+
+        assert response.status_code == 200
+        diff = response.json()["data"]
+        assert diff["merge_base_id"] == base["id"]
+        assert [node["id"] for node in diff["a_nodes"]] == [left["id"]]
+        assert [node["id"] for node in diff["b_nodes"]] == [right["id"], right_child["id"]]
+
+    def test_unknown_message(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that a diff with a missing message is rejected."""
+        node = canvas.insert_node(message_node("Hello"))
+        response = client.get(f"/api/v1/canvas/{canvas.canvas_id}/diff", params={"a": node["id"], "b": "missing"})
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["error"] == "message_not_found"
+
+
+class TestDeleteMessage:
+    """Test deleting messages."""
+
+    def test_delete_leaf(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that a message without children is removed from the canvas and its parent."""
+        parent = canvas.insert_node(message_node("Hello"))
+        leaf = canvas.insert_node(message_node("Hi there", parent_id=parent["id"]))
+        response = client.delete(f"/api/v1/canvas/{canvas.canvas_id}/messages/{leaf['id']}")
+
+        assert response.status_code == 200
+        assert response.json()["message_id"] == leaf["id"]
+        assert canvas.get_node(leaf["id"]) is None
+        stored_parent = canvas.get_node(parent["id"])
+        assert stored_parent is not None
+        assert stored_parent["child_ids"] == []
+
+    def test_message_with_children_is_kept(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that a message still having children is not deleted."""
+        parent = canvas.insert_node(message_node("Hello"))
+        canvas.insert_node(message_node("Hi there", parent_id=parent["id"]))
+        response = client.delete(f"/api/v1/canvas/{canvas.canvas_id}/messages/{parent['id']}")
+
+        assert response.status_code == 409
+        assert response.json()["detail"]["error"] == "message_has_children"
+        assert canvas.get_node(parent["id"]) is not None
+
+    def test_unknown_message(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that deleting a missing message is rejected."""
+        response = client.delete(f"/api/v1/canvas/{canvas.canvas_id}/messages/missing")
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["error"] == "message_not_found"
+
+
+class TestForkCanvas:
+    """Test forking canvases."""
+
+    def test_fork(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that a fork shares the messages of the canvas and evolves separately."""
+        first = canvas.insert_node(message_node("Hello"))
+        response = client.post(f"/api/v1/canvas/{canvas.canvas_id}/fork", json={"title": "Fork"})
+
+        assert response.status_code == 200
+        forked = registry.get(response.json()["canvas_id"])
+        assert forked is not None
+        try:
+            assert forked.canvas_id != canvas.canvas_id
+            assert forked.title == "Fork"
+            assert forked.description == canvas.description
+            assert forked.get_node(first["id"]) is not None
+
+            forked.insert_node(message_node("Only in the fork", parent_id=first["id"]))
+            assert len(forked.nodes) == 2
+            assert len(canvas.nodes) == 1
+        finally:
+            registry.remove(forked.canvas_id)
+
+    def test_unknown_canvas(self, client: TestClient) -> None:
+        """Test that forking a missing canvas is rejected."""
+        response = client.post("/api/v1/canvas/missing/fork", json={})
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["error"] == "canvas_not_found"
+
+
+class TestChanges:
+    """Test reading the changes of a canvas since a version."""
+
+    def test_changes_since(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that the changes after a version are returned in order."""
+        first = canvas.insert_node(message_node("Hello"))
+        version = canvas.version
+        second = canvas.insert_node(message_node("Hi there", parent_id=first["id"]))
+        response = client.get(f"/api/v1/canvas/{canvas.canvas_id}/changes", params={"since": version})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["version"] == canvas.version
+        assert body["snapshot"] is None
+        assert [change["event"]["data"]["id"] for change in body["changes"]] == [second["id"]]
+
+        response = client.get(f"/api/v1/canvas/{canvas.canvas_id}/changes", params={"since": canvas.version})
+        assert response.json()["changes"] == []
+
+    def test_snapshot_when_changes_are_unavailable(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that a snapshot is returned for a version the changelog cannot bring up to date."""
+        node = canvas.insert_node(message_node("Hello"))
+        response = client.get(f"/api/v1/canvas/{canvas.canvas_id}/changes", params={"since": canvas.version + 1})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["version"] == canvas.version
+        assert body["changes"] is None
+        assert list(body["snapshot"]["nodes"]) == [node["id"]]
+
+
+class TestMessageDelta:
+    """Test applying message deltas."""
+
+    def test_apply_delta(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that a delta appends text and sets meta keys of a stored message."""
+        node = canvas.insert_node(message_node("Hello", meta={"status": "streaming"}))
+        delta = {"id": node["id"], "text": " world", "meta": {"status": "done"}}
+        response = client.post(
+            f"/api/v1/canvas/{canvas.canvas_id}/messages/{node['id']}/delta",
+            json={"data": event("message_delta", canvas, delta)},
+        )
+
+        assert response.status_code == 200
+        stored = canvas.get_node(node["id"])
+        assert stored is not None
+        assert stored["message"]["content"] == "Hello world"
+        assert stored["meta"] == {"status": "done"}
+
+    def test_invalid_delta(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that a delta which does not fit the message is rejected."""
+        node = canvas.insert_node(message_node("Hello"))
+        delta = {"id": node["id"], "text": " world", "block_index": 1}
+        response = client.post(
+            f"/api/v1/canvas/{canvas.canvas_id}/messages/{node['id']}/delta",
+            json={"data": event("message_delta", canvas, delta)},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"] == "invalid_delta"
+        stored = canvas.get_node(node["id"])
+        assert stored is not None
+        assert stored["message"]["content"] == "Hello"
+
+    def test_unknown_message(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that a delta for a missing message is rejected."""
+        response = client.post(
+            f"/api/v1/canvas/{canvas.canvas_id}/messages/missing/delta",
+            json={"data": event("message_delta", canvas, {"id": "missing", "text": "Hello"})},
+        )
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["error"] == "message_not_found"
+
+
+class TestBlobs:
+    """Test serving images moved out of message content."""
+
+    def test_get_blob(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that a stored image is served from the URL that replaced it until its message is removed."""
+        data = uuid.uuid4().bytes
+        node = message_node("")
+        node["message"]["content"] = [
+            {"type": "text", "text": "Look"},
+            {
+                "type": "image",
+                "source": {"type": "base64", "media_type": "image/png", "data": base64.b64encode(data).decode()},
+            },
+        ]
+        stored = canvas.insert_node(node)
+        source = stored["message"]["content"][1]["source"]
+        assert source["type"] == "url"
+
+        response = client.get(source["url"])
+        assert response.status_code == 200
+        assert response.content == data
+        assert response.headers["content-type"] == "image/png"
+        assert "immutable" in response.headers["cache-control"]
+
+        canvas.remove_node(node["id"])
+        response = client.get(source["url"])
+        assert response.status_code == 404
+        assert response.json()["detail"]["error"] == "blob_not_found"
+
+
+class TestSearch:
+    """Test searching the messages of one canvas and of every canvas."""
+
+    def test_search_canvas(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that matching messages are returned best match first, with snippets."""
+        weather = canvas.insert_node(message_node("The weather in Paris is sunny."))
+        hotels = canvas.insert_node(message_node("Paris hotels: Paris has many.", parent_id=weather["id"]))
+        canvas.insert_node(message_node("Stock prices fell.", parent_id=hotels["id"]))
+        response = client.get(f"/api/v1/canvas/{canvas.canvas_id}/search", params={"q": "paris"})
+
+        assert response.status_code == 200
+        hits = response.json()["hits"]
+        assert [hit["node_id"] for hit in hits] == [hotels["id"], weather["id"]]
+        assert hits[1]["snippet"] == "The weather in Paris is sunny."
+
+        response = client.get(f"/api/v1/canvas/{canvas.canvas_id}/search", params={"q": "paris", "limit": 1})
+        assert [hit["node_id"] for hit in response.json()["hits"]] == [hotels["id"]]
+
+    def test_search_every_canvas(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that registry-wide results carry their canvas IDs and can be filtered."""
+        # A word no other canvas of the server registry contains
+        word = f"word{uuid.uuid4().hex}"
+        question = canvas.insert_node(message_node(f"What does {word} mean?"))
+        other_id = client.post("/api/v1/canvas", json={"title": "Other"}).json()["canvas_id"]
+        other = registry.get(other_id)
+        assert other is not None
+        try:
+            answer = message_node(f"{word} is a made-up word, {word} means nothing.")
+            answer["message"]["role"] = "assistant"
+            other.insert_node(answer)
+            response = client.get("/api/v1/search", params={"q": word})
+
+            assert response.status_code == 200
+            hits = response.json()["hits"]
+            assert [(hit["canvas_id"], hit["node_id"]) for hit in hits] == [
+                (other_id, answer["id"]),
+                (canvas.canvas_id, question["id"]),
+            ]
+
+            response = client.get("/api/v1/search", params={"q": word, "role": "user"})
+            assert [hit["node_id"] for hit in response.json()["hits"]] == [question["id"]]
+        finally:
+            registry.remove(other_id)
+
+    def test_search_unknown_canvas(self, client: TestClient) -> None:
+        """Test that searching a missing canvas is rejected."""
+        response = client.get("/api/v1/canvas/missing/search", params={"q": "paris"})
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["error"] == "canvas_not_found"
+
+
+class TestMetaQueries:
+    """Test declaring meta indexes and querying nodes through them."""
+
+    def test_query_declared_indexes(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that equality and range conditions are answered from the declared indexes."""
+        slow = canvas.insert_node(message_node("Slow", meta={"status": "ok", "latency": 4.0}))
+        fast = canvas.insert_node(message_node("Fast", parent_id=slow["id"], meta={"status": "ok", "latency": 1.5}))
+        canvas.insert_node(message_node("Failed", parent_id=fast["id"], meta={"status": "error", "latency": 2.0}))
+        url = f"/api/v1/canvas/{canvas.canvas_id}"
+
+        response = client.put(f"{url}/meta_indexes/status")
+        assert response.status_code == 200
+        assert response.json()["indexes"] == [{"key": "status", "kind": "hash"}]
+        response = client.put(f"{url}/meta_indexes/latency", params={"kind": "sorted"})
+        assert response.json()["indexes"] == [{"key": "status", "kind": "hash"}, {"key": "latency", "kind": "sorted"}]
+
+        response = client.post(f"{url}/nodes/query", json={"equals": {"status": "ok"}, "ranges": {"latency": [None, 5.0]}})
+        assert response.status_code == 200
+        assert [node["id"] for node in response.json()["nodes"]] == [fast["id"], slow["id"]]
+
+        response = client.delete(f"{url}/meta_indexes/latency", params={"kind": "sorted"})
+        assert response.json()["indexes"] == [{"key": "status", "kind": "hash"}]
+
+    def test_undeclared_index_is_rejected(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that a query on a key without an index is rejected instead of scanning the canvas."""
+        canvas.insert_node(message_node("Hello", meta={"status": "ok"}))
+        url = f"/api/v1/canvas/{canvas.canvas_id}/nodes/query"
+
+        response = client.post(url, json={"equals": {"status": "ok"}})
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"] == "meta_key_not_indexed"
+        assert canvas.meta_indexes == []
+
+        client.put(f"/api/v1/canvas/{canvas.canvas_id}/meta_indexes/status")
+        response = client.post(url, json={"ranges": {"status": [0, 1]}})
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"] == "meta_key_not_indexed"
+        assert "has no sorted index" in response.json()["detail"]["message"]
+
+        response = client.post(url, json={})
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"] == "invalid_query"
+
+
+class TestMessageBranches:
+    """Test finding the branch HEADs whose history includes a message."""
+
+    def test_heads_containing(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that the client-sent HEADs including the message are returned in request order."""
+        base = canvas.insert_node(message_node("Hello"))
+        left = canvas.insert_node(message_node("Left", parent_id=base["id"]))
+        right = canvas.insert_node(message_node("Right", parent_id=base["id"]))
+        url = f"/api/v1/canvas/{canvas.canvas_id}/messages"
+
+        response = client.get(f"{url}/{base['id']}/branches", params={"head": [right["id"], left["id"]]})
+        assert response.status_code == 200
+        assert response.json()["heads"] == [right["id"], left["id"]]
+
+        response = client.get(f"{url}/{left['id']}/branches", params={"head": [right["id"], left["id"], "missing"]})
+        assert response.json()["heads"] == [left["id"]]
+
+    def test_heads_are_required(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that a request without HEADs is rejected, since the server does not track branches."""
+        node = canvas.insert_node(message_node("Hello"))
+        response = client.get(f"/api/v1/canvas/{canvas.canvas_id}/messages/{node['id']}/branches")
+
+        assert response.status_code == 422
+
+    def test_unknown_message(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that asking about a missing message is rejected."""
+        node = canvas.insert_node(message_node("Hello"))
+        response = client.get(f"/api/v1/canvas/{canvas.canvas_id}/messages/missing/branches", params={"head": node["id"]})
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["error"] == "message_not_found"
+
+
+class TestCanvasList:
+    """Test the summaries of the canvases on the server."""
+
+    def test_summary_has_head_token_counts(self, client: TestClient, canvas: Canvas) -> None:
+        """Test that a server canvas, which has no branches, reports the token count of each HEAD."""
+        root = canvas.insert_node(message_node("one two"))
+        left = canvas.insert_node(message_node("three", parent_id=root["id"]))
+        right = canvas.insert_node(message_node("four five", parent_id=root["id"]))
+        response = client.get("/api/v1/canvas/list")
+
+        assert response.status_code == 200
+        summary = next(c for c in response.json()["canvases"] if c["canvas_id"] == canvas.canvas_id)
+        assert "branch_token_counts" not in summary
+        assert summary["head_token_counts"] == {
+            left["id"]: canvas.path_token_count(left["id"]),
+            right["id"]: canvas.path_token_count(right["id"]),
+        }
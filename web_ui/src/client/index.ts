@@ -4,10 +4,18 @@ export { OpenAPI } from "./core/OpenAPI";
 export type { OpenAPIConfig } from "./core/OpenAPI";
 
 export type { Base64ImageSourceParam } from "./models/Base64ImageSourceParam";
+export type { BranchDiff } from "./models/BranchDiff";
 export type { CacheControlEphemeralParam } from "./models/CacheControlEphemeralParam";
+export type { CanvasChange } from "./models/CanvasChange";
+export type { CanvasChangesResponse } from "./models/CanvasChangesResponse";
 export type { CanvasCommitMessageEvent } from "./models/CanvasCommitMessageEvent";
+export type { CanvasCommitMessagesEvent } from "./models/CanvasCommitMessagesEvent";
 export type { CanvasData } from "./models/CanvasData";
+export type { CanvasDeleteMessageEvent } from "./models/CanvasDeleteMessageEvent";
+export type { CanvasDiffResponse } from "./models/CanvasDiffResponse";
 export type { CanvasListResponse } from "./models/CanvasListResponse";
+export type { CanvasMessageDeltaEvent } from "./models/CanvasMessageDeltaEvent";
+export type { CanvasSearchResponse } from "./models/CanvasSearchResponse";
 export type { CanvasSummary } from "./models/CanvasSummary";
 export type { CanvasUpdateMessageEvent } from "./models/CanvasUpdateMessageEvent";
 export type { CitationCharLocationParam } from "./models/CitationCharLocationParam";
@@ -17,16 +25,30 @@ export type { CitationsConfigParam } from "./models/CitationsConfigParam";
 export type { CitationSearchResultLocationParam } from "./models/CitationSearchResultLocationParam";
 export type { CitationWebSearchResultLocationParam } from "./models/CitationWebSearchResultLocationParam";
 export type { CommitMessageRequest } from "./models/CommitMessageRequest";
+export type { CommitMessagesRequest } from "./models/CommitMessagesRequest";
 export type { CreateCanvasRequest } from "./models/CreateCanvasRequest";
 export type { CreateCanvasResponse } from "./models/CreateCanvasResponse";
 export type { CreateMessageResponse } from "./models/CreateMessageResponse";
+export type { CreateMessagesResponse } from "./models/CreateMessagesResponse";
 export type { DeleteCanvasResponse } from "./models/DeleteCanvasResponse";
+export type { DeleteMessageResponse } from "./models/DeleteMessageResponse";
+export type { ForkCanvasRequest } from "./models/ForkCanvasRequest";
 export type { GetCanvasResponse } from "./models/GetCanvasResponse";
 export type { HealthCheckResponse } from "./models/HealthCheckResponse";
 export type { HTTPValidationError } from "./models/HTTPValidationError";
 export type { ImageBlockParam } from "./models/ImageBlockParam";
 export type { Message } from "./models/Message";
+export type { MessageBranchesResponse } from "./models/MessageBranchesResponse";
+export type { MessageDelta } from "./models/MessageDelta";
+export type { MessageDeltaRequest } from "./models/MessageDeltaRequest";
 export type { MessageNode } from "./models/MessageNode";
+export type { MetaIndexesResponse } from "./models/MetaIndexesResponse";
+export type { MetaIndexInfo } from "./models/MetaIndexInfo";
+export type { QueryNodesRequest } from "./models/QueryNodesRequest";
+export type { QueryNodesResponse } from "./models/QueryNodesResponse";
+export type { RegistrySearchHit } from "./models/RegistrySearchHit";
+export type { RegistrySearchResponse } from "./models/RegistrySearchResponse";
+export type { SearchHit } from "./models/SearchHit";
 export type { SearchResultBlockParam } from "./models/SearchResultBlockParam";
 export type { SSECanvasCreatedEvent } from "./models/SSECanvasCreatedEvent";
 export type { SSECanvasDeletedEvent } from "./models/SSECanvasDeletedEvent";
@@ -39,6 +61,8 @@ export type { SSEHeartbeatEvent } from "./models/SSEHeartbeatEvent";
 export type { SSEMessageCommittedEvent } from "./models/SSEMessageCommittedEvent";
 export type { SSEMessageDeletedEvent } from "./models/SSEMessageDeletedEvent";
 export type { SSEMessageDeletedEventData } from "./models/SSEMessageDeletedEventData";
+export type { SSEMessageDeltaEvent } from "./models/SSEMessageDeltaEvent";
+export type { SSEMessagesCommittedEvent } from "./models/SSEMessagesCommittedEvent";
 export type { SSEMessageUpdatedEvent } from "./models/SSEMessageUpdatedEvent";
 export type { TextBlockParam } from "./models/TextBlockParam";
 export type { ToolResultBlockParam } from "./models/ToolResultBlockParam";
@@ -48,10 +72,18 @@ export type { URLImageSourceParam } from "./models/URLImageSourceParam";
 export type { ValidationError } from "./models/ValidationError";
 
 export { $Base64ImageSourceParam } from "./schemas/$Base64ImageSourceParam";
+export { $BranchDiff } from "./schemas/$BranchDiff";
 export { $CacheControlEphemeralParam } from "./schemas/$CacheControlEphemeralParam";
+export { $CanvasChange } from "./schemas/$CanvasChange";
+export { $CanvasChangesResponse } from "./schemas/$CanvasChangesResponse";
 export { $CanvasCommitMessageEvent } from "./schemas/$CanvasCommitMessageEvent";
+export { $CanvasCommitMessagesEvent } from "./schemas/$CanvasCommitMessagesEvent";
 export { $CanvasData } from "./schemas/$CanvasData";
+export { $CanvasDeleteMessageEvent } from "./schemas/$CanvasDeleteMessageEvent";
+export { $CanvasDiffResponse } from "./schemas/$CanvasDiffResponse";
 export { $CanvasListResponse } from "./schemas/$CanvasListResponse";
+export { $CanvasMessageDeltaEvent } from "./schemas/$CanvasMessageDeltaEvent";
+export { $CanvasSearchResponse } from "./schemas/$CanvasSearchResponse";
 export { $CanvasSummary } from "./schemas/$CanvasSummary";
 export { $CanvasUpdateMessageEvent } from "./schemas/$CanvasUpdateMessageEvent";
 export { $CitationCharLocationParam } from "./schemas/$CitationCharLocationParam";
@@ -61,16 +93,30 @@ export { $CitationsConfigParam } from "./schemas/$CitationsConfigParam";
 export { $CitationSearchResultLocationParam } from "./schemas/$CitationSearchResultLocationParam";
 export { $CitationWebSearchResultLocationParam } from "./schemas/$CitationWebSearchResultLocationParam";
 export { $CommitMessageRequest } from "./schemas/$CommitMessageRequest";
+export { $CommitMessagesRequest } from "./schemas/$CommitMessagesRequest";
 export { $CreateCanvasRequest } from "./schemas/$CreateCanvasRequest";
 export { $CreateCanvasResponse } from "./schemas/$CreateCanvasResponse";
 export { $CreateMessageResponse } from "./schemas/$CreateMessageResponse";
+export { $CreateMessagesResponse } from "./schemas/$CreateMessagesResponse";
 export { $DeleteCanvasResponse } from "./schemas/$DeleteCanvasResponse";
+export { $DeleteMessageResponse } from "./schemas/$DeleteMessageResponse";
+export { $ForkCanvasRequest } from "./schemas/$ForkCanvasRequest";
 export { $GetCanvasResponse } from "./schemas/$GetCanvasResponse";
 export { $HealthCheckResponse } from "./schemas/$HealthCheckResponse";
 export { $HTTPValidationError } from "./schemas/$HTTPValidationError";
 export { $ImageBlockParam } from "./schemas/$ImageBlockParam";
 export { $Message } from "./schemas/$Message";
+export { $MessageBranchesResponse } from "./schemas/$MessageBranchesResponse";
+export { $MessageDelta } from "./schemas/$MessageDelta";
+export { $MessageDeltaRequest } from "./schemas/$MessageDeltaRequest";
 export { $MessageNode } from "./schemas/$MessageNode";
+export { $MetaIndexesResponse } from "./schemas/$MetaIndexesResponse";
+export { $MetaIndexInfo } from "./schemas/$MetaIndexInfo";
+export { $QueryNodesRequest } from "./schemas/$QueryNodesRequest";
+export { $QueryNodesResponse } from "./schemas/$QueryNodesResponse";
+export { $RegistrySearchHit } from "./schemas/$RegistrySearchHit";
+export { $RegistrySearchResponse } from "./schemas/$RegistrySearchResponse";
+export { $SearchHit } from "./schemas/$SearchHit";
 export { $SearchResultBlockParam } from "./schemas/$SearchResultBlockParam";
 export { $SSECanvasCreatedEvent } from "./schemas/$SSECanvasCreatedEvent";
 export { $SSECanvasDeletedEvent } from "./schemas/$SSECanvasDeletedEvent";
@@ -83,6 +129,8 @@ export { $SSEHeartbeatEvent } from "./schemas/$SSEHeartbeatEvent";
 export { $SSEMessageCommittedEvent } from "./schemas/$SSEMessageCommittedEvent";
 export { $SSEMessageDeletedEvent } from "./schemas/$SSEMessageDeletedEvent";
 export { $SSEMessageDeletedEventData } from "./schemas/$SSEMessageDeletedEventData";
+export { $SSEMessageDeltaEvent } from "./schemas/$SSEMessageDeltaEvent";
+export { $SSEMessagesCommittedEvent } from "./schemas/$SSEMessagesCommittedEvent";
 export { $SSEMessageUpdatedEvent } from "./schemas/$SSEMessageUpdatedEvent";
 export { $TextBlockParam } from "./schemas/$TextBlockParam";
 export { $ToolResultBlockParam } from "./schemas/$ToolResultBlockParam";
@@ -0,0 +1,10 @@
+import type { MessageNode } from "./MessageNode";
+
+/**
+ * Messages unique to each of two histories since their merge base.
+ */
+export type BranchDiff = {
+  merge_base_id: string | null;
+  a_nodes: Array<MessageNode>;
+  b_nodes: Array<MessageNode>;
+};
@@ -0,0 +1,18 @@
+import type { CanvasCommitMessageEvent } from "./CanvasCommitMessageEvent";
+import type { CanvasCommitMessagesEvent } from "./CanvasCommitMessagesEvent";
+import type { CanvasDeleteMessageEvent } from "./CanvasDeleteMessageEvent";
+import type { CanvasMessageDeltaEvent } from "./CanvasMessageDeltaEvent";
+import type { CanvasUpdateMessageEvent } from "./CanvasUpdateMessageEvent";
+
+/**
+ * A change in a canvas changelog.
+ */
+export type CanvasChange = {
+  version: number;
+  event:
+    | CanvasCommitMessageEvent
+    | CanvasCommitMessagesEvent
+    | CanvasUpdateMessageEvent
+    | CanvasMessageDeltaEvent
+    | CanvasDeleteMessageEvent;
+};
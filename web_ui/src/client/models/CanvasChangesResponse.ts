@@ -0,0 +1,11 @@
+import type { CanvasChange } from "./CanvasChange";
+import type { CanvasData } from "./CanvasData";
+
+/**
+ * Response type for GET /api/v1/canvas/{canvas_id}/changes
+ */
+export type CanvasChangesResponse = {
+  version: number;
+  changes?: Array<CanvasChange> | null;
+  snapshot?: CanvasData | null;
+};
@@ -0,0 +1,11 @@
+import type { MessageNode } from "./MessageNode";
+
+/**
+ * Event data for a batch of messages committed together.
+ */
+export type CanvasCommitMessagesEvent = {
+  event_type: "commit_messages";
+  canvas_id: string;
+  timestamp: number;
+  data: Array<MessageNode>;
+};
@@ -0,0 +1,9 @@
+/**
+ * Event data for canvas message deletions.
+ */
+export type CanvasDeleteMessageEvent = {
+  event_type: "delete_message";
+  canvas_id: string;
+  timestamp: number;
+  data: string;
+};
@@ -0,0 +1,8 @@
+import type { BranchDiff } from "./BranchDiff";
+
+/**
+ * Response type for GET /api/v1/canvas/{canvas_id}/diff
+ */
+export type CanvasDiffResponse = {
+  data: BranchDiff;
+};
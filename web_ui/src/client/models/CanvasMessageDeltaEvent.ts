@@ -0,0 +1,11 @@
+import type { MessageDelta } from "./MessageDelta";
+
+/**
+ * Event data for incremental message changes.
+ */
+export type CanvasMessageDeltaEvent = {
+  event_type: "message_delta";
+  canvas_id: string;
+  timestamp: number;
+  data: MessageDelta;
+};
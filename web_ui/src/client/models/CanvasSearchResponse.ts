@@ -0,0 +1,8 @@
+import type { SearchHit } from "./SearchHit";
+
+/**
+ * Response type for GET /api/v1/canvas/{canvas_id}/search
+ */
+export type CanvasSearchResponse = {
+  hits: Array<SearchHit>;
+};
@@ -9,4 +9,6 @@ export type CanvasSummary = {
   title: string | null;
   description: string | null;
   meta: Record<string, unknown>;
+  branch_token_counts?: Record<string, number>;
+  head_token_counts?: Record<string, number>;
 };
@@ -0,0 +1,5 @@
+import type { CanvasCommitMessagesEvent } from "./CanvasCommitMessagesEvent";
+
+export type CommitMessagesRequest = {
+  data: CanvasCommitMessagesEvent;
+};
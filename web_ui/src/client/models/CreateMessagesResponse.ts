@@ -0,0 +1,8 @@
+/**
+ * Response type for POST /api/v1/canvas/{canvas_id}/messages/batch
+ */
+export type CreateMessagesResponse = {
+  message_ids: Array<string>;
+  canvas_id: string;
+  message: string;
+};
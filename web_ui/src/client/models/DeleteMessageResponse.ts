@@ -0,0 +1,8 @@
+/**
+ * Response type for DELETE /api/v1/canvas/{canvas_id}/messages/{message_id}
+ */
+export type DeleteMessageResponse = {
+  message_id: string;
+  canvas_id: string;
+  message: string;
+};
@@ -0,0 +1,7 @@
+/**
+ * Request type for POST /api/v1/canvas/{canvas_id}/fork
+ */
+export type ForkCanvasRequest = {
+  title?: string | null;
+  description?: string | null;
+};
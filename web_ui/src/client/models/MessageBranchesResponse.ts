@@ -0,0 +1,6 @@
+/**
+ * Response type for GET /api/v1/canvas/{canvas_id}/messages/{message_id}/branches
+ */
+export type MessageBranchesResponse = {
+  heads: Array<string>;
+};
@@ -0,0 +1,9 @@
+/**
+ * An incremental change to a stored message, e.g. the next tokens of a streamed response.
+ */
+export type MessageDelta = {
+  id: string;
+  text?: string;
+  block_index?: number;
+  meta?: Record<string, unknown>;
+};
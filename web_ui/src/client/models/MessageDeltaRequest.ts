@@ -0,0 +1,8 @@
+import type { CanvasMessageDeltaEvent } from "./CanvasMessageDeltaEvent";
+
+/**
+ * Request type for POST /api/v1/canvas/{canvas_id}/messages/{message_id}/delta
+ */
+export type MessageDeltaRequest = {
+  data: CanvasMessageDeltaEvent;
+};
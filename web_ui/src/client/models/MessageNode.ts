@@ -9,4 +9,5 @@ export type MessageNode = {
   parent_id: string | null;
   child_ids: Array<string>;
   meta: Record<string, unknown> | null;
+  merge_parent_ids?: Array<string>;
 };
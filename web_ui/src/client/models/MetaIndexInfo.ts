@@ -0,0 +1,7 @@
+/**
+ * A meta key a canvas is indexed by, and the kind of the index
+ */
+export type MetaIndexInfo = {
+  key: string;
+  kind: "hash" | "sorted";
+};
@@ -0,0 +1,8 @@
+import type { MetaIndexInfo } from "./MetaIndexInfo";
+
+/**
+ * Response type for PUT and DELETE /api/v1/canvas/{canvas_id}/meta_indexes/{key}
+ */
+export type MetaIndexesResponse = {
+  indexes: Array<MetaIndexInfo>;
+};
@@ -0,0 +1,8 @@
+/**
+ * Request type for POST /api/v1/canvas/{canvas_id}/nodes/query
+ */
+export type QueryNodesRequest = {
+  equals?: Record<string, unknown>;
+  ranges?: Record<string, unknown[]>;
+  limit?: number | null;
+};
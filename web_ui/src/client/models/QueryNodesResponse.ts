@@ -0,0 +1,8 @@
+import type { MessageNode } from "./MessageNode";
+
+/**
+ * Response type for POST /api/v1/canvas/{canvas_id}/nodes/query
+ */
+export type QueryNodesResponse = {
+  nodes: Array<MessageNode>;
+};
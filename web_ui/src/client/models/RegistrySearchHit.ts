@@ -0,0 +1,9 @@
+/**
+ * A message of one of the canvases of a registry matching a search query.
+ */
+export type RegistrySearchHit = {
+  node_id: string;
+  score: number;
+  snippet: string;
+  canvas_id: string;
+};
@@ -0,0 +1,8 @@
+import type { RegistrySearchHit } from "./RegistrySearchHit";
+
+/**
+ * Response type for GET /api/v1/search
+ */
+export type RegistrySearchResponse = {
+  hits: Array<RegistrySearchHit>;
+};
@@ -5,6 +5,8 @@ import type { SSEErrorEvent } from "./SSEErrorEvent";
 import type { SSEHeartbeatEvent } from "./SSEHeartbeatEvent";
 import type { SSEMessageCommittedEvent } from "./SSEMessageCommittedEvent";
 import type { SSEMessageDeletedEvent } from "./SSEMessageDeletedEvent";
+import type { SSEMessageDeltaEvent } from "./SSEMessageDeltaEvent";
+import type { SSEMessagesCommittedEvent } from "./SSEMessagesCommittedEvent";
 import type { SSEMessageUpdatedEvent } from "./SSEMessageUpdatedEvent";
 
 /**
@@ -18,7 +20,9 @@ export type SSEDocumentationResponse = {
     | SSEHeartbeatEvent
     | SSEErrorEvent
     | SSEMessageCommittedEvent
+    | SSEMessagesCommittedEvent
     | SSEMessageUpdatedEvent
+    | SSEMessageDeltaEvent
     | SSEMessageDeletedEvent
   >;
 };
@@ -0,0 +1,11 @@
+import type { MessageDelta } from "./MessageDelta";
+
+/**
+ * SSE event data for incremental message changes (only the new text and meta keys).
+ */
+export type SSEMessageDeltaEvent = {
+  type: "message_delta";
+  timestamp: number;
+  canvas_id: string;
+  data: MessageDelta;
+};
@@ -0,0 +1,11 @@
+import type { MessageNode } from "./MessageNode";
+
+/**
+ * SSE event data for a batch of messages committed together.
+ */
+export type SSEMessagesCommittedEvent = {
+  type: "messages_committed";
+  timestamp: number;
+  canvas_id: string;
+  data: Array<MessageNode>;
+};
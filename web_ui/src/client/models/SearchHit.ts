@@ -0,0 +1,8 @@
+/**
+ * A message matching a search query.
+ */
+export type SearchHit = {
+  node_id: string;
+  score: number;
+  snippet: string;
+};
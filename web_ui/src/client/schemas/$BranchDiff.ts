@@ -0,0 +1,31 @@
+export const $BranchDiff = {
+  description: `Messages unique to each of two histories since their merge base.`,
+  properties: {
+    merge_base_id: {
+      type: "any-of",
+      contains: [
+        {
+          type: "string",
+        },
+        {
+          type: "null",
+        },
+      ],
+      isRequired: true,
+    },
+    a_nodes: {
+      type: "array",
+      contains: {
+        type: "MessageNode",
+      },
+      isRequired: true,
+    },
+    b_nodes: {
+      type: "array",
+      contains: {
+        type: "MessageNode",
+      },
+      isRequired: true,
+    },
+  },
+} as const;
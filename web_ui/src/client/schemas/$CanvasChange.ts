@@ -0,0 +1,30 @@
+export const $CanvasChange = {
+  description: `A change in a canvas changelog.`,
+  properties: {
+    version: {
+      type: "number",
+      isRequired: true,
+    },
+    event: {
+      type: "any-of",
+      contains: [
+        {
+          type: "CanvasCommitMessageEvent",
+        },
+        {
+          type: "CanvasCommitMessagesEvent",
+        },
+        {
+          type: "CanvasUpdateMessageEvent",
+        },
+        {
+          type: "CanvasMessageDeltaEvent",
+        },
+        {
+          type: "CanvasDeleteMessageEvent",
+        },
+      ],
+      isRequired: true,
+    },
+  },
+} as const;
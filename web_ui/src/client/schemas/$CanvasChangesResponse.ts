@@ -0,0 +1,34 @@
+export const $CanvasChangesResponse = {
+  description: `Response type for GET /api/v1/canvas/{canvas_id}/changes`,
+  properties: {
+    version: {
+      type: "number",
+      isRequired: true,
+    },
+    changes: {
+      type: "any-of",
+      contains: [
+        {
+          type: "array",
+          contains: {
+            type: "CanvasChange",
+          },
+        },
+        {
+          type: "null",
+        },
+      ],
+    },
+    snapshot: {
+      type: "any-of",
+      contains: [
+        {
+          type: "CanvasData",
+        },
+        {
+          type: "null",
+        },
+      ],
+    },
+  },
+} as const;
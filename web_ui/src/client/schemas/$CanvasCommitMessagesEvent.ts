@@ -0,0 +1,24 @@
+export const $CanvasCommitMessagesEvent = {
+  description: `Event data for a batch of messages committed together.`,
+  properties: {
+    event_type: {
+      type: '"commit_messages"',
+      isRequired: true,
+    },
+    canvas_id: {
+      type: "string",
+      isRequired: true,
+    },
+    timestamp: {
+      type: "number",
+      isRequired: true,
+    },
+    data: {
+      type: "array",
+      contains: {
+        type: "MessageNode",
+      },
+      isRequired: true,
+    },
+  },
+} as const;
@@ -0,0 +1,21 @@
+export const $CanvasDeleteMessageEvent = {
+  description: `Event data for canvas message deletions.`,
+  properties: {
+    event_type: {
+      type: '"delete_message"',
+      isRequired: true,
+    },
+    canvas_id: {
+      type: "string",
+      isRequired: true,
+    },
+    timestamp: {
+      type: "number",
+      isRequired: true,
+    },
+    data: {
+      type: "string",
+      isRequired: true,
+    },
+  },
+} as const;
@@ -0,0 +1,9 @@
+export const $CanvasDiffResponse = {
+  description: `Response type for GET /api/v1/canvas/{canvas_id}/diff`,
+  properties: {
+    data: {
+      type: "BranchDiff",
+      isRequired: true,
+    },
+  },
+} as const;
@@ -0,0 +1,21 @@
+export const $CanvasMessageDeltaEvent = {
+  description: `Event data for incremental message changes.`,
+  properties: {
+    event_type: {
+      type: '"message_delta"',
+      isRequired: true,
+    },
+    canvas_id: {
+      type: "string",
+      isRequired: true,
+    },
+    timestamp: {
+      type: "number",
+      isRequired: true,
+    },
+    data: {
+      type: "MessageDelta",
+      isRequired: true,
+    },
+  },
+} as const;
@@ -0,0 +1,12 @@
+export const $CanvasSearchResponse = {
+  description: `Response type for GET /api/v1/canvas/{canvas_id}/search`,
+  properties: {
+    hits: {
+      type: "array",
+      contains: {
+        type: "SearchHit",
+      },
+      isRequired: true,
+    },
+  },
+} as const;
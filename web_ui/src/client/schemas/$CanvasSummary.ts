@@ -51,5 +51,17 @@ export const $CanvasSummary = {
       },
       isRequired: true,
     },
+    branch_token_counts: {
+      type: "dictionary",
+      contains: {
+        type: "number",
+      },
+    },
+    head_token_counts: {
+      type: "dictionary",
+      contains: {
+        type: "number",
+      },
+    },
   },
 } as const;
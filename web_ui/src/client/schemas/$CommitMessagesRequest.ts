@@ -0,0 +1,8 @@
+export const $CommitMessagesRequest = {
+  properties: {
+    data: {
+      type: "CanvasCommitMessagesEvent",
+      isRequired: true,
+    },
+  },
+} as const;
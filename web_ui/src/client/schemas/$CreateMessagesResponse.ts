@@ -0,0 +1,20 @@
+export const $CreateMessagesResponse = {
+  description: `Response type for POST /api/v1/canvas/{canvas_id}/messages/batch`,
+  properties: {
+    message_ids: {
+      type: "array",
+      contains: {
+        type: "string",
+      },
+      isRequired: true,
+    },
+    canvas_id: {
+      type: "string",
+      isRequired: true,
+    },
+    message: {
+      type: "string",
+      isRequired: true,
+    },
+  },
+} as const;
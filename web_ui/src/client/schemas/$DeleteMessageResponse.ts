@@ -0,0 +1,17 @@
+export const $DeleteMessageResponse = {
+  description: `Response type for DELETE /api/v1/canvas/{canvas_id}/messages/{message_id}`,
+  properties: {
+    message_id: {
+      type: "string",
+      isRequired: true,
+    },
+    canvas_id: {
+      type: "string",
+      isRequired: true,
+    },
+    message: {
+      type: "string",
+      isRequired: true,
+    },
+  },
+} as const;
@@ -0,0 +1,27 @@
+export const $ForkCanvasRequest = {
+  description: `Request type for POST /api/v1/canvas/{canvas_id}/fork`,
+  properties: {
+    title: {
+      type: "any-of",
+      contains: [
+        {
+          type: "string",
+        },
+        {
+          type: "null",
+        },
+      ],
+    },
+    description: {
+      type: "any-of",
+      contains: [
+        {
+          type: "string",
+        },
+        {
+          type: "null",
+        },
+      ],
+    },
+  },
+} as const;
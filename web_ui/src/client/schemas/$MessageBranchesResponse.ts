@@ -0,0 +1,12 @@
+export const $MessageBranchesResponse = {
+  description: `Response type for GET /api/v1/canvas/{canvas_id}/messages/{message_id}/branches`,
+  properties: {
+    heads: {
+      type: "array",
+      contains: {
+        type: "string",
+      },
+      isRequired: true,
+    },
+  },
+} as const;
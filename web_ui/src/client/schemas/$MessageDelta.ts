@@ -0,0 +1,21 @@
+export const $MessageDelta = {
+  description: `An incremental change to a stored message, e.g. the next tokens of a streamed response.`,
+  properties: {
+    id: {
+      type: "string",
+      isRequired: true,
+    },
+    text: {
+      type: "string",
+    },
+    block_index: {
+      type: "number",
+    },
+    meta: {
+      type: "dictionary",
+      contains: {
+        properties: {},
+      },
+    },
+  },
+} as const;
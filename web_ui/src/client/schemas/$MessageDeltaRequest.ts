@@ -0,0 +1,9 @@
+export const $MessageDeltaRequest = {
+  description: `Request type for POST /api/v1/canvas/{canvas_id}/messages/{message_id}/delta`,
+  properties: {
+    data: {
+      type: "CanvasMessageDeltaEvent",
+      isRequired: true,
+    },
+  },
+} as const;
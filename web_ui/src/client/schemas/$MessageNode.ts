@@ -43,5 +43,11 @@ export const $MessageNode = {
       ],
       isRequired: true,
     },
+    merge_parent_ids: {
+      type: "array",
+      contains: {
+        type: "string",
+      },
+    },
   },
 } as const;
@@ -0,0 +1,13 @@
+export const $MetaIndexInfo = {
+  description: `A meta key a canvas is indexed by, and the kind of the index`,
+  properties: {
+    key: {
+      type: "string",
+      isRequired: true,
+    },
+    kind: {
+      type: "Enum",
+      isRequired: true,
+    },
+  },
+} as const;
@@ -0,0 +1,12 @@
+export const $MetaIndexesResponse = {
+  description: `Response type for PUT and DELETE /api/v1/canvas/{canvas_id}/meta_indexes/{key}`,
+  properties: {
+    indexes: {
+      type: "array",
+      contains: {
+        type: "MetaIndexInfo",
+      },
+      isRequired: true,
+    },
+  },
+} as const;
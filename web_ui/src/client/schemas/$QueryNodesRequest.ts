@@ -0,0 +1,31 @@
+export const $QueryNodesRequest = {
+  description: `Request type for POST /api/v1/canvas/{canvas_id}/nodes/query`,
+  properties: {
+    equals: {
+      type: "dictionary",
+      contains: {
+        properties: {},
+      },
+    },
+    ranges: {
+      type: "dictionary",
+      contains: {
+        type: "unknown[]",
+        maxItems: 2,
+        minItems: 2,
+      },
+    },
+    limit: {
+      type: "any-of",
+      contains: [
+        {
+          type: "number",
+          minimum: 1,
+        },
+        {
+          type: "null",
+        },
+      ],
+    },
+  },
+} as const;
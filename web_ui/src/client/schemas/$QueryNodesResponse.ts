@@ -0,0 +1,12 @@
+export const $QueryNodesResponse = {
+  description: `Response type for POST /api/v1/canvas/{canvas_id}/nodes/query`,
+  properties: {
+    nodes: {
+      type: "array",
+      contains: {
+        type: "MessageNode",
+      },
+      isRequired: true,
+    },
+  },
+} as const;
@@ -0,0 +1,21 @@
+export const $RegistrySearchHit = {
+  description: `A message of one of the canvases of a registry matching a search query.`,
+  properties: {
+    node_id: {
+      type: "string",
+      isRequired: true,
+    },
+    score: {
+      type: "number",
+      isRequired: true,
+    },
+    snippet: {
+      type: "string",
+      isRequired: true,
+    },
+    canvas_id: {
+      type: "string",
+      isRequired: true,
+    },
+  },
+} as const;
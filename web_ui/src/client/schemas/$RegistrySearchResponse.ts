@@ -0,0 +1,12 @@
+export const $RegistrySearchResponse = {
+  description: `Response type for GET /api/v1/search`,
+  properties: {
+    hits: {
+      type: "array",
+      contains: {
+        type: "RegistrySearchHit",
+      },
+      isRequired: true,
+    },
+  },
+} as const;
@@ -24,9 +24,15 @@ export const $SSEDocumentationResponse = {
           {
             type: "SSEMessageCommittedEvent",
           },
+          {
+            type: "SSEMessagesCommittedEvent",
+          },
           {
             type: "SSEMessageUpdatedEvent",
           },
+          {
+            type: "SSEMessageDeltaEvent",
+          },
           {
             type: "SSEMessageDeletedEvent",
           },
@@ -0,0 +1,21 @@
+export const $SSEMessageDeltaEvent = {
+  description: `SSE event data for incremental message changes (only the new text and meta keys).`,
+  properties: {
+    type: {
+      type: '"message_delta"',
+      isRequired: true,
+    },
+    timestamp: {
+      type: "number",
+      isRequired: true,
+    },
+    canvas_id: {
+      type: "string",
+      isRequired: true,
+    },
+    data: {
+      type: "MessageDelta",
+      isRequired: true,
+    },
+  },
+} as const;
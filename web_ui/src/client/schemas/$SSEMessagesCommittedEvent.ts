@@ -0,0 +1,24 @@
+export const $SSEMessagesCommittedEvent = {
+  description: `SSE event data for a batch of messages committed together.`,
+  properties: {
+    type: {
+      type: '"messages_committed"',
+      isRequired: true,
+    },
+    timestamp: {
+      type: "number",
+      isRequired: true,
+    },
+    canvas_id: {
+      type: "string",
+      isRequired: true,
+    },
+    data: {
+      type: "array",
+      contains: {
+        type: "MessageNode",
+      },
+      isRequired: true,
+    },
+  },
+} as const;
@@ -0,0 +1,17 @@
+export const $SearchHit = {
+  description: `A message matching a search query.`,
+  properties: {
+    node_id: {
+      type: "string",
+      isRequired: true,
+    },
+    score: {
+      type: "number",
+      isRequired: true,
+    },
+    snippet: {
+      type: "string",
+      isRequired: true,
+    },
+  },
+} as const;
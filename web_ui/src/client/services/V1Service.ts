@@ -1,11 +1,24 @@
+import type { CanvasChangesResponse } from "../models/CanvasChangesResponse";
+import type { CanvasDiffResponse } from "../models/CanvasDiffResponse";
 import type { CanvasListResponse } from "../models/CanvasListResponse";
+import type { CanvasSearchResponse } from "../models/CanvasSearchResponse";
 import type { CommitMessageRequest } from "../models/CommitMessageRequest";
+import type { CommitMessagesRequest } from "../models/CommitMessagesRequest";
 import type { CreateCanvasRequest } from "../models/CreateCanvasRequest";
 import type { CreateCanvasResponse } from "../models/CreateCanvasResponse";
 import type { CreateMessageResponse } from "../models/CreateMessageResponse";
+import type { CreateMessagesResponse } from "../models/CreateMessagesResponse";
 import type { DeleteCanvasResponse } from "../models/DeleteCanvasResponse";
+import type { DeleteMessageResponse } from "../models/DeleteMessageResponse";
+import type { ForkCanvasRequest } from "../models/ForkCanvasRequest";
 import type { GetCanvasResponse } from "../models/GetCanvasResponse";
 import type { HealthCheckResponse } from "../models/HealthCheckResponse";
+import type { MessageBranchesResponse } from "../models/MessageBranchesResponse";
+import type { MessageDeltaRequest } from "../models/MessageDeltaRequest";
+import type { MetaIndexesResponse } from "../models/MetaIndexesResponse";
+import type { QueryNodesRequest } from "../models/QueryNodesRequest";
+import type { QueryNodesResponse } from "../models/QueryNodesResponse";
+import type { RegistrySearchResponse } from "../models/RegistrySearchResponse";
 import type { SSEDocumentationResponse } from "../models/SSEDocumentationResponse";
 import type { UpdateMessageRequest } from "../models/UpdateMessageRequest";
 import type { CancelablePromise } from "../core/CancelablePromise";
@@ -27,6 +40,13 @@ export type TDataDeleteCanvasApiV1CanvasCanvasIdDelete = {
    */
   canvasId: string;
 };
+export type TDataForkCanvasApiV1CanvasCanvasIdForkPost = {
+  /**
+   * Canvas UUID to fork
+   */
+  canvasId: string;
+  requestBody: ForkCanvasRequest;
+};
 export type TDataCommitMessageApiV1CanvasCanvasIdMessagesPost = {
   /**
    * Canvas UUID
@@ -34,6 +54,13 @@ export type TDataCommitMessageApiV1CanvasCanvasIdMessagesPost = {
   canvasId: string;
   requestBody: CommitMessageRequest;
 };
+export type TDataCommitMessagesApiV1CanvasCanvasIdMessagesBatchPost = {
+  /**
+   * Canvas UUID
+   */
+  canvasId: string;
+  requestBody: CommitMessagesRequest;
+};
 export type TDataUpdateMessageApiV1CanvasCanvasIdMessagesMessageIdPut = {
   /**
    * Canvas UUID
@@ -45,6 +72,146 @@ export type TDataUpdateMessageApiV1CanvasCanvasIdMessagesMessageIdPut = {
   messageId: string;
   requestBody: UpdateMessageRequest;
 };
+export type TDataDeleteMessageApiV1CanvasCanvasIdMessagesMessageIdDelete = {
+  /**
+   * Canvas UUID
+   */
+  canvasId: string;
+  /**
+   * Message ID to delete
+   */
+  messageId: string;
+};
+export type TDataApplyMessageDeltaApiV1CanvasCanvasIdMessagesMessageIdDeltaPost = {
+  /**
+   * Canvas UUID
+   */
+  canvasId: string;
+  /**
+   * Message ID to change
+   */
+  messageId: string;
+  requestBody: MessageDeltaRequest;
+};
+export type TDataDiffMessagesApiV1CanvasCanvasIdDiffGet = {
+  /**
+   * Canvas UUID
+   */
+  canvasId: string;
+  /**
+   * Last message ID of the first history, e.g. a branch HEAD
+   */
+  a: string;
+  /**
+   * Last message ID of the second history, e.g. a branch HEAD
+   */
+  b: string;
+};
+export type TDataGetMessageBranchesApiV1CanvasCanvasIdMessagesMessageIdBranchesGet = {
+  /**
+   * Canvas UUID
+   */
+  canvasId: string;
+  /**
+   * Message ID
+   */
+  messageId: string;
+  /**
+   * Last message ID of a branch, e.g. a client's branch HEAD (repeatable)
+   */
+  head: Array<string>;
+};
+export type TDataGetCanvasChangesApiV1CanvasCanvasIdChangesGet = {
+  /**
+   * Canvas UUID
+   */
+  canvasId: string;
+  /**
+   * Version the client has already seen
+   */
+  since: number;
+};
+export type TDataSearchCanvasApiV1CanvasCanvasIdSearchGet = {
+  /**
+   * Canvas UUID
+   */
+  canvasId: string;
+  /**
+   * Words to search for
+   */
+  q: string;
+  /**
+   * Maximum number of results
+   */
+  limit?: number;
+};
+export type TDataSearchCanvasesApiV1SearchGet = {
+  /**
+   * Words to search for
+   */
+  q: string;
+  /**
+   * Maximum number of results
+   */
+  limit?: number;
+  /**
+   * Only messages with one of these comma-separated roles
+   */
+  role?: string | null;
+  /**
+   * Only messages with a block of one of these comma-separated types
+   */
+  blockType?: string | null;
+  /**
+   * Only messages with a timestamp at or after this Unix time
+   */
+  since?: number | null;
+  /**
+   * Only messages with a timestamp at or before this Unix time
+   */
+  until?: number | null;
+};
+export type TDataCreateMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyPut = {
+  /**
+   * Canvas UUID
+   */
+  canvasId: string;
+  /**
+   * Meta key to index
+   */
+  key: string;
+  /**
+   * hash for equality or sorted for numeric range conditions
+   */
+  kind?: "hash" | "sorted";
+};
+export type TDataDropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDelete = {
+  /**
+   * Canvas UUID
+   */
+  canvasId: string;
+  /**
+   * Indexed meta key
+   */
+  key: string;
+  /**
+   * hash for equality or sorted for numeric range conditions
+   */
+  kind?: "hash" | "sorted";
+};
+export type TDataQueryNodesApiV1CanvasCanvasIdNodesQueryPost = {
+  /**
+   * Canvas UUID
+   */
+  canvasId: string;
+  requestBody: QueryNodesRequest;
+};
+export type TDataGetBlobApiV1BlobsDigestGet = {
+  /**
+   * Blob digest from an image URL
+   */
+  digest: string;
+};
 export type TDataCanvasMessageSseApiV1CanvasCanvasIdSseGet = {
   /**
    * Canvas UUID
@@ -177,6 +344,37 @@ export class V1Service {
     });
   }
 
+  /**
+   * Fork Canvas
+   * Fork a canvas without copying its messages.
+   * Args:
+   * canvas_id: Canvas UUID to fork
+   * request: Optional title and description for the fork (defaults to those of the canvas)
+   * Returns:
+   * CreateCanvasResponse with the ID of the fork and success message
+   * Raises:
+   * HTTPException: 404 if canvas not found
+   * @returns CreateCanvasResponse Successful Response
+   * @throws ApiError
+   */
+  public static forkCanvasApiV1CanvasCanvasIdForkPost(
+    data: TDataForkCanvasApiV1CanvasCanvasIdForkPost
+  ): CancelablePromise<CreateCanvasResponse> {
+    const { canvasId, requestBody } = data;
+    return __request(OpenAPI, {
+      method: "POST",
+      url: "/api/v1/canvas/{canvas_id}/fork",
+      path: {
+        canvas_id: canvasId,
+      },
+      body: requestBody,
+      mediaType: "application/json",
+      errors: {
+        422: `Validation Error`,
+      },
+    });
+  }
+
   /**
    * Commit Message
    * Commit a new message to a canvas.
@@ -208,6 +406,37 @@ export class V1Service {
     });
   }
 
+  /**
+   * Commit Messages
+   * Commit a batch of new messages to a canvas in one request.
+   * Args:
+   * canvas_id: Canvas UUID to add messages to
+   * request: Canvas commit messages event data, parents before children
+   * Returns:
+   * CreateMessagesResponse with the message IDs and success message
+   * Raises:
+   * HTTPException: 404 if canvas not found, 400 if any node already exists
+   * @returns CreateMessagesResponse Successful Response
+   * @throws ApiError
+   */
+  public static commitMessagesApiV1CanvasCanvasIdMessagesBatchPost(
+    data: TDataCommitMessagesApiV1CanvasCanvasIdMessagesBatchPost
+  ): CancelablePromise<CreateMessagesResponse> {
+    const { canvasId, requestBody } = data;
+    return __request(OpenAPI, {
+      method: "POST",
+      url: "/api/v1/canvas/{canvas_id}/messages/batch",
+      path: {
+        canvas_id: canvasId,
+      },
+      body: requestBody,
+      mediaType: "application/json",
+      errors: {
+        422: `Validation Error`,
+      },
+    });
+  }
+
   /**
    * Update Message
    * Update an existing message in a canvas.
@@ -241,6 +470,365 @@ export class V1Service {
     });
   }
 
+  /**
+   * Delete Message
+   * Delete a message that has no children from a canvas.
+   * Args:
+   * canvas_id: Canvas UUID containing the message
+   * message_id: Message ID to delete
+   * Returns:
+   * DeleteMessageResponse with the message ID and success message
+   * Raises:
+   * HTTPException: 404 if canvas or message not found, 409 if the message still has children
+   * @returns DeleteMessageResponse Successful Response
+   * @throws ApiError
+   */
+  public static deleteMessageApiV1CanvasCanvasIdMessagesMessageIdDelete(
+    data: TDataDeleteMessageApiV1CanvasCanvasIdMessagesMessageIdDelete
+  ): CancelablePromise<DeleteMessageResponse> {
+    const { canvasId, messageId } = data;
+    return __request(OpenAPI, {
+      method: "DELETE",
+      url: "/api/v1/canvas/{canvas_id}/messages/{message_id}",
+      path: {
+        canvas_id: canvasId,
+        message_id: messageId,
+      },
+      errors: {
+        422: `Validation Error`,
+      },
+    });
+  }
+
+  /**
+   * Apply Message Delta
+   * Append text to a message and/or set meta keys without resending the whole message.
+   * Args:
+   * canvas_id: Canvas UUID containing the message
+   * message_id: Message ID to change
+   * request: Canvas message delta event data
+   * Returns:
+   * CreateMessageResponse with the message ID and success message
+   * Raises:
+   * HTTPException: 404 if canvas or message not found, 400 if the delta does not fit the message
+   * @returns CreateMessageResponse Successful Response
+   * @throws ApiError
+   */
+  public static applyMessageDeltaApiV1CanvasCanvasIdMessagesMessageIdDeltaPost(
+    data: TDataApplyMessageDeltaApiV1CanvasCanvasIdMessagesMessageIdDeltaPost
+  ): CancelablePromise<CreateMessageResponse> {
+    const { canvasId, messageId, requestBody } = data;
+    return __request(OpenAPI, {
+      method: "POST",
+      url: "/api/v1/canvas/{canvas_id}/messages/{message_id}/delta",
+      path: {
+        canvas_id: canvasId,
+        message_id: messageId,
+      },
+      body: requestBody,
+      mediaType: "application/json",
+      errors: {
+        422: `Validation Error`,
+      },
+    });
+  }
+
+  /**
+   * Diff Messages
+   * Get the messages unique to each of two histories since their merge base.
+   * Args:
+   * canvas_id: Canvas UUID containing the messages
+   * a: Last message ID of the first history
+   * b: Last message ID of the second history
+   * Returns:
+   * CanvasDiffResponse with the merge base ID and the divergent messages of each history
+   * Raises:
+   * HTTPException: 404 if canvas or message not found
+   * @returns CanvasDiffResponse Successful Response
+   * @throws ApiError
+   */
+  public static diffMessagesApiV1CanvasCanvasIdDiffGet(
+    data: TDataDiffMessagesApiV1CanvasCanvasIdDiffGet
+  ): CancelablePromise<CanvasDiffResponse> {
+    const { canvasId, a, b } = data;
+    return __request(OpenAPI, {
+      method: "GET",
+      url: "/api/v1/canvas/{canvas_id}/diff",
+      path: {
+        canvas_id: canvasId,
+      },
+      query: {
+        a: a,
+        b: b,
+      },
+      errors: {
+        422: `Validation Error`,
+      },
+    });
+  }
+
+  /**
+   * Get Message Branches
+   * Get which branch HEADs include a message in their history. Branches live in clients, so they send their HEADs.
+   * Args:
+   * canvas_id: Canvas UUID containing the message
+   * message_id: Message ID to look up
+   * head: Branch HEAD message IDs to check
+   * Returns:
+   * MessageBranchesResponse with the HEADs including the message, in request order
+   * Raises:
+   * HTTPException: 404 if canvas or message not found
+   * @returns MessageBranchesResponse Successful Response
+   * @throws ApiError
+   */
+  public static getMessageBranchesApiV1CanvasCanvasIdMessagesMessageIdBranchesGet(
+    data: TDataGetMessageBranchesApiV1CanvasCanvasIdMessagesMessageIdBranchesGet
+  ): CancelablePromise<MessageBranchesResponse> {
+    const { canvasId, messageId, head } = data;
+    return __request(OpenAPI, {
+      method: "GET",
+      url: "/api/v1/canvas/{canvas_id}/messages/{message_id}/branches",
+      path: {
+        canvas_id: canvasId,
+        message_id: messageId,
+      },
+      query: {
+        head: head,
+      },
+      errors: {
+        422: `Validation Error`,
+      },
+    });
+  }
+
+  /**
+   * Get Canvas Changes
+   * Get the changes made to a canvas after a version.
+   * Args:
+   * canvas_id: Canvas UUID to read the changes of
+   * since: Version the client has already seen (from a previous response)
+   * Returns:
+   * CanvasChangesResponse with the current version and either the changes since the given
+   * version or, when they are no longer retained, a full snapshot of the canvas
+   * Raises:
+   * HTTPException: 404 if canvas not found
+   * @returns CanvasChangesResponse Successful Response
+   * @throws ApiError
+   */
+  public static getCanvasChangesApiV1CanvasCanvasIdChangesGet(
+    data: TDataGetCanvasChangesApiV1CanvasCanvasIdChangesGet
+  ): CancelablePromise<CanvasChangesResponse> {
+    const { canvasId, since } = data;
+    return __request(OpenAPI, {
+      method: "GET",
+      url: "/api/v1/canvas/{canvas_id}/changes",
+      path: {
+        canvas_id: canvasId,
+      },
+      query: {
+        since: since,
+      },
+      errors: {
+        422: `Validation Error`,
+      },
+    });
+  }
+
+  /**
+   * Search Canvas
+   * Search the text and tool results of a canvas's messages.
+   * Args:
+   * canvas_id: Canvas UUID to search
+   * q: Words to search for (case-insensitive)
+   * limit: Maximum number of results
+   * Returns:
+   * CanvasSearchResponse with the matching message IDs, best matches first, and snippets
+   * Raises:
+   * HTTPException: 404 if canvas not found
+   * @returns CanvasSearchResponse Successful Response
+   * @throws ApiError
+   */
+  public static searchCanvasApiV1CanvasCanvasIdSearchGet(
+    data: TDataSearchCanvasApiV1CanvasCanvasIdSearchGet
+  ): CancelablePromise<CanvasSearchResponse> {
+    const { canvasId, q, limit = 20 } = data;
+    return __request(OpenAPI, {
+      method: "GET",
+      url: "/api/v1/canvas/{canvas_id}/search",
+      path: {
+        canvas_id: canvasId,
+      },
+      query: {
+        q: q,
+        limit: limit,
+      },
+      errors: {
+        422: `Validation Error`,
+      },
+    });
+  }
+
+  /**
+   * Search Canvases
+   * Search the messages of every canvas.
+   * Args:
+   * q: Words to search for (case-insensitive)
+   * limit: Maximum number of results
+   * filters: Role (e.g. role=user,assistant), block type (e.g. block_type=tool_use; "text"
+   * includes plain string content) and timestamp (since, until) conditions
+   * Returns:
+   * RegistrySearchResponse with the matching messages and their canvas IDs, best matches first
+   * @returns RegistrySearchResponse Successful Response
+   * @throws ApiError
+   */
+  public static searchCanvasesApiV1SearchGet(
+    data: TDataSearchCanvasesApiV1SearchGet
+  ): CancelablePromise<RegistrySearchResponse> {
+    const { q, limit = 20, role, blockType, since, until } = data;
+    return __request(OpenAPI, {
+      method: "GET",
+      url: "/api/v1/search",
+      query: {
+        q: q,
+        limit: limit,
+        role: role,
+        block_type: blockType,
+        since: since,
+        until: until,
+      },
+      errors: {
+        422: `Validation Error`,
+      },
+    });
+  }
+
+  /**
+   * Create Meta Index
+   * Index the nodes of a canvas by a meta key, so nodes/query can filter on it. Creating an index that exists does nothing.
+   * Args:
+   * canvas_id: Canvas UUID to index
+   * key: Meta key to index
+   * kind: Kind of index to create
+   * Returns:
+   * MetaIndexesResponse with every index of the canvas
+   * Raises:
+   * HTTPException: 404 if canvas not found
+   * @returns MetaIndexesResponse Successful Response
+   * @throws ApiError
+   */
+  public static createMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyPut(
+    data: TDataCreateMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyPut
+  ): CancelablePromise<MetaIndexesResponse> {
+    const { canvasId, key, kind = "hash" } = data;
+    return __request(OpenAPI, {
+      method: "PUT",
+      url: "/api/v1/canvas/{canvas_id}/meta_indexes/{key}",
+      path: {
+        canvas_id: canvasId,
+        key: key,
+      },
+      query: {
+        kind: kind,
+      },
+      errors: {
+        422: `Validation Error`,
+      },
+    });
+  }
+
+  /**
+   * Drop Meta Index
+   * Remove a meta index of a canvas, if it exists.
+   * Args:
+   * canvas_id: Canvas UUID
+   * key: Indexed meta key
+   * kind: Kind of index to remove
+   * Returns:
+   * MetaIndexesResponse with the remaining indexes of the canvas
+   * Raises:
+   * HTTPException: 404 if canvas not found
+   * @returns MetaIndexesResponse Successful Response
+   * @throws ApiError
+   */
+  public static dropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDelete(
+    data: TDataDropMetaIndexApiV1CanvasCanvasIdMetaIndexesKeyDelete
+  ): CancelablePromise<MetaIndexesResponse> {
+    const { canvasId, key, kind = "hash" } = data;
+    return __request(OpenAPI, {
+      method: "DELETE",
+      url: "/api/v1/canvas/{canvas_id}/meta_indexes/{key}",
+      path: {
+        canvas_id: canvasId,
+        key: key,
+      },
+      query: {
+        kind: kind,
+      },
+      errors: {
+        422: `Validation Error`,
+      },
+    });
+  }
+
+  /**
+   * Query Nodes
+   * Find the nodes of a canvas whose meta matches equality and numeric range conditions.
+   * Args:
+   * request: Values meta keys must equal, inclusive [low, high] bounds (null for open) and an optional limit
+   * canvas_id: Canvas UUID to query
+   * Returns:
+   * QueryNodesResponse with the matching nodes, ordered by the first range key or oldest first
+   * Raises:
+   * HTTPException: 404 if canvas not found, 400 if the query has no conditions or a key has no index
+   * @returns QueryNodesResponse Successful Response
+   * @throws ApiError
+   */
+  public static queryNodesApiV1CanvasCanvasIdNodesQueryPost(
+    data: TDataQueryNodesApiV1CanvasCanvasIdNodesQueryPost
+  ): CancelablePromise<QueryNodesResponse> {
+    const { canvasId, requestBody } = data;
+    return __request(OpenAPI, {
+      method: "POST",
+      url: "/api/v1/canvas/{canvas_id}/nodes/query",
+      path: {
+        canvas_id: canvasId,
+      },
+      body: requestBody,
+      mediaType: "application/json",
+      errors: {
+        422: `Validation Error`,
+      },
+    });
+  }
+
+  /**
+   * Get Blob
+   * Get the data of an image moved out of message content.
+   * Args:
+   * digest: Blob digest, the last segment of the image URL in the message
+   * Returns:
+   * The image bytes with their media type; blobs never change, so they may be cached forever
+   * Raises:
+   * HTTPException: 404 if blob not found
+   * @returns unknown Successful Response
+   * @throws ApiError
+   */
+  public static getBlobApiV1BlobsDigestGet(
+    data: TDataGetBlobApiV1BlobsDigestGet
+  ): CancelablePromise<unknown> {
+    const { digest } = data;
+    return __request(OpenAPI, {
+      method: "GET",
+      url: "/api/v1/blobs/{digest}",
+      path: {
+        digest: digest,
+      },
+      errors: {
+        422: `Validation Error`,
+      },
+    });
+  }
+
   /**
    * Canvas Sse
    * Server-Sent Events endpoint for global canvas updates.
@@ -270,7 +858,9 @@ export class V1Service {
    * Sends events when messages are added, updated, or deleted in a specific canvas.
    * Events include:
    * - message_committed: When a new message is added to the canvas
+   * - messages_committed: When a batch of messages is added to the canvas
    * - message_updated: When an existing message is updated
+   * - message_delta: When text is appended to a message or meta keys are set (carries only the change)
    * - message_deleted: When a message is deleted
    *
    * Args:
@@ -24,9 +24,11 @@ import { config } from "../config";
 import { useIsGithubPages, useIsMobile } from "../hooks";
 import {
   CanvasData,
+  MessageDelta,
   MessageNode,
   SSEErrorEvent,
   SSEMessageCommittedEvent,
+  SSEMessageDeltaEvent,
   SSEMessageUpdatedEvent,
 } from "../types";
 import { MessageNodeComponent } from "./MessageNode";
@@ -46,6 +48,45 @@ export interface CanvasViewProps {
   showPanel?: boolean;
 }
 
+// Apply a message delta to the local copy of a canvas, mirroring Canvas.apply_message_delta
+const applyMessageDelta = (
+  canvas: CanvasData,
+  delta: MessageDelta
+): CanvasData => {
+  const node = canvas.nodes[delta.id];
+  if (!node) {
+    return canvas;
+  }
+
+  let content = node.message.content;
+  if (delta.text !== undefined) {
+    if (typeof content === "string") {
+      content = content + delta.text;
+    } else if (delta.block_index !== undefined) {
+      const blocks = [...content];
+      const block = blocks[delta.block_index];
+      if (block === undefined) {
+        blocks.push({ type: "text", text: delta.text });
+      } else if (block.type === "text") {
+        blocks[delta.block_index] = { ...block, text: block.text + delta.text };
+      }
+      content = blocks;
+    }
+  }
+
+  return {
+    ...canvas,
+    nodes: {
+      ...canvas.nodes,
+      [delta.id]: {
+        ...node,
+        message: { ...node.message, content },
+        meta: delta.meta ? { ...node.meta, ...delta.meta } : node.meta,
+      },
+    },
+  };
+};
+
 // Custom hook for SSE management
 const useCanvasSSE = (
   canvasId: string | undefined,
@@ -93,6 +134,11 @@ const useCanvasSSE = (
         }
       });
 
+      eventSource.addEventListener("messages_committed", () => {
+        // A batch of messages was committed; refetch once for the whole batch
+        refetchCanvas(id);
+      });
+
       eventSource.addEventListener("message_updated", event => {
         try {
           const data = JSON.parse(event.data) as SSEMessageUpdatedEvent;
@@ -105,6 +151,24 @@ const useCanvasSSE = (
         }
       });
 
+      eventSource.addEventListener("message_delta", event => {
+        try {
+          const data = JSON.parse(event.data) as SSEMessageDeltaEvent;
+
+          // Apply the delta locally; refetching would transfer the whole canvas per chunk
+          onCanvasUpdate(currentCanvas =>
+            applyMessageDelta(currentCanvas, data.data)
+          );
+        } catch (err) {
+          console.error("Failed to parse message_delta event:", err);
+        }
+      });
+
+      eventSource.addEventListener("message_deleted", () => {
+        // Unreachable messages were garbage collected
+        refetchCanvas(id);
+      });
+
       eventSource.addEventListener("heartbeat", () => {
         console.debug("SSE heartbeat received for canvas", id);
       });
@@ -127,7 +191,7 @@ const useCanvasSSE = (
 
       return eventSource;
     },
-    [refetchCanvas]
+    [refetchCanvas, onCanvasUpdate]
   );
 
   useEffect(() => {
@@ -1,4 +1,5 @@
 import React from "react";
+import { config } from "../config";
 import { ImageBlockParam } from "../types";
 
 interface Props {
@@ -13,7 +14,8 @@ export const ImageBlockView: React.FC<Props> = ({ block }) => {
     if (source.type === "base64") {
       return `data:${source.media_type};base64,${source.data}`;
     } else if (source.type === "url") {
-      return source.url;
+      // Images stored by the server are served from its blob endpoint
+      return source.url.startsWith("/api/") ? `${config.api.baseUrl}${source.url}` : source.url;
     }
     return "";
   };